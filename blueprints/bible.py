@@ -415,6 +415,83 @@ def generate_bible_tts_with_durations_gemini(verse_texts, voice_name="Charon", m
         return {"ok": False, "error": str(e)}
 
 
+def synthesize_bible_episode_tts(episode, voice: str) -> dict:
+    """
+    에피소드 TTS 생성 (절별 duration 포함) - 일일 파이프라인 / 백필 공용
+
+    Args:
+        episode: Episode 객체
+        voice: 시트 음성 설정 ("chirp3:Charon", "gemini:pro:Charon", 그 외 Google TTS 음성)
+
+    Returns:
+        {
+            "ok": True,
+            "audio_data": bytes,
+            "audio_duration": float,
+            "verse_durations": [float, ...]
+        } 또는 {"ok": False, "error": str}
+    """
+    from scripts.common.tts import parse_chirp3_voice, parse_gemini_voice
+
+    tts_texts = []
+    for chapter in episode.chapters:
+        for i, verse in enumerate(chapter.verses):
+            if i == 0:
+                chapter_intro = f"{chapter.book} {chapter.chapter}장."
+                tts_texts.append(f"{chapter_intro} {verse.tts_text}")
+            else:
+                tts_texts.append(verse.tts_text)
+
+    print(f"[BIBLE] TTS 텍스트: {len(tts_texts)}개 절 (장 제목 포함)", flush=True)
+
+    if voice.startswith("chirp3:"):
+        chirp3_config = parse_chirp3_voice(voice)
+        tts_result = generate_bible_tts_with_durations(
+            verse_texts=tts_texts,
+            voice_name=chirp3_config["voice"]
+        )
+        if not tts_result.get("ok"):
+            return tts_result
+        verse_durations = tts_result.get("verse_durations", [])
+        audio_duration = tts_result.get("total_duration", 0)
+
+    elif voice.startswith("gemini:"):
+        gemini_config = parse_gemini_voice(voice)
+        print(f"[BIBLE] Gemini TTS 사용: {gemini_config['voice']} ({gemini_config['model']})", flush=True)
+
+        tts_result = generate_bible_tts_with_durations_gemini(
+            verse_texts=tts_texts,
+            voice_name=gemini_config["voice"],
+            model=gemini_config["model"]
+        )
+        if not tts_result.get("ok"):
+            return tts_result
+        verse_durations = tts_result.get("verse_durations", [])
+        audio_duration = tts_result.get("total_duration", 0)
+
+    else:
+        full_text = " ".join(tts_texts)
+        from scripts.tts.google_tts import generate_google_tts
+        tts_result = generate_google_tts(full_text, voice)
+
+        if not tts_result.get("ok"):
+            return tts_result
+
+        audio_duration = tts_result.get("duration", len(full_text) / 15.0)
+        total_chars = sum(len(t) for t in tts_texts)
+        verse_durations = []
+        for text in tts_texts:
+            ratio = len(text) / total_chars if total_chars > 0 else 1.0 / len(tts_texts)
+            verse_durations.append(audio_duration * ratio)
+
+    return {
+        "ok": True,
+        "audio_data": tts_result.get("audio_data"),
+        "audio_duration": audio_duration,
+        "verse_durations": verse_durations,
+    }
+
+
 # ===== Bible Pipeline 메인 함수 =====
 
 def run_bible_episode_pipeline(
@@ -440,8 +517,6 @@ def run_bible_episode_pipeline(
     import time as time_module
     import glob
     import random
-    from scripts.common.tts import parse_chirp3_voice, parse_gemini_voice
-
     start_time = time_module.time()
 
     try:
@@ -517,124 +592,90 @@ def run_bible_episode_pipeline(
         temp_dir = os.path.join(tempfile.gettempdir(), f"bible_day_{day_number}")
         os.makedirs(temp_dir, exist_ok=True)
 
-        # ========== 1. TTS 생성 ==========
-        print(f"[BIBLE] 1. TTS 생성 시작...", flush=True)
-
-        tts_texts = []
-        for chapter in episode.chapters:
-            for i, verse in enumerate(chapter.verses):
-                if i == 0:
-                    chapter_intro = f"{chapter.book} {chapter.chapter}장."
-                    tts_texts.append(f"{chapter_intro} {verse.tts_text}")
-                else:
-                    tts_texts.append(verse.tts_text)
-
-        print(f"[BIBLE] TTS 텍스트: {len(tts_texts)}개 절 (장 제목 포함)", flush=True)
-
-        audio_path = os.path.join(temp_dir, f"day_{day_number:03d}.mp3")
-
-        if voice.startswith("chirp3:"):
-            chirp3_config = parse_chirp3_voice(voice)
-            tts_result = generate_bible_tts_with_durations(
-                verse_texts=tts_texts,
-                voice_name=chirp3_config["voice"]
-            )
-            if tts_result.get("ok"):
-                verse_durations = tts_result.get("verse_durations", [])
-                audio_duration = tts_result.get("total_duration", 0)
+        # 백필(scripts.bible_pipeline.backfill)로 미리 만든 영상이 있으면 1~4단계 생략
+        from scripts.bible_pipeline.backfill import load_backfilled_episode, ensure_backfilled_thumbnail
+        backfilled = None if is_test_episode else load_backfilled_episode(day_number, voice)
+
+        if backfilled:
+            print(f"[BIBLE] 1~4. 백필 결과 사용: {backfilled['video_path']}", flush=True)
+            audio_duration = backfilled["audio_duration"]
+            # 백필 때 썸네일 생성이 실패했거나 파일이 없으면 업로드 전에 다시 생성
+            thumbnail_path = ensure_backfilled_thumbnail(episode, backfilled)
+            if thumbnail_path:
+                print(f"[BIBLE] 썸네일: {thumbnail_path}", flush=True)
             else:
-                error_msg = f"TTS 생성 실패: {tts_result.get('error')}"
-                update_episode_status(service, sheet_id, row_idx, "실패", error_message=error_msg)
-                return {"ok": False, "error": error_msg}
+                print(f"[BIBLE] 썸네일 재생성 실패, 썸네일 없이 업로드", flush=True)
+            # BGM 믹싱이 영상을 제자리에서 교체하므로 복사본으로 진행 (업로드 실패 후 재시도 시 BGM 중복 방지)
+            import shutil
+            video_path = os.path.join(temp_dir, os.path.basename(backfilled["video_path"]))
+            shutil.copyfile(backfilled["video_path"], video_path)
+        else:
+            # ========== 1. TTS 생성 ==========
+            print(f"[BIBLE] 1. TTS 생성 시작...", flush=True)
 
-        elif voice.startswith("gemini:"):
-            gemini_config = parse_gemini_voice(voice)
-            print(f"[BIBLE] Gemini TTS 사용: {gemini_config['voice']} ({gemini_config['model']})", flush=True)
+            audio_path = os.path.join(temp_dir, f"day_{day_number:03d}.mp3")
 
-            tts_result = generate_bible_tts_with_durations_gemini(
-                verse_texts=tts_texts,
-                voice_name=gemini_config["voice"],
-                model=gemini_config["model"]
-            )
-            if tts_result.get("ok"):
-                verse_durations = tts_result.get("verse_durations", [])
-                audio_duration = tts_result.get("total_duration", 0)
-            else:
+            tts_result = synthesize_bible_episode_tts(episode, voice)
+            if not tts_result.get("ok"):
                 error_msg = f"TTS 생성 실패: {tts_result.get('error')}"
                 update_episode_status(service, sheet_id, row_idx, "실패", error_message=error_msg)
                 return {"ok": False, "error": error_msg}
 
-        else:
-            full_text = " ".join(tts_texts)
-            from scripts.tts.google_tts import generate_google_tts
-            tts_result = generate_google_tts(full_text, voice)
+            verse_durations = tts_result["verse_durations"]
+            audio_duration = tts_result["audio_duration"]
+            with open(audio_path, "wb") as f:
+                f.write(tts_result["audio_data"])
 
-            if not tts_result.get("ok"):
-                error_msg = f"TTS 생성 실패: {tts_result.get('error')}"
-                update_episode_status(service, sheet_id, row_idx, "실패", error_message=error_msg)
-                return {"ok": False, "error": error_msg}
+            print(f"[BIBLE] TTS 완료: {audio_duration:.1f}초, {len(verse_durations)}개 절 duration 계산됨", flush=True)
+
+            # ========== 2. 배경 이미지 ==========
+            print(f"[BIBLE] 2. 배경 이미지 확인...", flush=True)
+            from scripts.bible_pipeline.background import get_background_path, generate_book_background
 
-            audio_duration = tts_result.get("duration", len(full_text) / 15.0)
-            total_chars = sum(len(t) for t in tts_texts)
-            verse_durations = []
-            for text in tts_texts:
-                ratio = len(text) / total_chars if total_chars > 0 else 1.0 / len(tts_texts)
-                verse_durations.append(audio_duration * ratio)
-
-        audio_data = tts_result.get("audio_data")
-        with open(audio_path, "wb") as f:
-            f.write(audio_data)
-
-        print(f"[BIBLE] TTS 완료: {audio_duration:.1f}초, {len(verse_durations)}개 절 duration 계산됨", flush=True)
-
-        # ========== 2. 배경 이미지 ==========
-        print(f"[BIBLE] 2. 배경 이미지 확인...", flush=True)
-        from scripts.bible_pipeline.background import get_background_path, generate_book_background
-
-        background_path = get_background_path(episode.book)
-        if not background_path:
-            print(f"[BIBLE] 배경 이미지 생성: {episode.book}", flush=True)
-            bg_result = generate_book_background(episode.book)
-            if bg_result.get("ok"):
-                background_path = bg_result.get("image_path")
-                print(f"[BIBLE] 배경 이미지 생성 완료: {background_path}", flush=True)
+            background_path = get_background_path(episode.book)
+            if not background_path:
+                print(f"[BIBLE] 배경 이미지 생성: {episode.book}", flush=True)
+                bg_result = generate_book_background(episode.book)
+                if bg_result.get("ok"):
+                    background_path = bg_result.get("image_path")
+                    print(f"[BIBLE] 배경 이미지 생성 완료: {background_path}", flush=True)
+                else:
+                    print(f"[BIBLE] 배경 생성 실패, 기본 배경 사용", flush=True)
+                    background_path = None
             else:
-                print(f"[BIBLE] 배경 생성 실패, 기본 배경 사용", flush=True)
-                background_path = None
-        else:
-            print(f"[BIBLE] 기존 배경 이미지 사용: {background_path}", flush=True)
+                print(f"[BIBLE] 기존 배경 이미지 사용: {background_path}", flush=True)
 
-        # ========== 3. 썸네일 생성 ==========
-        print(f"[BIBLE] 3. 썸네일 생성...", flush=True)
-        from scripts.bible_pipeline.thumbnail import generate_episode_thumbnail
+            # ========== 3. 썸네일 생성 ==========
+            print(f"[BIBLE] 3. 썸네일 생성...", flush=True)
+            from scripts.bible_pipeline.thumbnail import generate_episode_thumbnail
 
-        thumb_result = generate_episode_thumbnail(episode)
-        thumbnail_path = thumb_result.get("image_path") if thumb_result.get("ok") else None
-        if thumbnail_path:
-            print(f"[BIBLE] 썸네일 생성 완료: {thumbnail_path}", flush=True)
-        else:
-            print(f"[BIBLE] 썸네일 생성 실패: {thumb_result.get('error', 'Unknown')}", flush=True)
-
-        # ========== 4. 영상 렌더링 ==========
-        print(f"[BIBLE] 4. 영상 렌더링...", flush=True)
-        from scripts.bible_pipeline.renderer import render_episode_video
-
-        video_result = render_episode_video(
-            episode=episode,
-            audio_path=audio_path,
-            verse_durations=verse_durations,
-            output_dir=temp_dir,
-            background_path=background_path,
-            use_ass=True
-        )
+            thumb_result = generate_episode_thumbnail(episode)
+            thumbnail_path = thumb_result.get("image_path") if thumb_result.get("ok") else None
+            if thumbnail_path:
+                print(f"[BIBLE] 썸네일 생성 완료: {thumbnail_path}", flush=True)
+            else:
+                print(f"[BIBLE] 썸네일 생성 실패: {thumb_result.get('error', 'Unknown')}", flush=True)
+
+            # ========== 4. 영상 렌더링 ==========
+            print(f"[BIBLE] 4. 영상 렌더링...", flush=True)
+            from scripts.bible_pipeline.renderer import render_episode_video
+
+            video_result = render_episode_video(
+                episode=episode,
+                audio_path=audio_path,
+                verse_durations=verse_durations,
+                output_dir=temp_dir,
+                background_path=background_path,
+                use_ass=True
+            )
 
-        if not video_result.get("ok"):
-            error_msg = f"영상 렌더링 실패: {video_result.get('error')}"
-            update_episode_status(service, sheet_id, row_idx, "실패", error_message=error_msg)
-            return {"ok": False, "error": error_msg}
+            if not video_result.get("ok"):
+                error_msg = f"영상 렌더링 실패: {video_result.get('error')}"
+                update_episode_status(service, sheet_id, row_idx, "실패", error_message=error_msg)
+                return {"ok": False, "error": error_msg}
 
-        video_path = video_result.get("video_path")
-        print(f"[BIBLE] 영상 생성 완료: {video_path}", flush=True)
+            video_path = video_result.get("video_path")
+            print(f"[BIBLE] 영상 생성 완료: {video_path}", flush=True)
 
         # ========== 4.5. BGM 믹싱 ==========
         print(f"[BIBLE] 4.5. BGM 믹싱...", flush=True)
@@ -742,6 +783,9 @@ def run_bible_episode_pipeline(
             shutil.rmtree(temp_dir, ignore_errors=True)
         except:
             pass
+        if backfilled:
+            from scripts.bible_pipeline.backfill import discard_backfilled_episode
+            discard_backfilled_episode(day_number)
 
         print(f"[BIBLE] ========== 파이프라인 완료: Day {day_number} ({work_time_str}) ==========", flush=True)
 
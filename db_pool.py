@@ -0,0 +1,197 @@
+"""
+DB 커넥션 풀 모듈
+
+get_db_connection()이 매번 새 연결(psycopg2.connect = TCP+TLS 핸드셰이크)을 만드는 대신
+풀에서 연결을 빌려주고, conn.close() 시 풀로 반납한다.
+기존 호출 코드(conn = get_db_connection() ... conn.close())는 그대로 동작한다.
+
+- PostgreSQL: psycopg2 ThreadedConnectionPool + 대기(세마포어) + 유휴 연결 상태 확인
+- SQLite (로컬 개발용): 스레드별 연결 재사용 (sqlite3 연결은 스레드 간 공유 불가)
+  같은 스레드에서 중첩으로 빌리면 같은 연결을 공유하므로, 가장 바깥 반납 때만 rollback
+
+사용법:
+    from db_pool import PostgresConnectionPool, SQLiteConnectionPool
+
+    pool = PostgresConnectionPool(DATABASE_URL, maxconn=10, cursor_factory=RealDictCursor)
+    conn = pool.getconn()
+    ...
+    conn.close()  # 풀로 반납
+
+    with pool.getconn() as conn:  # 정상 종료 시 commit, 예외 시 rollback 후 풀로 반납
+        ...
+"""
+
+import os
+import time
+import sqlite3
+import threading
+
+# 이 시간 이상 놀던 연결은 빌려주기 전에 SELECT 1로 확인 (서버측 끊김 대비)
+IDLE_CHECK_SECONDS = 30
+
+
+class PooledConnection:
+    """풀 연결 래퍼 - close() 호출 시 실제로 닫지 않고 풀로 반납"""
+
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._conn = conn
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name, value):
+        # conn.autocommit = True 등은 실제 연결에 적용
+        if name.startswith('_'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._conn, name, value)
+
+    def __enter__(self):
+        # with 블록 안에서도 래퍼를 쓰도록 (블록이 끝나면 close()와 같은 경로로 반납)
+        self._conn.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            # 실제 연결의 트랜잭션 처리 (정상 종료 commit / 예외 rollback)
+            return self._conn.__exit__(*exc)
+        finally:
+            self.close()
+
+    def close(self):
+        if not self._released:
+            self._released = True
+            self._pool.putconn(self._conn)
+
+    def __del__(self):
+        # close()를 빠뜨린 호출부가 있어도 풀 슬롯이 새지 않도록
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class PostgresConnectionPool:
+    """스레드 안전 PostgreSQL 커넥션 풀 (풀이 가득 차면 반납될 때까지 대기)"""
+
+    def __init__(self, dsn, minconn=1, maxconn=10, acquire_timeout=30, **connect_kwargs):
+        from psycopg2.pool import ThreadedConnectionPool
+
+        self._pool = ThreadedConnectionPool(minconn, maxconn, dsn, **connect_kwargs)
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._last_used = {}
+        self._lock = threading.Lock()
+        self.maxconn = maxconn
+        self.acquire_timeout = acquire_timeout
+        self._in_use = 0
+
+    def _healthy(self, conn):
+        if conn.closed:
+            return False
+        idle = time.time() - self._last_used.get(id(conn), 0)
+        if idle < IDLE_CHECK_SECONDS:
+            return True
+        try:
+            cur = conn.cursor()
+            cur.execute('SELECT 1')
+            cur.close()
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def getconn(self):
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise RuntimeError(f"[DB-POOL] 연결 대기 시간 초과 ({self.acquire_timeout}초, 최대 {self.maxconn}개)")
+        try:
+            conn = self._pool.getconn()
+            if not self._healthy(conn):
+                # 끊긴 연결은 버리고 새로 받기
+                self._pool.putconn(conn, close=True)
+                conn = self._pool.getconn()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._in_use += 1
+        return PooledConnection(self, conn)
+
+    def putconn(self, conn):
+        try:
+            broken = bool(conn.closed)
+            if not broken:
+                try:
+                    # 커밋하지 않은 트랜잭션은 기존 close()와 동일하게 폐기
+                    conn.rollback()
+                    if conn.autocommit:
+                        conn.autocommit = False
+                except Exception:
+                    broken = True
+            self._last_used[id(conn)] = time.time()
+            self._pool.putconn(conn, close=broken)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            return {'backend': 'postgres', 'inUse': self._in_use, 'maxConn': self.maxconn}
+
+    def closeall(self):
+        self._pool.closeall()
+
+
+class SQLiteConnectionPool:
+    """SQLite 스레드별 연결 재사용 (로컬 개발용)
+
+    스레드별 대여 횟수를 세어, 중첩 대여(바깥 호출부가 커밋 전에 안쪽에서 다시 빌림)의
+    안쪽 반납이 바깥 호출부의 미커밋 쓰기를 rollback하지 않도록 한다.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened = 0
+
+    def getconn(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+            self._local.checkouts = 0
+            with self._lock:
+                self._opened += 1
+        self._local.checkouts += 1
+        return PooledConnection(self, conn)
+
+    def putconn(self, conn):
+        if getattr(self._local, 'conn', None) is not conn:
+            # 다른 스레드에서 반납(__del__ 등)되었거나 이미 버린 연결 - 이 스레드의 연결 상태는 건드리지 않음
+            return
+        self._local.checkouts -= 1
+        if self._local.checkouts > 0:
+            # 바깥 대여가 아직 사용 중 - 미커밋 쓰기 유지
+            return
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            # 손상된 연결은 버리고 다음 요청 시 새로 연결
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+            self._local.conn = None
+
+    def stats(self):
+        with self._lock:
+            return {'backend': 'sqlite', 'threadConnections': self._opened}
+
+
+def default_pool_size():
+    """gunicorn 워커/스레드 수를 고려한 기본 풀 크기 (DB_POOL_MAX로 조정)"""
+    return int(os.environ.get('DB_POOL_MAX', '10'))
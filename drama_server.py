@@ -6,14 +6,22 @@ import base64
 import sqlite3
 import subprocess
 import threading
+import time
 import queue
 import uuid
 import tempfile
+
+# 시작 시간 측정 (단계별 소요 시간 + STARTUP_BUDGET_SECONDS 초과 경고)
+from startup import (
+    get_startup_profile, LazyObject, code_fingerprint, directory_fingerprint, marker_matches, write_marker,
+)
+startup_profile = get_startup_profile()
+
 import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime as dt
+from typing import Any, Dict, Optional, Tuple
 from flask import Flask, render_template, request, jsonify, send_file, Response, redirect, send_from_directory
-from openai import OpenAI
 
 # Routes Blueprint 등록
 from routes import register_blueprints
@@ -41,6 +49,23 @@ from youtube_auth import (
 # 이미지 생성 모듈
 from image import generate_image as image_generate, generate_image_base64, generate_thumbnail_image, get_image_count_by_script, GEMINI_FLASH, GEMINI_PRO
 
+# DB 커넥션 풀 (PostgreSQL / SQLite)
+from db_pool import PostgresConnectionPool, SQLiteConnectionPool, default_pool_size
+
+# 백그라운드 작업 저널 (video_jobs 상태 기록)
+from jobs import JobJournal, ProgressBus, FileLease, get_background_workers
+
+# 영상 렌더링 공통 모듈 (씬 클립 캐시, 렌더 스케줄러, 단일 패스 렌더러, 미디어 수집, 후반 작업, 자산 캐시, Ken Burns)
+from video import (
+    get_clip_cache, hash_file, get_render_scheduler, estimate_ffmpeg_memory_mb,
+    SINGLE_PASS_MAX_CUTS, build_single_pass_command, estimate_single_pass_memory_mb,
+    MEDIA_SPOOL_DIR, fetch_media, spool_data_urls, spool_data_url_list,
+    BgmTrack, SfxCue, probe_video_info, compute_bgm_segments, scene_bgm_track, bgm_track_filter,
+    build_post_production_command, run_ffmpeg,
+    get_asset_cache, KEN_BURNS_ENGINE, KenBurnsMotion, build_ken_burns_filter,
+)
+from video.postprod import DEFAULT_VIDEO_ARGS as POSTPROD_VIDEO_ARGS, DEFAULT_AUDIO_ARGS as POSTPROD_AUDIO_ARGS
+
 # TTS 청킹 모듈 (문장별 TTS 개선)
 from tts.tts_chunking import split_korean_sentences as tts_split_sentences
 
@@ -86,6 +111,20 @@ from scripts.common.tts import (
     generate_chirp3_tts,
     convert_gemini_wav_to_mp3,
 )
+from scripts.common.tts_cache import get_tts_cache
+from scripts.common.rate_limit import get_rate_limiter
+
+# ZIP 스트리밍 작성 (디스크 직접 쓰기 / SpooledTemporaryFile 응답)
+from scripts.common.zip_stream import atomic_zip, new_zip_spool, zip_write_bytes, zip_write_file, zip_write_url
+# TTS/자막 텍스트 정규화 (정규식 미리 컴파일)
+from scripts.common.text_normalize import clean_tts_punctuation, convert_numbers_to_korean
+# YouTube 재개 가능 업로드 (세션 저장, 적응형 청크)
+from scripts.common.youtube_upload import upload_video_resumable
+
+# Google Sheets 일괄 읽기/쓰기 (batchGet / batchUpdate + 토큰 버킷)
+from scripts.common.sheets_gateway import SheetsGateway
+
+startup_profile.mark('imports')
 
 app = Flask(__name__)
 
@@ -154,19 +193,55 @@ def serve_output(filename):
 
 
 # ===== FFmpeg 동시 실행 제한 (메모리 보호) =====
-# Render 2GB 메모리에서 동시에 2개 이상의 FFmpeg 프로세스 실행 시 OOM 위험
-# 세마포어로 최대 1개의 FFmpeg 작업만 동시 실행 허용
-ffmpeg_semaphore = threading.Semaphore(1)
+# 작업 단위 세마포어 대신 FFmpeg 서브프로세스마다 렌더 스케줄러(video.scheduler)가 여유 메모리/CPU 기준으로 입장 제어
+# (2GB 1 CPU에서는 사실상 순차, 큰 호스트에서는 작업끼리도 겹쳐 실행)
 
 # ===== 비동기 영상 생성 작업 큐 시스템 =====
 video_job_queue = queue.Queue()
 video_jobs = {}  # {job_id: {status, progress, result, error, created_at}}
 video_jobs_lock = threading.Lock()
-VIDEO_JOBS_FILE = 'data/video_jobs.json'
+VIDEO_JOBS_FILE = 'data/video_jobs.json'  # 레거시 (전체 dict 덮어쓰기) - 저널로 1회 이관됨
+VIDEO_JOBS_JOURNAL_FILE = 'data/video_jobs.jsonl'
+# 완료/실패 작업 보관 시간 (압축 시 제거)
+VIDEO_JOB_TTL_HOURS = float(os.environ.get('VIDEO_JOB_TTL_HOURS', '72'))
+video_jobs_journal = JobJournal(VIDEO_JOBS_JOURNAL_FILE, legacy_path=VIDEO_JOBS_FILE, ttl_hours=VIDEO_JOB_TTL_HOURS)
+
+# ===== 작업 진행 상황 푸시 (SSE / long-poll) =====
+# 상태 저장 시 publish → /api/jobs/<job_id>/events, /api/jobs/<job_id>/wait 구독자가 즉시 깨어남
+job_progress_bus = ProgressBus()
+# gunicorn 요청 스레드 수 (gunicorn.conf.py와 같은 환경변수, 1이면 sync 워커)
+REQUEST_THREADS = int(os.environ.get('GUNICORN_THREADS', '1'))
+# long-poll 최대 대기 시간 (프록시 타임아웃보다 짧게)
+# sync 워커는 대기 중 다른 요청을 처리하지 못하므로 기존 폴링 간격(2초)만큼만 대기
+JOB_WAIT_MAX_SECONDS = float(os.environ.get('JOB_WAIT_MAX_SECONDS', '25' if REQUEST_THREADS > 1 else '2'))
+# SSE 스트림 최대 유지 시간 - sync 워커면 long-poll과 같게 끊고 EventSource 자동 재연결(Last-Event-ID)에 맡김
+JOB_EVENTS_MAX_SECONDS = 7200 if REQUEST_THREADS > 1 else JOB_WAIT_MAX_SECONDS
+# SSE 스트림에서 버스에 새 상태가 없을 때 저장소(저널/DB)를 재조회하는 간격 (다중 워커 대응)
+JOB_EVENTS_POLL_SECONDS = float(os.environ.get('JOB_EVENTS_POLL_SECONDS', '5'))
+
+# ===== 문장별 TTS 동시 합성 (assets-zip) =====
+# 엔진별 동시 호출 수 / 초당 요청 상한
+# - Chirp 3 HD: 100 req/min, Gemini TTS: 10 req/min, Google Cloud TTS: 600 req/min
+ASSETS_TTS_CONCURRENCY = {
+    'chirp3': int(os.environ.get('CHIRP3_TTS_CONCURRENCY', '6')),
+    'gemini': int(os.environ.get('GEMINI_TTS_CONCURRENCY', '2')),
+    'google': int(os.environ.get('TTS_CONCURRENCY', '4')),
+}
+ASSETS_TTS_QPS = {
+    'chirp3': float(os.environ.get('CHIRP3_TTS_QPS', '1.5')),
+    'gemini': float(os.environ.get('GEMINI_TTS_QPS', '0.15')),
+    'google': float(os.environ.get('TTS_MAX_QPS', '8')),
+}
 
 # ===== 파이프라인 동시 실행 방지 Lock =====
 # cron job이 동시에 여러 worker에서 실행되는 것을 방지
-pipeline_lock = threading.Lock()
+# threading.Lock은 gunicorn 워커 프로세스끼리 공유되지 않으므로 파일 lease 사용 (data/locks/pipeline.lock)
+pipeline_lock = FileLease('pipeline')
+
+# 렌더 동시 실행은 모든 렌더 경로(드라마/Image Lab/쇼츠)에서 렌더 스케줄러가 호스트 여유 메모리 기준으로 제어
+# 워커 프로세스마다 스케줄러가 있으므로 "메모리가 부족해도 1건은 진행"을 호스트 전체에서 1건으로 제한 (render-floor.lock)
+render_floor_lease = FileLease('render-floor')
+get_render_scheduler().floor_lease = render_floor_lease
 
 # ===== 서버 시작 시간 (orphan 작업 감지용) =====
 # 서버 재시작 전에 시작된 "처리중" 작업을 자동 감지하여 실패 처리
@@ -174,31 +249,112 @@ SERVER_START_TIME = dt.now()
 print(f"[SERVER] 시작 시간: {SERVER_START_TIME.strftime('%Y-%m-%d %H:%M:%S')}")
 
 
-# Job 파일 저장/로드 함수 (Render 재시작 대비)
-def save_video_jobs():
-    """video_jobs를 파일에 저장"""
+# Job 저널 저장/로드 함수 (Render 재시작 대비)
+def save_video_jobs(job_id=None):
+    """video_jobs 변경분을 저널에 기록 (video_jobs_lock을 잡은 상태에서 호출)
+
+    job_id가 주어지면 해당 작업 1건만 한 줄 append (전체 작업 수와 무관한 O(1) 기록).
+    job_id 없이 호출하면 전체 스냅샷으로 압축 (TTL 지난 완료 작업 제거 포함).
+    """
     try:
-        os.makedirs('data', exist_ok=True)
-        with open(VIDEO_JOBS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(video_jobs, f, ensure_ascii=False, indent=2)
+        if job_id is None:
+            video_jobs_journal.compact(video_jobs)
+            return
+        if job_id in video_jobs:
+            video_jobs_journal.put(job_id, video_jobs[job_id])
+            job_progress_bus.publish(job_id, _drama_job_progress(job_id, video_jobs[job_id]))
+        if video_jobs_journal.needs_compaction():
+            video_jobs_journal.compact(video_jobs)
     except Exception as e:
         print(f"[VIDEO-JOBS] 저장 실패: {e}")
 
+def _drama_job_progress(job_id, job):
+    """드라마 영상 작업 상태 → 상태 API/진행 이벤트 공통 응답 형태"""
+    response = {
+        "ok": True,
+        "jobId": job_id,
+        "status": job.get('status', 'unknown'),  # pending, processing, completed, failed
+        "progress": job.get('progress', 0),
+        "message": job.get('message', ''),
+    }
+    if job.get('status') == 'completed':
+        result = job.get('result')
+        # 프론트엔드 호환성을 위해 result 내용을 최상위로 펼침
+        if result:
+            response['videoUrl'] = result.get('videoUrl')
+            response['videoFileUrl'] = result.get('videoFileUrl')
+            response['duration'] = result.get('duration')
+            response['fileSize'] = result.get('fileSize')
+            response['fileSizeMB'] = result.get('fileSizeMB')
+    elif job.get('status') == 'failed':
+        response['error'] = job.get('error')
+    return response
+
 def load_video_jobs():
-    """파일에서 video_jobs 로드"""
+    """저널에서 video_jobs 로드"""
     global video_jobs
     try:
-        if os.path.exists(VIDEO_JOBS_FILE):
-            with open(VIDEO_JOBS_FILE, 'r', encoding='utf-8') as f:
-                video_jobs = json.load(f)
+        video_jobs = video_jobs_journal.load()
+        if video_jobs:
             print(f"[VIDEO-JOBS] {len(video_jobs)}개 작업 로드됨")
         else:
-            video_jobs = {}
             print("[VIDEO-JOBS] 새로운 작업 저장소 생성")
     except Exception as e:
         print(f"[VIDEO-JOBS] 로드 실패: {e}")
         video_jobs = {}
 
+def _refresh_video_job(job_id):
+    """다른 워커 프로세스가 처리하는 작업이면 저널에서 최신 상태로 갱신 (video_jobs_lock을 잡은 상태에서 호출)
+
+    gunicorn 워커가 여러 개면 상태 조회 요청이 작업을 처리하지 않는 워커로 갈 수 있다.
+    이 프로세스가 처리 중인 작업과 이미 끝난 작업은 메모리 값을 그대로 쓴다.
+    """
+    job = video_jobs.get(job_id)
+    if job is not None and (job.get('pid') == os.getpid() or job.get('status') in ('completed', 'failed')):
+        return job
+    try:
+        latest = video_jobs_journal.get(job_id)
+    except Exception as e:
+        print(f"[VIDEO-JOBS] 저널 조회 실패: {e}")
+        latest = None
+    if latest is not None:
+        video_jobs[job_id] = latest
+    return video_jobs.get(job_id)
+
+# ===== 작업 미디어 spool (data URL → 파일 참조) =====
+# 작업 payload/상태 JSON에 base64가 남지 않도록 요청 수신 직후 파일로 빼낸다 (MEDIA_SPOOL_DIR: video.media)
+
+def _spool_job_media(job_id, cuts=None, images=None, audio_url=None, scenes=None):
+    """요청의 data URL을 작업별 spool 디렉토리에 파일로 저장하고 spool:// 참조로 교체
+
+    Returns:
+        (images, audio_url) - cuts/scenes는 in-place로 교체됨
+    """
+    spool_dir = os.path.join(MEDIA_SPOOL_DIR, job_id)
+    count = 0
+    if cuts:
+        count += spool_data_urls(cuts, ('imageUrl', 'audioUrl'), spool_dir, prefix='cut')
+    if scenes:
+        count += spool_data_urls(scenes, ('image_url', 'audio_url'), spool_dir, prefix='scene')
+    if images:
+        spooled = spool_data_url_list(images, spool_dir, prefix='image')
+        count += sum(1 for old, new in zip(images, spooled) if old is not new)
+        images = spooled
+    if audio_url and audio_url.startswith('data:'):
+        audio_url = spool_data_url_list([audio_url], spool_dir, prefix='audio')[0]
+        count += 1
+    if count:
+        print(f"[MEDIA-SPOOL] {job_id}: data URL {count}개 → 파일 참조로 교체")
+    return images, audio_url
+
+def _cleanup_job_media(job_id):
+    """작업 종료 후 spool 디렉토리 삭제"""
+    import shutil
+    shutil.rmtree(os.path.join(MEDIA_SPOOL_DIR, job_id), ignore_errors=True)
+
+# 이 프로세스의 video_worker가 작업을 처리 중인지 (큐에서 순서를 기다리는 pending 작업 판별용)
+video_worker_busy = threading.Event()
+
 def video_worker():
     """백그라운드 워커: 영상 생성 작업 처리
 
@@ -214,6 +370,7 @@ def video_worker():
                 break
 
             job_id = job['job_id']
+            video_worker_busy.set()
             print(f"[VIDEO-WORKER] 작업 시작: {job_id}")
 
             # 디버깅: 작업 데이터 상세 출력
@@ -224,15 +381,15 @@ def video_worker():
             print(f"  - resolution: {job.get('resolution', 'N/A')}")
             print(f"  - fps: {job.get('fps', 'N/A')}")
 
-            # 상태 업데이트: processing
-            with video_jobs_lock:
-                if job_id in video_jobs:
-                    video_jobs[job_id]['status'] = 'processing'
-                    video_jobs[job_id]['progress'] = 0
-                    video_jobs[job_id]['message'] = '영상 생성 시작...'
-                    save_video_jobs()
-
             try:
+                # 상태 업데이트: processing
+                with video_jobs_lock:
+                    if job_id in video_jobs:
+                        video_jobs[job_id]['status'] = 'processing'
+                        video_jobs[job_id]['progress'] = 0
+                        video_jobs[job_id]['message'] = '영상 생성 시작...'
+                        save_video_jobs(job_id)
+
                 # 실제 영상 생성 로직 실행 (cuts 지원)
                 result = _generate_video_sync(
                     images=job.get('images', []),
@@ -254,7 +411,7 @@ def video_worker():
                         video_jobs[job_id]['message'] = '영상 생성 완료'
                         video_jobs[job_id]['result'] = result
                         video_jobs[job_id]['completed_at'] = dt.now().isoformat()
-                        save_video_jobs()
+                        save_video_jobs(job_id)
 
                 print(f"[VIDEO-WORKER] 작업 완료: {job_id}")
 
@@ -270,7 +427,10 @@ def video_worker():
                         video_jobs[job_id]['status'] = 'failed'
                         video_jobs[job_id]['error'] = error_msg
                         video_jobs[job_id]['message'] = f'실패: {error_msg}'
-                        save_video_jobs()
+                        save_video_jobs(job_id)
+            finally:
+                video_worker_busy.clear()
+                _cleanup_job_media(job_id)
 
             video_job_queue.task_done()
 
@@ -292,17 +452,29 @@ def cleanup_stale_jobs():
             if job['status'] in ['pending', 'processing']:
                 job['status'] = 'failed'
                 job['error'] = '서버 재시작으로 인해 작업이 중단되었습니다. 다시 시도해주세요.'
+                # 압축은 저널 파일 기준이므로 변경을 먼저 기록
+                video_jobs_journal.put(job_id, job)
                 stale_count += 1
         if stale_count > 0:
-            save_video_jobs()
             print(f"[VIDEO-JOBS] 서버 재시작: {stale_count}개 미완료 작업 실패 처리됨")
+        # 저널 압축 (TTL 지난 완료/실패 작업 제거 포함)
+        save_video_jobs()
 
+# gunicorn preload_app=True: 마스터에서 fork 전에 한 번만 실행됨
 cleanup_stale_jobs()
 
-# 워커 스레드 시작
-video_worker_thread = threading.Thread(target=video_worker, daemon=True)
-video_worker_thread.start()
-print(f"[VIDEO-WORKER] 워커 스레드 시작됨 (alive: {video_worker_thread.is_alive()})")
+# 워커 스레드는 여기서 등록만 하고 요청을 처리할 프로세스에서 시작
+# (preload_app=True면 이 모듈은 gunicorn 마스터에서 import되고, 스레드는 fork를 따라가지 않음)
+# - gunicorn: gunicorn.conf.py post_fork 훅
+# - 그 외 실행: 첫 요청 전 _ensure_background_workers()
+background_workers = get_background_workers()
+background_workers.register('video_worker', video_worker)
+startup_profile.mark('video_jobs')
+
+
+@app.before_request
+def _ensure_background_workers():
+    background_workers.ensure_started()
 
 # ===== JSON 지침 파일 로드 =====
 GUIDES_DIR = os.path.join(os.path.dirname(__file__), 'guides')
@@ -740,8 +912,14 @@ def get_client():
     if not key:
         print("[WARNING] OPENAI_API_KEY가 설정되지 않았습니다. API 호출 시 오류가 발생할 수 있습니다.")
         return None
-    # GPT-5.1 긴 처리 시간을 위한 타임아웃 설정 (10분) - sermon_server.py와 동일
-    return OpenAI(api_key=key, timeout=600.0)
+
+    def _create():
+        from openai import OpenAI
+        # GPT-5.1 긴 처리 시간을 위한 타임아웃 설정 (10분) - sermon_server.py와 동일
+        return OpenAI(api_key=key, timeout=600.0)
+
+    # openai SDK import(pydantic/httpx)는 첫 API 호출 때 - 서버 시작 시간 단축
+    return LazyObject(_create)
 
 client = get_client()
 
@@ -751,14 +929,15 @@ def get_openrouter_client():
     if not key:
         print("[OPENROUTER] API 키가 설정되지 않았습니다.")
         return None
-    try:
+
+    def _create():
+        from openai import OpenAI
         return OpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=key
         )
-    except Exception as e:
-        print(f"[OPENROUTER] 클라이언트 초기화 실패: {e}")
-        return None
+
+    return LazyObject(_create)
 
 openrouter_client = get_openrouter_client()
 
@@ -775,19 +954,46 @@ if USE_POSTGRES:
     if DATABASE_URL.startswith('postgres://'):
         DATABASE_URL = DATABASE_URL.replace('postgres://', 'postgresql://', 1)
 
+    # 커넥션 풀 (요청마다 TCP+TLS 연결을 새로 맺지 않도록)
+    # 연결은 처음 사용할 때 생성 (import 시점에 DB 접속하지 않음)
+    _db_pool = None
+    _db_pool_lock = threading.Lock()
+
+    def _get_db_pool():
+        global _db_pool
+        with _db_pool_lock:
+            if _db_pool is None:
+                _db_pool = PostgresConnectionPool(
+                    DATABASE_URL, minconn=1, maxconn=default_pool_size(),
+                    cursor_factory=RealDictCursor
+                )
+                print(f"[DB-POOL] PostgreSQL 커넥션 풀 생성 (최대 {_db_pool.maxconn}개)")
+            return _db_pool
+
     def get_db_connection():
-        """Create a PostgreSQL database connection"""
-        conn = psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
-        return conn
+        """PostgreSQL 풀 연결 획득 (conn.close() 시 풀로 반납)"""
+        return _get_db_pool().getconn()
 else:
     # SQLite 사용 (로컬 개발용)
     DB_PATH = os.path.join(os.path.dirname(__file__), 'drama_data.db')
+    _db_pool = SQLiteConnectionPool(DB_PATH)
+
+    def _get_db_pool():
+        return _db_pool
 
     def get_db_connection():
-        """Create a SQLite database connection"""
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """SQLite 연결 획득 (스레드별 재사용, conn.close() 시 반납)"""
+        return _db_pool.getconn()
+
+def _reset_db_pool_after_fork():
+    """fork된 gunicorn 워커는 마스터가 import 중에 연 DB 연결(소켓)을 공유하지 않고 새로 연결"""
+    global _db_pool
+    if USE_POSTGRES:
+        _db_pool = None
+    else:
+        _db_pool = SQLiteConnectionPool(DB_PATH)
+
+os.register_at_fork(after_in_child=_reset_db_pool_after_fork)
 
 # DB 초기화
 def init_db():
@@ -1056,8 +1262,65 @@ def init_db():
     conn.close()
     print("[DRAMA-DB] Database initialized (including youtube_tokens, products)")
 
-# 앱 시작 시 DB 초기화
-init_db()
+# DB 스키마 버전 마커: init_db() 안의 SQL이 바뀌었을 때만 DDL 실행 (재시작마다 CREATE TABLE 수십 번 왕복 생략)
+# 테이블을 수동으로 지웠다면 INIT_DB_FORCE=1로 한 번 강제 실행
+SCHEMA_MARKER_NAME = 'drama_server.init_db'
+INIT_DB_FORCE = os.environ.get('INIT_DB_FORCE', '0') == '1'
+
+def init_db_if_needed():
+    """schema_meta 테이블의 버전이 init_db() 지문과 다를 때만 init_db() 실행 - 실행했으면 True"""
+    version = code_fingerprint(init_db)
+    placeholder = '%s' if USE_POSTGRES else '?'
+
+    if not INIT_DB_FORCE:
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT version FROM schema_meta WHERE name = {placeholder}", (SCHEMA_MARKER_NAME,))
+            row = cursor.fetchone()
+            if row is not None and row['version'] == version:
+                print(f"[DRAMA-DB] 스키마 변경 없음 ({version[:12]}) - init_db 생략")
+                return False
+        except Exception:
+            # schema_meta 테이블이 아직 없음 (첫 실행) - 실패한 트랜잭션을 풀에 남기지 않음
+            conn.rollback()
+        finally:
+            conn.close()
+
+    init_db()
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS schema_meta (
+            name VARCHAR(100) PRIMARY KEY,
+            version VARCHAR(64) NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    if USE_POSTGRES:
+        cursor.execute('''
+            INSERT INTO schema_meta (name, version, updated_at)
+            VALUES (%s, %s, CURRENT_TIMESTAMP)
+            ON CONFLICT (name) DO UPDATE SET
+                version = EXCLUDED.version,
+                updated_at = CURRENT_TIMESTAMP
+        ''', (SCHEMA_MARKER_NAME, version))
+    else:
+        cursor.execute('''
+            INSERT OR REPLACE INTO schema_meta (name, version, updated_at)
+            VALUES (?, ?, datetime('now'))
+        ''', (SCHEMA_MARKER_NAME, version))
+    conn.commit()
+    cursor.close()
+    conn.close()
+    print(f"[DRAMA-DB] 스키마 버전 기록: {version[:12]}")
+    return True
+
+# 앱 시작 시 DB 초기화 (스키마가 바뀐 경우만)
+startup_profile.mark('module_setup')
+init_db_if_needed()
+startup_profile.mark('init_db')
 
 # YouTube 토큰/할당량 모듈 DB 연결 초기화
 youtube_auth.init_db(get_db_connection, USE_POSTGRES)
@@ -3971,14 +4234,13 @@ def api_freesound_test():
 def api_audio_download_zip():
     """서버의 모든 BGM/SFX 파일을 zip으로 다운로드"""
     import zipfile
-    import io
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
     bgm_dir = os.path.join(script_dir, "static", "audio", "bgm")
     sfx_dir = os.path.join(script_dir, "static", "audio", "sfx")
 
-    # 메모리에 zip 파일 생성
-    memory_file = io.BytesIO()
+    # 임시 스풀에 zip 파일 생성 (크면 디스크로 넘어감)
+    memory_file = new_zip_spool()
 
     with zipfile.ZipFile(memory_file, 'w', zipfile.ZIP_DEFLATED) as zf:
         # BGM 파일 추가
@@ -3986,14 +4248,14 @@ def api_audio_download_zip():
             for filename in os.listdir(bgm_dir):
                 if filename.endswith('.mp3'):
                     filepath = os.path.join(bgm_dir, filename)
-                    zf.write(filepath, f"bgm/{filename}")
+                    zip_write_file(zf, filepath, f"bgm/{filename}")
 
         # SFX 파일 추가
         if os.path.exists(sfx_dir):
             for filename in os.listdir(sfx_dir):
                 if filename.endswith('.mp3'):
                     filepath = os.path.join(sfx_dir, filename)
-                    zf.write(filepath, f"sfx/{filename}")
+                    zip_write_file(zf, filepath, f"sfx/{filename}")
 
     memory_file.seek(0)
 
@@ -4489,92 +4751,41 @@ def api_check_images():
         return jsonify({"ok": False, "error": str(e)}), 200
 
 
-# ===== Step6: 씬별 클립 생성 헬퍼 함수 (병렬 처리용) =====
-def _create_scene_clip(args):
+# ===== Step6: 씬 미디어 준비 (다운로드 + 오디오 길이 측정) =====
+def _prepare_cut_media(idx, cut, temp_dir):
     """
-    단일 씬의 클립을 생성하는 헬퍼 함수 (ThreadPoolExecutor용)
+    단일 씬의 이미지/오디오를 temp_dir에 준비하고 실제 길이를 측정
 
     Args:
-        args: (idx, cut, temp_dir, width, height, fps)
+        idx: 씬 인덱스
+        cut: {'cutId', 'imageUrl', 'audioUrl', 'duration'}
+        temp_dir: 작업 디렉토리
 
     Returns:
-        (idx, segment_path, duration) 또는 (idx, None, 0) on failure
+        (img_path, audio_path 또는 None, duration) 또는 None on failure
     """
-    import requests
-    import base64
     import subprocess
-    import shutil
-    import gc
 
-    idx, cut, temp_dir, width, height, fps = args
     cut_id = cut.get('cutId', idx + 1)
     img_url = cut.get('imageUrl', '')
     audio_url = cut.get('audioUrl', '')
     cut_duration = cut.get('duration', 10)
 
-    print(f"[DRAMA-PARALLEL] 씬 {cut_id} 병렬 처리 시작 (worker)")
-
-    # 이미지 다운로드/처리
+    # 이미지/오디오를 메모리에 올리지 않고 디스크로 바로 기록 (스트리밍/청크 디코딩)
+    base_dir = os.path.dirname(__file__)
     img_path = os.path.join(temp_dir, f"image_{idx:03d}.png")
-    if img_url:
-        try:
-            if img_url.startswith('data:'):
-                header, encoded = img_url.split(',', 1)
-                img_data = base64.b64decode(encoded)
-                with open(img_path, 'wb') as f:
-                    f.write(img_data)
-                del img_data  # 메모리 즉시 해제
-                gc.collect()
-            elif img_url.startswith('/static/'):
-                local_path = os.path.join(os.path.dirname(__file__), img_url.lstrip('/'))
-                if os.path.exists(local_path):
-                    shutil.copy2(local_path, img_path)
-                else:
-                    print(f"[DRAMA-PARALLEL] 씬 {cut_id} 로컬 이미지 없음: {local_path}")
-                    return (idx, None, 0)
-            else:
-                response = requests.get(img_url, timeout=60)
-                if response.status_code == 200:
-                    with open(img_path, 'wb') as f:
-                        f.write(response.content)
-                else:
-                    print(f"[DRAMA-PARALLEL] 씬 {cut_id} 이미지 다운로드 실패: {img_url}")
-                    return (idx, None, 0)
-        except Exception as e:
-            print(f"[DRAMA-PARALLEL] 씬 {cut_id} 이미지 처리 오류: {e}")
-            return (idx, None, 0)
-    else:
+    if not img_url:
         print(f"[DRAMA-PARALLEL] 씬 {cut_id} 이미지 URL 없음")
-        return (idx, None, 0)
+        return None
+    if not fetch_media(img_url, img_path, base_dir=base_dir, timeout=60, label=f"씬 {cut_id} 이미지"):
+        print(f"[DRAMA-PARALLEL] 씬 {cut_id} 이미지 처리 실패: {img_url[:100]}")
+        return None
 
-    # 오디오 다운로드/처리
     audio_path = os.path.join(temp_dir, f"audio_{idx:03d}.mp3")
     actual_duration = cut_duration
-    has_audio = False
-
-    if audio_url:
-        try:
-            if audio_url.startswith('data:'):
-                header, encoded = audio_url.split(',', 1)
-                audio_data = base64.b64decode(encoded)
-                with open(audio_path, 'wb') as f:
-                    f.write(audio_data)
-                del audio_data  # 메모리 즉시 해제
-                gc.collect()
-                has_audio = True
-            elif audio_url.startswith('/static/'):
-                local_path = os.path.join(os.path.dirname(__file__), audio_url.lstrip('/'))
-                if os.path.exists(local_path):
-                    shutil.copy2(local_path, audio_path)
-                    has_audio = True
-            else:
-                response = requests.get(audio_url, timeout=60)
-                if response.status_code == 200:
-                    with open(audio_path, 'wb') as f:
-                        f.write(response.content)
-                    has_audio = True
-        except Exception as e:
-            print(f"[DRAMA-PARALLEL] 씬 {cut_id} 오디오 처리 오류: {e}")
+    has_audio = bool(audio_url) and fetch_media(
+        audio_url, audio_path, base_dir=base_dir, timeout=60, label=f"씬 {cut_id} 오디오"
+    )
 
     # 오디오가 있으면 실제 길이 확인
     if has_audio and os.path.exists(audio_path):
@@ -4591,6 +4802,34 @@ def _create_scene_clip(args):
 
     print(f"[DRAMA-PARALLEL] 씬 {cut_id}: 오디오={has_audio}, 길이={actual_duration:.1f}초")
 
+    return img_path, (audio_path if has_audio else None), actual_duration
+
+
+# ===== Step6: 씬별 클립 생성 헬퍼 함수 (병렬 처리용) =====
+def _create_scene_clip(args):
+    """
+    단일 씬의 클립을 생성하는 헬퍼 함수 (ThreadPoolExecutor용)
+
+    Args:
+        args: (idx, cut, temp_dir, width, height, fps)
+
+    Returns:
+        (idx, segment_path, duration) 또는 (idx, None, 0) on failure
+    """
+    import subprocess
+    import gc
+
+    idx, cut, temp_dir, width, height, fps = args
+    cut_id = cut.get('cutId', idx + 1)
+
+    print(f"[DRAMA-PARALLEL] 씬 {cut_id} 병렬 처리 시작 (worker)")
+
+    media = _prepare_cut_media(idx, cut, temp_dir)
+    if not media:
+        return (idx, None, 0)
+    img_path, audio_path, actual_duration = media
+    has_audio = audio_path is not None
+
     # 씬별 클립 생성
     segment_path = os.path.join(temp_dir, f"segment_{idx:03d}.mp4")
 
@@ -4632,6 +4871,23 @@ def _create_scene_clip(args):
             segment_path
         ]
 
+    # 씬 클립 캐시 조회 (재시도/부분 수정 시 변경 없는 씬은 재인코딩 생략)
+    clip_cache = get_clip_cache()
+    cache_key = None
+    try:
+        encoder_args = [a for a in ffmpeg_cmd if a not in (img_path, audio_path, segment_path)]
+        cache_key = clip_cache.make_key(
+            hash_file(img_path),
+            hash_file(audio_path) if has_audio else None,
+            width, height, target_fps, encoder_args
+        )
+        cached = clip_cache.fetch(cache_key, segment_path)
+        if cached:
+            print(f"[DRAMA-PARALLEL] 씬 {cut_id} 캐시 히트 - 인코딩 생략 ({cached[1]:.1f}초)")
+            return (idx, cached[0], cached[1])
+    except Exception as e:
+        print(f"[DRAMA-PARALLEL] 씬 {cut_id} 캐시 조회 오류 (무시): {e}")
+
     try:
         print(f"[DRAMA-PARALLEL] 씬 {cut_id} FFmpeg 시작...")
         # 메모리 최적화: stdout DEVNULL, stderr만 PIPE로 캡처 (OOM 방지)
@@ -4645,6 +4901,8 @@ def _create_scene_clip(args):
             print(f"[DRAMA-PARALLEL] 씬 {cut_id} 클립 생성 완료: {actual_duration:.1f}초")
             del process  # 명시적 해제
             gc.collect()
+            if cache_key:
+                clip_cache.store(cache_key, segment_path, actual_duration)
             return (idx, segment_path, actual_duration)
         else:
             # 에러 시에만 stderr 읽기 (최대 500바이트)
@@ -4661,6 +4919,241 @@ def _create_scene_clip(args):
         return (idx, None, 0)
 
 
+# ===== Step6: 단일 패스 렌더링 (중간 세그먼트 파일 없이 FFmpeg 1회) =====
+def _render_cuts_single_pass(cuts, temp_dir, width, height, fps, output_path, update_progress):
+    """
+    모든 씬을 하나의 filter_complex로 한 번에 인코딩
+
+    동일한 cut 목록의 재시도는 씬 클립 캐시에서 결과 전체를 재사용한다.
+
+    Returns:
+        (total_duration, 씬 수) 또는 None (실패 시 - 호출 측에서 씬별 렌더링으로 폴백)
+    """
+    import subprocess
+    import hashlib
+    import gc
+
+    target_fps = min(fps, 24)  # 씬별 렌더링과 동일한 FPS 제한
+
+    # 1. 모든 씬 미디어 준비 (다운로드 + 길이 측정)
+    media = []
+    for idx, cut in enumerate(cuts):
+        update_progress(10 + int((idx / len(cuts)) * 20), f"씬 {idx+1}/{len(cuts)} 미디어 준비 중...")
+        prepared = _prepare_cut_media(idx, cut, temp_dir)
+        if prepared:
+            media.append(prepared)
+        else:
+            print(f"[DRAMA-SINGLE-PASS] 씬 {idx+1} 미디어 준비 실패 - 제외")
+        gc.collect()
+
+    if not media:
+        return None
+
+    total_duration = sum(m[2] for m in media)
+    scheduler = get_render_scheduler()
+    threads = max(1, scheduler.max_parallel)
+    script_path = os.path.join(temp_dir, "filter_complex.txt")
+    cmd = build_single_pass_command(media, width, height, target_fps, output_path, script_path, threads=threads)
+
+    # 2. 결과 캐시 조회 (cut 목록 전체가 동일한 재시도)
+    clip_cache = get_clip_cache()
+    cache_key = None
+    try:
+        image_digest = hashlib.sha256()
+        audio_digest = hashlib.sha256()
+        for img_path, audio_path, duration in media:
+            image_digest.update(hash_file(img_path).encode())
+            audio_digest.update((hash_file(audio_path) if audio_path else '-').encode())
+            audio_digest.update(f"{duration:.3f}".encode())
+        with open(script_path, 'r', encoding='utf-8') as f:
+            filter_script = f.read()
+        encoder_args = ['single_pass', filter_script] + cmd[cmd.index('-map'):-1]
+        cache_key = clip_cache.make_key(
+            image_digest.hexdigest(), audio_digest.hexdigest(),
+            width, height, target_fps, encoder_args
+        )
+        cached = clip_cache.fetch(cache_key, output_path)
+        if cached:
+            print(f"[DRAMA-SINGLE-PASS] 캐시 히트 - 인코딩 생략 ({len(media)}개 씬, {cached[1]:.1f}초)")
+            return cached[1], len(media)
+    except Exception as e:
+        print(f"[DRAMA-SINGLE-PASS] 캐시 조회 오류 (무시): {e}")
+
+    # 3. 단일 FFmpeg 인코딩 (입력 이미지 수에 비례한 메모리 예약)
+    update_progress(35, f"단일 패스 인코딩 중... ({len(media)}개 씬, {total_duration:.0f}초)")
+    estimate_mb = estimate_single_pass_memory_mb(len(media), width, height)
+    print(f"[DRAMA-SINGLE-PASS] 인코딩 시작 - {len(media)}개 씬, {total_duration:.1f}초, 예상 메모리 {estimate_mb}MB")
+
+    try:
+        with scheduler.admit(estimate_mb, label="단일 패스"):
+            # 메모리 최적화: stdout DEVNULL, stderr만 PIPE (OOM 방지)
+            # 타임아웃: 영상 길이의 3배 (최소 10분)
+            process = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=max(600, int(total_duration * 3))
+            )
+    except subprocess.TimeoutExpired:
+        print(f"[DRAMA-SINGLE-PASS] 타임아웃")
+        return None
+    except Exception as e:
+        print(f"[DRAMA-SINGLE-PASS] 실행 오류: {e}")
+        return None
+
+    if process.returncode != 0 or not os.path.exists(output_path):
+        stderr_msg = process.stderr[-500:].decode('utf-8', errors='ignore') if process.stderr else '(stderr 없음)'
+        print(f"[DRAMA-SINGLE-PASS] FFmpeg 오류 (returncode={process.returncode}): {stderr_msg}")
+        del process
+        gc.collect()
+        return None
+
+    del process
+    gc.collect()
+    print(f"[DRAMA-SINGLE-PASS] 인코딩 완료 - {len(media)}개 씬, {total_duration:.1f}초")
+    update_progress(85, "단일 패스 인코딩 완료")
+
+    if cache_key:
+        clip_cache.store(cache_key, output_path, total_duration)
+    return total_duration, len(media)
+
+
+# ===== Step6: 씬별 세그먼트 렌더링 + concat (cut 기반 영상 기본 모드) =====
+def _render_cuts_segmented(cuts, temp_dir, width, height, fps, output_path, update_progress):
+    """
+    씬마다 세그먼트 MP4를 만들고 concat demuxer로 병합 (스트림 복사)
+
+    Returns:
+        (total_duration, 성공한 씬 수)
+    """
+    import subprocess
+    import gc
+
+    segment_files = []
+    total_duration = 0.0
+
+    # 렌더 스케줄러: 여유 메모리/CPU 기준으로 동시 실행 수 결정
+    # (1 CPU / 2GB 환경에서는 순차 처리, 여유가 있으면 자동 병렬)
+    scheduler = get_render_scheduler()
+    clip_estimates = [
+        estimate_ffmpeg_memory_mb(width, height, duration=float(cut.get('duration', 10) or 10))
+        for cut in cuts
+    ]
+    parallel_workers = scheduler.parallelism_for(max(clip_estimates))
+
+    if parallel_workers > 1:
+        # 병렬 처리 모드
+        print(f"[DRAMA-PARALLEL] 병렬 처리 시작 - {len(cuts)}개 씬, 최대 {parallel_workers}개 동시 실행")
+
+        tasks = [(idx, cut, temp_dir, width, height, fps) for idx, cut in enumerate(cuts)]
+        labels = [f"씬 {cut.get('cutId', idx + 1)}" for idx, cut in enumerate(cuts)]
+        results = [None] * len(cuts)  # 순서 유지를 위한 리스트
+        completed = 0
+
+        for idx, result, error in scheduler.run_all(_create_scene_clip, tasks, clip_estimates, labels):
+            completed += 1
+            update_progress(15 + int((completed / len(cuts)) * 55), f"씬 {completed}/{len(cuts)} 클립 생성 중...")
+
+            if error is not None:
+                print(f"[DRAMA-PARALLEL] 씬 {idx+1} 오류: {error}")
+                results[idx] = (None, 0)
+                continue
+
+            result_idx, segment_path, duration = result
+            results[idx] = (segment_path, duration)
+
+            if segment_path and os.path.exists(segment_path):
+                print(f"[DRAMA-PARALLEL] 씬 {idx+1} 완료: {duration:.1f}초")
+            else:
+                print(f"[DRAMA-PARALLEL] 씬 {idx+1} 실패")
+
+        # 결과 정리 (순서대로)
+        for segment_path, duration in results:
+            if segment_path and os.path.exists(segment_path):
+                segment_files.append(segment_path)
+                total_duration += duration
+
+        # 메모리 정리
+        gc.collect()
+        print(f"[DRAMA-PARALLEL] 병렬 처리 완료 - 성공: {len(segment_files)}/{len(cuts)}, 총 길이: {total_duration:.1f}초")
+
+    else:
+        # 순차 처리 모드 (기본값 - 메모리 절약)
+        print(f"[DRAMA-SEQUENTIAL] 순차 처리 시작 - {len(cuts)}개 씬 (메모리 절약 모드)")
+
+        for idx, cut in enumerate(cuts):
+            update_progress(15 + int((idx / len(cuts)) * 55), f"씬 {idx+1}/{len(cuts)} 클립 생성 중...")
+
+            try:
+                # 씬 클립 생성 (다른 작업의 FFmpeg와 메모리 경합 시 대기)
+                task = (idx, cut, temp_dir, width, height, fps)
+                with scheduler.admit(clip_estimates[idx], label=f"씬 {idx+1}"):
+                    result_idx, segment_path, duration = _create_scene_clip(task)
+
+                if segment_path and os.path.exists(segment_path):
+                    segment_files.append(segment_path)
+                    total_duration += duration
+                    print(f"[DRAMA-SEQUENTIAL] 씬 {idx+1} 완료: {duration:.1f}초")
+                else:
+                    print(f"[DRAMA-SEQUENTIAL] 씬 {idx+1} 실패")
+
+            except Exception as e:
+                print(f"[DRAMA-SEQUENTIAL] 씬 {idx+1} 오류: {e}")
+
+            # 각 씬 처리 후 강제 메모리 정리
+            gc.collect()
+
+        print(f"[DRAMA-SEQUENTIAL] 순차 처리 완료 - 성공: {len(segment_files)}/{len(cuts)}, 총 길이: {total_duration:.1f}초")
+
+    # 메모리 정리
+    gc.collect()
+
+    if not segment_files:
+        raise Exception("클립을 생성하지 못했습니다. 이미지와 오디오 파일을 확인해주세요.")
+
+    # 모든 세그먼트 concat
+    update_progress(75, f"영상 병합 중... ({len(segment_files)}개 클립)")
+
+    concat_list_path = os.path.join(temp_dir, "concat.txt")
+    with open(concat_list_path, 'w', encoding='utf-8') as f:
+        for seg in segment_files:
+            f.write(f"file '{seg}'\n")
+
+    concat_cmd = [
+        'ffmpeg', '-y',
+        '-f', 'concat',
+        '-safe', '0',
+        '-i', concat_list_path,
+        '-c', 'copy',
+        output_path
+    ]
+
+    try:
+        print(f"[DRAMA-CUTS-VIDEO] Concat 명령: {' '.join(concat_cmd)}")
+        print(f"[DRAMA-CUTS-VIDEO] concat.txt 내용:")
+        with open(concat_list_path, 'r') as f:
+            print(f.read())
+        # 메모리 최적화: stdout DEVNULL, stderr만 PIPE (OOM 방지)
+        process = subprocess.run(
+            concat_cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=600
+        )
+        if process.returncode != 0:
+            stderr_msg = process.stderr[:500].decode('utf-8', errors='ignore') if process.stderr else '(stderr 없음)'
+            print(f"[DRAMA-CUTS-VIDEO] Concat 오류 (returncode={process.returncode}): {stderr_msg}")
+            del process
+            gc.collect()
+            raise Exception(f"영상 병합 실패: {stderr_msg[:200]}")
+        del process
+        gc.collect()
+        print(f"[DRAMA-CUTS-VIDEO] Concat 완료, 파일 존재: {os.path.exists(output_path)}")
+    except subprocess.TimeoutExpired:
+        raise Exception("영상 병합 타임아웃 (10분)")
+
+    return total_duration, len(segment_files)
+
 # ===== Step6: 씬별 클립 생성 후 concat 방식 영상 제작 (병렬 처리) =====
 def _generate_video_with_cuts(cuts, subtitle_data, burn_subtitle, resolution, fps, update_progress):
     """
@@ -4714,127 +5207,29 @@ def _generate_video_with_cuts(cuts, subtitle_data, burn_subtitle, resolution, fp
         print(f"[DRAMA-CUTS-VIDEO] 메모리 최적화 - 해상도 조정: {resolution}")
 
     with tempfile.TemporaryDirectory() as temp_dir:
-        update_progress(10, "씬별 영상 순차 생성 중...")
-
-        segment_files = []
-        total_duration = 0.0
-
-        # 환경변수로 병렬 처리 워커 수 설정 (기본값: 1 = 순차 처리)
-        # Render Pro (4GB) 환경에서는 2로 설정 권장
-        parallel_workers = int(os.environ.get('VIDEO_PARALLEL_WORKERS', 1))
-
-        if parallel_workers > 1:
-            # 병렬 처리 모드
-            print(f"[DRAMA-PARALLEL] 병렬 처리 시작 - {len(cuts)}개 씬, {parallel_workers}개 워커")
-
-            tasks = [(idx, cut, temp_dir, width, height, fps) for idx, cut in enumerate(cuts)]
-            results = [None] * len(cuts)  # 순서 유지를 위한 리스트
-
-            with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
-                future_to_idx = {executor.submit(_create_scene_clip, task): task[0] for task in tasks}
-                completed = 0
-
-                for future in as_completed(future_to_idx):
-                    idx = future_to_idx[future]
-                    completed += 1
-                    update_progress(15 + int((completed / len(cuts)) * 55), f"씬 {completed}/{len(cuts)} 클립 생성 중...")
-
-                    try:
-                        result_idx, segment_path, duration = future.result()
-                        results[idx] = (segment_path, duration)
-
-                        if segment_path and os.path.exists(segment_path):
-                            print(f"[DRAMA-PARALLEL] 씬 {idx+1} 완료: {duration:.1f}초")
-                        else:
-                            print(f"[DRAMA-PARALLEL] 씬 {idx+1} 실패")
-                    except Exception as e:
-                        print(f"[DRAMA-PARALLEL] 씬 {idx+1} 오류: {e}")
-                        results[idx] = (None, 0)
-
-            # 결과 정리 (순서대로)
-            for segment_path, duration in results:
-                if segment_path and os.path.exists(segment_path):
-                    segment_files.append(segment_path)
-                    total_duration += duration
-
-            # 메모리 정리
-            gc.collect()
-            print(f"[DRAMA-PARALLEL] 병렬 처리 완료 - 성공: {len(segment_files)}/{len(cuts)}, 총 길이: {total_duration:.1f}초")
-
-        else:
-            # 순차 처리 모드 (기본값 - 메모리 절약)
-            print(f"[DRAMA-SEQUENTIAL] 순차 처리 시작 - {len(cuts)}개 씬 (메모리 절약 모드)")
-
-            for idx, cut in enumerate(cuts):
-                update_progress(15 + int((idx / len(cuts)) * 55), f"씬 {idx+1}/{len(cuts)} 클립 생성 중...")
-
-                try:
-                    # 씬 클립 생성
-                    task = (idx, cut, temp_dir, width, height, fps)
-                    result_idx, segment_path, duration = _create_scene_clip(task)
-
-                    if segment_path and os.path.exists(segment_path):
-                        segment_files.append(segment_path)
-                        total_duration += duration
-                        print(f"[DRAMA-SEQUENTIAL] 씬 {idx+1} 완료: {duration:.1f}초")
-                    else:
-                        print(f"[DRAMA-SEQUENTIAL] 씬 {idx+1} 실패")
-
-                except Exception as e:
-                    print(f"[DRAMA-SEQUENTIAL] 씬 {idx+1} 오류: {e}")
-
-                # 각 씬 처리 후 강제 메모리 정리
-                gc.collect()
-
-            print(f"[DRAMA-SEQUENTIAL] 순차 처리 완료 - 성공: {len(segment_files)}/{len(cuts)}, 총 길이: {total_duration:.1f}초")
-
-        # 메모리 정리
-        gc.collect()
+        output_path = os.path.join(temp_dir, "output.mp4")
 
-        if not segment_files:
-            raise Exception("클립을 생성하지 못했습니다. 이미지와 오디오 파일을 확인해주세요.")
+        # 렌더 모드: segments(기본) / single_pass / auto
+        # 단일 패스는 FFmpeg 1개가 모든 입력 이미지를 동시에 들고 있으므로 옵트인
+        # auto: 씬 수가 SINGLE_PASS_MAX_CUTS 이하이고, 씬 수/해상도로 추정한 메모리가 지금 여유 메모리에 들어갈 때만 단일 패스
+        render_mode = os.environ.get('VIDEO_RENDER_MODE', 'segments')
+        use_single_pass = render_mode == 'single_pass' or (
+            render_mode == 'auto' and len(cuts) <= SINGLE_PASS_MAX_CUTS
+            and get_render_scheduler().fits(estimate_single_pass_memory_mb(len(cuts), width, height))
+        )
 
-        # 모든 세그먼트 concat
-        update_progress(75, f"영상 병합 중... ({len(segment_files)}개 클립)")
+        rendered = None
+        if use_single_pass:
+            update_progress(10, "씬 미디어 준비 중 (단일 패스 모드)...")
+            rendered = _render_cuts_single_pass(cuts, temp_dir, width, height, fps, output_path, update_progress)
+            if not rendered:
+                print(f"[DRAMA-CUTS-VIDEO] 단일 패스 실패 → 씬별 렌더링으로 폴백")
 
-        concat_list_path = os.path.join(temp_dir, "concat.txt")
-        with open(concat_list_path, 'w', encoding='utf-8') as f:
-            for seg in segment_files:
-                f.write(f"file '{seg}'\n")
+        if not rendered:
+            update_progress(10, "씬별 영상 순차 생성 중...")
+            rendered = _render_cuts_segmented(cuts, temp_dir, width, height, fps, output_path, update_progress)
 
-        output_path = os.path.join(temp_dir, "output.mp4")
-        concat_cmd = [
-            'ffmpeg', '-y',
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', concat_list_path,
-            '-c', 'copy',
-            output_path
-        ]
-
-        try:
-            print(f"[DRAMA-CUTS-VIDEO] Concat 명령: {' '.join(concat_cmd)}")
-            print(f"[DRAMA-CUTS-VIDEO] concat.txt 내용:")
-            with open(concat_list_path, 'r') as f:
-                print(f.read())
-            # 메모리 최적화: stdout DEVNULL, stderr만 PIPE (OOM 방지)
-            process = subprocess.run(
-                concat_cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                timeout=600
-            )
-            if process.returncode != 0:
-                stderr_msg = process.stderr[:500].decode('utf-8', errors='ignore') if process.stderr else '(stderr 없음)'
-                print(f"[DRAMA-CUTS-VIDEO] Concat 오류 (returncode={process.returncode}): {stderr_msg}")
-                del process
-                gc.collect()
-                raise Exception(f"영상 병합 실패: {stderr_msg[:200]}")
-            del process
-            gc.collect()
-            print(f"[DRAMA-CUTS-VIDEO] Concat 완료, 파일 존재: {os.path.exists(output_path)}")
-        except subprocess.TimeoutExpired:
-            raise Exception("영상 병합 타임아웃 (10분)")
+        total_duration, rendered_count = rendered
 
         update_progress(90, "영상 저장 중...")
 
@@ -4854,30 +5249,18 @@ def _generate_video_with_cuts(cuts, subtitle_data, burn_subtitle, resolution, fp
 
         video_url = f"/static/videos/{video_filename}"
 
-        # Base64 인코딩 (10MB 이하만 - 2GB 환경 메모리 최적화)
-        # 10MB 영상 + Base64 오버헤드(33%) = ~13MB 메모리 사용
-        if file_size_mb <= 10:
-            with open(final_video_path, 'rb') as f:
-                video_data = f.read()
-            video_base64 = base64.b64encode(video_data).decode('utf-8')
-            video_url_base64 = f"data:video/mp4;base64,{video_base64}"
-            del video_data
-            del video_base64
-            gc.collect()
-        else:
-            video_url_base64 = None
-
-        print(f"[DRAMA-CUTS-VIDEO] 영상 생성 완료 - {len(segment_files)}개 씬, 총 {total_duration:.1f}초, {file_size_mb:.2f}MB")
+        print(f"[DRAMA-CUTS-VIDEO] 영상 생성 완료 - {rendered_count}개 씬, 총 {total_duration:.1f}초, {file_size_mb:.2f}MB")
 
         update_progress(100, "완료!")
 
+        # 결과에는 파일 참조만 저장 (base64 인라인 시 작업 JSON과 메모리가 커짐)
         return {
-            "videoUrl": video_url_base64 or video_url,
+            "videoUrl": video_url,
             "videoFileUrl": video_url,
             "duration": total_duration,
             "fileSize": file_size,
             "fileSizeMB": round(file_size_mb, 2),
-            "cutsCount": len(segment_files)
+            "cutsCount": rendered_count
         }
 
 
@@ -4897,6 +5280,7 @@ def _generate_video_sync(images, audio_url, subtitle_data, burn_subtitle, resolu
     import tempfile
     import subprocess
     import shutil
+    import time
     import gc
 
     # 의존성 체크: Pillow
@@ -4942,7 +5326,7 @@ def _generate_video_sync(images, audio_url, subtitle_data, burn_subtitle, resolu
                     video_jobs[job_id]['progress'] = progress
                     if message:
                         video_jobs[job_id]['message'] = message
-                    save_video_jobs()  # 파일에 저장
+                    save_video_jobs(job_id)  # 저널에 기록
 
     update_progress(5, "의존성 확인 완료, 영상 생성 준비 중...")
 
@@ -4966,43 +5350,19 @@ def _generate_video_sync(images, audio_url, subtitle_data, burn_subtitle, resolu
                 # 임시 원본 이미지 경로
                 temp_img_path = os.path.join(temp_dir, f"temp_{idx:03d}.png")
 
-                if img_url.startswith('data:'):
-                    # Base64 데이터 URL
-                    header, encoded = img_url.split(',', 1)
-                    img_data = base64.b64decode(encoded)
-                    with open(temp_img_path, 'wb') as f:
-                        f.write(img_data)
-                elif img_url.startswith('/static/'):
-                    # 로컬 static 파일 경로
-                    local_path = os.path.join(os.path.dirname(__file__), img_url.lstrip('/'))
-                    if os.path.exists(local_path):
-                        shutil.copy2(local_path, temp_img_path)
-                    else:
-                        print(f"[DRAMA-STEP6-VIDEO] 로컬 이미지 파일 없음: {local_path}")
-                        failed_images.append(f"이미지 {idx+1}")
-                        continue
-                else:
-                    # HTTP URL (재시도 로직 추가)
-                    max_retries = 3
-                    for retry in range(max_retries):
-                        try:
-                            response = requests.get(img_url, timeout=60)
-                            if response.status_code == 200:
-                                with open(temp_img_path, 'wb') as f:
-                                    f.write(response.content)
-                                break
-                            else:
-                                if retry == max_retries - 1:
-                                    print(f"[DRAMA-STEP6-VIDEO] 이미지 다운로드 실패: {img_url} (상태: {response.status_code})")
-                                    failed_images.append(f"이미지 {idx+1}")
-                                    continue
-                        except requests.exceptions.RequestException as e:
-                            if retry == max_retries - 1:
-                                print(f"[DRAMA-STEP6-VIDEO] 이미지 다운로드 오류: {img_url} - {str(e)}")
-                                failed_images.append(f"이미지 {idx+1}")
-                                continue
-                            import time
-                            time.sleep(1)
+                # 스트리밍 다운로드 / data URL 청크 디코딩 (HTTP는 최대 3회 시도)
+                fetched = False
+                for retry in range(3):
+                    if fetch_media(img_url, temp_img_path, base_dir=os.path.dirname(__file__), timeout=60, label=f"이미지 {idx+1}"):
+                        fetched = True
+                        break
+                    if not img_url.startswith('http'):
+                        break
+                    time.sleep(1)
+                if not fetched:
+                    print(f"[DRAMA-STEP6-VIDEO] 이미지 다운로드 실패: {img_url[:100]}")
+                    failed_images.append(f"이미지 {idx+1}")
+                    continue
 
                 # 메모리 최적화: 이미지 리사이즈 (메모리 사용량 감소)
                 if os.path.exists(temp_img_path):
@@ -5037,41 +5397,17 @@ def _generate_video_sync(images, audio_url, subtitle_data, burn_subtitle, resolu
 
         # 2. 오디오 저장 (재시도 로직 추가)
         audio_path = os.path.join(temp_dir, "audio.mp3")
-        if audio_url.startswith('data:'):
-            header, encoded = audio_url.split(',', 1)
-            audio_data = base64.b64decode(encoded)
-            with open(audio_path, 'wb') as f:
-                f.write(audio_data)
-        elif audio_url.startswith('/static/'):
-            # 로컬 static 파일 경로
-            local_audio_path = os.path.join(os.path.dirname(__file__), audio_url.lstrip('/'))
-            if os.path.exists(local_audio_path):
-                shutil.copy2(local_audio_path, audio_path)
-            else:
-                raise Exception(f"오디오 파일을 찾을 수 없습니다: {audio_url}")
-        else:
-            # HTTP URL (재시도 로직 추가)
-            max_retries = 3
-            audio_downloaded = False
-            for retry in range(max_retries):
-                try:
-                    response = requests.get(audio_url, timeout=60)
-                    if response.status_code == 200:
-                        with open(audio_path, 'wb') as f:
-                            f.write(response.content)
-                        audio_downloaded = True
-                        break
-                    else:
-                        if retry == max_retries - 1:
-                            raise Exception(f"오디오 다운로드 실패 (HTTP {response.status_code})")
-                except requests.exceptions.RequestException as e:
-                    if retry == max_retries - 1:
-                        raise Exception(f"오디오 다운로드 오류: {str(e)}")
-                    import time
-                    time.sleep(1)
+        audio_downloaded = False
+        for retry in range(3):
+            if fetch_media(audio_url, audio_path, base_dir=os.path.dirname(__file__), timeout=60, label="오디오"):
+                audio_downloaded = True
+                break
+            if not audio_url.startswith('http'):
+                break
+            time.sleep(1)
 
-            if not audio_downloaded:
-                raise Exception("오디오를 다운로드할 수 없습니다.")
+        if not audio_downloaded:
+            raise Exception(f"오디오를 가져올 수 없습니다: {audio_url[:100]}")
 
         update_progress(40, "영상 인코딩 준비 중...")
 
@@ -5235,13 +5571,16 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
         # FFmpeg 실행 (타임아웃 30분 - 10분 이상 영상 지원)
         # 메모리 최적화: stdout DEVNULL, stderr만 PIPE (OOM 방지 - 30분 인코딩 시 수백MB 출력 가능)
+        # 렌더 스케줄러 입장 후 실행 (다른 영상 작업과 메모리 공유)
+        encode_estimate = estimate_ffmpeg_memory_mb(width, height, duration=audio_duration)
         try:
-            process = subprocess.run(
-                ffmpeg_cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                timeout=1800
-            )
+            with get_render_scheduler().admit(encode_estimate, label="이미지 슬라이드 인코딩"):
+                process = subprocess.run(
+                    ffmpeg_cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=1800
+                )
         except subprocess.TimeoutExpired:
             print(f"[DRAMA-STEP6-VIDEO][ERROR] FFmpeg 타임아웃 (30분)")
             raise Exception("영상 인코딩 시간 초과 (30분). 이미지 수를 줄이거나 해상도를 낮춰주세요.")
@@ -5284,30 +5623,17 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         file_size = os.path.getsize(final_video_path)
         file_size_mb = file_size / (1024 * 1024)
 
-        # 메모리 최적화: Base64 인코딩 제한을 10MB로 낮춤 (2GB 환경)
-        # 10MB 영상 + Base64 오버헤드(33%) = ~13MB 메모리 사용
         video_url = f"/static/videos/{video_filename}"
-        if file_size_mb <= 10:
-            with open(final_video_path, 'rb') as f:
-                video_data = f.read()
-            video_base64 = base64.b64encode(video_data).decode('utf-8')
-            video_url_base64 = f"data:video/mp4;base64,{video_base64}"
-            # 즉시 메모리 해제
-            del video_data
-            del video_base64
-            gc.collect()
-        else:
-            video_url_base64 = None
 
         print(f"[DRAMA-STEP6-VIDEO] 영상 생성 완료 - 크기: {file_size_mb:.2f}MB, 길이: {audio_duration:.1f}초, 파일: {video_filename}")
 
         # 메모리 정리
         gc.collect()
 
-        # 결과를 dict로 반환 (jsonify 대신)
+        # 결과를 dict로 반환 (jsonify 대신) - 파일 참조만 저장 (base64 인라인 없음)
         return {
             "ok": True,
-            "videoUrl": video_url_base64 if video_url_base64 else video_url,
+            "videoUrl": video_url,
             "videoFileUrl": video_url,
             "duration": audio_duration,
             "fileSize": file_size,
@@ -5648,6 +5974,11 @@ def api_generate_video():
         # Job ID 생성
         job_id = str(uuid.uuid4())
 
+        # data URL은 파일로 빼내고 참조만 유지 (큐/작업 JSON에 base64가 남지 않도록)
+        images, audio_url = _spool_job_media(job_id, cuts=cuts, images=images, audio_url=audio_url)
+        if cuts:
+            images = [cut.get('imageUrl', '') for cut in cuts]
+
         # ===== 동기 모드: 직접 처리하고 결과 반환 =====
         if sync_mode:
             print(f"[DRAMA-STEP6-VIDEO] 동기식 영상 생성 시작: {job_id}")
@@ -5660,9 +5991,10 @@ def api_generate_video():
                     'message': '영상 생성 시작...',
                     'result': None,
                     'error': None,
-                    'created_at': dt.now().isoformat()
+                    'created_at': dt.now().isoformat(),
+                    'pid': os.getpid()  # 작업을 처리하는 워커 프로세스 (다른 워커는 저널에서 조회)
                 }
-                save_video_jobs()
+                save_video_jobs(job_id)
 
             try:
                 # 직접 영상 생성 실행
@@ -5684,7 +6016,7 @@ def api_generate_video():
                         video_jobs[job_id]['status'] = 'completed'
                         video_jobs[job_id]['progress'] = 100
                         video_jobs[job_id]['result'] = result
-                        save_video_jobs()
+                        save_video_jobs(job_id)
 
                 print(f"[DRAMA-STEP6-VIDEO] 동기식 영상 생성 완료: {job_id}")
                 return jsonify({
@@ -5709,7 +6041,7 @@ def api_generate_video():
                     if job_id in video_jobs:
                         video_jobs[job_id]['status'] = 'failed'
                         video_jobs[job_id]['error'] = error_msg
-                        save_video_jobs()
+                        save_video_jobs(job_id)
 
                 return jsonify({
                     "ok": False,
@@ -5717,6 +6049,8 @@ def api_generate_video():
                     "status": "failed",
                     "error": error_msg
                 })
+            finally:
+                _cleanup_job_media(job_id)
 
         # ===== 비동기 모드: 워커 큐 사용 =====
         print(f"[DRAMA-STEP6-VIDEO] 비동기 영상 생성 작업 등록: {job_id}, 이미지: {len(images)}개, cuts: {len(cuts)}개")
@@ -5729,9 +6063,10 @@ def api_generate_video():
                 'message': '작업 대기 중...',
                 'result': None,
                 'error': None,
-                'created_at': dt.now().isoformat()
+                'created_at': dt.now().isoformat(),
+                'pid': os.getpid()
             }
-            save_video_jobs()
+            save_video_jobs(job_id)
 
         # 작업을 큐에 추가 (백그라운드 워커가 처리)
         job_data = {
@@ -5755,7 +6090,7 @@ def api_generate_video():
             "jobId": job_id,
             "status": "pending",
             "progress": 0,
-            "workerAlive": video_worker_thread.is_alive(),
+            "workerAlive": background_workers.is_alive('video_worker'),
             "message": "영상 생성 작업이 시작되었습니다. 상태를 확인해주세요."
         })
 
@@ -5823,9 +6158,10 @@ def api_generate_video_stream():
                         'message': '영상 생성 시작...',
                         'result': None,
                         'error': None,
-                        'created_at': dt.now().isoformat()
+                        'created_at': dt.now().isoformat(),
+                        'pid': os.getpid()
                     }
-                    save_video_jobs()
+                    save_video_jobs(job_id)
 
                 yield f"data: {json.dumps({'event': 'progress', 'progress': 5, 'message': '의존성 확인 중...'})}\n\n"
 
@@ -5887,7 +6223,7 @@ def api_generate_video_stream():
                         if job_id in video_jobs:
                             video_jobs[job_id]['status'] = 'failed'
                             video_jobs[job_id]['error'] = result_holder['error']
-                            save_video_jobs()
+                            save_video_jobs(job_id)
 
                     yield f"data: {json.dumps({'event': 'error', 'error': result_holder['error']})}\n\n"
 
@@ -5899,7 +6235,7 @@ def api_generate_video_stream():
                             video_jobs[job_id]['status'] = 'completed'
                             video_jobs[job_id]['progress'] = 100
                             video_jobs[job_id]['result'] = result
-                            save_video_jobs()
+                            save_video_jobs(job_id)
 
                     yield f"data: {json.dumps({'event': 'complete', 'progress': 100, 'videoUrl': result.get('videoUrl'), 'videoPath': result.get('videoFileUrl'), 'duration': result.get('duration'), 'fileSize': result.get('fileSize')})}\n\n"
 
@@ -5929,21 +6265,34 @@ def api_generate_video_stream():
 
 
 # ===== 작업 상태 조회 API =====
+def _pid_alive(pid):
+    """같은 호스트에 pid 프로세스가 살아 있는지 (signal 0)"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _pending_job_stalled(job):
+    """pending 작업을 타임아웃으로 실패 처리해도 되는지
+
+    작업을 받은 워커 프로세스만 판단한다 (다른 워커는 그 프로세스의 큐 상태를 모름).
+    소유 프로세스가 없으면(재시작/종료) 아무 워커나 실패 처리.
+    """
+    owner_pid = job.get('pid')
+    if owner_pid == os.getpid():
+        # 워커가 다른 작업을 처리 중이면 큐에서 순서를 기다리는 중
+        return not (background_workers.is_alive('video_worker') and video_worker_busy.is_set())
+    return not owner_pid or not _pid_alive(owner_pid)
+
 @app.route('/api/drama/video-status/<job_id>', methods=['GET'])
 def api_video_status(job_id):
     """영상 생성 작업 상태 조회"""
     with video_jobs_lock:
-        # 메모리에 없으면 파일에서 다시 로드 시도 (다중 인스턴스/재시작 대응)
-        if job_id not in video_jobs:
-            print(f"[VIDEO-STATUS] job_id {job_id} 메모리에 없음, 파일에서 로드 시도...")
-            try:
-                if os.path.exists(VIDEO_JOBS_FILE):
-                    with open(VIDEO_JOBS_FILE, 'r', encoding='utf-8') as f:
-                        loaded_jobs = json.load(f)
-                        video_jobs.update(loaded_jobs)
-                        print(f"[VIDEO-STATUS] 파일에서 {len(loaded_jobs)}개 작업 로드됨")
-            except Exception as e:
-                print(f"[VIDEO-STATUS] 파일 로드 실패: {e}")
+        # 메모리에 없거나 다른 워커 프로세스의 작업이면 저널에서 최신 상태 조회 (다중 워커/재시작 대응)
+        _refresh_video_job(job_id)
 
         if job_id not in video_jobs:
             print(f"[VIDEO-STATUS] job_id {job_id} 여전히 찾을 수 없음")
@@ -5955,35 +6304,97 @@ def api_video_status(job_id):
         if job['status'] == 'pending':
             created_at = dt.fromisoformat(job['created_at'])
             elapsed = (dt.now() - created_at).total_seconds()
-            if elapsed > 300:  # 5분 = 300초
+            if elapsed > 300 and _pending_job_stalled(job):  # 5분 = 300초
                 job['status'] = 'failed'
                 job['error'] = f'작업 처리 시간 초과 (워커 상태 확인 필요). 경과 시간: {int(elapsed)}초'
-                save_video_jobs()
+                save_video_jobs(job_id)
                 print(f"[VIDEO-STATUS] 작업 {job_id} pending 타임아웃으로 실패 처리")
 
-        response = {
-            "ok": True,
-            "jobId": job_id,
-            "status": job['status'],  # pending, processing, completed, failed
-            "progress": job['progress'],
-            "message": job.get('message', ''),
-            "workerAlive": True  # 동기식으로 변경됨 - 항상 True
-        }
+        response = _drama_job_progress(job_id, job)
+        response['workerAlive'] = True  # 동기식으로 변경됨 - 항상 True
+        if job['status'] == 'completed':
+            response['result'] = job['result']  # 기존 호환성 유지
+
+        return jsonify(response)
+
+
+# ===== 작업 진행 상황 푸시 API (SSE / long-poll) =====
+# 드라마(video_jobs)와 Image Lab(_save_job_status) 작업 모두 같은 job_id 공간에서 조회
+def _lookup_job_progress(job_id):
+    """진행 버스에 없는 작업의 현재 상태를 저장소에서 조회 (없으면 None)"""
+    with video_jobs_lock:
+        job = _refresh_video_job(job_id)
+        if job is not None:
+            return _drama_job_progress(job_id, job)
+    job = _load_job_status(job_id)
+    if job is not None:
+        return _image_job_progress(job_id, job)
+    return None
+
 
-        if job['status'] == 'completed':
-            result = job['result']
-            # 프론트엔드 호환성을 위해 result 내용을 최상위로 펼침
-            if result:
-                response['videoUrl'] = result.get('videoUrl')
-                response['videoFileUrl'] = result.get('videoFileUrl')
-                response['duration'] = result.get('duration')
-                response['fileSize'] = result.get('fileSize')
-                response['fileSizeMB'] = result.get('fileSizeMB')
-            response['result'] = result  # 기존 호환성 유지
-        elif job['status'] == 'failed':
-            response['error'] = job['error']
+def job_wait_service(job_id: str, since: int = -1,
+                     timeout: float = JOB_WAIT_MAX_SECONDS) -> Tuple[Dict[str, Any], int]:
+    """작업 상태 long-poll
 
-        return jsonify(response)
+    since(마지막으로 받은 version)보다 새 상태가 생기면 즉시 반환, 없으면 timeout초 후 현재 상태 반환.
+    since가 -1이면 현재 상태를 바로 반환. 반환값의 version을 다음 호출의 since로 사용.
+    """
+    timeout = min(max(timeout, 0), JOB_WAIT_MAX_SECONDS)
+
+    version, state = job_progress_bus.get(job_id)
+    if state is None:
+        # 버스에 없음 (재시작 전 작업 등) → 저장소 상태를 version 0으로 응답
+        state = _lookup_job_progress(job_id)
+        if state is None:
+            return {"ok": False, "error": "작업을 찾을 수 없습니다"}, 404
+        if since < 0 or state.get('status') in ('completed', 'failed'):
+            return dict(state, version=0), 200
+        # 이 프로세스에서 publish되지 않는 작업일 수 있으므로 짧게만 대기 후 저장소 재조회
+        version, bus_state = job_progress_bus.wait(job_id, since=0, timeout=min(timeout, 5))
+        state = bus_state or _lookup_job_progress(job_id) or state
+        return dict(state, version=version), 200
+
+    if version <= since:
+        version, state = job_progress_bus.wait(job_id, since=since, timeout=timeout)
+    return dict(state, version=version), 200
+
+
+@app.route('/api/jobs/<job_id>/wait', methods=['GET'])
+def api_job_wait(job_id):
+    """GET /api/jobs/<job_id>/wait?since=N - job_wait_service() HTTP 래퍼"""
+    result, status = job_wait_service(
+        job_id,
+        since=request.args.get('since', -1, type=int),
+        timeout=request.args.get('timeout', JOB_WAIT_MAX_SECONDS, type=float),
+    )
+    return jsonify(result), status
+
+
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+def api_job_events(job_id):
+    """작업 상태 SSE 스트림 (event: progress, 완료/실패 시 스트림 종료)"""
+    initial = None
+    version, state = job_progress_bus.get(job_id)
+    if state is None:
+        initial = _lookup_job_progress(job_id)
+        if initial is None:
+            return jsonify({"ok": False, "error": "작업을 찾을 수 없습니다"}), 404
+
+    since = request.headers.get('Last-Event-ID', type=int) or 0
+
+    return Response(
+        # 다른 워커 프로세스가 처리하는 작업은 이 프로세스 버스로 publish되지 않으므로 저장소를 주기적으로 재조회
+        job_progress_bus.stream(job_id, since=since, initial=initial,
+                                max_seconds=JOB_EVENTS_MAX_SECONDS,
+                                fallback=lambda: _lookup_job_progress(job_id),
+                                poll_interval=JOB_EVENTS_POLL_SECONDS),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'Connection': 'keep-alive',
+            'X-Accel-Buffering': 'no'  # nginx 버퍼링 비활성화
+        }
+    )
 
 
 # ===== 워커 상태 디버깅 API =====
@@ -6001,7 +6412,18 @@ def api_worker_status():
         "queueSize": 0,  # 동기식이므로 큐 없음
         "pendingJobs": pending_jobs,
         "processingJobs": processing_jobs,
-        "totalJobs": len(video_jobs)
+        "totalJobs": len(video_jobs),
+        "clipCache": get_clip_cache().stats(),
+        "ttsCache": get_tts_cache().stats(),
+        "renderScheduler": get_render_scheduler().stats(),
+        "dbPool": _get_db_pool().stats(),
+        "progressBus": job_progress_bus.stats(),
+        "backgroundWorkers": background_workers.stats(),
+        "startup": startup_profile.report(),
+        "leases": {
+            "pipeline": pipeline_lock.holder(),
+            "renderFloor": render_floor_lease.holder(),
+        }
     })
 
 
@@ -7011,26 +7433,12 @@ def upload_youtube():
                 'status': status_data
             }
 
-            # 업로드 실행
-            media = MediaFileUpload(
-                video_path,
-                mimetype='video/mp4',
-                resumable=True,
-                chunksize=1024*1024  # 1MB chunks
-            )
-
-            insert_request = youtube.videos().insert(
-                part='snippet,status',
-                body=body,
-                media_body=media
+            # 업로드 실행 (적응형 청크, 전송 오류 시 같은 세션으로 재시도)
+            response = upload_video_resumable(
+                youtube, body, video_path,
+                scope=f"{channel_id or 'default'}|"
             )
 
-            response = None
-            while response is None:
-                status, response = insert_request.next_chunk()
-                if status:
-                    print(f"[YOUTUBE-UPLOAD] 업로드 진행률: {int(status.progress() * 100)}%")
-
             video_id = response['id']
             video_url = f"https://www.youtube.com/watch?v={video_id}"
 
@@ -7948,15 +8356,12 @@ def api_youtube_auth_page():
         """
 
 
-@app.route('/api/youtube/upload', methods=['POST'])
-def youtube_upload():
+def youtube_upload_service(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
     """
     YouTube 업로드 API.
     OAuth가 설정되어 있으면 실제 업로드, 아니면 테스트 모드로 동작
     """
     try:
-        data = request.get_json() or {}
-
         video_path = data.get('videoPath', '')
         title = data.get('title', '제목 없음')
         description = data.get('description', '')
@@ -7968,6 +8373,8 @@ def youtube_upload():
         channel_id = data.get('channelId')  # 선택된 채널 ID
         playlist_id = data.get('playlistId')  # 플레이리스트 ID (선택)
         project_suffix_param = data.get('projectSuffix', None)  # 파이프라인에서 전달된 프로젝트 접미사
+        srt_path = data.get('srtPath')  # 자막 파일 (있으면 영상 업로드 후 captions.insert)
+        caption_language = data.get('captionLanguage', 'ko')
 
         print(f"[YOUTUBE-UPLOAD] 업로드 요청 수신")
         print(f"  - 영상: {video_path}")
@@ -7989,10 +8396,10 @@ def youtube_upload():
 
             if not os.path.exists(full_path):
                 print(f"[YOUTUBE-UPLOAD][WARN] 영상 파일 없음: {full_path}")
-                return jsonify({
+                return {
                     "ok": False,
                     "error": f"영상 파일을 찾을 수 없습니다: {video_path}"
-                }), 200
+                }, 200
 
             # 영상 파일 유효성 검사 (강화된 검증)
             try:
@@ -8009,10 +8416,10 @@ def youtube_upload():
                 if probe_result.returncode != 0:
                     print(f"[YOUTUBE-UPLOAD][ERROR] 손상된 영상 파일: {full_path}")
                     print(f"[YOUTUBE-UPLOAD][ERROR] ffprobe stderr: {probe_result.stderr[:500]}")
-                    return jsonify({
+                    return {
                         "ok": False,
                         "error": f"손상된 영상 파일입니다. FFmpeg 인코딩 오류가 발생했을 수 있습니다."
-                    }), 200
+                    }, 200
 
                 probe_data = json_module.loads(probe_result.stdout)
                 video_duration = float(probe_data.get('format', {}).get('duration', 0))
@@ -8036,39 +8443,39 @@ def youtube_upload():
                 # 파일 크기 최소값 검사 (100KB 미만은 손상 가능성)
                 if video_size < 100 * 1024:
                     print(f"[YOUTUBE-UPLOAD][ERROR] 파일 크기가 너무 작음: {video_size/1024:.1f}KB")
-                    return jsonify({
+                    return {
                         "ok": False,
                         "error": f"영상 파일 크기가 너무 작습니다 ({video_size/1024:.1f}KB). 인코딩이 실패했을 수 있습니다."
-                    }), 200
+                    }, 200
 
                 if video_duration < 1:
                     print(f"[YOUTUBE-UPLOAD][ERROR] 영상 길이가 너무 짧음: {video_duration}초")
-                    return jsonify({
+                    return {
                         "ok": False,
                         "error": f"영상 길이가 너무 짧습니다 ({video_duration:.1f}초). 인코딩 오류가 발생했을 수 있습니다."
-                    }), 200
+                    }, 200
 
                 if not has_video:
                     print(f"[YOUTUBE-UPLOAD][ERROR] 비디오 스트림 없음")
-                    return jsonify({
+                    return {
                         "ok": False,
                         "error": "영상에 비디오 스트림이 없습니다. 인코딩 오류가 발생했을 수 있습니다."
-                    }), 200
+                    }, 200
 
                 if not has_audio:
                     print(f"[YOUTUBE-UPLOAD][ERROR] 오디오 스트림 없음")
-                    return jsonify({
+                    return {
                         "ok": False,
                         "error": "영상에 오디오 스트림이 없습니다. YouTube 업로드에는 오디오가 필요합니다."
-                    }), 200
+                    }, 200
 
                 # 해상도 검사 (너무 작거나 0이면 문제)
                 if video_width < 100 or video_height < 100:
                     print(f"[YOUTUBE-UPLOAD][ERROR] 비정상 해상도: {video_width}x{video_height}")
-                    return jsonify({
+                    return {
                         "ok": False,
                         "error": f"영상 해상도가 비정상입니다 ({video_width}x{video_height}). 인코딩 오류가 발생했을 수 있습니다."
-                    }), 200
+                    }, 200
 
                 # 2단계: 실제 프레임 디코딩 테스트 (ffmpeg로 첫 1초 읽기)
                 print(f"[YOUTUBE-UPLOAD] 프레임 디코딩 테스트 시작...")
@@ -8082,27 +8489,27 @@ def youtube_upload():
                 if decode_result.returncode != 0:
                     print(f"[YOUTUBE-UPLOAD][ERROR] 프레임 디코딩 실패")
                     print(f"[YOUTUBE-UPLOAD][ERROR] ffmpeg stderr: {decode_result.stderr[:500]}")
-                    return jsonify({
+                    return {
                         "ok": False,
                         "error": f"영상 프레임 디코딩에 실패했습니다. 파일이 손상되었을 수 있습니다."
-                    }), 200
+                    }, 200
 
                 print(f"[YOUTUBE-UPLOAD] 영상 검증 통과!")
 
             except subprocess.TimeoutExpired:
                 print(f"[YOUTUBE-UPLOAD][ERROR] 영상 검증 타임아웃")
-                return jsonify({
+                return {
                     "ok": False,
                     "error": "영상 파일 검증 타임아웃. 파일이 손상되었을 수 있습니다."
-                }), 200
+                }, 200
             except Exception as e:
                 print(f"[YOUTUBE-UPLOAD][ERROR] 영상 검증 실패: {e}")
                 import traceback
                 traceback.print_exc()
-                return jsonify({
+                return {
                     "ok": False,
                     "error": f"영상 파일 검증 중 오류 발생: {str(e)}"
-                }), 200
+                }, 200
         else:
             full_path = video_path
 
@@ -8159,12 +8566,12 @@ def youtube_upload():
                     if attempt_idx < len(projects_to_try) - 1:
                         print(f"[YOUTUBE-UPLOAD] 다음 프로젝트({projects_to_try[attempt_idx + 1]})로 시도...")
                         continue
-                    return jsonify({
+                    return {
                         "ok": False,
                         "error": f"YouTube 토큰이 없습니다. 해당 채널({channel_id})로 OAuth 로그인이 필요합니다. (project: {project_suffix or '기본'})",
                         "needsAuth": True,
                         "channelId": channel_id
-                    }), 200
+                    }, 200
 
                 # Credentials 객체 생성 (프로젝트에 맞는 client_id/secret 사용)
                 if project_suffix == "_2":
@@ -8226,25 +8633,12 @@ def youtube_upload():
                     body['status']['privacyStatus'] = 'private'  # 예약 시 반드시 비공개
                     print(f"[YOUTUBE-UPLOAD] 예약 공개 설정: {publish_at}")
 
-                media = MediaFileUpload(
-                    full_path,
-                    mimetype='video/mp4',
-                    resumable=True,
-                    chunksize=1024*1024  # 1MB chunks
-                )
-
-                request_obj = youtube.videos().insert(
-                    part='snippet,status',
-                    body=body,
-                    media_body=media
+                # 재개 가능 업로드 (세션 URI/위치 저장 → 재시작 후 이어 올림, 적응형 청크)
+                response = upload_video_resumable(
+                    youtube, body, full_path,
+                    scope=f"{channel_id or 'default'}|{project_suffix or ''}"
                 )
 
-                response = None
-                while response is None:
-                    status, response = request_obj.next_chunk()
-                    if status:
-                        print(f"[YOUTUBE-UPLOAD] 진행률: {int(status.progress() * 100)}%")
-
                 video_id = response.get('id')
                 video_url = f"https://www.youtube.com/watch?v={video_id}"
 
@@ -8268,52 +8662,51 @@ def youtube_upload():
 
                         if rejection_reason:
                             print(f"[YOUTUBE-UPLOAD][ERROR] 거부됨: {rejection_reason}")
-                            return jsonify({
+                            return {
                                 "ok": False,
                                 "error": f"YouTube가 영상을 거부했습니다: {rejection_reason}"
-                            }), 200
+                            }, 200
 
                         if failure_reason:
                             print(f"[YOUTUBE-UPLOAD][ERROR] 실패: {failure_reason}")
-                            return jsonify({
+                            return {
                                 "ok": False,
                                 "error": f"YouTube 처리 실패: {failure_reason}"
-                            }), 200
+                            }, 200
 
                         if upload_status == 'rejected':
                             print(f"[YOUTUBE-UPLOAD][ERROR] 영상이 거부됨")
-                            return jsonify({
+                            return {
                                 "ok": False,
                                 "error": "YouTube가 영상을 거부했습니다. 영상 형식을 확인해주세요."
-                            }), 200
+                            }, 200
 
                         if upload_status == 'failed':
                             print(f"[YOUTUBE-UPLOAD][ERROR] 업로드 실패 상태")
-                            return jsonify({
+                            return {
                                 "ok": False,
                                 "error": "YouTube 업로드가 실패했습니다. 영상 파일을 확인해주세요."
-                            }), 200
+                            }, 200
                     else:
                         print(f"[YOUTUBE-UPLOAD][ERROR] 영상 정보 조회 실패 - items 없음 (video_id: {video_id})")
                         print(f"[YOUTUBE-UPLOAD][ERROR] YouTube가 업로드 직후 영상을 삭제했을 수 있습니다.")
-                        return jsonify({
+                        return {
                             "ok": False,
                             "error": f"YouTube 업로드 후 영상 확인 실패. 영상이 정책 위반으로 즉시 삭제되었을 수 있습니다. (video_id: {video_id})"
-                        }), 200
+                        }, 200
                 except Exception as check_error:
                     print(f"[YOUTUBE-UPLOAD][ERROR] 상태 확인 실패: {check_error}")
                     import traceback
                     traceback.print_exc()
-                    return jsonify({
+                    return {
                         "ok": False,
                         "error": f"YouTube 업로드 후 상태 확인 실패: {str(check_error)}"
-                    }), 200
+                    }, 200
 
                 print(f"[YOUTUBE-UPLOAD] 업로드 성공: {video_url}")
 
-                # 썸네일 업로드 (썸네일 경로가 있는 경우)
-                thumbnail_uploaded = False
-                if thumbnail_path:
+                # 썸네일/자막 업로드 (video ID가 나온 뒤 병렬 실행, 스레드마다 별도 클라이언트)
+                def upload_thumbnail_task():
                     try:
                         # 썸네일 전체 경로 처리
                         # 1. 절대 경로면 그대로 사용
@@ -8332,132 +8725,156 @@ def youtube_upload():
                         print(f"[YOUTUBE-UPLOAD] 썸네일 경로: {thumbnail_path} → {thumb_full_path}")
 
                         # 파일 존재 확인
-                        if os.path.exists(thumb_full_path):
-                            print(f"[YOUTUBE-UPLOAD] 썸네일 업로드 시작: {thumb_full_path}")
-
-                            # 썸네일 MIME 타입 결정
-                            thumb_ext = os.path.splitext(thumb_full_path)[1].lower()
-                            thumb_mime = {
-                                '.jpg': 'image/jpeg',
-                                '.jpeg': 'image/jpeg',
-                                '.png': 'image/png',
-                                '.gif': 'image/gif'
-                            }.get(thumb_ext, 'image/jpeg')
-
-                            thumb_media = MediaFileUpload(
-                                thumb_full_path,
-                                mimetype=thumb_mime,
-                                resumable=True
-                            )
-
-                            thumb_request = youtube.thumbnails().set(
-                                videoId=video_id,
-                                media_body=thumb_media
-                            )
-                            thumb_response = thumb_request.execute()
-                            thumbnail_uploaded = True
-                            print(f"[YOUTUBE-UPLOAD] 썸네일 업로드 성공!")
-                        else:
+                        if not os.path.exists(thumb_full_path):
                             print(f"[YOUTUBE-UPLOAD] 썸네일 파일 없음: {thumb_full_path}")
+                            return False
+
+                        print(f"[YOUTUBE-UPLOAD] 썸네일 업로드 시작: {thumb_full_path}")
+
+                        # 썸네일 MIME 타입 결정
+                        thumb_ext = os.path.splitext(thumb_full_path)[1].lower()
+                        thumb_mime = {
+                            '.jpg': 'image/jpeg',
+                            '.jpeg': 'image/jpeg',
+                            '.png': 'image/png',
+                            '.gif': 'image/gif'
+                        }.get(thumb_ext, 'image/jpeg')
+
+                        thumb_media = MediaFileUpload(
+                            thumb_full_path,
+                            mimetype=thumb_mime,
+                            resumable=True
+                        )
+
+                        thumb_youtube = build('youtube', 'v3', credentials=creds)
+                        thumb_youtube.thumbnails().set(
+                            videoId=video_id,
+                            media_body=thumb_media
+                        ).execute()
+                        print(f"[YOUTUBE-UPLOAD] 썸네일 업로드 성공!")
+                        return True
                     except Exception as thumb_error:
                         print(f"[YOUTUBE-UPLOAD] 썸네일 업로드 실패: {thumb_error}")
                         import traceback
                         traceback.print_exc()
+                        return False
 
-                # 플레이리스트에 영상 추가 (플레이리스트 ID가 있는 경우)
-                playlist_added = False
-                if playlist_id:
-                    try:
-                        print(f"[YOUTUBE-UPLOAD] 플레이리스트에 영상 추가 시작: {playlist_id}")
-                        playlist_request = youtube.playlistItems().insert(
-                            part="snippet",
-                            body={
-                                "snippet": {
-                                    "playlistId": playlist_id,
-                                    "resourceId": {
-                                        "kind": "youtube#video",
-                                        "videoId": video_id
-                                    }
-                                }
-                            }
+                post_upload_executor = ThreadPoolExecutor(max_workers=2)
+                thumbnail_future = None
+                captions_future = None
+                try:
+                    if thumbnail_path:
+                        thumbnail_future = post_upload_executor.submit(upload_thumbnail_task)
+                    if srt_path:
+                        captions_future = post_upload_executor.submit(
+                            _upload_youtube_captions, video_id, srt_path, caption_language, creds
                         )
-                        playlist_response = playlist_request.execute()
-                        playlist_added = True
-                        print(f"[YOUTUBE-UPLOAD] 플레이리스트 추가 성공! playlistItemId: {playlist_response.get('id')}")
-                    except Exception as playlist_error:
-                        print(f"[YOUTUBE-UPLOAD] 플레이리스트 추가 실패: {playlist_error}")
-                        import traceback
-                        traceback.print_exc()
-                        # 플레이리스트 추가 실패해도 업로드는 성공한 것으로 처리
-
-                # 첫 댓글 작성 (first_comment가 있는 경우)
-                first_comment = data.get('firstComment', '')
-                comment_posted = False
-                comment_id = ''
-                if first_comment:
-                    import time
-                    max_retries = 3
-                    retry_delays = [5, 10, 15]  # 5초, 10초, 15초 후 재시도
-
-                    for attempt in range(max_retries):
-                        try:
-                            if attempt > 0:
-                                print(f"[YOUTUBE-UPLOAD] 첫 댓글 재시도 {attempt + 1}/{max_retries} ({retry_delays[attempt]}초 대기 후)...")
-                                time.sleep(retry_delays[attempt])
-                            else:
-                                # 첫 시도 전 5초 대기 (영상 처리 시간 확보)
-                                print(f"[YOUTUBE-UPLOAD] 첫 댓글 작성 대기 중 (5초)...")
-                                time.sleep(5)
 
-                            print(f"[YOUTUBE-UPLOAD] 첫 댓글 작성 시도 {attempt + 1}: {first_comment[:50]}...")
-                            comment_request = youtube.commentThreads().insert(
+                    # 플레이리스트에 영상 추가 (플레이리스트 ID가 있는 경우)
+                    playlist_added = False
+                    if playlist_id:
+                        try:
+                            print(f"[YOUTUBE-UPLOAD] 플레이리스트에 영상 추가 시작: {playlist_id}")
+                            playlist_request = youtube.playlistItems().insert(
                                 part="snippet",
                                 body={
                                     "snippet": {
-                                        "videoId": video_id,
-                                        "topLevelComment": {
-                                            "snippet": {
-                                                "textOriginal": first_comment
-                                            }
+                                        "playlistId": playlist_id,
+                                        "resourceId": {
+                                            "kind": "youtube#video",
+                                            "videoId": video_id
                                         }
                                     }
                                 }
                             )
-                            comment_response = comment_request.execute()
-                            comment_posted = True
-                            comment_id = comment_response.get('id', '')
-                            print(f"[YOUTUBE-UPLOAD] 첫 댓글 작성 성공! commentId: {comment_id}")
-                            break  # 성공하면 루프 종료
-
-                        except Exception as comment_error:
-                            error_str = str(comment_error)
-                            print(f"[YOUTUBE-UPLOAD] 첫 댓글 작성 실패 (시도 {attempt + 1}/{max_retries}): {error_str}")
-
-                            # 상세 에러 분석
-                            if 'commentsDisabled' in error_str:
-                                print(f"[YOUTUBE-UPLOAD] 원인: 영상 댓글이 비활성화됨")
-                                break  # 재시도 불필요
-                            elif 'forbidden' in error_str.lower() or '403' in error_str:
-                                print(f"[YOUTUBE-UPLOAD] 원인: 권한 부족 (youtube.force-ssl scope 확인 필요)")
-                                break  # 재시도 불필요
-                            elif 'quotaExceeded' in error_str:
-                                print(f"[YOUTUBE-UPLOAD] 원인: API 할당량 초과")
-                                break  # 재시도 불필요
-                            elif 'videoNotFound' in error_str or 'notFound' in error_str.lower():
-                                print(f"[YOUTUBE-UPLOAD] 원인: 영상을 찾을 수 없음 (video_id: {video_id})")
-                                # 마지막 시도가 아니면 재시도
-                                if attempt < max_retries - 1:
-                                    continue
-                            else:
-                                # 알 수 없는 에러는 재시도
-                                if attempt < max_retries - 1:
-                                    continue
-
+                            playlist_response = playlist_request.execute()
+                            playlist_added = True
+                            print(f"[YOUTUBE-UPLOAD] 플레이리스트 추가 성공! playlistItemId: {playlist_response.get('id')}")
+                        except Exception as playlist_error:
+                            print(f"[YOUTUBE-UPLOAD] 플레이리스트 추가 실패: {playlist_error}")
                             import traceback
                             traceback.print_exc()
+                            # 플레이리스트 추가 실패해도 업로드는 성공한 것으로 처리
+
+                    # 첫 댓글 작성 (first_comment가 있는 경우)
+                    first_comment = data.get('firstComment', '')
+                    comment_posted = False
+                    comment_id = ''
+                    if first_comment:
+                        import time
+                        max_retries = 3
+                        retry_delays = [5, 10, 15]  # 5초, 10초, 15초 후 재시도
+
+                        for attempt in range(max_retries):
+                            try:
+                                if attempt > 0:
+                                    print(f"[YOUTUBE-UPLOAD] 첫 댓글 재시도 {attempt + 1}/{max_retries} ({retry_delays[attempt]}초 대기 후)...")
+                                    time.sleep(retry_delays[attempt])
+                                else:
+                                    # 첫 시도 전 5초 대기 (영상 처리 시간 확보)
+                                    print(f"[YOUTUBE-UPLOAD] 첫 댓글 작성 대기 중 (5초)...")
+                                    time.sleep(5)
 
-                    if not comment_posted:
-                        print(f"[YOUTUBE-UPLOAD] 첫 댓글 작성 최종 실패 (모든 재시도 소진)")
+                                print(f"[YOUTUBE-UPLOAD] 첫 댓글 작성 시도 {attempt + 1}: {first_comment[:50]}...")
+                                comment_request = youtube.commentThreads().insert(
+                                    part="snippet",
+                                    body={
+                                        "snippet": {
+                                            "videoId": video_id,
+                                            "topLevelComment": {
+                                                "snippet": {
+                                                    "textOriginal": first_comment
+                                                }
+                                            }
+                                        }
+                                    }
+                                )
+                                comment_response = comment_request.execute()
+                                comment_posted = True
+                                comment_id = comment_response.get('id', '')
+                                print(f"[YOUTUBE-UPLOAD] 첫 댓글 작성 성공! commentId: {comment_id}")
+                                break  # 성공하면 루프 종료
+
+                            except Exception as comment_error:
+                                error_str = str(comment_error)
+                                print(f"[YOUTUBE-UPLOAD] 첫 댓글 작성 실패 (시도 {attempt + 1}/{max_retries}): {error_str}")
+
+                                # 상세 에러 분석
+                                if 'commentsDisabled' in error_str:
+                                    print(f"[YOUTUBE-UPLOAD] 원인: 영상 댓글이 비활성화됨")
+                                    break  # 재시도 불필요
+                                elif 'forbidden' in error_str.lower() or '403' in error_str:
+                                    print(f"[YOUTUBE-UPLOAD] 원인: 권한 부족 (youtube.force-ssl scope 확인 필요)")
+                                    break  # 재시도 불필요
+                                elif 'quotaExceeded' in error_str:
+                                    print(f"[YOUTUBE-UPLOAD] 원인: API 할당량 초과")
+                                    break  # 재시도 불필요
+                                elif 'videoNotFound' in error_str or 'notFound' in error_str.lower():
+                                    print(f"[YOUTUBE-UPLOAD] 원인: 영상을 찾을 수 없음 (video_id: {video_id})")
+                                    # 마지막 시도가 아니면 재시도
+                                    if attempt < max_retries - 1:
+                                        continue
+                                else:
+                                    # 알 수 없는 에러는 재시도
+                                    if attempt < max_retries - 1:
+                                        continue
+
+                                import traceback
+                                traceback.print_exc()
+
+                        if not comment_posted:
+                            print(f"[YOUTUBE-UPLOAD] 첫 댓글 작성 최종 실패 (모든 재시도 소진)")
+
+                    # 썸네일/자막 업로드 결과 수집
+                    thumbnail_uploaded = thumbnail_future.result() if thumbnail_future else False
+                    captions_uploaded = captions_future.result() if captions_future else False
+                finally:
+                    # 플레이리스트/댓글 단계에서 예외가 나도 썸네일/자막 작업을 버리지 않음:
+                    # 시작 전이면 취소, 실행 중이면 끝날 때까지 기다린 뒤 예외를 로그로 남김
+                    post_upload_executor.shutdown(wait=True, cancel_futures=True)
+                    for task_name, task_future in (('썸네일', thumbnail_future), ('자막', captions_future)):
+                        if task_future is not None and not task_future.cancelled() and task_future.exception():
+                            print(f"[YOUTUBE-UPLOAD] {task_name} 업로드 작업 오류: {task_future.exception()}")
 
                 # 메시지 생성
                 upload_message = "YouTube 업로드 완료!"
@@ -8467,14 +8884,17 @@ def youtube_upload():
                     upload_message += " (플레이리스트 추가됨)"
                 if comment_posted:
                     upload_message += " (첫 댓글 게시됨)"
+                if captions_uploaded:
+                    upload_message += " (자막 포함)"
 
-                return jsonify({
+                return {
                     "ok": True,
                     "mode": "live",
                     "videoId": video_id,
                     "videoUrl": video_url,
                     "status": "uploaded",
                     "thumbnailUploaded": thumbnail_uploaded,
+                    "captionsUploaded": captions_uploaded,
                     "playlistAdded": playlist_added,
                     "playlistId": playlist_id if playlist_added else None,
                     "commentPosted": comment_posted,
@@ -8483,15 +8903,15 @@ def youtube_upload():
                         "title": title,
                         "privacyStatus": privacy_status
                     }
-                })
+                }, 200
 
             except ImportError as e:
                 print(f"[YOUTUBE-UPLOAD] 라이브러리 없음: {e}")
-                return jsonify({
+                return {
                     "ok": False,
                     "error": f"필수 라이브러리 없음: {str(e)}",
                     "needsAuth": False
-                }), 200
+                }, 200
             except Exception as upload_error:
                 error_str = str(upload_error).lower()
                 print(f"[YOUTUBE-UPLOAD] 업로드 오류 (프로젝트: {project_suffix or '기본'}): {upload_error}")
@@ -8511,42 +8931,49 @@ def youtube_upload():
                     else:
                         # 모든 프로젝트 소진
                         print(f"[YOUTUBE-UPLOAD] 모든 프로젝트({projects_to_try})에서 할당량 초과!")
-                        return jsonify({
+                        return {
                             "ok": False,
                             "error": f"YouTube API 할당량 초과. 모든 프로젝트({', '.join(p or '기본' for p in projects_to_try)})에서 할당량이 초과되었습니다. 내일 다시 시도해주세요.",
                             "quotaExceeded": True,
                             "needsAuth": False
-                        }), 200
+                        }, 200
 
                 # 할당량 초과가 아닌 다른 오류
-                return jsonify({
+                return {
                     "ok": False,
                     "error": f"업로드 중 오류 발생: {str(upload_error)}",
                     "needsAuth": False
-                }), 200
+                }, 200
 
         # for 루프가 break 없이 끝남 - 정상적으로는 도달 불가
         print(f"[YOUTUBE-UPLOAD][WARN] 예상치 못한 코드 경로 - 모든 시도 완료")
         if last_error:
-            return jsonify({
+            return {
                 "ok": False,
                 "error": f"업로드 실패: {str(last_error)}",
                 "needsAuth": False
-            }), 200
-        return jsonify({
+            }, 200
+        return {
             "ok": False,
             "error": "예상치 못한 코드 경로입니다. 서버 로그를 확인해주세요.",
             "metadata": {
                 "title": title,
                 "privacyStatus": privacy_status
             }
-        })
+        }, 200
 
     except Exception as e:
         print(f"[YOUTUBE-UPLOAD][ERROR] {str(e)}")
         import traceback
         traceback.print_exc()
-        return jsonify({"ok": False, "error": str(e)}), 200
+        return {"ok": False, "error": str(e)}, 200
+
+
+@app.route('/api/youtube/upload', methods=['POST'])
+def youtube_upload():
+    """POST /api/youtube/upload - youtube_upload_service() HTTP 래퍼"""
+    result, status = youtube_upload_service(request.get_json(silent=True) or {})
+    return jsonify(result), status
 
 
 @app.route('/api/drama/generate-thumbnails', methods=['POST'])
@@ -8977,8 +9404,7 @@ def _analyze_seo_keywords(script, lang='ko'):
         return None
 
 
-@app.route('/api/image/analyze-script', methods=['POST'])
-def api_image_analyze_script():
+def image_analyze_script_service(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
     """이미지 제작용 대본 분석 - 씬 분리 + 썸네일/이미지 프롬프트 생성"""
     try:
         from openai import OpenAI
@@ -8991,7 +9417,6 @@ def api_image_analyze_script():
             write=60.0      # 쓰기 타임아웃 1분
         ))
 
-        data = request.get_json()
         script = data.get('script', '')
         content_type = data.get('content_type', 'drama')
         image_style = data.get('image_style', 'realistic')
@@ -9031,7 +9456,7 @@ def api_image_analyze_script():
             print(f"[IMAGE-ANALYZE] ★ Using category-specific style: {category_style['name']}")
 
         if not script:
-            return jsonify({"ok": False, "error": "대본이 필요합니다"}), 400
+            return {"ok": False, "error": "대본이 필요합니다"}, 400
 
         # ★ SEO 키워드 분석 (YouTube 상위 영상 분석)
         seo_data = _analyze_seo_keywords(script, output_language)
@@ -9040,11 +9465,11 @@ def api_image_analyze_script():
             # 할당량 초과 감지 시 조기 중단
             if seo_data.get('quota_exceeded'):
                 print("[IMAGE-ANALYZE][ERROR] YouTube API 할당량 초과 - 파이프라인 중단")
-                return jsonify({
+                return {
                     "ok": False,
                     "error": "YouTube API 할당량 초과. 파이프라인을 중단합니다. 내일 다시 시도하세요.",
                     "quota_exceeded": True
-                }), 200
+                }, 200
             seo_prompt = seo_data.get('seo_prompt', '')
             print(f"[IMAGE-ANALYZE] SEO 분석 완료: {len(seo_data.get('keywords', []))}개 키워드, {len(seo_data.get('recommended_keywords', []))}개 추천 태그")
         else:
@@ -9613,7 +10038,7 @@ Rules:
         print(f"[IMAGE-ANALYZE] tags: {len(youtube_meta.get('tags', []))}개")
         print(f"[IMAGE-ANALYZE] pin_comment: {'있음' if youtube_meta.get('pin_comment') else '없음'}")
 
-        return jsonify({
+        return {
             "ok": True,
             "youtube": result.get("youtube", {}),
             "thumbnail": result.get("thumbnail", {}),
@@ -9626,13 +10051,20 @@ Rules:
                 "image_count": image_count,
                 "audience": audience
             }
-        })
+        }, 200
 
     except Exception as e:
         print(f"[IMAGE-ANALYZE][ERROR] {str(e)}")
         import traceback
         traceback.print_exc()
-        return jsonify({"ok": False, "error": str(e)}), 500
+        return {"ok": False, "error": str(e)}, 500
+
+
+@app.route('/api/image/analyze-script', methods=['POST'])
+def api_image_analyze_script():
+    """POST /api/image/analyze-script - image_analyze_script_service() HTTP 래퍼"""
+    result, status = image_analyze_script_service(request.get_json(silent=True) or {})
+    return jsonify(result), status
 
 
 @app.route('/api/image/download-zip', methods=['POST'])
@@ -9640,8 +10072,6 @@ def api_image_download_zip():
     """이미지들을 ZIP으로 묶어 다운로드"""
     try:
         import zipfile
-        import io
-        import urllib.request
 
         data = request.get_json()
         images = data.get('images', [])
@@ -9649,8 +10079,8 @@ def api_image_download_zip():
         if not images:
             return jsonify({"ok": False, "error": "다운로드할 이미지가 없습니다"}), 400
 
-        # ZIP 파일 생성
-        zip_buffer = io.BytesIO()
+        # ZIP 파일 생성 (임시 스풀 - 크면 디스크로 넘어감)
+        zip_buffer = new_zip_spool()
         with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
             for img in images:
                 try:
@@ -9658,17 +10088,13 @@ def api_image_download_zip():
                     url = img.get('url', '')
 
                     if url.startswith('http'):
-                        # 외부 URL에서 이미지 다운로드
-                        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-                        with urllib.request.urlopen(req, timeout=30) as response:
-                            img_data = response.read()
-                            zip_file.writestr(name, img_data)
+                        # 외부 URL에서 이미지 다운로드 (엔트리로 바로 스트리밍)
+                        zip_write_url(zip_file, url, name, timeout=30)
                     elif url.startswith('/'):
                         # 로컬 파일
                         local_path = url.lstrip('/')
                         if os.path.exists(local_path):
-                            with open(local_path, 'rb') as f:
-                                zip_file.writestr(name, f.read())
+                            zip_write_file(zip_file, local_path, name)
                 except Exception as e:
                     print(f"[IMAGE-ZIP] Failed to add {img.get('name')}: {e}")
                     continue
@@ -9689,8 +10115,7 @@ def api_image_download_zip():
         return jsonify({"ok": False, "error": str(e)}), 500
 
 
-@app.route('/api/image/generate-assets-zip', methods=['POST'])
-def api_image_generate_assets_zip():
+def image_generate_assets_zip_service(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
     """CapCut용 에셋 ZIP 생성 (이미지 + TTS 오디오 + SRT 자막) - 문장별 정확한 싱크"""
     try:
         import zipfile
@@ -9701,6 +10126,7 @@ def api_image_generate_assets_zip():
         import uuid
         import subprocess
         import gc  # 메모리 정리용
+        import shutil
         from datetime import datetime
 
         def detect_language(text):
@@ -10032,303 +10458,6 @@ def api_image_generate_assets_zip():
             # 폴백: MP3 128kbps 기준 추정 (16KB/초)
             return len(audio_bytes) / 16000
 
-        def convert_numbers_to_korean(text):
-            """숫자를 한글로 변환 (TTS 자연스러운 읽기용)
-
-            - 고유어 단위 (번, 개, 명, 살, 시, 마리, 잔, 병, 권, 대, 채, 장, 벌, 켤레, 그루, 송이):
-              15번 → 열다섯번, 3개 → 세개
-            - 한자어 단위 (원, 층, 년, 월, 일, 분, 초, 도, 호, 회, 배, km, m, kg, g):
-              200원 → 이백원, 15층 → 십오층
-            """
-            import re
-
-            # ★ 전처리: 쉼표가 포함된 숫자 처리 (1,350 → 1350)
-            # 숫자+쉼표+숫자 패턴에서 쉼표 제거 (천 단위 구분자)
-            text = re.sub(r'(\d),(\d{3})', r'\1\2', text)
-            # 연속된 쉼표 패턴도 처리 (1,234,567 → 1234567)
-            while re.search(r'(\d),(\d{3})', text):
-                text = re.sub(r'(\d),(\d{3})', r'\1\2', text)
-
-            # 고유어 숫자 (1~99)
-            native_units = ['번', '개', '명', '살', '시', '마리', '잔', '병', '권', '대', '채', '장', '벌', '켤레', '그루', '송이', '군데', '가지', '줄', '쌍']
-            native_ones = ['', '한', '두', '세', '네', '다섯', '여섯', '일곱', '여덟', '아홉']
-            native_tens = ['', '열', '스물', '서른', '마흔', '쉰', '예순', '일흔', '여든', '아흔']
-
-            def num_to_native(n):
-                """숫자를 고유어로 변환 (1~99)"""
-                if n <= 0 or n >= 100:
-                    return str(n)
-                tens = n // 10
-                ones = n % 10
-                return native_tens[tens] + native_ones[ones]
-
-            # 한자어 숫자
-            sino_digits = ['', '일', '이', '삼', '사', '오', '육', '칠', '팔', '구']
-
-            def num_to_sino(n):
-                """숫자를 한자어로 변환"""
-                if n == 0:
-                    return '영'
-                if n < 0:
-                    return '마이너스 ' + num_to_sino(-n)
-
-                result = ''
-
-                # 억 단위
-                if n >= 100000000:
-                    result += num_to_sino(n // 100000000) + '억'
-                    n %= 100000000
-
-                # 만 단위
-                if n >= 10000:
-                    man = n // 10000
-                    if man == 1:
-                        result += '만'
-                    else:
-                        result += num_to_sino(man) + '만'
-                    n %= 10000
-
-                # 천 단위
-                if n >= 1000:
-                    cheon = n // 1000
-                    if cheon == 1:
-                        result += '천'
-                    else:
-                        result += sino_digits[cheon] + '천'
-                    n %= 1000
-
-                # 백 단위
-                if n >= 100:
-                    baek = n // 100
-                    if baek == 1:
-                        result += '백'
-                    else:
-                        result += sino_digits[baek] + '백'
-                    n %= 100
-
-                # 십 단위
-                if n >= 10:
-                    sip = n // 10
-                    if sip == 1:
-                        result += '십'
-                    else:
-                        result += sino_digits[sip] + '십'
-                    n %= 10
-
-                # 일 단위
-                if n > 0:
-                    result += sino_digits[n]
-
-                return result
-
-            # ★ 성경 구절 패턴 (X장 Y절) - 한자어로 읽어야 함 (고유어 처리 전에!)
-            # 예: "4장 3절" → "사장 삼절", "5장 18절" → "오장 십팔절"
-            # 장(章, 챕터)은 한자어 단위이므로 한자어 수사 사용
-            def replace_bible_verse(match):
-                chapter = num_to_sino(int(match.group(1)))
-                verse = num_to_sino(int(match.group(2)))
-                return f"{chapter}장 {verse}절"
-            text = re.sub(r'(\d+)장\s*(\d+)절', replace_bible_verse, text)
-
-            # X장만 단독으로 사용된 경우도 한자어로 (문맥상 챕터를 의미할 때)
-            # "제1장", "1장에서" 등의 패턴
-            def replace_chapter_context(match):
-                prefix = match.group(1) or ''
-                chapter = num_to_sino(int(match.group(2)))
-                suffix = match.group(3)
-                return f"{prefix}{chapter}장{suffix}"
-            # 제X장, X장에서, X장을, X장의, X장은, X장이, X장과, X장부터, X장까지 등
-            text = re.sub(r'(제)?(\d+)장(에서|을|의|은|이|과|부터|까지|으로|에|도)', replace_chapter_context, text)
-
-            # ★ "개"로 시작하는 한자어 단위 (고유어 처리 전에 먼저!)
-            # "11개월" → "십일개월" (O), "열한개월" (X)
-            # "5개국" → "오개국" (O), "다섯개국" (X)
-            sino_ge_units = ['개월', '개국', '개사', '개년', '개소', '개항', '개교']
-            for unit in sino_ge_units:
-                pattern = r'(\d+)' + re.escape(unit)
-                def replace_sino_ge(match, u=unit):
-                    num = int(match.group(1))
-                    return num_to_sino(num) + u
-                text = re.sub(pattern, replace_sino_ge, text)
-
-            # 고유어 단위 패턴 (숫자 + 고유어단위)
-            for unit in native_units:
-                pattern = r'(\d+)' + re.escape(unit)
-                def replace_native(match, u=unit):
-                    num = int(match.group(1))
-                    if 1 <= num <= 99:
-                        return num_to_native(num) + u
-                    else:
-                        return num_to_sino(num) + u
-                text = re.sub(pattern, replace_native, text)
-
-            # ★★★ 소수점 패턴을 정수+단위 패턴보다 먼저 처리 (2024-12-20 수정) ★★★
-            # 0.75% → "영점칠오퍼센트" (O), "영점칠십오퍼센트" (X)
-            # 소수점 뒤의 숫자는 개별 자릿수로 읽어야 함
-
-            # 소수점 숫자 (7.5 → 칠점오, 3.14 → 삼점일사)
-            def convert_decimal(match):
-                integer_part = match.group(1)
-                decimal_part = match.group(2)
-                unit = match.group(3) if match.lastindex >= 3 else ''
-
-                # 정수 부분 변환
-                result = num_to_sino(int(integer_part)) + '점'
-
-                # 소수점 이하 각 자릿수 변환 (0.75 → 영점칠오)
-                decimal_digits = ['영', '일', '이', '삼', '사', '오', '육', '칠', '팔', '구']
-                for digit in decimal_part:
-                    result += decimal_digits[int(digit)]
-
-                # % → 퍼센트로 변환
-                if unit == '%':
-                    unit = '퍼센트'
-
-                return result + unit
-
-            # 소수점 + 단위 패턴 (7.5일, 3.5kg, 0.75% 등) - 정수+단위보다 먼저!
-            text = re.sub(r'(\d+)\.(\d+)(일|시간|분|초|km|m|kg|g|cm|mm|%|퍼센트|배|도|리터|L|ml)', convert_decimal, text)
-
-            # 단위 없는 소수점 (그냥 7.5 등)
-            text = re.sub(r'(\d+)\.(\d+)(?![가-힣a-zA-Z%])', lambda m: convert_decimal(m), text)
-
-            # 한자어 단위 패턴 (숫자 + 한자어단위) - 소수점 처리 후 남은 정수+단위
-            # ★ 복합 단위(조원, 억원 등)가 단순 단위(원)보다 먼저 와야 함
-            sino_units = [
-                # 큰 단위 복합어 (먼저 처리)
-                '조원', '억원', '만원', '천원', '백원',
-                '조달러', '억달러', '만달러',
-                '조엔', '억엔', '만엔',
-                # 큰 단위 단독
-                '조', '억', '만',
-                # 일반 단위
-                '원', '층', '년', '월', '일', '분', '초', '도', '호', '회', '배', '위', '등', '점',
-                '퍼센트', '%', 'km', 'm', 'kg', 'g', 'cm', 'mm', '원짜리', '달러', '엔', '유로',
-                # 주식/지수 단위
-                '선', '포인트', 'p', 'pt',
-                # ★ 추가 단위 (2025-12-23)
-                '세기', '차', '항', '기', '반', '판', '부', '편', '곡', '막', '절', '관',
-                '조', '장', '권', '쪽', '면', '페이지', '화', '회차', '라운드', '세트',
-                '번지', '동', '호실', '구', '로', '길',  # 주소
-                '교시', '학년', '학기',  # 학교
-                '대', '세대',  # 세대
-                '승', '패', '무',  # 스포츠
-            ]
-            for unit in sino_units:
-                pattern = r'(\d+)' + re.escape(unit)
-                def replace_sino(match, u=unit):
-                    num = int(match.group(1))
-                    converted = num_to_sino(num)
-                    # % → 퍼센트로 읽기
-                    if u == '%':
-                        u = '퍼센트'
-                    return converted + u
-                text = re.sub(pattern, replace_sino, text)
-
-            # 곱하기/나누기 표현
-            text = re.sub(r'(\d+)\s*[xX×]\s*(\d+)', lambda m: num_to_sino(int(m.group(1))) + ' 곱하기 ' + num_to_sino(int(m.group(2))), text)
-            text = re.sub(r'(\d+)\s*[/÷]\s*(\d+)', lambda m: num_to_sino(int(m.group(1))) + ' 나누기 ' + num_to_sino(int(m.group(2))), text)
-
-            # ★ 범위 표현 (물결표 ~) (2025-12-22 추가)
-            # 7~8 → "칠에서팔", 10~20% → "십에서이십퍼센트"
-            # 물결표를 "에서"로 변환하여 자연스러운 범위 읽기
-            def replace_range(match):
-                num1 = num_to_sino(int(match.group(1)))
-                num2 = num_to_sino(int(match.group(2)))
-                unit = match.group(3) if match.lastindex >= 3 and match.group(3) else ''
-                # % → 퍼센트
-                if unit == '%':
-                    unit = '퍼센트'
-                return f"{num1}에서{num2}{unit}"
-            # 숫자~숫자 + 선택적 단위 (%, 개, 명, 원 등)
-            text = re.sub(r'(\d+)~(\d+)(%|퍼센트|개|명|원|만원|억원|조원|kg|g|cm|m|km|일|시간|분|초)?', replace_range, text)
-            # 남은 ~ 문자 제거 (TTS가 "물결표"로 읽는 것 방지)
-            text = text.replace('~', ' ')
-
-            # ★★★ 추가 패턴들 (2025-12-23) ★★★
-
-            # ★ 시간 패턴 (3:30 → 세시 삼십분) - 스코어보다 먼저 처리!
-            # 시간은 고유어로 읽음 (한시, 두시, 세시...)
-            def replace_time(match):
-                hour = int(match.group(1))
-                minute = int(match.group(2))
-                # 시간 범위 체크 (0~23시, 0~59분)
-                if hour > 23 or minute > 59:
-                    return match.group(0)  # 시간이 아님
-                # 시간은 1~12는 고유어, 0/13~23는 한자어
-                if 1 <= hour <= 12:
-                    hour_str = num_to_native(hour) + '시'
-                else:
-                    hour_str = num_to_sino(hour) + '시'
-                # 분은 한자어
-                if minute == 0:
-                    return hour_str
-                elif minute == 30:
-                    return hour_str + ' 반'
-                else:
-                    return hour_str + ' ' + num_to_sino(minute) + '분'
-            # HH:MM 패턴 (00:00 ~ 23:59) - 분이 00~59 범위인 경우만
-            text = re.sub(r'\b([0-2]?[0-9]):([0-5][0-9])\b', replace_time, text)
-
-            # ★ 스코어/비율 (3:2 → 삼 대 이) - 시간 처리 후 남은 콜론 패턴
-            def replace_score(match):
-                num1 = num_to_sino(int(match.group(1)))
-                num2 = num_to_sino(int(match.group(2)))
-                return f"{num1} 대 {num2}"
-            text = re.sub(r'(\d+)\s*:\s*(\d+)(?!\d)', replace_score, text)
-
-            # ★ 전화번호 (010-1234-5678 → 공일공 일이삼사 오육칠팔)
-            def replace_phone(match):
-                digits = re.sub(r'[^\d]', '', match.group(0))
-                digit_names = ['공', '일', '이', '삼', '사', '오', '육', '칠', '팔', '구']
-                result = ' '.join(digit_names[int(d)] for d in digits)
-                return result
-            # 전화번호 패턴: 010-1234-5678, 02-123-4567
-            text = re.sub(r'\b(0\d{1,2})[- ](\d{3,4})[- ](\d{4})\b', replace_phone, text)
-
-            # ★ ISO 날짜 (2025-12-23 → 이천이십오년 십이월 이십삼일)
-            def replace_iso_date(match):
-                year = num_to_sino(int(match.group(1)))
-                month = num_to_sino(int(match.group(2)))
-                day = num_to_sino(int(match.group(3)))
-                return f"{year}년 {month}월 {day}일"
-            text = re.sub(r'\b(\d{4})-(\d{1,2})-(\d{1,2})\b', replace_iso_date, text)
-
-            # ★ 괄호 숫자 ((1), (2) → 일, 이)
-            def replace_paren_num(match):
-                num = num_to_sino(int(match.group(1)))
-                return f"({num})"
-            text = re.sub(r'\((\d+)\)', replace_paren_num, text)
-
-            # ★ 원문자 (①②③... → 일, 이, 삼...)
-            circled_nums = {'①': '일', '②': '이', '③': '삼', '④': '사', '⑤': '오',
-                           '⑥': '육', '⑦': '칠', '⑧': '팔', '⑨': '구', '⑩': '십',
-                           '⑪': '십일', '⑫': '십이', '⑬': '십삼', '⑭': '십사', '⑮': '십오',
-                           '⑯': '십육', '⑰': '십칠', '⑱': '십팔', '⑲': '십구', '⑳': '이십'}
-            for symbol, reading in circled_nums.items():
-                text = text.replace(symbol, reading)
-
-            # ★ 로마 숫자 (Ⅰ, Ⅱ, Ⅲ... → 일, 이, 삼...)
-            roman_nums = {'Ⅰ': '일', 'Ⅱ': '이', 'Ⅲ': '삼', 'Ⅳ': '사', 'Ⅴ': '오',
-                         'Ⅵ': '육', 'Ⅶ': '칠', 'Ⅷ': '팔', 'Ⅸ': '구', 'Ⅹ': '십',
-                         'Ⅺ': '십일', 'Ⅻ': '십이',
-                         'ⅰ': '일', 'ⅱ': '이', 'ⅲ': '삼', 'ⅳ': '사', 'ⅴ': '오',
-                         'ⅵ': '육', 'ⅶ': '칠', 'ⅷ': '팔', 'ⅸ': '구', 'ⅹ': '십'}
-            for symbol, reading in roman_nums.items():
-                text = text.replace(symbol, reading)
-
-            # ★ 단위 없는 큰 숫자 (마지막에 처리 - 다른 패턴에 안 걸린 숫자)
-            def replace_standalone_number(match):
-                # 앞뒤에 한글/영문이 없는 순수 숫자만
-                num = int(match.group(1))
-                if num >= 100:  # 100 이상만 변환 (작은 숫자는 그대로)
-                    return num_to_sino(num)
-                return match.group(0)
-            # 단어 경계의 숫자 (앞뒤로 한글/영문 없음)
-            text = re.sub(r'(?<![가-힣a-zA-Z])(\d{3,})(?![가-힣a-zA-Z%])', replace_standalone_number, text)
-
-            return text
-
         def generate_tts_for_sentence(text, voice_name, language_code, api_key):
             """단일 문장에 대한 TTS 생성 (Chirp 3 HD, Gemini TTS, Google Cloud TTS 지원)"""
 
@@ -10339,32 +10468,8 @@ def api_image_generate_assets_zip():
             # 0-1b) 확장 전처리: 영문 약어, 특수기호, 이모지, URL 등 (2025-12-23)
             text = preprocess_tts_extended(text)
 
-            # 0-2) 줄바꿈 제거 (모든 형태: \n, \\n, \N, \\N)
-            text = text.replace('\\N', ' ').replace('\\n', ' ')  # 이스케이프된 형태 먼저
-            text = text.replace('\n', ' ')                        # 실제 줄바꿈 문자
-            text = re.sub(r'[/\\][nN]', ' ', text)               # 슬래시 형태까지
-
-            # 0-3) 문장부호 정리 (TTS가 "점", "물음표"로 읽는 것 방지)
-            # 연속된 마침표/물음표/느낌표 → 단일 공백 (휴지 효과)
-            text = re.sub(r'[.]{2,}', ' ', text)   # ... → 공백
-            text = re.sub(r'[?]{2,}', ' ', text)   # ??? → 공백
-            text = re.sub(r'[!]{2,}', ' ', text)   # !!! → 공백
-            # 문장 끝 마침표/물음표/느낌표 → 공백으로 대체 (TTS는 문장 끝에서 자연스럽게 휴지)
-            text = re.sub(r'[.?!]+\s*$', '', text)  # 문장 끝 부호 제거
-            text = re.sub(r'[.?!]+\s+', ' ', text)  # 문장 중간 부호 → 공백
-            # 단독 부호 제거
-            text = re.sub(r'\s+[.?!]+\s+', ' ', text)
-
-            # 0-4) 쉼표 처리
-            # 먼저 숫자 내 쉼표 제거 (103,600 → 103600) - 천단위 구분자
-            text = re.sub(r'(\d),(\d{3})', r'\1\2', text)
-            while re.search(r'(\d),(\d{3})', text):  # 연속 쉼표 처리 (1,234,567)
-                text = re.sub(r'(\d),(\d{3})', r'\1\2', text)
-            # 나머지 쉼표 → 공백 (휴지 효과)
-            text = text.replace(',', ' ')
-
-            # 연속 공백 정리
-            text = re.sub(r'\s+', ' ', text).strip()
+            # 0-2) 줄바꿈/문장부호/쉼표 정리 (TTS가 "점", "물음표"로 읽는 것 방지)
+            text = clean_tts_punctuation(text)
 
             # ===== Chirp 3 HD 처리 (최고 품질 + 빠른 속도) =====
             if is_chirp3_voice(voice_name):
@@ -10484,13 +10589,12 @@ def api_image_generate_assets_zip():
                 print(f"[TTS] 에러: {response.status_code} - {response.text[:200]}")
             return None
 
-        data = request.get_json()
         session_id = data.get('session_id', str(uuid.uuid4())[:8])
         base_voice = data.get('voice', lang_ko.TTS['default_voice'])
         scenes = data.get('scenes', [])
 
         if not scenes:
-            return jsonify({"ok": False, "error": "씬 데이터가 없습니다"}), 400
+            return {"ok": False, "error": "씬 데이터가 없습니다"}, 400
 
         # API 키 체크 (Chirp 3 HD vs Gemini TTS vs Google Cloud TTS)
         google_cloud_api_key = os.getenv("GOOGLE_CLOUD_API_KEY", "")
@@ -10507,12 +10611,12 @@ def api_image_generate_assets_zip():
             print(f"[ASSETS-ZIP] Chirp 3 HD 사용: {base_voice} (100 req/min)")
         elif using_gemini:
             if not google_api_key:
-                return jsonify({"ok": False, "error": "GOOGLE_API_KEY가 설정되지 않았습니다 (Gemini TTS용)"}), 500
+                return {"ok": False, "error": "GOOGLE_API_KEY가 설정되지 않았습니다 (Gemini TTS용)"}, 500
             api_key = google_api_key
             print(f"[ASSETS-ZIP] Gemini TTS 사용: {base_voice} (10 req/min - 느림!)")
         else:
             if not google_cloud_api_key:
-                return jsonify({"ok": False, "error": "GOOGLE_CLOUD_API_KEY가 설정되지 않았습니다"}), 500
+                return {"ok": False, "error": "GOOGLE_CLOUD_API_KEY가 설정되지 않았습니다"}, 500
             api_key = google_cloud_api_key
             print(f"[ASSETS-ZIP] Google Cloud TTS 사용: {base_voice}")
 
@@ -10522,7 +10626,16 @@ def api_image_generate_assets_zip():
         consecutive_tts_fails = 0
 
         # 결과 저장용
-        all_sentence_audios = []  # [(scene_idx, sent_idx, audio_bytes, duration, text), ...]
+        all_sentence_audios = []  # [(scene_idx, sent_idx, audio_path), ...]
+        # 문장 오디오는 받는 즉시 디스크에 기록하고 경로만 보관 (긴 대본에서 수백 MB가 메모리에 쌓이지 않도록)
+        sentence_audio_dir = tempfile.mkdtemp(prefix=f"assets_{session_id}_")
+
+        def spool_sentence_audio(scene_idx, sent_idx, audio_bytes):
+            filename = f"{str(scene_idx + 1).zfill(2)}_{str(sent_idx + 1).zfill(2)}_sent.mp3"
+            audio_path = os.path.join(sentence_audio_dir, filename)
+            with open(audio_path, 'wb') as f:
+                f.write(audio_bytes)
+            all_sentence_audios.append((scene_idx, sent_idx, audio_path))
         srt_entries = []
         current_time = 0.0
 
@@ -10544,221 +10657,260 @@ def api_image_generate_assets_zip():
             ssml_tags = ['<speak>', '<prosody', '<emphasis', '<break']
             return any(tag in text for tag in ssml_tags)
 
-        # Gemini TTS Rate Limit: 딜레이용 time_module
-        import time as time_module
+        # 문장 TTS 동시 합성: 엔진별 동시 호출 수 + QPS 제한 (토큰 버킷은 프로세스 공용)
+        tts_engine = 'chirp3' if using_chirp3 else ('gemini' if using_gemini else 'google')
+        tts_limiter = get_rate_limiter(f"{tts_engine}_tts", ASSETS_TTS_QPS[tts_engine])
+        tts_executor = ThreadPoolExecutor(max_workers=max(1, ASSETS_TTS_CONCURRENCY[tts_engine]))
 
-        # 1. 각 씬의 TTS 생성 (씬 단위)
-        for scene_idx, scene in enumerate(scenes):
-            narration = scene.get('text', '')
-            image_url = scene.get('image_url', '')
-            if not narration:
-                continue
+        def synthesize_sentence(sentence, voice_name, language_code):
+            tts_limiter.acquire()
+            return generate_tts_for_sentence(sentence, voice_name, language_code, api_key)
 
-            detected_lang = detect_language(narration)
-            detected_lang_global = detected_lang  # 전체 언어 업데이트
-            voice_name = get_voice_for_language(detected_lang, base_voice)
-            language_code = get_language_code(detected_lang)
+        scene_plans = []
 
-            # SSML 모드 비활성화 (Gemini TTS는 SSML 미지원, 속도 저하 원인)
-            has_ssml = False  # is_ssml_content(narration)
+        def cancel_pending_tts():
+            for plan in scene_plans:
+                for future in plan[-1]:
+                    if future is not None:
+                        future.cancel()
+            tts_executor.shutdown(wait=False)
 
-            # ★ VRCS 2.0: subtitle_segments로 문장별 ON/OFF 제어
-            subtitle_segments = scene.get('subtitle_segments', [])
+        # 예외로 중단되면 남은 문장 TTS가 계속 합성되지 않도록 (TTS 쿼터/토큰 낭비) 취소하고 임시 디렉토리 정리
+        tts_phase_ok = False
+        try:
+            # 1-a. 씬별 문장 분할 + 문장 TTS 작업 제출 (씬/문장 순서대로 큐에 들어감)
+            for scene_idx, scene in enumerate(scenes):
+                narration = scene.get('text', '')
+                image_url = scene.get('image_url', '')
+                if not narration:
+                    continue
 
-            # 자막용 텍스트 분할 (★ 항상 SSML 태그 제거 - has_ssml과 무관)
-            plain_narration = strip_ssml_tags(narration)
+                detected_lang = detect_language(narration)
+                detected_lang_global = detected_lang  # 전체 언어 업데이트
+                voice_name = get_voice_for_language(detected_lang, base_voice)
+                language_code = get_language_code(detected_lang)
 
-            # ★ 핵심 수정: 항상 대본 전체를 문장 분할하여 TTS 수행
-            # subtitle_segments는 자막 표시 여부만 제어 (TTS 대상을 제한하면 안됨!)
-            # ★ TTS 억양 개선: 한국어는 문장 단위로 분할 (20자 청킹 대신)
-            if detected_lang == 'ko':
-                tts_sentences = tts_split_sentences(plain_narration)
-            else:
-                tts_sentences = split_sentences(plain_narration, detected_lang)
-            if not tts_sentences:
-                tts_sentences = [plain_narration]
-
-            print(f"[ASSETS-ZIP] Scene {scene_idx + 1}: {len(tts_sentences)}개 문장 TTS 예정")
-
-            # 자막 매핑: subtitle_segments가 있으면 VRCS 모드, 없으면 전체 자막
-            vrcs_mode = bool(subtitle_segments)
-            subtitle_map = {}  # {sentence_idx: subtitle_text}
-
-            if vrcs_mode and len(subtitle_segments) == len(tts_sentences):
-                # VRCS 2.0: subtitle_on=true인 문장만 자막 표시
-                for idx, seg in enumerate(subtitle_segments):
-                    if seg.get('subtitle_on') and seg.get('subtitle_text'):
-                        subtitle_map[idx] = seg.get('subtitle_text', '')
-                vrcs_on_count = len(subtitle_map)
-                print(f"[ASSETS-ZIP] Scene {scene_idx + 1}: VRCS 모드 - {vrcs_on_count}/{len(tts_sentences)} 문장 자막 ON")
-            else:
-                # 기본: 모든 문장 자막화
-                for idx, sent in enumerate(tts_sentences):
-                    subtitle_map[idx] = sent
-                if vrcs_mode:
-                    print(f"[ASSETS-ZIP] Scene {scene_idx + 1}: VRCS 문장수 불일치 ({len(subtitle_segments)} vs {len(tts_sentences)}), 전체 자막 모드")
-
-            scene_audios = []
-            scene_start_time = current_time  # 씬 시작 시간
-            scene_subtitles = []  # 씬 내 상대적 자막 타이밍
-            scene_relative_time = 0.0
-
-            # ★ VRCS 타이밍 상수
-            VRCS_SUBTITLE_LEAD = 0.3  # 자막이 TTS보다 0.3초 먼저 시작
-            VRCS_SUBTITLE_TRAIL = 0.2  # 자막이 TTS보다 0.2초 늦게 끝남
-
-            if has_ssml:
-                # ★ SSML 모드: 전체 나레이션을 하나의 TTS로 처리 (감정 표현 유지!)
-                print(f"[ASSETS-ZIP] Scene {scene_idx + 1}: SSML 감정 표현 TTS (전체 처리)")
-
-                # 전체 SSML 나레이션으로 TTS 생성
-                audio_bytes = generate_tts_for_sentence(narration, voice_name, language_code, api_key)
-
-                if audio_bytes:
-                    total_duration = get_mp3_duration(audio_bytes)
-                    scene_audios.append(audio_bytes)
-                    all_sentence_audios.append((scene_idx, 0, audio_bytes))
-
-                    # 문장별 duration 계산 (글자 수 비율)
-                    if vrcs_mode:
-                        sentences_for_timing = tts_sentences
-                    else:
-                        sentences_for_timing = tts_sentences
-
-                    total_chars = sum(len(s) for s in sentences_for_timing)
-                    if total_chars == 0:
-                        total_chars = 1
-
-                    for sent_idx, sentence in enumerate(sentences_for_timing):
-                        # 글자 수 비율로 duration 계산
-                        char_ratio = len(sentence) / total_chars
-                        sent_duration = total_duration * char_ratio
-
-                        # ★ VRCS 2.0: subtitle_on=true인 문장만 자막 추가
-                        if sent_idx in subtitle_map:
-                            subtitle_text = subtitle_map[sent_idx]
-
-                            # ★ VRCS 타이밍: 자막이 0.3초 먼저 시작, 0.2초 늦게 끝남
-                            sub_start = max(0, current_time - VRCS_SUBTITLE_LEAD)
-                            sub_end = current_time + sent_duration + VRCS_SUBTITLE_TRAIL
-                            sub_relative_start = max(0, scene_relative_time - VRCS_SUBTITLE_LEAD)
-                            sub_relative_end = scene_relative_time + sent_duration + VRCS_SUBTITLE_TRAIL
-
-                            # ★ 자막 겹침 방지: 이전 자막 종료 시간이 현재 시작 시간을 초과하면 조정
-                            if srt_entries and srt_entries[-1]['end'] > sub_start:
-                                srt_entries[-1]['end'] = sub_start
-                            if scene_subtitles and scene_subtitles[-1]['end'] > sub_relative_start:
-                                scene_subtitles[-1]['end'] = sub_relative_start
-
-                            srt_entries.append({
-                                'index': len(srt_entries) + 1,
-                                'start': sub_start,
-                                'end': sub_end,
-                                'text': subtitle_text
-                            })
-                            scene_subtitles.append({
-                                'start': sub_relative_start,
-                                'end': sub_relative_end,
-                                'text': subtitle_text
-                            })
-
-                            if vrcs_mode:
-                                print(f"  Sent {sent_idx + 1}: {sent_duration:.2f}s - 자막 ON - '{subtitle_text}'")
-                            else:
-                                print(f"  Sent {sent_idx + 1}: {sent_duration:.2f}s - {sentence[:30]}...")
-                        else:
-                            # 자막 OFF - TTS만 재생
-                            if vrcs_mode:
-                                print(f"  Sent {sent_idx + 1}: {sent_duration:.2f}s - 자막 OFF")
+                # SSML 모드 비활성화 (Gemini TTS는 SSML 미지원, 속도 저하 원인)
+                has_ssml = False  # is_ssml_content(narration)
+
+                # ★ VRCS 2.0: subtitle_segments로 문장별 ON/OFF 제어
+                subtitle_segments = scene.get('subtitle_segments', [])
 
-                        current_time += sent_duration
-                        scene_relative_time += sent_duration
+                # 자막용 텍스트 분할 (★ 항상 SSML 태그 제거 - has_ssml과 무관)
+                plain_narration = strip_ssml_tags(narration)
+
+                # ★ 핵심 수정: 항상 대본 전체를 문장 분할하여 TTS 수행
+                # subtitle_segments는 자막 표시 여부만 제어 (TTS 대상을 제한하면 안됨!)
+                # ★ TTS 억양 개선: 한국어는 문장 단위로 분할 (20자 청킹 대신)
+                if detected_lang == 'ko':
+                    tts_sentences = tts_split_sentences(plain_narration)
+                else:
+                    tts_sentences = split_sentences(plain_narration, detected_lang)
+                if not tts_sentences:
+                    tts_sentences = [plain_narration]
+
+                print(f"[ASSETS-ZIP] Scene {scene_idx + 1}: {len(tts_sentences)}개 문장 TTS 예정")
+
+                # 자막 매핑: subtitle_segments가 있으면 VRCS 모드, 없으면 전체 자막
+                vrcs_mode = bool(subtitle_segments)
+                subtitle_map = {}  # {sentence_idx: subtitle_text}
+
+                if vrcs_mode and len(subtitle_segments) == len(tts_sentences):
+                    # VRCS 2.0: subtitle_on=true인 문장만 자막 표시
+                    for idx, seg in enumerate(subtitle_segments):
+                        if seg.get('subtitle_on') and seg.get('subtitle_text'):
+                            subtitle_map[idx] = seg.get('subtitle_text', '')
+                    vrcs_on_count = len(subtitle_map)
+                    print(f"[ASSETS-ZIP] Scene {scene_idx + 1}: VRCS 모드 - {vrcs_on_count}/{len(tts_sentences)} 문장 자막 ON")
                 else:
-                    print(f"[ASSETS-ZIP] Scene {scene_idx + 1}: SSML TTS 실패, 문장별 폴백")
-                    has_ssml = False  # 폴백하여 아래 문장별 처리로
+                    # 기본: 모든 문장 자막화
+                    for idx, sent in enumerate(tts_sentences):
+                        subtitle_map[idx] = sent
+                    if vrcs_mode:
+                        print(f"[ASSETS-ZIP] Scene {scene_idx + 1}: VRCS 문장수 불일치 ({len(subtitle_segments)} vs {len(tts_sentences)}), 전체 자막 모드")
+
+                # SSML 모드는 씬 전체를 한 번에 합성하므로 문장 작업을 미리 제출하지 않음
+                sentence_futures = [] if has_ssml else [
+                    tts_executor.submit(synthesize_sentence, sentence, voice_name, language_code)
+                    for sentence in tts_sentences
+                ]
+                scene_plans.append((scene_idx, image_url, narration, detected_lang, voice_name, language_code,
+                                    has_ssml, tts_sentences, vrcs_mode, subtitle_map, sentence_futures))
+
+            print(f"[ASSETS-ZIP] 문장 TTS {sum(len(p[-1]) for p in scene_plans)}개 제출 "
+                  f"(engine={tts_engine}, workers={ASSETS_TTS_CONCURRENCY[tts_engine]}, qps={ASSETS_TTS_QPS[tts_engine]})")
 
-            if not has_ssml:
-                # ★ 문장별 TTS 생성
-                sentences = tts_sentences
-                print(f"[ASSETS-ZIP] Scene {scene_idx + 1}: {len(sentences)} sentences → 문장별 TTS")
+            # 1-b. 씬/문장 순서대로 결과 수집 → 타이밍 계산 (완료 순서와 무관하게 원래 순서 유지)
+            for (scene_idx, image_url, narration, detected_lang, voice_name, language_code,
+                 has_ssml, tts_sentences, vrcs_mode, subtitle_map, sentence_futures) in scene_plans:
+                scene_start_time = current_time  # 씬 시작 시간
+                scene_subtitles = []  # 씬 내 상대적 자막 타이밍
+                scene_relative_time = 0.0
 
-                for sent_idx, sentence in enumerate(sentences):
-                    # Rate limit 대응:
-                    # - Chirp 3 HD: 100 req/min → 딜레이 불필요
-                    # - Gemini TTS: 10 req/min → 1.5초 딜레이 필요
-                    # - Google Cloud TTS: 600 req/min → 딜레이 불필요
-                    if using_gemini and sent_idx > 0:
-                        time_module.sleep(1.5)
+                # ★ VRCS 타이밍 상수
+                VRCS_SUBTITLE_LEAD = 0.3  # 자막이 TTS보다 0.3초 먼저 시작
+                VRCS_SUBTITLE_TRAIL = 0.2  # 자막이 TTS보다 0.2초 늦게 끝남
 
-                    # 문장별 TTS 생성
-                    audio_bytes = generate_tts_for_sentence(sentence, voice_name, language_code, api_key)
+                if has_ssml:
+                    # ★ SSML 모드: 전체 나레이션을 하나의 TTS로 처리 (감정 표현 유지!)
+                    print(f"[ASSETS-ZIP] Scene {scene_idx + 1}: SSML 감정 표현 TTS (전체 처리)")
+
+                    # 전체 SSML 나레이션으로 TTS 생성
+                    audio_bytes = generate_tts_for_sentence(narration, voice_name, language_code, api_key)
 
                     if audio_bytes:
-                        duration = get_mp3_duration(audio_bytes)
-                        scene_audios.append(audio_bytes)
-                        all_sentence_audios.append((scene_idx, sent_idx, audio_bytes))
-
-                        # ★ VRCS 2.0: subtitle_on=true인 문장만 자막 추가
-                        if sent_idx in subtitle_map:
-                            subtitle_text = subtitle_map[sent_idx]
-
-                            # ★ VRCS 타이밍: 자막이 0.3초 먼저 시작, 0.2초 늦게 끝남
-                            sub_start = max(0, current_time - VRCS_SUBTITLE_LEAD)
-                            sub_end = current_time + duration + VRCS_SUBTITLE_TRAIL
-                            sub_relative_start = max(0, scene_relative_time - VRCS_SUBTITLE_LEAD)
-                            sub_relative_end = scene_relative_time + duration + VRCS_SUBTITLE_TRAIL
-
-                            # ★ 자막 겹침 방지: 이전 자막 종료 시간이 현재 시작 시간을 초과하면 조정
-                            if srt_entries and srt_entries[-1]['end'] > sub_start:
-                                srt_entries[-1]['end'] = sub_start
-                            if scene_subtitles and scene_subtitles[-1]['end'] > sub_relative_start:
-                                scene_subtitles[-1]['end'] = sub_relative_start
-
-                            srt_entries.append({
-                                'index': len(srt_entries) + 1,
-                                'start': sub_start,
-                                'end': sub_end,
-                                'text': subtitle_text
-                            })
-                            scene_subtitles.append({
-                                'start': sub_relative_start,
-                                'end': sub_relative_end,
-                                'text': subtitle_text
-                            })
-
-                            if vrcs_mode:
-                                print(f"  Sent {sent_idx + 1}: {duration:.2f}s - 자막 ON - '{subtitle_text[:30]}...'")
-                            else:
-                                print(f"  Sent {sent_idx + 1}: {duration:.2f}s - {sentence[:30]}...")
+                        total_duration = get_mp3_duration(audio_bytes)
+                        spool_sentence_audio(scene_idx, 0, audio_bytes)
+                        del audio_bytes
+
+                        # 문장별 duration 계산 (글자 수 비율)
+                        if vrcs_mode:
+                            sentences_for_timing = tts_sentences
                         else:
-                            # 자막 OFF - TTS만 재생
-                            if vrcs_mode:
-                                print(f"  Sent {sent_idx + 1}: {duration:.2f}s - 자막 OFF")
+                            sentences_for_timing = tts_sentences
+
+                        total_chars = sum(len(s) for s in sentences_for_timing)
+                        if total_chars == 0:
+                            total_chars = 1
+
+                        for sent_idx, sentence in enumerate(sentences_for_timing):
+                            # 글자 수 비율로 duration 계산
+                            char_ratio = len(sentence) / total_chars
+                            sent_duration = total_duration * char_ratio
+
+                            # ★ VRCS 2.0: subtitle_on=true인 문장만 자막 추가
+                            if sent_idx in subtitle_map:
+                                subtitle_text = subtitle_map[sent_idx]
+
+                                # ★ VRCS 타이밍: 자막이 0.3초 먼저 시작, 0.2초 늦게 끝남
+                                sub_start = max(0, current_time - VRCS_SUBTITLE_LEAD)
+                                sub_end = current_time + sent_duration + VRCS_SUBTITLE_TRAIL
+                                sub_relative_start = max(0, scene_relative_time - VRCS_SUBTITLE_LEAD)
+                                sub_relative_end = scene_relative_time + sent_duration + VRCS_SUBTITLE_TRAIL
+
+                                # ★ 자막 겹침 방지: 이전 자막 종료 시간이 현재 시작 시간을 초과하면 조정
+                                if srt_entries and srt_entries[-1]['end'] > sub_start:
+                                    srt_entries[-1]['end'] = sub_start
+                                if scene_subtitles and scene_subtitles[-1]['end'] > sub_relative_start:
+                                    scene_subtitles[-1]['end'] = sub_relative_start
+
+                                srt_entries.append({
+                                    'index': len(srt_entries) + 1,
+                                    'start': sub_start,
+                                    'end': sub_end,
+                                    'text': subtitle_text
+                                })
+                                scene_subtitles.append({
+                                    'start': sub_relative_start,
+                                    'end': sub_relative_end,
+                                    'text': subtitle_text
+                                })
 
-                        current_time += duration
-                        scene_relative_time += duration
-                        consecutive_tts_fails = 0  # 성공 시 리셋
+                                if vrcs_mode:
+                                    print(f"  Sent {sent_idx + 1}: {sent_duration:.2f}s - 자막 ON - '{subtitle_text}'")
+                                else:
+                                    print(f"  Sent {sent_idx + 1}: {sent_duration:.2f}s - {sentence[:30]}...")
+                            else:
+                                # 자막 OFF - TTS만 재생
+                                if vrcs_mode:
+                                    print(f"  Sent {sent_idx + 1}: {sent_duration:.2f}s - 자막 OFF")
+
+                            current_time += sent_duration
+                            scene_relative_time += sent_duration
                     else:
-                        consecutive_tts_fails += 1
-                        print(f"[ASSETS-ZIP] Scene {scene_idx + 1} Sent {sent_idx + 1}: TTS 실패 ({consecutive_tts_fails}회) - '{sentence[:40]}...'")
-                        # ★ 연속 실패 시 중단 (5회 연속 실패 = 심각한 문제)
-                        if consecutive_tts_fails >= 5:
-                            error_msg = f"TTS 연속 5회 실패 - 중단 (Scene {scene_idx + 1}, Sent {sent_idx + 1})"
-                            print(f"[ASSETS-ZIP][ERROR] {error_msg}")
-                            return jsonify({"ok": False, "error": error_msg}), 500
-
-            # 씬 메타데이터 저장
-            scene_duration = current_time - scene_start_time
-            scene_metadata.append({
-                'scene_idx': scene_idx,
-                'image_url': image_url,
-                'duration': scene_duration,
-                'subtitles': scene_subtitles,
-                'language': detected_lang
-            })
+                        print(f"[ASSETS-ZIP] Scene {scene_idx + 1}: SSML TTS 실패, 문장별 폴백")
+                        has_ssml = False  # 폴백하여 아래 문장별 처리로
+                        sentence_futures = [
+                            tts_executor.submit(synthesize_sentence, sentence, voice_name, language_code)
+                            for sentence in tts_sentences
+                        ]
+
+                if not has_ssml:
+                    # ★ 문장별 TTS 생성
+                    sentences = tts_sentences
+                    print(f"[ASSETS-ZIP] Scene {scene_idx + 1}: {len(sentences)} sentences → 문장별 TTS")
+
+                    for sent_idx, sentence in enumerate(sentences):
+                        # 문장별 TTS 결과 (Rate limit은 synthesize_sentence의 엔진별 토큰 버킷이 담당)
+                        try:
+                            audio_bytes = sentence_futures[sent_idx].result()
+                        except Exception as tts_err:
+                            print(f"[ASSETS-ZIP] Scene {scene_idx + 1} Sent {sent_idx + 1}: TTS 예외 - {tts_err}")
+                            audio_bytes = None
+
+                        if audio_bytes:
+                            duration = get_mp3_duration(audio_bytes)
+                            spool_sentence_audio(scene_idx, sent_idx, audio_bytes)
+                            del audio_bytes
+                            sentence_futures[sent_idx] = None  # 결과 bytes 참조 해제
+
+                            # ★ VRCS 2.0: subtitle_on=true인 문장만 자막 추가
+                            if sent_idx in subtitle_map:
+                                subtitle_text = subtitle_map[sent_idx]
+
+                                # ★ VRCS 타이밍: 자막이 0.3초 먼저 시작, 0.2초 늦게 끝남
+                                sub_start = max(0, current_time - VRCS_SUBTITLE_LEAD)
+                                sub_end = current_time + duration + VRCS_SUBTITLE_TRAIL
+                                sub_relative_start = max(0, scene_relative_time - VRCS_SUBTITLE_LEAD)
+                                sub_relative_end = scene_relative_time + duration + VRCS_SUBTITLE_TRAIL
+
+                                # ★ 자막 겹침 방지: 이전 자막 종료 시간이 현재 시작 시간을 초과하면 조정
+                                if srt_entries and srt_entries[-1]['end'] > sub_start:
+                                    srt_entries[-1]['end'] = sub_start
+                                if scene_subtitles and scene_subtitles[-1]['end'] > sub_relative_start:
+                                    scene_subtitles[-1]['end'] = sub_relative_start
+
+                                srt_entries.append({
+                                    'index': len(srt_entries) + 1,
+                                    'start': sub_start,
+                                    'end': sub_end,
+                                    'text': subtitle_text
+                                })
+                                scene_subtitles.append({
+                                    'start': sub_relative_start,
+                                    'end': sub_relative_end,
+                                    'text': subtitle_text
+                                })
+
+                                if vrcs_mode:
+                                    print(f"  Sent {sent_idx + 1}: {duration:.2f}s - 자막 ON - '{subtitle_text[:30]}...'")
+                                else:
+                                    print(f"  Sent {sent_idx + 1}: {duration:.2f}s - {sentence[:30]}...")
+                            else:
+                                # 자막 OFF - TTS만 재생
+                                if vrcs_mode:
+                                    print(f"  Sent {sent_idx + 1}: {duration:.2f}s - 자막 OFF")
+
+                            current_time += duration
+                            scene_relative_time += duration
+                            consecutive_tts_fails = 0  # 성공 시 리셋
+                        else:
+                            consecutive_tts_fails += 1
+                            print(f"[ASSETS-ZIP] Scene {scene_idx + 1} Sent {sent_idx + 1}: TTS 실패 ({consecutive_tts_fails}회) - '{sentence[:40]}...'")
+                            # ★ 연속 실패 시 중단 (5회 연속 실패 = 심각한 문제)
+                            if consecutive_tts_fails >= 5:
+                                error_msg = f"TTS 연속 5회 실패 - 중단 (Scene {scene_idx + 1}, Sent {sent_idx + 1})"
+                                print(f"[ASSETS-ZIP][ERROR] {error_msg}")
+                                return {"ok": False, "error": error_msg}, 500
+
+                # 씬 메타데이터 저장
+                scene_duration = current_time - scene_start_time
+                scene_metadata.append({
+                    'scene_idx': scene_idx,
+                    'image_url': image_url,
+                    'duration': scene_duration,
+                    'subtitles': scene_subtitles,
+                    'language': detected_lang
+                })
 
-            # 씬 간 짧은 간격 (무음 0.3초 추가 가능, 여기서는 시간만 조정)
-            current_time += 0.3
+                # 씬 간 짧은 간격 (무음 0.3초 추가 가능, 여기서는 시간만 조정)
+                current_time += 0.3
+
+            tts_phase_ok = True
+        finally:
+            cancel_pending_tts()
+            if not tts_phase_ok:
+                shutil.rmtree(sentence_audio_dir, ignore_errors=True)
 
         # ★ TTS 성공/실패 요약 로그
         total_sentences = sum(len(s.get('subtitle_segments', [])) or 1 for s in scenes if s.get('text'))
@@ -10767,170 +10919,108 @@ def api_image_generate_assets_zip():
         if successful_tts < total_sentences:
             print(f"[ASSETS-ZIP][WARNING] {total_sentences - successful_tts}개 문장 TTS 실패!")
 
-        # 2. ZIP 파일 생성
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        # 2. ZIP 파일 생성 (uploads/에 바로 스트리밍 작성 - ZIP 전체를 메모리에 만들지 않음)
+        zip_filename = f"capcut_assets_{session_id}.zip"
+        upload_dir = "uploads"
+        os.makedirs(upload_dir, exist_ok=True)
+        zip_path = os.path.join(upload_dir, zip_filename)
 
-            # 이미지 다운로드 및 추가
-            image_count = 0
-            for idx, scene in enumerate(scenes):
-                image_url = scene.get('image_url', '')
-                if not image_url:
-                    continue
+        try:
+            with atomic_zip(zip_path) as zip_file:
 
-                try:
-                    if image_url.startswith('http'):
-                        req = urllib.request.Request(image_url, headers={'User-Agent': 'Mozilla/5.0'})
-                        with urllib.request.urlopen(req, timeout=30) as response:
-                            img_data = response.read()
-                    elif image_url.startswith('/'):
-                        local_path = image_url.lstrip('/')
-                        if os.path.exists(local_path):
-                            with open(local_path, 'rb') as f:
-                                img_data = f.read()
-                        else:
-                            continue
-                    else:
+                # 이미지 다운로드 및 추가 (URL 응답을 엔트리로 바로 스트리밍)
+                image_count = 0
+                for idx, scene in enumerate(scenes):
+                    image_url = scene.get('image_url', '')
+                    if not image_url:
                         continue
 
                     # 파일명: 01_scene.jpg, 02_scene.jpg, ...
                     filename = f"{str(idx + 1).zfill(2)}_scene.jpg"
-                    zip_file.writestr(f"images/{filename}", img_data)
-                    image_count += 1
-
-                except Exception as e:
-                    print(f"[ASSETS-ZIP] Failed to add image {idx + 1}: {e}")
-
-            # 오디오 파일 추가 (문장별 + 씬별 병합 + 전체 병합)
-            if all_sentence_audios:
-                # 1. 문장별 개별 오디오 저장
-                for scene_idx, sent_idx, audio_bytes in all_sentence_audios:
-                    filename = f"{str(scene_idx + 1).zfill(2)}_{str(sent_idx + 1).zfill(2)}_sent.mp3"
-                    zip_file.writestr(f"audio/sentences/{filename}", audio_bytes)
-
-                # 2. 씬별 오디오 병합 (FFmpeg 사용) + uploads/ 저장
-                scene_audio_map = {}  # {scene_idx: [audio_bytes, ...]}
-                for scene_idx, sent_idx, audio_bytes in all_sentence_audios:
-                    if scene_idx not in scene_audio_map:
-                        scene_audio_map[scene_idx] = []
-                    scene_audio_map[scene_idx].append(audio_bytes)
-
-                # uploads 디렉토리 생성
-                upload_dir = "uploads"
-                os.makedirs(upload_dir, exist_ok=True)
-
-                scene_merged_files = []
-                for scene_idx in sorted(scene_audio_map.keys()):
-                    audios = scene_audio_map[scene_idx]
                     try:
-                        # 임시 파일들 생성
-                        temp_files = []
-                        for i, audio in enumerate(audios):
-                            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp:
-                                tmp.write(audio)
-                                temp_files.append(tmp.name)
-
-                        # FFmpeg concat으로 병합
-                        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False, mode='w') as list_file:
-                            for tf in temp_files:
-                                list_file.write(f"file '{tf}'\n")
-                            list_path = list_file.name
-
-                        merged_path = tempfile.mktemp(suffix='.mp3')
-                        cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", merged_path]
-                        # 메모리 최적화: stdout/stderr DEVNULL (OOM 방지)
-                        merge_result = subprocess.run(
-                            cmd,
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL,
-                            timeout=60
-                        )
-                        del merge_result
-                        gc.collect()
+                        if image_url.startswith('http'):
+                            zip_write_url(zip_file, image_url, f"images/{filename}", timeout=30)
+                        elif image_url.startswith('/'):
+                            local_path = image_url.lstrip('/')
+                            if os.path.exists(local_path):
+                                zip_write_file(zip_file, local_path, f"images/{filename}")
+                            else:
+                                continue
+                        else:
+                            continue
+                        image_count += 1
+
+                    except Exception as e:
+                        print(f"[ASSETS-ZIP] Failed to add image {idx + 1}: {e}")
 
-                        if os.path.exists(merged_path):
-                            with open(merged_path, 'rb') as f:
-                                merged_audio = f.read()
-                            filename = f"{str(scene_idx + 1).zfill(2)}_scene.mp3"
-                            zip_file.writestr(f"audio/{filename}", merged_audio)
+                # 오디오 파일 추가 (문장별 + 씬별 병합 + 전체 병합) - 모두 디스크 파일에서 복사
+                if all_sentence_audios:
+                    # 1. 문장별 개별 오디오 저장
+                    for scene_idx, sent_idx, audio_path in all_sentence_audios:
+                        zip_write_file(zip_file, audio_path, f"audio/sentences/{os.path.basename(audio_path)}")
 
-                            # uploads/에도 개별 저장 (영상 생성용)
+                    # 2. 씬별 오디오 병합 (FFmpeg concat → uploads/에 직접 출력)
+                    scene_audio_map = {}  # {scene_idx: [audio_path, ...]}
+                    for scene_idx, sent_idx, audio_path in all_sentence_audios:
+                        scene_audio_map.setdefault(scene_idx, []).append(audio_path)
+
+                    for scene_idx in sorted(scene_audio_map.keys()):
+                        try:
+                            list_path = os.path.join(sentence_audio_dir, f"scene_{scene_idx + 1}.txt")
+                            with open(list_path, 'w') as list_file:
+                                for audio_path in scene_audio_map[scene_idx]:
+                                    list_file.write(f"file '{audio_path}'\n")
+
+                            # uploads/에 개별 저장 (영상 생성용)
                             audio_filename = f"{session_id}_scene_{str(scene_idx + 1).zfill(2)}.mp3"
-                            audio_path = os.path.join(upload_dir, audio_filename)
-                            with open(audio_path, 'wb') as f:
-                                f.write(merged_audio)
-
-                            # scene_metadata에 audio_url 추가
-                            for sm in scene_metadata:
-                                if sm['scene_idx'] == scene_idx:
-                                    sm['audio_url'] = f"/uploads/{audio_filename}"
-                                    break
-
-                            scene_merged_files.append(merged_path)
-                            os.unlink(merged_path)
-
-                        # 임시 파일 정리
-                        for tf in temp_files:
-                            if os.path.exists(tf):
-                                os.unlink(tf)
-                        if os.path.exists(list_path):
-                            os.unlink(list_path)
+                            merged_path = os.path.join(upload_dir, audio_filename)
+                            if os.path.exists(merged_path):
+                                os.unlink(merged_path)
+                            cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", merged_path]
+                            # 메모리 최적화: stdout/stderr DEVNULL (OOM 방지)
+                            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
+
+                            if os.path.exists(merged_path):
+                                zip_write_file(zip_file, merged_path, f"audio/{str(scene_idx + 1).zfill(2)}_scene.mp3")
+
+                                # scene_metadata에 audio_url 추가
+                                for sm in scene_metadata:
+                                    if sm['scene_idx'] == scene_idx:
+                                        sm['audio_url'] = f"/uploads/{audio_filename}"
+                                        break
 
-                    except Exception as e:
-                        print(f"[ASSETS-ZIP] Scene {scene_idx + 1} merge failed: {e}")
+                        except Exception as e:
+                            print(f"[ASSETS-ZIP] Scene {scene_idx + 1} merge failed: {e}")
 
-                # 3. 전체 오디오 병합
-                try:
-                    all_audios = [audio for _, _, audio in all_sentence_audios]
-                    temp_files = []
-                    for audio in all_audios:
-                        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp:
-                            tmp.write(audio)
-                            temp_files.append(tmp.name)
-
-                    with tempfile.NamedTemporaryFile(suffix='.txt', delete=False, mode='w') as list_file:
-                        for tf in temp_files:
-                            list_file.write(f"file '{tf}'\n")
-                        list_path = list_file.name
-
-                    full_merged_path = tempfile.mktemp(suffix='.mp3')
-                    cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", full_merged_path]
-                    # 메모리 최적화: stdout/stderr DEVNULL (OOM 방지)
-                    full_merge_result = subprocess.run(
-                        cmd,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        timeout=120
-                    )
-                    del full_merge_result
-                    gc.collect()
+                    # 3. 전체 오디오 병합
+                    try:
+                        list_path = os.path.join(sentence_audio_dir, "full.txt")
+                        with open(list_path, 'w') as list_file:
+                            for _, _, audio_path in all_sentence_audios:
+                                list_file.write(f"file '{audio_path}'\n")
 
-                    if os.path.exists(full_merged_path):
-                        with open(full_merged_path, 'rb') as f:
-                            full_audio = f.read()
-                        zip_file.writestr("audio/narration_full.mp3", full_audio)
-                        os.unlink(full_merged_path)
+                        full_merged_path = os.path.join(sentence_audio_dir, "narration_full.mp3")
+                        cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", full_merged_path]
+                        # 메모리 최적화: stdout/stderr DEVNULL (OOM 방지)
+                        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=120)
 
-                    for tf in temp_files:
-                        if os.path.exists(tf):
-                            os.unlink(tf)
-                    if os.path.exists(list_path):
-                        os.unlink(list_path)
+                        if os.path.exists(full_merged_path):
+                            zip_write_file(zip_file, full_merged_path, "audio/narration_full.mp3")
 
-                except Exception as e:
-                    print(f"[ASSETS-ZIP] Full audio merge failed: {e}")
+                    except Exception as e:
+                        print(f"[ASSETS-ZIP] Full audio merge failed: {e}")
 
-            # SRT 자막 파일 생성
-            srt_content = ""
-            for entry in srt_entries:
-                start = format_srt_time(entry['start'])
-                end = format_srt_time(entry['end'])
-                srt_content += f"{entry['index']}\n{start} --> {end}\n{entry['text']}\n\n"
+                # SRT 자막 파일 생성
+                srt_content = ""
+                for entry in srt_entries:
+                    start = format_srt_time(entry['start'])
+                    end = format_srt_time(entry['end'])
+                    srt_content += f"{entry['index']}\n{start} --> {end}\n{entry['text']}\n\n"
 
-            zip_file.writestr("subtitles.srt", srt_content.encode('utf-8'))
+                zip_write_bytes(zip_file, "subtitles.srt", srt_content)
 
-            # 가이드 파일 추가
-            guide_content = f"""CapCut 에셋 가이드
+                # 가이드 파일 추가
+                guide_content = f"""CapCut 에셋 가이드
 ==================
 
 📁 폴더 구조:
@@ -10952,17 +11042,11 @@ def api_image_generate_assets_zip():
 
 생성일: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-            zip_file.writestr("README.txt", guide_content.encode('utf-8'))
-
-        # 3. ZIP 파일 저장
-        zip_buffer.seek(0)
-        zip_filename = f"capcut_assets_{session_id}.zip"
-        upload_dir = "uploads"
-        os.makedirs(upload_dir, exist_ok=True)
-        zip_path = os.path.join(upload_dir, zip_filename)
-
-        with open(zip_path, 'wb') as f:
-            f.write(zip_buffer.read())
+                zip_write_bytes(zip_file, "README.txt", guide_content)
+        finally:
+            # 문장 오디오 임시 디렉토리 정리
+            shutil.rmtree(sentence_audio_dir, ignore_errors=True)
+            gc.collect()
 
         # 오디오 총 길이 계산
         total_duration = current_time
@@ -10972,20 +11056,27 @@ def api_image_generate_assets_zip():
 
         print(f"[ASSETS-ZIP] ZIP created: {zip_path}, images: {image_count}, duration: {duration_str}")
 
-        return jsonify({
+        return {
             "ok": True,
             "zip_url": f"/uploads/{zip_filename}",
             "image_count": image_count,
             "audio_duration": duration_str,
             "scene_metadata": scene_metadata,  # 영상 생성용 메타데이터
             "detected_language": detected_lang_global  # 감지된 언어
-        })
+        }, 200
 
     except Exception as e:
         print(f"[ASSETS-ZIP][ERROR] {str(e)}")
         import traceback
         traceback.print_exc()
-        return jsonify({"ok": False, "error": str(e)}), 500
+        return {"ok": False, "error": str(e)}, 500
+
+
+@app.route('/api/image/generate-assets-zip', methods=['POST'])
+def api_image_generate_assets_zip():
+    """POST /api/image/generate-assets-zip - image_generate_assets_zip_service() HTTP 래퍼"""
+    result, status = image_generate_assets_zip_service(request.get_json(silent=True) or {})
+    return jsonify(result), status
 
 
 def format_srt_time(seconds):
@@ -11005,8 +11096,68 @@ def format_srt_time(seconds):
 VIDEO_JOBS_DIR = "uploads/video_jobs"
 os.makedirs(VIDEO_JOBS_DIR, exist_ok=True)
 
+# ===== 작업 상태 write-through 캐시 =====
+# 상태 폴링(/api/image/video-status)은 캐시에서 응답하고, 쓰기는 캐시 + DB/파일에 모두 기록.
+# 이 프로세스가 쓴 항목은 항상 최신이므로 조회 만료 없음, DB에서 읽어온 항목만 짧게 캐시.
+# 메모리 정리: 완료/실패 항목은 JOB_STATUS_CACHE_FINISHED_TTL 후, 그 외 항목도 VIDEO_JOB_TTL_HOURS 후 제거
+# (제거된 작업은 다시 조회하면 DB/파일에서 읽음)
+JOB_STATUS_CACHE_TTL = float(os.environ.get('JOB_STATUS_CACHE_TTL', '2'))
+JOB_STATUS_CACHE_FINISHED_TTL = float(os.environ.get('JOB_STATUS_CACHE_FINISHED_TTL', '600'))
+_JOB_STATUS_CACHE_SWEEP_INTERVAL = 60
+_job_status_cache = {}  # {job_id: (status_dict, loaded_at 또는 None=로컬 기록, 기록 시각)}
+_job_status_cache_lock = threading.Lock()
+_job_status_cache_swept = [time.time()]
+
+def _sweep_job_status_cache(now):
+    """만료된 캐시 항목 제거 (_job_status_cache_lock을 잡은 상태에서 호출)"""
+    max_age = VIDEO_JOB_TTL_HOURS * 3600
+    expired = [
+        job_id for job_id, (status_data, loaded_at, cached_at) in _job_status_cache.items()
+        if (loaded_at is not None and now - loaded_at > JOB_STATUS_CACHE_TTL)
+        or (status_data.get('status') in ('completed', 'failed') and now - cached_at > JOB_STATUS_CACHE_FINISHED_TTL)
+        or now - cached_at > max_age
+    ]
+    for job_id in expired:
+        del _job_status_cache[job_id]
+    _job_status_cache_swept[0] = now
+
+def _cache_job_status(job_id, status_data, from_store=False):
+    now = time.time()
+    with _job_status_cache_lock:
+        _job_status_cache[job_id] = (dict(status_data), now if from_store else None, now)
+        if now - _job_status_cache_swept[0] > _JOB_STATUS_CACHE_SWEEP_INTERVAL:
+            _sweep_job_status_cache(now)
+    if not from_store:
+        # 이 프로세스의 상태 변경 → SSE/long-poll 구독자에게 푸시
+        job_progress_bus.publish(job_id, _image_job_progress(job_id, status_data))
+
+def _cached_job_status(job_id):
+    with _job_status_cache_lock:
+        entry = _job_status_cache.get(job_id)
+        if not entry:
+            return None
+        status_data, loaded_at, _ = entry
+        if loaded_at is not None and time.time() - loaded_at > JOB_STATUS_CACHE_TTL:
+            return None
+        return dict(status_data)
+
+def _image_job_progress(job_id, job):
+    """Image Lab 영상 작업 상태 → 상태 API/진행 이벤트 공통 응답 형태"""
+    return {
+        "ok": True,
+        "job_id": job_id,
+        "status": job.get('status', 'unknown'),
+        "progress": job.get('progress', 0),
+        "message": job.get('message', ''),
+        "video_url": job.get('video_url'),
+        "duration": job.get('duration'),
+        "subtitle_count": job.get('subtitle_count', 0),
+        "error": job.get('error')
+    }
+
 def _save_job_status(job_id, status_data):
-    """작업 상태를 DB 또는 파일로 저장"""
+    """작업 상태를 DB 또는 파일로 저장 (캐시 write-through)"""
+    _cache_job_status(job_id, status_data)
     if USE_POSTGRES:
         try:
             conn = get_db_connection()
@@ -11047,6 +11198,16 @@ def _save_job_status(job_id, status_data):
             json.dump(status_data, f, ensure_ascii=False)
 
 def _load_job_status(job_id):
+    """작업 상태 로드 (캐시 → DB 또는 파일)"""
+    cached = _cached_job_status(job_id)
+    if cached is not None:
+        return cached
+    status = _load_job_status_from_store(job_id)
+    if status is not None:
+        _cache_job_status(job_id, status, from_store=True)
+    return status
+
+def _load_job_status_from_store(job_id):
     """작업 상태를 DB 또는 파일에서 로드"""
     if USE_POSTGRES:
         try:
@@ -11091,7 +11252,13 @@ def _load_job_status(job_id):
         return None
 
 def _update_job_status(job_id, **kwargs):
-    """작업 상태 부분 업데이트"""
+    """작업 상태 부분 업데이트 (캐시 write-through)"""
+    cached = _cached_job_status(job_id)
+    if cached is None:
+        cached = _load_job_status_from_store(job_id) or {}
+    cached.update(kwargs)
+    _cache_job_status(job_id, cached)
+
     if USE_POSTGRES:
         try:
             conn = get_db_connection()
@@ -11899,20 +12066,7 @@ def _mix_scene_bgm_with_video(video_path, scenes, video_effects, output_path, bg
             print(f"[BGM-SCENE] 기본 BGM 분위기가 없음")
             return False
 
-        # 씬별 시작/종료 시간 계산
-        scene_times = []
-        current_time = 0
-        for idx, scene in enumerate(scenes):
-            duration = scene.get('duration', 0)
-            scene_times.append({
-                'scene': idx + 1,
-                'start': current_time,
-                'end': current_time + duration,
-                'duration': duration
-            })
-            current_time += duration
-
-        total_duration = current_time
+        total_duration = sum(scene.get('duration', 0) for scene in scenes)
         print(f"[BGM-SCENE] 전체 길이: {total_duration:.1f}초, 씬 수: {len(scenes)}")
 
         # scene_bgm_changes가 없거나 비어있으면 기존 방식으로 폴백
@@ -11923,36 +12077,8 @@ def _mix_scene_bgm_with_video(video_path, scenes, video_effects, output_path, bg
                 return _mix_bgm_with_video(video_path, bgm_file, output_path, bgm_volume)
             return False
 
-        # BGM 구간 계산 (각 구간의 mood와 시간)
-        bgm_segments = []
-        changes_dict = {c['scene']: c['mood'] for c in scene_bgm_changes}
-
-        current_mood = base_mood
-        segment_start = 0
-
-        for st in scene_times:
-            scene_num = st['scene']
-            if scene_num in changes_dict:
-                # 이전 구간 저장
-                if st['start'] > segment_start:
-                    bgm_segments.append({
-                        'mood': current_mood,
-                        'start': segment_start,
-                        'end': st['start'],
-                        'duration': st['start'] - segment_start
-                    })
-                # 새 mood로 전환
-                current_mood = changes_dict[scene_num]
-                segment_start = st['start']
-
-        # 마지막 구간 추가
-        if total_duration > segment_start:
-            bgm_segments.append({
-                'mood': current_mood,
-                'start': segment_start,
-                'end': total_duration,
-                'duration': total_duration - segment_start
-            })
+        # BGM 구간 계산 (각 구간의 mood와 시간) - 단일 인코딩 후반 작업과 공용
+        bgm_segments = compute_bgm_segments(scenes, base_mood, scene_bgm_changes)
 
         print(f"[BGM-SCENE] BGM 구간: {len(bgm_segments)}개")
         for seg in bgm_segments:
@@ -11966,31 +12092,17 @@ def _mix_scene_bgm_with_video(video_path, scenes, video_effects, output_path, bg
             input_files = [video_path]
             filter_parts = []
 
-            for i, seg in enumerate(bgm_segments):
+            for seg in bgm_segments:
                 bgm_file = _get_bgm_file(seg['mood'])
                 if not bgm_file:
                     print(f"[BGM-SCENE] '{seg['mood']}' BGM 파일 없음, 건너뜀")
                     continue
 
                 input_files.append(bgm_file)
-                input_idx = len(input_files) - 1
-
-                # 각 BGM 구간에 볼륨, 딜레이, 트림, 페이드 적용
-                delay_ms = int(seg['start'] * 1000)
-                duration = seg['duration']
-
-                # 페이드 인/아웃: 구간 시작/끝에 1초씩
-                fade_in_duration = min(1.0, duration * 0.2)
-                fade_out_start = max(0, duration - 1.0)
-                fade_out_duration = min(1.0, duration * 0.2)
 
-                filter_parts.append(
-                    f"[{input_idx}:a]atrim=0:{duration},asetpts=PTS-STARTPTS,"
-                    f"volume={bgm_volume},"
-                    f"afade=t=in:st=0:d={fade_in_duration},"
-                    f"afade=t=out:st={fade_out_start}:d={fade_out_duration},"
-                    f"adelay={delay_ms}|{delay_ms}[bgm{i}]"
-                )
+                # 각 BGM 구간에 볼륨, 딜레이, 트림, 페이드 적용 (단일 인코딩 후반 작업과 같은 BgmTrack 값)
+                track = scene_bgm_track(bgm_file, seg, volume=bgm_volume)
+                filter_parts.append(bgm_track_filter(track, len(input_files) - 1, f"bgm{len(filter_parts)}"))
 
             if not filter_parts:
                 print(f"[BGM-SCENE] 사용 가능한 BGM 없음")
@@ -12276,26 +12388,30 @@ def _mix_sfx_into_video(video_path, sound_effects, scenes, output_path, sfx_dir=
         return False
 
 
-def _generate_outro_video(output_path, duration=5, fonts_dir=None):
+def _generate_outro_video(output_path, duration=5, fonts_dir=None, width=1280, height=720, fps=24):
     """공용 아웃트로 영상 생성 (구독/좋아요 요청)
 
+    해상도/fps/폰트/문구 조합마다 한 번만 인코딩해서 video 자산 캐시에 보관하고,
+    output_path에는 캐시된 파일을 하드링크(실패 시 복사)로 배치한다.
+    인코더 설정은 후반 작업 최종 인코딩(video.postprod)과 같아서 concat demuxer 스트림 복사가 가능하다.
+
     Args:
         output_path: 출력 파일 경로
         duration: 아웃트로 길이 (초)
         fonts_dir: 폰트 디렉토리 (없으면 스크립트 위치 기준)
+        width, height, fps: 메인 영상과 같은 해상도/프레임레이트
 
     Returns:
         성공 여부 (bool)
     """
+    import shutil
+
     try:
         # 스크립트 위치 기준 절대 경로 사용
         if fonts_dir is None:
             script_dir = os.path.dirname(os.path.abspath(__file__))
             fonts_dir = os.path.join(script_dir, "fonts")
 
-        print(f"[OUTRO] 폰트 디렉토리: {fonts_dir}")
-        print(f"[OUTRO] 디렉토리 존재: {os.path.exists(fonts_dir)}")
-
         # 폰트 설정: lang/ko.py에서 관리
         font_path = None
         for font_file in lang_ko.FONTS['priority']:
@@ -12313,50 +12429,53 @@ def _generate_outro_video(output_path, duration=5, fonts_dir=None):
             print(f"[OUTRO] 폰트 파일 없음: {fonts_dir}")
             return False
 
-        print(f"[OUTRO] 사용 폰트: {font_path}")
         font_escaped = font_path.replace('\\', '/').replace(':', '\\:')
+        # 글자 크기는 720p 기준값을 해상도에 맞춰 조정
+        scale = height / 720
 
         # 그라데이션 배경 + 텍스트 아웃트로
-        # 메인 영상과 동일한 1280x720 해상도 사용 (concat 호환성)
         # 이모지 제거 (FFmpeg drawtext 호환성 문제)
-        ffmpeg_cmd = [
+        render_cmd = [
             "ffmpeg", "-y",
             "-f", "lavfi",
-            "-i", f"color=c=0x1a1a2e:s=1280x720:d={duration}",
+            "-i", f"color=c=0x1a1a2e:s={width}x{height}:d={duration}",
             "-f", "lavfi",
             "-i", f"anullsrc=r=44100:cl=stereo:d={duration}",
             "-vf", (
                 f"drawtext=text='시청해 주셔서 감사합니다':"
-                f"fontfile='{font_escaped}':fontsize=48:fontcolor=white:"
-                f"x=(w-text_w)/2:y=(h-text_h)/2-70,"
+                f"fontfile='{font_escaped}':fontsize={int(48 * scale)}:fontcolor=white:"
+                f"x=(w-text_w)/2:y=(h-text_h)/2-{int(70 * scale)},"
                 f"drawtext=text='좋아요와 구독 부탁드려요':"
-                f"fontfile='{font_escaped}':fontsize=38:fontcolor=yellow:"
-                f"x=(w-text_w)/2:y=(h-text_h)/2+15,"
+                f"fontfile='{font_escaped}':fontsize={int(38 * scale)}:fontcolor=yellow:"
+                f"x=(w-text_w)/2:y=(h-text_h)/2+{int(15 * scale)},"
                 f"drawtext=text='알림 설정도 잊지 마세요':"
-                f"fontfile='{font_escaped}':fontsize=30:fontcolor=#aaaaaa:"
-                f"x=(w-text_w)/2:y=(h-text_h)/2+80,"
+                f"fontfile='{font_escaped}':fontsize={int(30 * scale)}:fontcolor=#aaaaaa:"
+                f"x=(w-text_w)/2:y=(h-text_h)/2+{int(80 * scale)},"
                 f"fade=t=in:st=0:d=0.5,fade=t=out:st={duration-0.5}:d=0.5"
             ),
-            # 메인 영상과 동일한 인코딩 설정 (concat demuxer 호환)
-            "-c:v", "libx264", "-preset", "fast", "-profile:v", "high", "-level", "4.0",
-            "-pix_fmt", "yuv420p", "-r", "24",  # 24fps (메인 영상과 동일)
-            "-c:a", "aac", "-b:a", "128k", "-ar", "44100",
+            # 메인 영상 최종 인코딩과 동일한 설정 (concat demuxer 스트림 복사 호환)
+            *POSTPROD_VIDEO_ARGS, "-r", f"{fps:g}",
+            *POSTPROD_AUDIO_ARGS,
             "-movflags", "+faststart",
             "-t", str(duration),
-            output_path
         ]
 
-        result = subprocess.run(ffmpeg_cmd, stdout=subprocess.DEVNULL,
-                               stderr=subprocess.PIPE, timeout=60)
-
-        if result.returncode == 0:
-            print(f"[OUTRO] 아웃트로 생성 완료 (1280x720, 24fps): {output_path}")
-            return True
-        else:
-            stderr = result.stderr.decode('utf-8', errors='ignore')[:300]
-            print(f"[OUTRO] 생성 실패: {stderr}")
+        asset_path = get_asset_cache().get_or_render(
+            'outro', width, height, fps, render_cmd, dependencies=[font_path], timeout=60
+        )
+        if not asset_path:
+            print(f"[OUTRO] 생성 실패")
             return False
 
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        try:
+            os.link(asset_path, output_path)
+        except OSError:
+            shutil.copy2(asset_path, output_path)
+        print(f"[OUTRO] 아웃트로 준비 완료 ({width}x{height}, {fps:g}fps): {output_path}")
+        return True
+
     except Exception as e:
         print(f"[OUTRO] 오류: {e}")
         return False
@@ -12939,7 +13058,10 @@ OUTPUT: 1080x1920 vertical Korean webtoon style illustration with centered chara
                     print(f"[SHORTS-V2] 클립 {bd['beat_id']} 오디오 파일 없음: {bd['audio_path']}")
                     continue
 
-                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=120)
+                # 1080x1920 인코딩 - 렌더 스케줄러 입장 후 실행
+                clip_estimate = estimate_ffmpeg_memory_mb(1080, 1920, duration=bd['duration'], preset='fast')
+                with get_render_scheduler().admit(clip_estimate, label=f"쇼츠 클립 {bd['beat_id']}"):
+                    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=120)
                 if result.returncode == 0 and os.path.exists(clip_path):
                     clip_paths.append(clip_path)
                     print(f"[SHORTS-V2] 클립 {bd['beat_id']} 완료 ({bd['duration']:.1f}초)")
@@ -12968,7 +13090,11 @@ OUTPUT: 1080x1920 vertical Korean webtoon style illustration with centered chara
                 output_path
             ]
 
-            result = subprocess.run(concat_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=180)
+            concat_estimate = estimate_ffmpeg_memory_mb(
+                1080, 1920, duration=sum(bd['duration'] for bd in beat_data), preset='fast'
+            )
+            with get_render_scheduler().admit(concat_estimate, label="쇼츠 병합"):
+                result = subprocess.run(concat_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=180)
 
             if result.returncode == 0 and os.path.exists(output_path):
                 # 최종 영상 길이 확인
@@ -13357,7 +13483,10 @@ def _upload_youtube_captions(video_id, srt_path, language="ko", credentials=None
 
 
 def _get_ken_burns_filter(effect_type, duration, fps=24, output_size="1280x720"):
-    """Ken Burns 효과용 zoompan 필터 생성 - 부드러운 sin/cos 모션
+    """Ken Burns 효과 필터 생성 - 부드러운 sin/cos 모션
+
+    움직임은 zoompan 좌표계 식으로 정의하고, 실제 필터 체인은 video.kenburns가 만든다
+    (기본: 마스터 1회 스케일 + crop 이동, KEN_BURNS_ENGINE=zoompan이면 기존 zoompan).
 
     Args:
         effect_type: zoom_in, zoom_out, pan_left, pan_right, pan_up, pan_down
@@ -13366,13 +13495,13 @@ def _get_ken_burns_filter(effect_type, duration, fps=24, output_size="1280x720")
         output_size: 출력 해상도
 
     Returns:
-        FFmpeg vf filter string (scale + zoompan + fade)
+        FFmpeg vf filter string (Ken Burns + fade)
     """
     total_frames = int(duration * fps)
     w, h = map(int, output_size.split('x'))
 
     # 부드러운 움직임을 위한 설정
-    # 이미지를 크게 스케일해서 패닝/줌 시 검정 테두리 방지
+    # 움직임 식의 기준 좌표계: 이미지를 40% 크게 채운 것으로 간주 (패닝/줌 시 검정 테두리 방지)
     scale_w = int(w * 1.4)  # 40% 더 크게
     scale_h = int(h * 1.4)
 
@@ -13419,11 +13548,10 @@ def _get_ken_burns_filter(effect_type, duration, fps=24, output_size="1280x720")
         x_expr = f"(iw-{w})/2+8*sin(on/120)"
         y_expr = f"(ih-{h})/2+6*cos(on/150)"
 
-    # 필터 체인: scale(크게) → zoompan(부드러운 움직임) → fade(페이드인/아웃)
+    # 필터 체인: Ken Burns(부드러운 움직임, 1.4배 좌표계) → fade(페이드인/아웃)
+    motion = KenBurnsMotion(zoom=zoom_expr, x=x_expr, y=y_expr, zoom_max=1.08)
     vf_filter = (
-        f"scale={scale_w}:{scale_h}:force_original_aspect_ratio=increase,"
-        f"crop={scale_w}:{scale_h},"
-        f"zoompan=z='{zoom_expr}':x='{x_expr}':y='{y_expr}':d={total_frames}:s={output_size}:fps={fps},"
+        f"{build_ken_burns_filter(motion, scale_w, scale_h, w, h, fps, duration)},"
         f"fade=t=in:st=0:d={fade_in},fade=t=out:st={fade_out_start}:d={fade_out}"
     )
 
@@ -13436,8 +13564,6 @@ def _create_scene_clip_worker(task):
     병렬 처리 시 각 워커에서 독립적으로 실행됨
     """
     import subprocess
-    import shutil
-    import urllib.request
     import gc
 
     idx, scene, work_dir, total_scenes = task
@@ -13452,55 +13578,18 @@ def _create_scene_clip_worker(task):
         print(f"[VIDEO-WORKER-PARALLEL] 씬 {idx+1} 스킵 - 이미지 URL 없음")
         return idx, None, duration
 
-    # 이미지 다운로드
+    # 이미지 다운로드 (스트리밍 - 메모리에 통째로 올리지 않음)
     img_path = os.path.join(work_dir, f"scene_{idx:03d}.jpg")
-    try:
-        if image_url.startswith('http'):
-            req = urllib.request.Request(image_url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urllib.request.urlopen(req, timeout=30) as response:
-                with open(img_path, 'wb') as f:
-                    f.write(response.read())
-        elif image_url.startswith('/'):
-            local_path = image_url.lstrip('/')
-            if os.path.exists(local_path):
-                shutil.copy(local_path, img_path)
-            else:
-                print(f"[VIDEO-WORKER-PARALLEL] 씬 {idx+1} 로컬 이미지 없음: {local_path}")
-                return idx, None, duration
-        else:
-            # 로컬 경로 (/ 없이 시작하는 경우, 예: uploads/xxx/image.png)
-            if os.path.exists(image_url):
-                shutil.copy(image_url, img_path)
-            else:
-                print(f"[VIDEO-WORKER-PARALLEL] 씬 {idx+1} 로컬 이미지 없음: {image_url}")
-                return idx, None, duration
-    except Exception as e:
-        print(f"[VIDEO-WORKER-PARALLEL] 씬 {idx+1} 이미지 다운로드 실패: {e}")
-        return idx, None, duration
-
-    if not os.path.exists(img_path):
+    if not fetch_media(image_url, img_path, base_dir=os.getcwd(), timeout=30, label=f"씬 {idx+1} 이미지"):
+        print(f"[VIDEO-WORKER-PARALLEL] 씬 {idx+1} 이미지 다운로드 실패: {image_url[:100]}")
         return idx, None, duration
 
     # 오디오 다운로드
     audio_path = None
     if audio_url:
         audio_path = os.path.join(work_dir, f"audio_{idx:03d}.mp3")
-        try:
-            if audio_url.startswith('http'):
-                req = urllib.request.Request(audio_url, headers={'User-Agent': 'Mozilla/5.0'})
-                with urllib.request.urlopen(req, timeout=30) as response:
-                    with open(audio_path, 'wb') as f:
-                        f.write(response.read())
-            elif audio_url.startswith('/'):
-                local_path = audio_url.lstrip('/')
-                if os.path.exists(local_path):
-                    shutil.copy(local_path, audio_path)
-            else:
-                # 로컬 경로 (/ 없이 시작하는 경우)
-                if os.path.exists(audio_url):
-                    shutil.copy(audio_url, audio_path)
-        except Exception as e:
-            print(f"[VIDEO-WORKER-PARALLEL] 씬 {idx+1} 오디오 다운로드 실패: {e}")
+        if not fetch_media(audio_url, audio_path, base_dir=os.getcwd(), timeout=30, label=f"씬 {idx+1} 오디오"):
+            print(f"[VIDEO-WORKER-PARALLEL] 씬 {idx+1} 오디오 다운로드 실패")
             audio_path = None
 
     # Ken Burns 효과 (씬별로 다양한 효과 자동 배정)
@@ -13608,6 +13697,216 @@ def _create_scene_clip_worker(task):
     return idx, None, duration
 
 
+# 자막 + BGM + 효과음 + 아웃트로를 FFmpeg 1회 인코딩으로 처리 (0이면 단계별 처리)
+POSTPROD_FUSED = os.environ.get('POSTPROD_FUSED', '1') == '1'
+
+
+def _run_fused_post_production(job_id, merged_path, subtitle_filter, scenes, video_effects, work_dir, fonts_dir):
+    """자막 + BGM + 효과음 + 아웃트로를 filter_complex 하나로 묶어 1회 인코딩 (video.postprod)
+
+    단계별 처리와 같은 BGM/효과음/아웃트로 파일과 믹싱 값을 사용하고,
+    효과음 트림과 아웃트로 concat은 그래프 안에서 처리한다.
+
+    Returns:
+        최종 영상 경로 또는 None (실패 시 호출 측에서 단계별 처리로 폴백)
+    """
+    try:
+        info = probe_video_info(merged_path)
+        if info is None:
+            print(f"[POSTPROD] 영상 정보 조회 실패, 단계별 처리로 폴백")
+            return None
+
+        # BGM (씬별 변경이 있으면 구간별, 없으면 전체 영상에 하나)
+        bgm_tracks = []
+        bgm_mood = video_effects.get('bgm_mood', '')
+        scene_bgm_changes = video_effects.get('scene_bgm_changes', [])
+        if bgm_mood and scene_bgm_changes:
+            for seg in compute_bgm_segments(scenes, bgm_mood, scene_bgm_changes):
+                bgm_file = _get_bgm_file(seg['mood'])
+                if not bgm_file:
+                    print(f"[POSTPROD] '{seg['mood']}' BGM 파일 없음, 건너뜀")
+                    continue
+                # 구간 시작/끝에 최대 1초 페이드 (단계별 처리와 같은 값)
+                bgm_tracks.append(scene_bgm_track(bgm_file, seg))
+        elif bgm_mood:
+            bgm_file = _get_bgm_file(bgm_mood)
+            if bgm_file:
+                # 처음 2초 페이드인, 마지막 3초 페이드아웃
+                bgm_tracks.append(BgmTrack(bgm_file, 0.0, info.duration, fade_in=2.0, fade_out=3.0))
+            else:
+                print(f"[POSTPROD] BGM 파일 없음: {bgm_mood}")
+
+        # 효과음 (씬 시작 + 0.5초)
+        sfx_cues = []
+        scene_start_times = {}
+        current_time = 0
+        for idx, scene in enumerate(scenes):
+            scene_start_times[idx + 1] = current_time
+            current_time += scene.get('duration', 0)
+        for sfx in video_effects.get('sound_effects', []):
+            scene_num = sfx.get('scene', 1)
+            if scene_num not in scene_start_times:
+                continue
+            sfx_file = _get_sfx_file(sfx.get('type', ''))
+            if sfx_file:
+                sfx_cues.append(SfxCue(sfx_file, scene_start_times[scene_num] + 0.5))
+
+        # 아웃트로
+        outro_path = None
+        outro_duration = 5
+        if video_effects.get('add_outro', True):
+            candidate = os.path.join(work_dir, "outro.mp4")
+            if _generate_outro_video(candidate, duration=outro_duration, fonts_dir=fonts_dir,
+                                     width=info.width, height=info.height, fps=info.fps):
+                outro_path = candidate
+            else:
+                print(f"[POSTPROD] 아웃트로 생성 실패, 아웃트로 없이 진행")
+
+        output_path = os.path.join(work_dir, "final_fused.mp4")
+        cmd = build_post_production_command(
+            merged_path, output_path, info,
+            subtitle_filter=subtitle_filter,
+            bgm_tracks=bgm_tracks,
+            sfx_cues=sfx_cues,
+            outro_path=outro_path,
+        )
+        total_duration = info.duration + (outro_duration if outro_path else 0)
+        print(f"[POSTPROD] 1회 인코딩 시작: {info.width}x{info.height}@{info.fps:g}, {total_duration:.1f}초 "
+              f"(BGM {len(bgm_tracks)}구간, 효과음 {len(sfx_cues)}개, 아웃트로 {'O' if outro_path else 'X'})")
+
+        last_progress = [90]
+
+        def on_progress(current_sec, total_sec):
+            progress = 90 + int(8 * min(current_sec / total_sec, 1.0)) if total_sec > 0 else 90
+            if progress != last_progress[0]:
+                last_progress[0] = progress
+                _update_job_status(job_id, progress=progress, message='자막/BGM/효과음/아웃트로 인코딩 중...')
+
+        result = run_ffmpeg(cmd, duration=total_duration, label="POSTPROD", on_progress=on_progress)
+        if not result.get('ok') or not os.path.exists(output_path):
+            print(f"[POSTPROD] 1회 인코딩 실패, 단계별 처리로 폴백: {result.get('error', '출력 파일 없음')[:300]}")
+            return None
+
+        print(f"[POSTPROD] 완료: {result['elapsed']:.0f}초, {result['speed']:.1f}x")
+        return output_path
+
+    except Exception as e:
+        print(f"[POSTPROD] 오류, 단계별 처리로 폴백: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
+def _run_staged_post_production(job_id, merged_path, vf_filter, scenes, video_effects, work_dir, fonts_dir):
+    """후반 작업 단계별 처리 (자막 burn-in → BGM → 효과음 → 아웃트로, 단계마다 FFmpeg 1회)
+
+    단일 인코딩(_run_fused_post_production)이 꺼져 있거나 실패했을 때 사용.
+    각 단계는 실패해도 해당 효과 없이 진행한다.
+
+    Returns:
+        최종 영상 경로
+    """
+    final_path = os.path.join(work_dir, "final.mp4")
+
+    # IMPORTANT: stdout=DEVNULL, stderr=PIPE to avoid OOM from buffering FFmpeg output
+    # FFmpeg video encoding generates massive amounts of progress output to stderr
+    # YouTube 호환 설정: -profile:v high -level 4.0, AAC 오디오, +faststart
+    result = subprocess.run([
+        "ffmpeg", "-y", "-i", merged_path,
+        "-vf", vf_filter,
+        "-c:v", "libx264", "-preset", "fast", "-profile:v", "high", "-level", "4.0",
+        "-c:a", "aac", "-b:a", "128k", "-ar", "44100",
+        "-movflags", "+faststart",
+        final_path
+    ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=1800)  # 30분 타임아웃
+
+    if result.returncode != 0:
+        # stderr 전체에서 실제 에러 메시지 추출 (FFmpeg는 마지막에 에러 출력)
+        stderr_full = result.stderr.decode('utf-8', errors='ignore') if result.stderr else ""
+        # 마지막 800자 출력 (실제 에러 메시지 포함)
+        stderr_tail = stderr_full[-800:] if len(stderr_full) > 800 else stderr_full
+        print(f"[VIDEO-WORKER] Subtitle burn-in failed (code {result.returncode})")
+        print(f"[VIDEO-WORKER] stderr (마지막 800자): {stderr_tail}")
+
+        # 자막 burn-in 실패 시 자막 없이 YouTube 호환 인코딩 시도
+        print(f"[VIDEO-WORKER] 자막 없이 YouTube 호환 재인코딩 시도...")
+        fallback_result = subprocess.run([
+            "ffmpeg", "-y", "-i", merged_path,
+            "-c:v", "libx264", "-preset", "fast", "-profile:v", "high", "-level", "4.0",
+            "-c:a", "aac", "-b:a", "128k", "-ar", "44100",
+            "-movflags", "+faststart",
+            final_path
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=1800)
+
+        if fallback_result.returncode != 0:
+            print(f"[VIDEO-WORKER] Fallback 인코딩도 실패, 원본 사용")
+            final_path = merged_path
+        else:
+            print(f"[VIDEO-WORKER] Fallback 인코딩 성공 (자막 없음)")
+
+    del result
+    gc.collect()
+
+    # 5. BGM 믹싱 (옵션) - 씬별 BGM 변경 지원
+    bgm_mood = video_effects.get('bgm_mood', '')
+    scene_bgm_changes = video_effects.get('scene_bgm_changes', [])
+    if bgm_mood:
+        _update_job_status(job_id, progress=95, message='BGM 믹싱 중...')
+        bgm_output_path = os.path.join(work_dir, "with_bgm.mp4")
+
+        # 씬별 BGM 변경이 있으면 새로운 함수 사용
+        if scene_bgm_changes:
+            print(f"[VIDEO-WORKER] 씬별 BGM 믹싱 시작 (변경 {len(scene_bgm_changes)}회)")
+            if _mix_scene_bgm_with_video(final_path, scenes, video_effects, bgm_output_path):
+                final_path = bgm_output_path
+                print(f"[VIDEO-WORKER] 씬별 BGM 믹싱 완료")
+            else:
+                print(f"[VIDEO-WORKER] 씬별 BGM 믹싱 실패, BGM 없이 진행")
+        else:
+            # 기존 방식: 전체 영상에 하나의 BGM
+            bgm_file = _get_bgm_file(bgm_mood)
+            if bgm_file:
+                if _mix_bgm_with_video(final_path, bgm_file, bgm_output_path):
+                    final_path = bgm_output_path
+                    print(f"[VIDEO-WORKER] BGM 믹싱 완료: {bgm_mood}")
+                else:
+                    print(f"[VIDEO-WORKER] BGM 믹싱 실패, BGM 없이 진행")
+            else:
+                print(f"[VIDEO-WORKER] BGM 파일 없음: {bgm_mood}")
+
+    # 6. 효과음 믹싱 (옵션)
+    sound_effects = video_effects.get('sound_effects', [])
+    if sound_effects:
+        _update_job_status(job_id, progress=96, message='효과음 추가 중...')
+        sfx_output_path = os.path.join(work_dir, "with_sfx.mp4")
+        if _mix_sfx_into_video(final_path, sound_effects, scenes, sfx_output_path):
+            final_path = sfx_output_path
+            print(f"[VIDEO-WORKER] 효과음 {len(sound_effects)}개 추가 완료")
+        else:
+            print(f"[VIDEO-WORKER] 효과음 믹싱 실패, 효과음 없이 진행")
+
+    # 7. 아웃트로 추가 (옵션)
+    add_outro = video_effects.get('add_outro', True)  # 기본값: 추가
+    if add_outro:
+        _update_job_status(job_id, progress=98, message='아웃트로 추가 중...')
+        outro_path = os.path.join(work_dir, "outro.mp4")
+        # 메인 영상과 같은 해상도/fps로 맞춰야 concat demuxer 스트림 복사가 성공
+        info = probe_video_info(final_path)
+        outro_size = (info.width, info.height, info.fps) if info else (1280, 720, 24)
+        if _generate_outro_video(outro_path, duration=5, fonts_dir=fonts_dir,
+                                 width=outro_size[0], height=outro_size[1], fps=outro_size[2]):
+            outro_output_path = os.path.join(work_dir, "with_outro.mp4")
+            if _append_outro_to_video(final_path, outro_path, outro_output_path):
+                final_path = outro_output_path
+                print(f"[VIDEO-WORKER] 아웃트로 추가 완료")
+            else:
+                print(f"[VIDEO-WORKER] 아웃트로 연결 실패, 아웃트로 없이 진행")
+        else:
+            print(f"[VIDEO-WORKER] 아웃트로 생성 실패")
+
+    return final_path
+
+
 def _generate_video_worker(job_id, session_id, scenes, detected_lang, video_effects=None):
     """백그라운드 영상 생성 워커
 
@@ -13627,11 +13926,7 @@ def _generate_video_worker(job_id, session_id, scenes, detected_lang, video_effe
     if video_effects is None:
         video_effects = {}
 
-    # FFmpeg 세마포어 획득 (다른 FFmpeg 작업과 동시 실행 방지 - 메모리 보호)
-    print(f"[VIDEO-WORKER] FFmpeg 세마포어 대기 중...")
-    ffmpeg_semaphore.acquire()
-    print(f"[VIDEO-WORKER] FFmpeg 세마포어 획득, 영상 생성 시작...")
-
+    # FFmpeg 동시 실행은 서브프로세스마다 렌더 스케줄러가 제어 (씬 클립, 후반 작업)
     try:
         _update_job_status(job_id, status='processing', message='영상 생성 시작...')
 
@@ -13661,37 +13956,40 @@ def _generate_video_worker(job_id, session_id, scenes, detected_lang, video_effe
             all_subtitles = []
             current_time = 0.0
 
-            # 환경변수로 병렬 처리 워커 수 설정 (기본값: 1 = 순차 처리)
-            # Render Pro (4GB) 환경에서는 2로 설정 권장
-            parallel_workers = int(os.environ.get('VIDEO_PARALLEL_WORKERS', 1))
+            # 렌더 스케줄러: 여유 메모리/CPU 기준으로 동시 실행 수 결정
+            # Ken Burns는 1280x720 출력, preset fast (zoompan 엔진은 1.4배 업스케일, crop 엔진은 최대 줌 1.1배 마스터)
+            scheduler = get_render_scheduler()
+            kb_scale = 1.4 if KEN_BURNS_ENGINE == 'zoompan' else 1.1
+            clip_estimates = [
+                estimate_ffmpeg_memory_mb(1280, 720, duration=float(scene.get('duration', 5.0) or 5.0),
+                                          preset='fast', scale=kb_scale)
+                for scene in scenes
+            ]
+            parallel_workers = scheduler.parallelism_for(max(clip_estimates)) if scenes else 1
 
             # 1. 각 씬별 영상 클립 생성
             if parallel_workers > 1:
                 # ========== 병렬 처리 모드 ==========
-                from concurrent.futures import ThreadPoolExecutor, as_completed
-
-                print(f"[VIDEO-WORKER-PARALLEL] 병렬 처리 시작 - {total_scenes}개 씬, {parallel_workers}개 워커")
-                _update_job_status(job_id, progress=5, message=f'병렬 처리 시작 ({parallel_workers}개 워커)...')
+                print(f"[VIDEO-WORKER-PARALLEL] 병렬 처리 시작 - {total_scenes}개 씬, 최대 {parallel_workers}개 동시 실행")
+                _update_job_status(job_id, progress=5, message=f'병렬 처리 시작 (최대 {parallel_workers}개 동시 실행)...')
 
                 tasks = [(idx, scene, work_dir, total_scenes) for idx, scene in enumerate(scenes)]
+                labels = [f"씬 {idx+1}" for idx in range(total_scenes)]
                 results = [None] * total_scenes  # 순서 유지를 위한 리스트
+                completed = 0
 
-                with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
-                    future_to_idx = {executor.submit(_create_scene_clip_worker, task): task[0] for task in tasks}
-                    completed = 0
+                for idx, result, error in scheduler.run_all(_create_scene_clip_worker, tasks, clip_estimates, labels):
+                    completed += 1
+                    progress = int((completed / total_scenes) * 70)
+                    _update_job_status(job_id, progress=progress, message=f'씬 {completed}/{total_scenes} 클립 생성 중...')
 
-                    for future in as_completed(future_to_idx):
-                        idx = future_to_idx[future]
-                        completed += 1
-                        progress = int((completed / total_scenes) * 70)
-                        _update_job_status(job_id, progress=progress, message=f'씬 {completed}/{total_scenes} 클립 생성 중...')
+                    if error is not None:
+                        print(f"[VIDEO-WORKER-PARALLEL] 씬 {idx+1} 오류: {error}")
+                        results[idx] = (None, scenes[idx].get('duration', 5.0))
+                        continue
 
-                        try:
-                            result_idx, clip_path, duration = future.result()
-                            results[idx] = (clip_path, duration)
-                        except Exception as e:
-                            print(f"[VIDEO-WORKER-PARALLEL] 씬 {idx+1} 오류: {e}")
-                            results[idx] = (None, scenes[idx].get('duration', 5.0))
+                    result_idx, clip_path, duration = result
+                    results[idx] = (clip_path, duration)
 
                 # 결과 정리 (순서대로) + 자막 시간 계산
                 for idx, (clip_path, duration) in enumerate(results):
@@ -13730,41 +14028,14 @@ def _generate_video_worker(job_id, session_id, scenes, detected_lang, video_effe
                         current_time += duration
                         continue
 
-                    # 이미지 다운로드
+                    # 이미지 다운로드 (스트리밍 - 메모리에 통째로 올리지 않음)
                     img_path = os.path.join(work_dir, f"scene_{idx:03d}.jpg")
                     print(f"[VIDEO-WORKER-SEQUENTIAL] Scene {idx + 1} image_url: {image_url[:100]}...")
-                    try:
-                        if image_url.startswith('http'):
-                            req = urllib.request.Request(image_url, headers={'User-Agent': 'Mozilla/5.0'})
-                            with urllib.request.urlopen(req, timeout=30) as response:
-                                with open(img_path, 'wb') as f:
-                                    f.write(response.read())
-                        elif image_url.startswith('/'):
-                            local_path = image_url.lstrip('/')
-                            if os.path.exists(local_path):
-                                shutil.copy(local_path, img_path)
-                            else:
-                                print(f"[VIDEO-WORKER-SEQUENTIAL] Local image not found: {local_path}")
-                                current_time += duration
-                                continue
-                        else:
-                            # 로컬 경로 (/ 없이 시작하는 경우)
-                            if os.path.exists(image_url):
-                                shutil.copy(image_url, img_path)
-                            else:
-                                print(f"[VIDEO-WORKER-SEQUENTIAL] Local image not found: {image_url}")
-                                current_time += duration
-                                continue
-                    except Exception as e:
-                        print(f"[VIDEO-WORKER-SEQUENTIAL] Image download failed: {e}")
+                    if not fetch_media(image_url, img_path, base_dir=os.getcwd(), timeout=30, label=f"Scene {idx + 1} image"):
+                        print(f"[VIDEO-WORKER-SEQUENTIAL] Image download failed: {image_url[:100]}")
                         current_time += duration
                         continue
 
-                    # 이미지 파일 검증
-                    if not os.path.exists(img_path):
-                        print(f"[VIDEO-WORKER-SEQUENTIAL] Image file not created: {img_path}")
-                        current_time += duration
-                        continue
                     img_size = os.path.getsize(img_path)
                     print(f"[VIDEO-WORKER-SEQUENTIAL] Scene {idx + 1} image saved: {img_size} bytes")
 
@@ -13772,22 +14043,8 @@ def _generate_video_worker(job_id, session_id, scenes, detected_lang, video_effe
                     audio_path = None
                     if audio_url:
                         audio_path = os.path.join(work_dir, f"audio_{idx:03d}.mp3")
-                        try:
-                            if audio_url.startswith('http'):
-                                req = urllib.request.Request(audio_url, headers={'User-Agent': 'Mozilla/5.0'})
-                                with urllib.request.urlopen(req, timeout=30) as response:
-                                    with open(audio_path, 'wb') as f:
-                                        f.write(response.read())
-                            elif audio_url.startswith('/'):
-                                local_path = audio_url.lstrip('/')
-                                if os.path.exists(local_path):
-                                    shutil.copy(local_path, audio_path)
-                            else:
-                                # 로컬 경로 (/ 없이 시작하는 경우)
-                                if os.path.exists(audio_url):
-                                    shutil.copy(audio_url, audio_path)
-                        except Exception as e:
-                            print(f"[VIDEO-WORKER-SEQUENTIAL] Audio download failed: {e}")
+                        if not fetch_media(audio_url, audio_path, base_dir=os.getcwd(), timeout=30, label=f"Scene {idx + 1} audio"):
+                            print(f"[VIDEO-WORKER-SEQUENTIAL] Audio download failed")
                             audio_path = None
 
                     # 자막 시간 조정
@@ -13841,12 +14098,13 @@ def _generate_video_worker(job_id, session_id, scenes, detected_lang, video_effe
                         ]
 
                     # 메모리 최적화: stdout DEVNULL, stderr만 PIPE (OOM 방지)
-                    result = subprocess.run(
-                        cmd,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.PIPE,
-                        timeout=600
-                    )
+                    with scheduler.admit(clip_estimates[idx], label=f"씬 {idx+1}"):
+                        result = subprocess.run(
+                            cmd,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE,
+                            timeout=600
+                        )
                     if result.returncode == 0 and os.path.exists(clip_path):
                         scene_videos.append(clip_path)
                         print(f"[VIDEO-WORKER-SEQUENTIAL] Clip {idx+1} created successfully")
@@ -13888,12 +14146,13 @@ def _generate_video_worker(job_id, session_id, scenes, detected_lang, video_effe
                                 clip_path
                             ]
 
-                        fallback_result = subprocess.run(
-                            fallback_cmd,
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.PIPE,
-                            timeout=600
-                        )
+                        with scheduler.admit(clip_estimates[idx], label=f"씬 {idx+1} 재시도"):
+                            fallback_result = subprocess.run(
+                                fallback_cmd,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE,
+                                timeout=600
+                            )
                         if fallback_result.returncode == 0 and os.path.exists(clip_path):
                             scene_videos.append(clip_path)
                             print(f"[VIDEO-WORKER-SEQUENTIAL] Clip {idx+1} 단순 방식 성공")
@@ -13985,10 +14244,9 @@ def _generate_video_worker(job_id, session_id, scenes, detected_lang, video_effe
             ass_path = os.path.join(work_dir, "subtitles.ass")
             _generate_ass_subtitles(all_subtitles, subtitle_highlights, ass_path, lang=detected_lang)
 
-            # 4. 자막 burn-in + 화면 텍스트 오버레이
+            # 4~7. 자막 burn-in + BGM + 효과음 + 아웃트로
             _update_job_status(job_id, progress=90, message='자막 및 효과 삽입 중...')
 
-            final_path = os.path.join(work_dir, "final.mp4")
 
             # 폰트 디렉토리 절대 경로 설정 (스크립트 위치 기준)
             script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -14016,97 +14274,19 @@ def _generate_video_worker(job_id, session_id, scenes, detected_lang, video_effe
             print(f"[VIDEO-WORKER] VF filter (처음 500자): {vf_filter[:500]}")
             print(f"[VIDEO-WORKER] Fonts directory: {fonts_dir}")
 
-            # IMPORTANT: stdout=DEVNULL, stderr=PIPE to avoid OOM from buffering FFmpeg output
-            # FFmpeg video encoding generates massive amounts of progress output to stderr
-            # YouTube 호환 설정: -profile:v high -level 4.0, AAC 오디오, +faststart
-            result = subprocess.run([
-                "ffmpeg", "-y", "-i", merged_path,
-                "-vf", vf_filter,
-                "-c:v", "libx264", "-preset", "fast", "-profile:v", "high", "-level", "4.0",
-                "-c:a", "aac", "-b:a", "128k", "-ar", "44100",
-                "-movflags", "+faststart",
-                final_path
-            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=1800)  # 30분 타임아웃
-
-            if result.returncode != 0:
-                # stderr 전체에서 실제 에러 메시지 추출 (FFmpeg는 마지막에 에러 출력)
-                stderr_full = result.stderr.decode('utf-8', errors='ignore') if result.stderr else ""
-                # 마지막 800자 출력 (실제 에러 메시지 포함)
-                stderr_tail = stderr_full[-800:] if len(stderr_full) > 800 else stderr_full
-                print(f"[VIDEO-WORKER] Subtitle burn-in failed (code {result.returncode})")
-                print(f"[VIDEO-WORKER] stderr (마지막 800자): {stderr_tail}")
-
-                # 자막 burn-in 실패 시 자막 없이 YouTube 호환 인코딩 시도
-                print(f"[VIDEO-WORKER] 자막 없이 YouTube 호환 재인코딩 시도...")
-                fallback_result = subprocess.run([
-                    "ffmpeg", "-y", "-i", merged_path,
-                    "-c:v", "libx264", "-preset", "fast", "-profile:v", "high", "-level", "4.0",
-                    "-c:a", "aac", "-b:a", "128k", "-ar", "44100",
-                    "-movflags", "+faststart",
-                    final_path
-                ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=1800)
-
-                if fallback_result.returncode != 0:
-                    print(f"[VIDEO-WORKER] Fallback 인코딩도 실패, 원본 사용")
-                    final_path = merged_path
-                else:
-                    print(f"[VIDEO-WORKER] Fallback 인코딩 성공 (자막 없음)")
-
-            del result
-            gc.collect()
-
-            # 5. BGM 믹싱 (옵션) - 씬별 BGM 변경 지원
-            bgm_mood = video_effects.get('bgm_mood', '')
-            scene_bgm_changes = video_effects.get('scene_bgm_changes', [])
-            if bgm_mood:
-                _update_job_status(job_id, progress=95, message='BGM 믹싱 중...')
-                bgm_output_path = os.path.join(work_dir, "with_bgm.mp4")
-
-                # 씬별 BGM 변경이 있으면 새로운 함수 사용
-                if scene_bgm_changes:
-                    print(f"[VIDEO-WORKER] 씬별 BGM 믹싱 시작 (변경 {len(scene_bgm_changes)}회)")
-                    if _mix_scene_bgm_with_video(final_path, scenes, video_effects, bgm_output_path):
-                        final_path = bgm_output_path
-                        print(f"[VIDEO-WORKER] 씬별 BGM 믹싱 완료")
-                    else:
-                        print(f"[VIDEO-WORKER] 씬별 BGM 믹싱 실패, BGM 없이 진행")
-                else:
-                    # 기존 방식: 전체 영상에 하나의 BGM
-                    bgm_file = _get_bgm_file(bgm_mood)
-                    if bgm_file:
-                        if _mix_bgm_with_video(final_path, bgm_file, bgm_output_path):
-                            final_path = bgm_output_path
-                            print(f"[VIDEO-WORKER] BGM 믹싱 완료: {bgm_mood}")
-                        else:
-                            print(f"[VIDEO-WORKER] BGM 믹싱 실패, BGM 없이 진행")
-                    else:
-                        print(f"[VIDEO-WORKER] BGM 파일 없음: {bgm_mood}")
-
-            # 6. 효과음 믹싱 (옵션)
-            sound_effects = video_effects.get('sound_effects', [])
-            if sound_effects:
-                _update_job_status(job_id, progress=96, message='효과음 추가 중...')
-                sfx_output_path = os.path.join(work_dir, "with_sfx.mp4")
-                if _mix_sfx_into_video(final_path, sound_effects, scenes, sfx_output_path):
-                    final_path = sfx_output_path
-                    print(f"[VIDEO-WORKER] 효과음 {len(sound_effects)}개 추가 완료")
-                else:
-                    print(f"[VIDEO-WORKER] 효과음 믹싱 실패, 효과음 없이 진행")
-
-            # 7. 아웃트로 추가 (옵션)
-            add_outro = video_effects.get('add_outro', True)  # 기본값: 추가
-            if add_outro:
-                _update_job_status(job_id, progress=98, message='아웃트로 추가 중...')
-                outro_path = os.path.join(work_dir, "outro.mp4")
-                if _generate_outro_video(outro_path, duration=5, fonts_dir=fonts_dir):
-                    outro_output_path = os.path.join(work_dir, "with_outro.mp4")
-                    if _append_outro_to_video(final_path, outro_path, outro_output_path):
-                        final_path = outro_output_path
-                        print(f"[VIDEO-WORKER] 아웃트로 추가 완료")
-                    else:
-                        print(f"[VIDEO-WORKER] 아웃트로 연결 실패, 아웃트로 없이 진행")
-                else:
-                    print(f"[VIDEO-WORKER] 아웃트로 생성 실패")
+            # 켜진 효과를 filter_complex 하나로 묶어 1회 인코딩, 실패하면 기존 단계별 처리로 폴백
+            # 전체 길이 재인코딩이므로 렌더 스케줄러 입장 후 실행 (다른 작업의 씬 클립/후반 작업과 메모리 공유)
+            postprod_estimate = estimate_ffmpeg_memory_mb(1280, 720, duration=current_time, preset='fast')
+            with scheduler.admit(postprod_estimate, label=f"{job_id[:8]} 후반 작업"):
+                final_path = None
+                if POSTPROD_FUSED:
+                    final_path = _run_fused_post_production(
+                        job_id, merged_path, vf_filter, scenes, video_effects, work_dir, fonts_dir
+                    )
+                if not final_path:
+                    final_path = _run_staged_post_production(
+                        job_id, merged_path, vf_filter, scenes, video_effects, work_dir, fonts_dir
+                    )
 
             # 8. 결과 저장
             output_filename = f"video_{session_id}.mp4"
@@ -14140,30 +14320,29 @@ def _generate_video_worker(job_id, session_id, scenes, detected_lang, video_effe
         traceback.print_exc()
         _update_job_status(job_id, status='failed', error=str(e), message=f'오류: {str(e)}')
     finally:
-        # 세마포어 해제 (다음 FFmpeg 작업 허용)
-        ffmpeg_semaphore.release()
-        print(f"[VIDEO-WORKER] FFmpeg 세마포어 해제됨")
+        _cleanup_job_media(job_id)
 
 
-@app.route('/api/image/generate-video', methods=['POST'])
-def api_image_generate_video():
+def image_generate_video_service(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
     """영상 생성 시작 (백그라운드) - job_id 반환"""
     import threading
     import uuid as uuid_module
     from datetime import datetime
 
-    data = request.get_json()
     session_id = data.get('session_id', str(uuid_module.uuid4())[:8])
     scenes = data.get('scenes', [])
     detected_lang = data.get('language', 'en')
     video_effects = data.get('video_effects', {})  # 새 기능: BGM, 효과음, 자막 강조, Ken Burns 등
 
     if not scenes:
-        return jsonify({"ok": False, "error": "씬 데이터가 없습니다"}), 400
+        return {"ok": False, "error": "씬 데이터가 없습니다"}, 400
 
     total_duration = sum(s.get('duration', 0) for s in scenes)
     job_id = f"vj_{uuid_module.uuid4().hex[:12]}"
 
+    # data URL은 파일로 빼내고 참조만 유지 (워커 스레드가 base64를 들고 있지 않도록)
+    _spool_job_media(job_id, scenes=scenes)
+
     # 작업 상태 초기화 (파일 기반)
     _save_job_status(job_id, {
         'status': 'queued',
@@ -14187,12 +14366,19 @@ def api_image_generate_video():
 
     print(f"[IMAGE-VIDEO] Job started: {job_id}, {len(scenes)} scenes, {total_duration:.1f}s")
 
-    return jsonify({
+    return {
         "ok": True,
         "job_id": job_id,
         "message": "영상 생성이 시작되었습니다. 상태를 확인해주세요.",
         "estimated_time": f"{int(total_duration // 60)}분 {int(total_duration % 60)}초 예상"
-    })
+    }, 200
+
+
+@app.route('/api/image/generate-video', methods=['POST'])
+def api_image_generate_video():
+    """POST /api/image/generate-video - image_generate_video_service() HTTP 래퍼"""
+    result, status = image_generate_video_service(request.get_json(silent=True) or {})
+    return jsonify(result), status
 
 
 @app.route('/api/image/video-status/<job_id>', methods=['GET'])
@@ -14202,17 +14388,7 @@ def api_image_video_status(job_id):
     if not job:
         return jsonify({"ok": False, "error": "작업을 찾을 수 없습니다"}), 404
 
-    return jsonify({
-        "ok": True,
-        "job_id": job_id,
-        "status": job.get('status', 'unknown'),
-        "progress": job.get('progress', 0),
-        "message": job.get('message', ''),
-        "video_url": job.get('video_url'),
-        "duration": job.get('duration'),
-        "subtitle_count": job.get('subtitle_count', 0),
-        "error": job.get('error')
-    })
+    return jsonify(_image_job_progress(job_id, job))
 
 
 # ===== 썸네일 자동 생성 API =====
@@ -15014,8 +15190,7 @@ def get_learning_examples(limit=5):
     return examples
 
 
-@app.route('/api/thumbnail-ai/analyze', methods=['POST'])
-def api_thumbnail_ai_analyze():
+def thumbnail_ai_analyze_service(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
     """
     GPT-5.1이 대본을 분석하여 썸네일 프롬프트 1개 생성
     학습 데이터를 Few-shot으로 활용
@@ -15024,13 +15199,12 @@ def api_thumbnail_ai_analyze():
         from openai import OpenAI
         client = OpenAI()
 
-        data = request.get_json() or {}
         script = data.get('script', '')
         title = data.get('title', '')
         additional_prompt = data.get('additional_prompt', '')  # 사용자 추가 요청사항
 
         if not script:
-            return jsonify({"ok": False, "error": "대본이 필요합니다"}), 400
+            return {"ok": False, "error": "대본이 필요합니다"}, 400
 
         # 언어 감지 (대본 기준)
         def detect_language(text):
@@ -15203,14 +15377,14 @@ def api_thumbnail_ai_analyze():
         except json.JSONDecodeError as je:
             print(f"[THUMBNAIL-AI] JSON 파싱 오류: {je}")
             print(f"[THUMBNAIL-AI] 원본 텍스트: {result_text[:500]}")
-            return jsonify({"ok": False, "error": f"AI 응답 파싱 오류: {str(je)}"}), 200
+            return {"ok": False, "error": f"AI 응답 파싱 오류: {str(je)}"}, 200
 
         # 세션 ID 생성
         session_id = f"thumb_{uuid.uuid4().hex[:12]}"
 
         print(f"[THUMBNAIL-AI] 분석 완료 - 세션: {session_id}")
 
-        return jsonify({
+        return {
             "ok": True,
             "session_id": session_id,
             "script_summary": result.get("script_summary", ""),
@@ -15219,13 +15393,20 @@ def api_thumbnail_ai_analyze():
             "title": title,
             "lang": lang_code,  # 감지된 언어
             "learning_examples_used": len(learning_examples)
-        })
+        }, 200
 
     except Exception as e:
         print(f"[THUMBNAIL-AI][ERROR] {str(e)}")
         import traceback
         traceback.print_exc()
-        return jsonify({"ok": False, "error": str(e)}), 500
+        return {"ok": False, "error": str(e)}, 500
+
+
+@app.route('/api/thumbnail-ai/analyze', methods=['POST'])
+def api_thumbnail_ai_analyze():
+    """POST /api/thumbnail-ai/analyze - thumbnail_ai_analyze_service() HTTP 래퍼"""
+    result, status = thumbnail_ai_analyze_service(request.get_json(silent=True) or {})
+    return jsonify(result), status
 
 
 @app.route('/api/thumbnail-ai/generate', methods=['POST'])
@@ -15437,8 +15618,7 @@ def api_thumbnail_ai_history():
         return jsonify({"ok": False, "error": str(e)}), 500
 
 
-@app.route('/api/thumbnail-ai/generate-single', methods=['POST'])
-def api_thumbnail_ai_generate_single():
+def thumbnail_ai_generate_single_service(data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
     """
     단일 썸네일 생성 (자동화 파이프라인용 - A 하나만 생성)
     ★ Gemini가 직접 텍스트 렌더링
@@ -15448,7 +15628,6 @@ def api_thumbnail_ai_generate_single():
         from PIL import Image
         import io
 
-        data = request.get_json() or {}
         prompt_data = data.get('prompt', {})
         session_id = data.get('session_id', '')
         category = data.get('category', '')
@@ -15456,7 +15635,7 @@ def api_thumbnail_ai_generate_single():
         style = prompt_data.get('style', '')
 
         if not prompt_data.get('prompt'):
-            return jsonify({"ok": False, "error": "prompt 필드가 필요합니다"}), 400
+            return {"ok": False, "error": "prompt 필드가 필요합니다"}, 400
 
         print(f"[THUMBNAIL-AI] 단일 썸네일 생성 - 세션: {session_id}, 카테고리: {category}, 스타일: {style}")
 
@@ -15507,11 +15686,11 @@ Style: {character_nationality} webtoon style, comic illustration, clean bold out
         # Gemini 3 Pro로 이미지 생성 (텍스트 포함)
         result = generate_image_base64(prompt=enhanced_prompt, model=GEMINI_PRO)
         if not result.get("ok"):
-            return jsonify({"ok": False, "error": result.get("error", "이미지 생성 실패")})
+            return {"ok": False, "error": result.get("error", "이미지 생성 실패")}, 200
 
         base64_image_data = result.get("base64")
         if not base64_image_data:
-            return jsonify({"ok": False, "error": "이미지 데이터 추출 실패"})
+            return {"ok": False, "error": "이미지 데이터 추출 실패"}, 200
 
         # 이미지 처리
         upload_dir = "uploads/thumbnails"
@@ -15540,16 +15719,23 @@ Style: {character_nationality} webtoon style, comic illustration, clean bold out
         file_size = os.path.getsize(filepath)
         print(f"[THUMBNAIL-AI] 썸네일 저장: {filepath} ({file_size / 1024:.1f}KB)")
 
-        return jsonify({
+        return {
             "ok": True,
             "image_url": f"/uploads/thumbnails/{filename}"
-        })
+        }, 200
 
     except Exception as e:
         print(f"[THUMBNAIL-AI][ERROR] {str(e)}")
         import traceback
         traceback.print_exc()
-        return jsonify({"ok": False, "error": str(e)}), 500
+        return {"ok": False, "error": str(e)}, 500
+
+
+@app.route('/api/thumbnail-ai/generate-single', methods=['POST'])
+def api_thumbnail_ai_generate_single():
+    """POST /api/thumbnail-ai/generate-single - thumbnail_ai_generate_single_service() HTTP 래퍼"""
+    result, status = thumbnail_ai_generate_single_service(request.get_json(silent=True) or {})
+    return jsonify(result), status
 
 
 @app.route('/api/thumbnail-ai/generate-both', methods=['POST'])
@@ -15671,9 +15857,6 @@ def api_thumbnail_ai_download_zip():
     YouTube Test & Compare용 3개 썸네일
     """
     try:
-        import zipfile
-        from io import BytesIO
-
         data = request.get_json() or {}
         image_urls = data.get('image_urls', {})
         session_id = data.get('session_id', 'thumbnails')
@@ -15681,11 +15864,12 @@ def api_thumbnail_ai_download_zip():
         if not image_urls:
             return jsonify({"ok": False, "error": "이미지 URL이 필요합니다"}), 400
 
-        # ZIP 파일 생성
-        zip_buffer = BytesIO()
+        # ZIP 파일 생성 (outputs/에 바로 작성)
         output_dir = os.path.join(os.path.dirname(__file__), 'outputs')
+        zip_filename = f"thumbnails_{session_id}_{int(time.time())}.zip"
+        zip_filepath = os.path.join(output_dir, zip_filename)
 
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        with atomic_zip(zip_filepath) as zip_file:
             for variant, url in image_urls.items():
                 if not url:
                     continue
@@ -15697,18 +15881,9 @@ def api_thumbnail_ai_download_zip():
 
                     if os.path.exists(filepath):
                         # 파일명을 간단하게 변경 (thumbnail_A.png, thumbnail_B.png, thumbnail_C.png)
-                        zip_filename = f"thumbnail_{variant}.png"
-                        zip_file.write(filepath, zip_filename)
-                        print(f"[THUMBNAIL-ZIP] Added: {zip_filename}")
-
-        zip_buffer.seek(0)
-
-        # ZIP 파일 저장
-        zip_filename = f"thumbnails_{session_id}_{int(time.time())}.zip"
-        zip_filepath = os.path.join(output_dir, zip_filename)
-
-        with open(zip_filepath, 'wb') as f:
-            f.write(zip_buffer.getvalue())
+                        entry_name = f"thumbnail_{variant}.png"
+                        zip_write_file(zip_file, filepath, entry_name)
+                        print(f"[THUMBNAIL-ZIP] Added: {entry_name}")
 
         print(f"[THUMBNAIL-ZIP] ZIP 생성 완료: {zip_filename}")
 
@@ -15726,12 +15901,14 @@ def api_thumbnail_ai_download_zip():
 
 
 # ===== Google Sheets 자동화 시스템 (서비스 계정 인증) =====
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+# google.oauth2 / googleapiclient는 import에 ~0.5초 → 서비스 객체를 만들 때 import
 
 def get_sheets_service_account():
     """서비스 계정을 사용하여 Google Sheets API 서비스 객체 반환"""
     try:
+        from google.oauth2 import service_account
+        from googleapiclient.discovery import build
+
         # 환경변수에서 서비스 계정 JSON 로드
         service_account_json = os.environ.get('GOOGLE_SERVICE_ACCOUNT_JSON')
         if not service_account_json:
@@ -15766,6 +15943,9 @@ def get_sheets_service_account():
 def get_docs_service_account():
     """서비스 계정을 사용하여 Google Docs API 서비스 객체 반환"""
     try:
+        from google.oauth2 import service_account
+        from googleapiclient.discovery import build
+
         service_account_json = os.environ.get('GOOGLE_SERVICE_ACCOUNT_JSON')
         if not service_account_json:
             print("[DOCS] GOOGLE_SERVICE_ACCOUNT_JSON 환경변수가 설정되지 않음")
@@ -15794,6 +15974,9 @@ def get_docs_service_account():
 def get_drive_service_account():
     """서비스 계정을 사용하여 Google Drive API 서비스 객체 반환"""
     try:
+        from google.oauth2 import service_account
+        from googleapiclient.discovery import build
+
         service_account_json = os.environ.get('GOOGLE_SERVICE_ACCOUNT_JSON')
         if not service_account_json:
             print("[DRIVE] GOOGLE_SERVICE_ACCOUNT_JSON 환경변수가 설정되지 않음")
@@ -16998,15 +17181,16 @@ def run_automation_pipeline(row_data, row_index, selected_project=''):
     row_index: 시트에서의 행 번호 (1-based, 헤더 제외하면 데이터는 2부터)
     selected_project: 미리 선택된 YouTube 프로젝트 ('', '_2') - api_sheets_check_and_process에서 전달
 
-    ★★★ 중요: 기존 /image 페이지와 동일한 API를 사용합니다 ★★★
-    - /api/image/analyze-script (대본 분석)
+    ★★★ 중요: 기존 /image 페이지와 동일한 로직을 사용합니다 ★★★
+    HTTP 루프백 대신 각 API의 서비스 함수를 직접 호출 (워커 점유/self-deadlock 방지)
+    - image_analyze_script_service (/api/image/analyze-script, 대본 분석)
+    - thumbnail_ai_analyze_service (/api/thumbnail-ai/analyze, 썸네일 프롬프트)
     - /api/drama/generate-image (이미지 생성)
-    - /api/image/generate-assets-zip (TTS + 자막)
-    - /api/thumbnail-ai/generate-all (썸네일 생성)
-    - /api/image/generate-video (영상 생성)
-    - /api/youtube/upload (YouTube 업로드)
+    - image_generate_assets_zip_service (/api/image/generate-assets-zip, TTS + 자막)
+    - thumbnail_ai_generate_single_service (/api/thumbnail-ai/generate-single, 썸네일 생성)
+    - image_generate_video_service + job_wait_service (/api/image/generate-video, 영상 생성)
+    - youtube_upload_service (/api/youtube/upload, YouTube 업로드)
     """
-    import requests as req
     import time as time_module
 
     try:
@@ -17099,8 +17283,7 @@ def run_automation_pipeline(row_data, row_index, selected_project=''):
             image_count, estimated_minutes = get_image_count_by_script(len(script))
             print(f"[AUTOMATION] 대본 {len(script)}자 → 예상 {estimated_minutes:.1f}분 → 이미지 {image_count}개")
 
-            # HTTP 호출 대신 직접 함수 호출 (self-deadlock 방지)
-            # Flask의 test_request_context를 사용하여 request 객체 시뮬레이션
+            # HTTP 호출 대신 서비스 함수 직접 호출 (self-deadlock 방지)
             analyze_request_data = {
                 "script": script,
                 "content_type": "drama",
@@ -17112,18 +17295,7 @@ def run_automation_pipeline(row_data, row_index, selected_project=''):
                 "channel_style": channel_style  # [TUBELENS] 채널별 스타일 정보
             }
 
-            with app.test_request_context(
-                '/api/image/analyze-script',
-                method='POST',
-                json=analyze_request_data,
-                content_type='application/json'
-            ):
-                analyze_response = api_image_analyze_script()
-                # Flask 응답 처리: (response, status_code) 튜플 또는 response 객체
-                if isinstance(analyze_response, tuple):
-                    analyze_data = analyze_response[0].get_json()
-                else:
-                    analyze_data = analyze_response.get_json()
+            analyze_data, _ = image_analyze_script_service(analyze_request_data)
 
             if not analyze_data.get('ok'):
                 return {"ok": False, "error": f"대본 분석 실패: {analyze_data.get('error')}", "video_url": None}
@@ -17137,14 +17309,11 @@ def run_automation_pipeline(row_data, row_index, selected_project=''):
             print(f"[AUTOMATION] 전용 썸네일 분석 API 호출 시작...")
             ai_prompts = {}
             try:
-                # 내부 API 호출 (같은 서버)
-                thumb_analyze_response = requests.post(
-                    f"http://127.0.0.1:{os.environ.get('PORT', 5000)}/api/thumbnail-ai/analyze",
-                    json={"script": script, "title": youtube_meta.get('title', '')},
-                    timeout=120
+                # 서비스 함수 직접 호출 (같은 프로세스)
+                thumb_result, thumb_status = thumbnail_ai_analyze_service(
+                    {"script": script, "title": youtube_meta.get('title', '')}
                 )
-                if thumb_analyze_response.status_code == 200:
-                    thumb_result = thumb_analyze_response.json()
+                if thumb_status == 200:
                     if thumb_result.get('ok'):
                         # prompts 구조: {"A": {"prompt": "...", "text_overlay": {...}}, "B": {...}}
                         thumb_prompts = thumb_result.get('prompts', {})
@@ -17158,7 +17327,7 @@ def run_automation_pipeline(row_data, row_index, selected_project=''):
                     else:
                         print(f"[AUTOMATION] 전용 썸네일 분석 실패: {thumb_result.get('error')}, 폴백 사용")
                 else:
-                    print(f"[AUTOMATION] 전용 썸네일 분석 HTTP 오류: {thumb_analyze_response.status_code}")
+                    print(f"[AUTOMATION] 전용 썸네일 분석 오류 ({thumb_status}): {thumb_result.get('error')}")
             except Exception as te:
                 print(f"[AUTOMATION] 전용 썸네일 분석 예외: {te}")
 
@@ -17392,14 +17561,13 @@ def run_automation_pipeline(row_data, row_index, selected_project=''):
                         "subtitle_segments": scene.get('subtitle_segments', [])  # VRCS 2.0 문장별 자막
                     })
 
-                assets_resp = req.post(f"{base_url}/api/image/generate-assets-zip", json={
+                assets_data, _ = image_generate_assets_zip_service({
                     "session_id": session_id,
                     "scenes": scenes_for_tts,
                     "voice": voice,
                     "include_images": False
-                }, timeout=900)  # 15분 (긴 대본 + Gemini Rate Limit 배치 처리용)
+                })
 
-                assets_data = assets_resp.json()
                 if not assets_data.get('ok'):
                     raise Exception(f"TTS 실패: {assets_data.get('error')}")
 
@@ -17634,14 +17802,13 @@ NO photorealistic."""
                             "text_overlay": {"main": fallback_text, "sub": fallback_sub}
                         }
 
-                thumb_resp = req.post(f"{base_url}/api/thumbnail-ai/generate-single", json={
+                thumb_data, _ = thumbnail_ai_generate_single_service({
                     "session_id": f"thumb_{session_id}",
                     "prompt": thumb_prompt,
                     "category": detected_category,
                     "lang": detected_lang
-                }, timeout=180)
+                })
 
-                thumb_data = thumb_resp.json()
                 if thumb_data.get('ok') and thumb_data.get('image_url'):
                     thumbnail_url = thumb_data['image_url']
                     total_cost += 0.03
@@ -17702,14 +17869,13 @@ NO photorealistic."""
                     print(f"[AUTOMATION] 3. 영상 생성 재시도 ({video_attempt + 1}/{max_video_retries}) - 3분 후 시작...")
                     time_module.sleep(180)  # 재시도 전 3분 대기
 
-                video_resp = req.post(f"{base_url}/api/image/generate-video", json={
+                video_data, _ = image_generate_video_service({
                     "session_id": session_id,
                     "scenes": scenes,
                     "language": "ko",  # 한글 자막용 NanumGothic 폰트 적용
                     "video_effects": video_effects  # 새 기능: BGM, 효과음, 자막 강조, Ken Burns 등
-                }, timeout=600)
+                })
 
-                video_data = video_resp.json()
                 if not video_data.get('ok') and not video_data.get('job_id'):
                     video_generation_error = f"영상 생성 시작 실패: {video_data.get('error')}"
                     print(f"[AUTOMATION] 3. 시도 {video_attempt + 1} 실패: {video_generation_error}")
@@ -17717,12 +17883,17 @@ NO photorealistic."""
 
                 job_id = video_data.get('job_id')
 
-                # 영상 생성 완료 대기 (폴링) - 40분 대기
+                # 영상 생성 완료 대기 (long-poll) - 40분 대기
                 # 10분 영상에 ~20분 소요되므로 여유있게 40분
-                for _ in range(1200):  # 1200 * 2초 = 40분
-                    time_module.sleep(2)
-                    status_resp = req.get(f"{base_url}/api/image/video-status/{job_id}", timeout=30)
-                    status_data = status_resp.json()
+                # 상태 변경 시 즉시 반환, 변경 없으면 최대 JOB_WAIT_MAX_SECONDS 대기
+                wait_deadline = time_module.time() + 40 * 60
+                since = -1
+                while time_module.time() < wait_deadline:
+                    status_data, _ = job_wait_service(job_id, since=since)
+                    if not status_data.get('ok'):
+                        time_module.sleep(2)  # 작업 상태 저장 전 - 잠시 후 재시도
+                        continue
+                    since = status_data.get('version', since)
 
                     if status_data.get('status') == 'completed':
                         video_url_local = status_data.get('video_url')
@@ -17944,10 +18115,9 @@ NO photorealistic."""
                     print(f"[AUTOMATION] 예약시간 처리 오류: {parse_err}")
 
             # 긴 영상(이세계 드라마 등)은 업로드에 10분 이상 걸릴 수 있음
-            upload_resp = req.post(f"{base_url}/api/youtube/upload", json=upload_payload, timeout=1800)  # 30분
+            upload_data, upload_status = youtube_upload_service(upload_payload)
 
-            print(f"[AUTOMATION] YouTube 업로드 응답 상태: {upload_resp.status_code}")
-            upload_data = upload_resp.json()
+            print(f"[AUTOMATION] YouTube 업로드 응답 상태: {upload_status}")
             print(f"[AUTOMATION] YouTube 업로드 응답: ok={upload_data.get('ok')}, mode={upload_data.get('mode', 'N/A')}, videoUrl={upload_data.get('videoUrl', 'N/A')[:50] if upload_data.get('videoUrl') else 'N/A'}")
 
             # 테스트 모드 감지 (실제 업로드 안됨)
@@ -17997,13 +18167,9 @@ NO photorealistic."""
                 if highlight_scenes_nums and len(highlight_scenes_nums) > 0:
                     # 백그라운드 스레드에서 쇼츠 생성
                     def generate_shorts_background():
-                        # FFmpeg 세마포어 획득 (다른 FFmpeg 작업과 동시 실행 방지)
-                        print(f"[SHORTS-BG] FFmpeg 세마포어 대기 중...")
-                        ffmpeg_semaphore.acquire()
-                        print(f"[SHORTS-BG] FFmpeg 세마포어 획득, 쇼츠 생성 시작...")
+                        # FFmpeg 동시 실행은 _generate_shorts_video_v2의 인코딩마다 렌더 스케줄러가 제어
+                        print(f"[SHORTS-BG] 쇼츠 생성 시작...")
                         try:
-                            import requests as bg_req
-
                             # 하이라이트 나레이션 추출
                             highlight_narrations = []
                             for scene_num in highlight_scenes_nums:
@@ -18098,8 +18264,7 @@ NO photorealistic."""
                                 shorts_upload_payload["publish_at"] = publish_at_iso
                                 print(f"[SHORTS-BG] 쇼츠도 메인 영상과 동시 공개 예정: {publish_at_iso}")
 
-                            shorts_resp = bg_req.post(f"{base_url}/api/youtube/upload", json=shorts_upload_payload, timeout=300)
-                            shorts_data = shorts_resp.json()
+                            shorts_data, _ = youtube_upload_service(shorts_upload_payload)
 
                             if shorts_data.get('ok'):
                                 shorts_url = shorts_data.get('videoUrl', '')
@@ -18121,10 +18286,6 @@ NO photorealistic."""
                             print(f"[SHORTS-BG] 백그라운드 쇼츠 오류: {bg_err}")
                             import traceback
                             traceback.print_exc()
-                        finally:
-                            # 세마포어 해제 (다음 FFmpeg 작업 허용)
-                            ffmpeg_semaphore.release()
-                            print(f"[SHORTS-BG] FFmpeg 세마포어 해제됨")
 
                     # 백그라운드 스레드 시작
                     shorts_thread = threading.Thread(target=generate_shorts_background, daemon=True)
@@ -18255,6 +18416,7 @@ def api_sheets_check_and_process():
             "processed": 0
         })
 
+    gateway = None
     try:
         from datetime import datetime, timedelta, timezone
 
@@ -18287,6 +18449,9 @@ def api_sheets_check_and_process():
                 "error": "AUTOMATION_SHEET_ID 환경변수가 설정되지 않았습니다"
             }), 400
 
+        # 시트 읽기는 batchGet, 셀 쓰기는 모아서 batchUpdate (토큰 버킷으로 쿼터 제한)
+        gateway = SheetsGateway(service, sheet_id)
+
         # 현재 시간 (한국 시간 KST = UTC+9)
         kst = timezone(timedelta(hours=9))
         now = datetime.now(kst).replace(tzinfo=None)
@@ -18310,16 +18475,17 @@ def api_sheets_check_and_process():
 
         # ========== 2. 모든 시트에서 처리중 상태 확인 ==========
         # 어떤 시트에서든 처리중이면 새 작업 시작 안함
-        # 2026-01: Rate Limit 방지를 위해 시트 읽기 간 딜레이 추가
-        import time as time_module
-        SHEET_READ_DELAY = 1.2  # 60 reads/min = 1 read/sec, 여유 0.2초 추가
-
-        for idx, sheet_name in enumerate(sheet_names):
-            # Rate Limit 방지: 첫 번째 시트 제외하고 딜레이 적용
-            if idx > 0:
-                time_module.sleep(SHEET_READ_DELAY)
+        # 모든 시트를 batchGet 한 번으로 읽음 (시트별 읽기 + 고정 딜레이 대체)
+        sheet_ranges = {name: f"'{name}'!A:AZ" for name in sheet_names}
+        all_rows = gateway.batch_get(list(sheet_ranges.values()))
+        if all_rows is None:
+            return jsonify({
+                "ok": False,
+                "error": "시트 읽기 실패"
+            }), 503
 
-            rows = sheets_read_rows(service, sheet_id, f"'{sheet_name}'!A:AZ")
+        for sheet_name in sheet_names:
+            rows = all_rows.get(sheet_ranges[sheet_name])
             if rows is None or len(rows) < 3:  # 행1: 채널설정, 행2: 헤더, 행3~: 데이터
                 continue
 
@@ -18347,9 +18513,9 @@ def api_sheets_check_and_process():
                             if work_dt < SERVER_START_TIME:
                                 print(f"[SHEETS] [{sheet_name}] 행 {i}: 서버 재시작으로 orphan 작업 감지 - 대기로 변경")
                                 print(f"  - 작업 시작: {work_time}, 서버 시작: {SERVER_START_TIME.strftime('%Y-%m-%d %H:%M:%S')}")
-                                sheets_update_cell_by_header(service, sheet_id, sheet_name, i, col_map, '상태', '대기')
-                                sheets_update_cell_by_header(service, sheet_id, sheet_name, i, col_map, '에러메시지', '')
-                                sheets_update_cell_by_header(service, sheet_id, sheet_name, i, col_map, '작업시간', '')
+                                gateway.update_by_header(sheet_name, i, col_map, '상태', '대기')
+                                gateway.update_by_header(sheet_name, i, col_map, '에러메시지', '')
+                                gateway.update_by_header(sheet_name, i, col_map, '작업시간', '')
                                 continue  # 다음 행 확인
 
                             # 환경변수로 타임아웃 설정 가능 (기본 90분)
@@ -18357,11 +18523,11 @@ def api_sheets_check_and_process():
                             if elapsed_minutes > processing_timeout_minutes:
                                 # 타임아웃 초과 → 실패로 변경
                                 print(f"[SHEETS] [{sheet_name}] 행 {i}: 처리중 상태 {elapsed_minutes:.1f}분 경과 - 타임아웃으로 실패 처리 (제한: {processing_timeout_minutes}분)")
-                                sheets_update_cell_by_header(service, sheet_id, sheet_name, i, col_map, '상태', '실패')
-                                sheets_update_cell_by_header(service, sheet_id, sheet_name, i, col_map, '에러메시지', f'타임아웃: {elapsed_minutes:.0f}분 경과')
+                                gateway.update_by_header(sheet_name, i, col_map, '상태', '실패')
+                                gateway.update_by_header(sheet_name, i, col_map, '에러메시지', f'타임아웃: {elapsed_minutes:.0f}분 경과')
                                 continue
                             else:
-                                # 아직 처리중 → 전체 대기
+                                # 아직 처리중 → 전체 대기 (앞에서 예약한 정리 쓰기는 finally에서 flush)
                                 print(f"[SHEETS] [{sheet_name}] 행 {i}에서 처리중 ({elapsed_minutes:.1f}분 경과) - 새 작업 시작 안함")
                                 return jsonify({
                                     "ok": True,
@@ -18373,21 +18539,25 @@ def api_sheets_check_and_process():
                         except ValueError:
                             # 시간 형식 파싱 실패 → 실패로 처리
                             print(f"[SHEETS] [{sheet_name}] 행 {i}: 시작시간 형식 오류 - 실패 처리")
-                            sheets_update_cell_by_header(service, sheet_id, sheet_name, i, col_map, '상태', '실패')
-                            sheets_update_cell_by_header(service, sheet_id, sheet_name, i, col_map, '에러메시지', '시작시간 형식 오류로 실패')
+                            gateway.update_by_header(sheet_name, i, col_map, '상태', '실패')
+                            gateway.update_by_header(sheet_name, i, col_map, '에러메시지', '시작시간 형식 오류로 실패')
                             continue
                     else:
                         # 시작시간 없음 → 실패로 처리
                         print(f"[SHEETS] [{sheet_name}] 행 {i}: 시작시간 없음 - 실패 처리")
-                        sheets_update_cell_by_header(service, sheet_id, sheet_name, i, col_map, '상태', '실패')
-                        sheets_update_cell_by_header(service, sheet_id, sheet_name, i, col_map, '에러메시지', '시작시간 없음 (서버 재시작)')
+                        gateway.update_by_header(sheet_name, i, col_map, '상태', '실패')
+                        gateway.update_by_header(sheet_name, i, col_map, '에러메시지', '시작시간 없음 (서버 재시작)')
                         continue
 
+        # orphan/타임아웃 정리 결과를 아래 재조회 전에 반영
+        gateway.flush()
+
         # ========== 2.5 HISTORY 시트 '준비' → 대본 생성 → '대기' ==========
         # 영상 생성 전에 먼저 대본이 없는 에피소드의 대본을 자동 생성
+        # ('준비' 행은 2단계 정리 대상이 아니므로 2단계에서 읽은 행을 그대로 사용)
         if 'HISTORY' in sheet_names:
             try:
-                history_rows = sheets_read_rows(service, sheet_id, "'HISTORY'!A:AZ")
+                history_rows = all_rows.get(sheet_ranges['HISTORY'])
                 if history_rows and len(history_rows) >= 3:
                     history_headers = history_rows[1]
                     history_col_map = get_column_mapping(history_headers)
@@ -18442,12 +18612,16 @@ def api_sheets_check_and_process():
         # ========== 3. 모든 시트에서 대기 작업 수집 ==========
         pending_tasks = []  # [(예약시간, 시트순서, 시트이름, 행번호, 행데이터, 채널ID, col_map)]
 
-        for sheet_order, sheet_name in enumerate(sheet_names):
-            # 2026-01: Rate Limit 방지 딜레이
-            if sheet_order > 0:
-                time_module.sleep(SHEET_READ_DELAY)
+        # 2단계 정리(orphan → 대기)가 반영된 상태로 다시 일괄 조회
+        all_rows = gateway.batch_get(list(sheet_ranges.values()))
+        if all_rows is None:
+            return jsonify({
+                "ok": False,
+                "error": "시트 읽기 실패"
+            }), 503
 
-            rows = sheets_read_rows(service, sheet_id, f"'{sheet_name}'!A:AZ")
+        for sheet_order, sheet_name in enumerate(sheet_names):
+            rows = all_rows.get(sheet_ranges[sheet_name])
             if rows is None or len(rows) < 3:
                 continue
 
@@ -18520,9 +18694,10 @@ def api_sheets_check_and_process():
 
         # ★★★ Race Condition 방지: 상태를 즉시 '처리중'으로 변경 ★★★
         # 다른 워커/cron이 같은 작업을 중복 처리하지 않도록
-        sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '상태', '처리중')
-        sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '작업시간', now.strftime('%Y-%m-%d %H:%M:%S'))
-        sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '에러메시지', '')  # 이전 에러 클리어
+        gateway.update_by_header(sheet_name, row_num, col_map, '상태', '처리중')
+        gateway.update_by_header(sheet_name, row_num, col_map, '작업시간', now.strftime('%Y-%m-%d %H:%M:%S'))
+        gateway.update_by_header(sheet_name, row_num, col_map, '에러메시지', '')  # 이전 에러 클리어
+        gateway.flush()  # 파이프라인 시작 전에 반드시 기록
         print(f"[SHEETS] 상태 '처리중' 설정 완료 (중복 실행 방지)")
 
         # ========== 5.1 YouTube 할당량/토큰 체크 (파이프라인 시작 전) ==========
@@ -18534,8 +18709,8 @@ def api_sheets_check_and_process():
             print(f"[SHEETS][ERROR] YouTube 체크 실패: {quota_error}")
             # 할당량 초과 또는 토큰 없음 - 파이프라인 시작하지 않음
             # Sheet 상태를 '실패'로 업데이트
-            sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '상태', '실패')
-            sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '에러메시지', f'YouTube 체크 실패: {quota_error}')
+            gateway.update_by_header(sheet_name, row_num, col_map, '상태', '실패')
+            gateway.update_by_header(sheet_name, row_num, col_map, '에러메시지', f'YouTube 체크 실패: {quota_error}')
             return jsonify({
                 "ok": False,
                 "error": quota_error,
@@ -18658,43 +18833,43 @@ def api_sheets_check_and_process():
             print(f"[SHEETS] ★★★ 파이프라인 예외 발생 ★★★")
             print(f"[SHEETS] 에러: {type(pipeline_err).__name__}: {pipeline_err}")
             traceback.print_exc()
-            # 시트에 실패 기록
-            sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '상태', '실패')
-            sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '에러메시지', f'예외: {str(pipeline_err)[:200]}')
+            # 시트에 실패 기록 (finally에서 flush)
+            gateway.update_by_header(sheet_name, row_num, col_map, '상태', '실패')
+            gateway.update_by_header(sheet_name, row_num, col_map, '에러메시지', f'예외: {str(pipeline_err)[:200]}')
             raise  # 다시 던져서 상위에서 처리
 
-        # ========== 6. 결과 기록 ==========
+        # ========== 6. 결과 기록 (모아서 한 번에 batchUpdate) ==========
         # 비용 기록 (원화로 변환, 1 USD = 1,350 KRW)
         cost_usd = result.get('cost', 0.0)
         cost_krw = int(cost_usd * 1350)
-        sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '비용', f'{cost_krw:,}원')
+        gateway.update_by_header(sheet_name, row_num, col_map, '비용', f'{cost_krw:,}원')
 
         # 제목 기록
         if result.get('title'):
-            sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '제목(GPT생성)', result['title'])
+            gateway.update_by_header(sheet_name, row_num, col_map, '제목(GPT생성)', result['title'])
         title_options = result.get('title_options', [])
         if len(title_options) >= 1:
-            sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '제목2', title_options[0].get('title', ''))
+            gateway.update_by_header(sheet_name, row_num, col_map, '제목2', title_options[0].get('title', ''))
         if len(title_options) >= 2:
-            sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '제목3', title_options[1].get('title', ''))
+            gateway.update_by_header(sheet_name, row_num, col_map, '제목3', title_options[1].get('title', ''))
 
         # 카테고리 기록
         if result.get('detected_category'):
-            sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '카테고리', result['detected_category'])
+            gateway.update_by_header(sheet_name, row_num, col_map, '카테고리', result['detected_category'])
 
         if result.get('ok'):
             # 성공
-            sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '상태', '완료')
+            gateway.update_by_header(sheet_name, row_num, col_map, '상태', '완료')
             if result.get('video_url'):
-                sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '영상URL', result['video_url'])
+                gateway.update_by_header(sheet_name, row_num, col_map, '영상URL', result['video_url'])
             # 업로드 완료 시간 기록
             upload_time = datetime.now(timezone(timedelta(hours=9))).strftime('%Y-%m-%d %H:%M:%S')
-            sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '업로드시간', upload_time)
+            gateway.update_by_header(sheet_name, row_num, col_map, '업로드시간', upload_time)
         else:
             # 실패
-            sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '상태', '실패')
+            gateway.update_by_header(sheet_name, row_num, col_map, '상태', '실패')
             error_msg = result.get('error', '알 수 없는 오류')[:500]
-            sheets_update_cell_by_header(service, sheet_id, sheet_name, row_num, col_map, '에러메시지', error_msg)
+            gateway.update_by_header(sheet_name, row_num, col_map, '에러메시지', error_msg)
 
         return jsonify({
             "ok": True,
@@ -18712,6 +18887,12 @@ def api_sheets_check_and_process():
         traceback.print_exc()
         return jsonify({"ok": False, "error": str(e)}), 500
     finally:
+        # 예약된 셀 쓰기 전송 (결과/실패/정리 기록) - 실패해도 lock은 해제
+        if gateway is not None:
+            try:
+                gateway.flush()
+            except Exception as flush_err:
+                print(f"[SHEETS] 셀 쓰기 flush 오류: {flush_err}")
         # 항상 lock 해제
         pipeline_lock.release()
         print("[SHEETS] 파이프라인 Lock 해제됨")
@@ -19912,10 +20093,6 @@ def run_isekai_video_pipeline(
 """
 
         try:
-            import requests as req
-            port = os.environ.get("PORT", "5002")
-            base_url = f"http://127.0.0.1:{port}"
-
             upload_payload = {
                 "videoPath": video_path,
                 "title": title,
@@ -19928,6 +20105,10 @@ def run_isekai_video_pipeline(
             if thumbnail_path and os.path.exists(thumbnail_path):
                 upload_payload["thumbnailPath"] = thumbnail_path
 
+            # 자막은 영상에 굽지 않으므로 YouTube 자막 트랙으로 업로드
+            if srt_path and os.path.exists(srt_path):
+                upload_payload["srtPath"] = srt_path
+
             if playlist_id:
                 upload_payload["playlistId"] = playlist_id
 
@@ -19941,13 +20122,7 @@ def run_isekai_video_pipeline(
                 except:
                     pass
 
-            upload_resp = req.post(
-                f"{base_url}/api/youtube/upload",
-                json=upload_payload,
-                timeout=600
-            )
-
-            upload_result = upload_resp.json()
+            upload_result, _ = youtube_upload_service(upload_payload)
 
             if upload_result.get('ok'):
                 video_url = upload_result.get('videoUrl', '')
@@ -20196,7 +20371,8 @@ def upload_to_youtube(
     scheduled_time: str = None,
     playlist_id: str = None,
     thumbnail_path: str = None,
-    selected_project: str = ""
+    selected_project: str = "",
+    srt_path: str = None
 ) -> dict:
     """
     YouTube 업로드 래퍼 함수 (기존 API 활용)
@@ -20212,11 +20388,10 @@ def upload_to_youtube(
         playlist_id: 플레이리스트 ID
         thumbnail_path: 썸네일 이미지 경로
         selected_project: YouTube 프로젝트 접미사
+        srt_path: 자막 파일 경로 (있으면 YouTube 자막 트랙으로 업로드)
     """
     try:
-        import requests as req
-
-        # 내부 업로드 API 호출 (썸네일 포함)
+        # 업로드 서비스 직접 호출 (썸네일 포함)
         upload_data = {
             "videoPath": video_path,
             "title": title,
@@ -20234,19 +20409,15 @@ def upload_to_youtube(
         if thumbnail_path:
             upload_data["thumbnailPath"] = thumbnail_path
 
-        # API 호출 (Render 환경에서는 PORT 환경변수 사용)
-        port = os.environ.get("PORT", "5059")
-        base_url = f"http://127.0.0.1:{port}"
-        response = req.post(
-            f"{base_url}/api/youtube/upload",
-            json=upload_data,
-            timeout=300
-        )
+        if srt_path:
+            upload_data["srtPath"] = srt_path
 
-        if response.status_code == 200:
-            return response.json()
+        result, status = youtube_upload_service(upload_data)
+
+        if status == 200:
+            return result
         else:
-            return {"ok": False, "error": f"업로드 API 오류: {response.status_code}"}
+            return {"ok": False, "error": f"업로드 API 오류: {status}"}
 
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -20757,7 +20928,11 @@ def api_hide_old_sheets():
 
 # ===== Fontconfig 설정 (일본어 폰트 인식용) =====
 def setup_fontconfig():
-    """프로젝트 fonts 디렉토리를 fontconfig에 등록"""
+    """프로젝트 fonts 디렉토리를 fontconfig에 등록
+
+    fc-cache -f(전체 폰트 캐시 재생성)는 fonts 디렉토리(파일 목록/크기/mtime)나 설정이 바뀌었거나
+    fontconfig 캐시 디렉토리가 비어 있을 때만 실행한다 (data/startup/fontconfig.json 지문 마커).
+    """
     try:
         import subprocess
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -20774,19 +20949,38 @@ def setup_fontconfig():
   <dir>{fonts_dir}</dir>
 </fontconfig>'''
 
-        with open(fonts_conf, 'w') as f:
-            f.write(config_content)
+        conf_changed = True
+        if os.path.exists(fonts_conf):
+            with open(fonts_conf, 'r') as f:
+                conf_changed = f.read() != config_content
+        if conf_changed:
+            with open(fonts_conf, 'w') as f:
+                f.write(config_content)
+
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser("~/.cache")
+        cache_dir = os.path.join(cache_home, "fontconfig")
+        cache_ready = os.path.isdir(cache_dir) and bool(os.listdir(cache_dir))
+        fingerprint = directory_fingerprint(fonts_dir, extra=config_content)
+        if not conf_changed and cache_ready and marker_matches('fontconfig', fingerprint):
+            print(f"[FONTCONFIG] 폰트 변경 없음 - fc-cache 생략: {fonts_dir}")
+            return
 
         # fontconfig 캐시 업데이트
-        subprocess.run(['fc-cache', '-f'], capture_output=True)
+        result = subprocess.run(['fc-cache', '-f'], capture_output=True)
+        if result.returncode == 0:
+            write_marker('fontconfig', fingerprint)
         print(f"[FONTCONFIG] 설정 완료: {fonts_dir}")
     except Exception as e:
         print(f"[FONTCONFIG] 설정 실패 (무시): {e}")
 
 # 서버 시작 시 fontconfig 설정
+startup_profile.mark('routes')
 setup_fontconfig()
+startup_profile.mark('fontconfig')
+startup_profile.log_summary()
 
 # ===== Render 배포를 위한 설정 =====
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5059))
+    background_workers.start()
     app.run(host="0.0.0.0", port=port, debug=False)
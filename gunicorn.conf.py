@@ -4,10 +4,16 @@ import os
 bind = f"0.0.0.0:{os.environ.get('PORT', '10000')}"
 
 # Worker processes
-# ★ Race Condition 방지: 파이프라인 동시 실행 문제로 워커 1개로 제한
-# threading.Lock()은 프로세스 간에 공유되지 않음
+# 파이프라인 동시 실행은 파일 lease(jobs/lease.py, data/locks/pipeline.lock)로 프로세스 간에 막으므로
+# 요청 처리량이 필요하면 GUNICORN_WORKERS를 늘려도 됨
+# (영상 렌더링은 모든 경로가 렌더 스케줄러를 거쳐 호스트 여유 메모리 기준으로 동시 실행 - video/scheduler.py)
 workers = int(os.environ.get('GUNICORN_WORKERS', '1'))
-worker_class = 'sync'
+# 요청 스레드 수 - 기본 1(sync 워커, 요청을 하나씩 처리)
+# drama_server.py는 모듈 수준 전역 상태(캐시/작업 dict 등)가 많고 전부 스레드 동시 요청 기준으로 점검되지 않았으므로
+# gthread는 옵트인: GUNICORN_THREADS>1이면 SSE/long-poll 연결이 워커를 점유하지 않도록 스레드로 요청 처리
+# (sync 워커에서는 long-poll/SSE 대기를 짧게 끊음 - drama_server.py JOB_WAIT_MAX_SECONDS)
+threads = int(os.environ.get('GUNICORN_THREADS', '1'))
+worker_class = 'gthread' if threads > 1 else 'sync'
 worker_connections = 1000
 timeout = int(os.environ.get('GUNICORN_TIMEOUT', '7200'))  # 환경변수 사용 (기본 2시간)
 keepalive = 5
@@ -23,4 +29,11 @@ proc_name = 'drama_server'
 
 # Server mechanics
 daemon = False
+# 앱은 마스터에서 한 번 import (저널 로드/미완료 작업 정리도 한 번만 실행)
+# 백그라운드 워커 스레드는 fork를 따라가지 않으므로 post_fork에서 워커 프로세스마다 시작
 preload_app = True
+
+
+def post_fork(server, worker):
+    from jobs import get_background_workers
+    get_background_workers().start()
@@ -16,7 +16,6 @@ from io import BytesIO
 from typing import Optional, Tuple, Dict, Any
 
 import requests
-from PIL import Image as PILImage
 
 
 # 상수
@@ -390,6 +389,9 @@ def _process_and_save_image(
     filename_prefix: str = "gemini"
 ) -> Optional[str]:
     """Base64 이미지를 처리하고 파일로 저장"""
+    # PIL은 이미지 저장 때만 필요 - 서버 시작 시 import 비용 제외
+    from PIL import Image as PILImage
+
     try:
         # Base64 디코딩
         image_bytes = base64.b64decode(base64_data)
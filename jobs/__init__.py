@@ -0,0 +1,24 @@
+"""
+백그라운드 작업 공통 모듈
+drama_server 영상 작업의 상태 저장/조회 인프라
+
+핵심 기능:
+- 작업 저널 (journal): append-only JSONL 상태 기록 + 주기적 압축 + 완료 작업 TTL 제거
+- 진행 상황 버스 (progress): 상태 변경 시 SSE/long-poll 구독자에게 즉시 푸시
+- 프로세스 간 lease (lease): fcntl.flock 파일 lock, gunicorn 워커 간 파이프라인 중복 실행 방지
+- 백그라운드 워커 (workers): fork 이후 요청 처리 프로세스에서 워커 스레드 시작
+"""
+
+from .journal import JobJournal
+from .progress import ProgressBus, TERMINAL_STATUSES
+from .lease import FileLease
+from .workers import BackgroundWorkers, get_background_workers
+
+__all__ = [
+    "JobJournal",
+    "ProgressBus",
+    "TERMINAL_STATUSES",
+    "FileLease",
+    "BackgroundWorkers",
+    "get_background_workers",
+]
@@ -0,0 +1,202 @@
+"""
+append-only 작업 저널 (JSONL)
+
+상태가 바뀔 때마다 전체 작업 dict를 다시 쓰는 대신, 바뀐 작업 1건만 한 줄로 덧붙인다.
+- 기록: {"op": "put", "id": job_id, "job": {...}} / {"op": "del", "id": job_id}
+- 로드: 처음부터 재생 (같은 id는 마지막 줄이 우선)
+- 압축: 줄 수가 현재 작업 수보다 충분히 많아지면 스냅샷으로 다시 씀 (임시 파일 + rename)
+- TTL: 압축 시 완료/실패 후 ttl_hours가 지난 작업은 제거
+- 여러 프로세스 (gunicorn 워커): 기록/압축은 파일 lease({path}.lock) 안에서 수행하고,
+  압축은 메모리가 아니라 파일을 재생한 결과로 다시 써서 다른 프로세스의 작업을 지우지 않음
+- 다른 프로세스의 작업 조회 (get): 마지막으로 읽은 위치 이후에 덧붙은 줄만 읽어 반영
+  (압축으로 파일이 교체되면 처음부터 다시 재생)
+
+사용법:
+    journal = JobJournal('data/video_jobs.jsonl', legacy_path='data/video_jobs.json')
+    jobs = journal.load()
+    journal.put(job_id, jobs[job_id])
+"""
+
+import os
+import json
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from .lease import FileLease
+
+FINISHED_STATUSES = ('completed', 'failed')
+
+
+class JobJournal:
+    """작업 상태 append-only 저널 (프로세스 내 스레드 안전)"""
+
+    def __init__(self, path: str, legacy_path: Optional[str] = None, ttl_hours: float = 72,
+                 compact_min_lines: int = 500, compact_ratio: int = 4):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.ttl = timedelta(hours=ttl_hours)
+        self.compact_min_lines = compact_min_lines
+        self.compact_ratio = compact_ratio
+        self._lock = threading.Lock()
+        self._file_lease = FileLease(os.path.basename(path), lock_dir=os.path.dirname(path) or '.')
+        self._lines = 0
+        self._live_ids = set()
+        # get()용 파일 상태 뷰 (put/압축과 별도 lock - 조회가 기록을 막지 않도록)
+        self._view_lock = threading.Lock()
+        self._view: Dict[str, dict] = {}
+        self._view_inode = None
+        self._view_offset = 0
+
+    # ----- 로드 -----
+    @staticmethod
+    def _apply(jobs: Dict[str, dict], line: str) -> bool:
+        """저널 한 줄을 jobs에 반영, 유효한 줄이면 True"""
+        line = line.strip()
+        if not line:
+            return False
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            # 비정상 종료로 마지막 줄이 잘린 경우
+            return True
+        job_id = entry.get('id')
+        if entry.get('op') == 'put' and job_id:
+            jobs[job_id] = entry.get('job') or {}
+        elif entry.get('op') == 'del':
+            jobs.pop(job_id, None)
+        return True
+
+    def _replay(self):
+        """저널 파일을 처음부터 재생 → (작업 dict, 줄 수)"""
+        jobs: Dict[str, dict] = {}
+        lines = 0
+        if not os.path.exists(self.path):
+            return jobs, lines
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if self._apply(jobs, line):
+                    lines += 1
+        return jobs, lines
+
+    def load(self) -> Dict[str, dict]:
+        """저널을 재생하여 현재 작업 상태 반환 (레거시 JSON이 있으면 1회 이관)"""
+        with self._lock:
+            if os.path.exists(self.path):
+                jobs, lines = self._replay()
+            elif self.legacy_path and os.path.exists(self.legacy_path):
+                try:
+                    with open(self.legacy_path, 'r', encoding='utf-8') as f:
+                        jobs = json.load(f)
+                    print(f"[JOB-JOURNAL] 레거시 파일 이관: {self.legacy_path} ({len(jobs)}개)")
+                except Exception as e:
+                    print(f"[JOB-JOURNAL] 레거시 파일 로드 실패: {e}")
+                    jobs = {}
+                with self._file_lease:
+                    self._write_snapshot(jobs)
+                lines = len(jobs)
+            else:
+                jobs, lines = {}, 0
+            self._lines = lines
+            self._live_ids = set(jobs)
+            return jobs
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """작업 1건의 최신 상태 (다른 프로세스가 기록한 작업 조회용, 내부 카운터는 건드리지 않음)
+
+        마지막으로 읽은 위치 이후에 덧붙은 줄만 읽는다 - 상태 폴링마다 전체 파일을 재생하지 않음.
+        """
+        with self._view_lock:
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                self._view, self._view_inode, self._view_offset = {}, None, 0
+                return None
+            inode = (st.st_dev, st.st_ino)
+            if inode != self._view_inode or st.st_size < self._view_offset:
+                # 압축(파일 교체) 또는 처음 조회 → 처음부터 재생
+                self._view, self._view_inode, self._view_offset = {}, inode, 0
+            if st.st_size > self._view_offset:
+                with open(self.path, 'rb') as f:
+                    f.seek(self._view_offset)
+                    chunk = f.read(st.st_size - self._view_offset)
+                # 기록 중인 마지막 줄(개행 전)은 다음 조회에서 읽음
+                end = chunk.rfind(b'\n') + 1
+                for line in chunk[:end].decode('utf-8', errors='replace').splitlines():
+                    self._apply(self._view, line)
+                self._view_offset += end
+            job = self._view.get(job_id)
+            return dict(job) if job is not None else None
+
+    # ----- 기록 -----
+    def _append(self, entry: dict):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        line = json.dumps(entry, ensure_ascii=False, default=str) + '\n'
+        # 다른 프로세스의 압축(파일 교체)과 겹치지 않도록 lease 안에서 한 번에 기록
+        with self._file_lease:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+        self._lines += 1
+
+    def put(self, job_id: str, job: dict):
+        """작업 1건의 현재 상태 기록"""
+        with self._lock:
+            self._append({'op': 'put', 'id': job_id, 'job': job})
+            self._live_ids.add(job_id)
+
+    def delete(self, job_id: str):
+        with self._lock:
+            self._append({'op': 'del', 'id': job_id})
+            self._live_ids.discard(job_id)
+
+    def needs_compaction(self) -> bool:
+        return self._lines >= max(self.compact_min_lines, len(self._live_ids) * self.compact_ratio)
+
+    # ----- 압축 / TTL -----
+    def _is_expired(self, job: dict, now: datetime) -> bool:
+        if job.get('status') not in FINISHED_STATUSES:
+            return False
+        stamp = job.get('completed_at') or job.get('updated_at') or job.get('created_at')
+        if not stamp:
+            return False
+        try:
+            return now - datetime.fromisoformat(stamp) > self.ttl
+        except (TypeError, ValueError):
+            return False
+
+    def evict_expired(self, jobs: Dict[str, dict]) -> int:
+        """TTL이 지난 완료/실패 작업을 jobs에서 제거 (in-place), 제거 개수 반환"""
+        now = datetime.now()
+        expired = [job_id for job_id, job in jobs.items() if self._is_expired(job, now)]
+        for job_id in expired:
+            del jobs[job_id]
+        return len(expired)
+
+    def _write_snapshot(self, jobs: Dict[str, dict]):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for job_id, job in jobs.items():
+                f.write(json.dumps({'op': 'put', 'id': job_id, 'job': job}, ensure_ascii=False, default=str) + '\n')
+        os.replace(tmp_path, self.path)
+
+    def compact(self, jobs: Dict[str, dict]) -> int:
+        """TTL 제거 후 현재 상태만 남기도록 저널을 다시 씀 (jobs는 in-place로 정리됨)
+
+        스냅샷은 파일을 재생한 결과 기준이다 (다른 프로세스가 기록한 작업 유지).
+        jobs에만 있는 작업은 추가하고, 이미 파일에 있는 작업은 파일 쪽이 최신이므로
+        jobs를 바꾼 뒤에는 put()으로 먼저 기록해야 한다.
+        호출 측은 jobs를 수정하는 다른 스레드와 동일한 lock을 잡은 상태여야 한다.
+        """
+        with self._lock, self._file_lease:
+            snapshot, _ = self._replay()
+            for job_id, job in jobs.items():
+                snapshot.setdefault(job_id, job)
+            removed = self.evict_expired(snapshot)
+            for job_id in [job_id for job_id in jobs if job_id not in snapshot]:
+                del jobs[job_id]
+            self._write_snapshot(snapshot)
+            self._lines = len(snapshot)
+            self._live_ids = set(snapshot)
+        print(f"[JOB-JOURNAL] 압축 완료: {len(snapshot)}개 유지, 만료 {removed}개 제거")
+        return removed
@@ -0,0 +1,136 @@
+"""
+프로세스 간 lease (파일 lock)
+
+threading.Lock은 gunicorn 워커 프로세스끼리 공유되지 않아서, 워커가 2개 이상이면
+같은 cron 파이프라인이 워커마다 한 번씩 실행될 수 있다.
+같은 호스트의 프로세스들이 같은 lock 파일에 fcntl.flock을 걸어 한 번에 하나만 실행한다.
+
+- threading.Lock과 같은 인터페이스: acquire(blocking, timeout) / release() / locked() / with
+- 같은 프로세스의 다른 스레드도 배제 (내부 threading.Lock + flock)
+- acquire마다 파일을 새로 열어서 fork로 상속된 fd를 다른 프로세스와 공유하지 않음
+- 보유 프로세스가 죽으면 OS가 flock을 풀어줌 → 재시작 후 남는 lock 없음
+- lock 파일에 보유자 pid / 시작 시각 기록 (holder()로 조회, 디버깅용)
+
+사용법:
+    from jobs import FileLease
+
+    pipeline_lock = FileLease('pipeline')
+    if not pipeline_lock.acquire(blocking=False):
+        return "다른 워커에서 실행 중"
+    try:
+        ...
+    finally:
+        pipeline_lock.release()
+"""
+
+import os
+import json
+import time
+import fcntl
+import threading
+from datetime import datetime
+from typing import Optional
+
+LEASE_DIR = os.environ.get('LEASE_DIR', 'data/locks')
+
+# blocking acquire(timeout)일 때 flock 재시도 간격
+_POLL_INTERVAL = 0.2
+
+
+class FileLease:
+    """fcntl.flock 기반 프로세스 간 + 스레드 간 lock"""
+
+    def __init__(self, name: str, lock_dir: Optional[str] = None):
+        self.name = name
+        self.path = os.path.join(lock_dir or LEASE_DIR, f"{name}.lock")
+        self._thread_lock = threading.Lock()
+        self._fd: Optional[int] = None
+
+    def _try_flock(self) -> bool:
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        except Exception:
+            os.close(fd)
+            raise
+        self._fd = fd
+        try:
+            holder = json.dumps({'pid': os.getpid(), 'since': datetime.now().isoformat()})
+            os.ftruncate(fd, 0)
+            os.pwrite(fd, holder.encode('utf-8'), 0)
+        except OSError:
+            pass
+        return True
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """threading.Lock.acquire와 같은 의미 (timeout < 0이면 무한 대기)"""
+        deadline = None if timeout is None or timeout < 0 else time.monotonic() + timeout
+        if not blocking:
+            if not self._thread_lock.acquire(blocking=False):
+                return False
+        elif not self._thread_lock.acquire(timeout=-1 if deadline is None else max(0.0, timeout)):
+            return False
+
+        try:
+            while True:
+                if self._try_flock():
+                    return True
+                if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                    break
+                time.sleep(_POLL_INTERVAL)
+        except Exception:
+            self._thread_lock.release()
+            raise
+        self._thread_lock.release()
+        return False
+
+    def release(self):
+        fd, self._fd = self._fd, None
+        if fd is None:
+            raise RuntimeError(f"[LEASE] 보유하지 않은 lease 해제: {self.name}")
+        try:
+            os.ftruncate(fd, 0)
+        except OSError:
+            pass
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+            self._thread_lock.release()
+
+    def locked(self) -> bool:
+        """어느 프로세스든 보유 중이면 True"""
+        if self._fd is not None:
+            return True
+        if not os.path.exists(self.path):
+            return False
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            return False
+        except BlockingIOError:
+            return True
+        finally:
+            os.close(fd)
+
+    def holder(self) -> Optional[dict]:
+        """보유자 {pid, since} (보유자 없으면 None)"""
+        if not self.locked():
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.loads(f.read() or 'null')
+        except (OSError, ValueError):
+            return None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
@@ -0,0 +1,191 @@
+"""
+작업 진행 상황 푸시 버스 (SSE / long-poll)
+
+상태를 쓰는 쪽(워커)이 publish()하면 버전이 1 올라가고,
+기다리는 쪽(SSE 스트림, long-poll 요청)은 wait()에서 즉시 깨어난다.
+→ 클라이언트가 2초마다 상태 API를 두드리며 DB를 조회할 필요가 없음
+
+같은 프로세스 안에서만 공유되므로, 버스에 없는 작업은
+호출 측에서 기존 저장소(DB/파일/저널)로 폴백해야 한다.
+"""
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# 더 이상 진행 이벤트가 없는 상태
+TERMINAL_STATUSES = ('completed', 'failed', 'cancelled')
+
+
+class _JobChannel:
+    __slots__ = ('version', 'state', 'updated_at', 'waiters', 'cond')
+
+    def __init__(self, lock):
+        self.version = 0
+        self.state = None
+        self.updated_at = time.time()
+        self.waiters = 0
+        self.cond = threading.Condition(lock)
+
+
+class ProgressBus:
+    """작업별 버전 카운터 + Condition 기반 진행 상황 브로드캐스트"""
+
+    def __init__(self, retain_seconds: float = 600, max_jobs: int = 2000):
+        """
+        Args:
+            retain_seconds: 종료된 작업 채널을 메모리에 유지하는 시간 (초)
+            max_jobs: 채널 수가 이를 넘으면 publish 시 오래된 종료 작업부터 정리
+        """
+        self.retain_seconds = retain_seconds
+        self.max_jobs = max_jobs
+        self._lock = threading.Lock()
+        self._channels: Dict[str, _JobChannel] = {}
+
+    def _channel(self, job_id: str) -> _JobChannel:
+        channel = self._channels.get(job_id)
+        if channel is None:
+            channel = _JobChannel(self._lock)
+            self._channels[job_id] = channel
+        return channel
+
+    def publish(self, job_id: str, state: Dict[str, Any]) -> int:
+        """작업 상태 갱신 → 대기 중인 모든 구독자를 깨움
+
+        Returns:
+            새 버전 번호
+        """
+        with self._lock:
+            channel = self._channel(job_id)
+            channel.version += 1
+            channel.state = dict(state)
+            channel.updated_at = time.time()
+            channel.cond.notify_all()
+            version = channel.version
+            if len(self._channels) > self.max_jobs:
+                self._prune()
+        return version
+
+    def get(self, job_id: str) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """현재 (버전, 상태) - 버스에 없으면 (0, None)"""
+        with self._lock:
+            channel = self._channels.get(job_id)
+            if channel is None or channel.state is None:
+                return 0, None
+            return channel.version, dict(channel.state)
+
+    def wait(self, job_id: str, since: int = 0, timeout: float = 25) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """버전이 since보다 커지거나 timeout이 지날 때까지 대기
+
+        이미 종료 상태면 버전과 무관하게 즉시 반환.
+
+        Returns:
+            (버전, 상태) - 타임아웃이면 변경 없는 현재 값
+        """
+        with self._lock:
+            channel = self._channel(job_id)
+
+            def _ready():
+                if channel.version > since:
+                    return True
+                return bool(channel.state) and channel.state.get('status') in TERMINAL_STATUSES
+
+            channel.waiters += 1
+            try:
+                channel.cond.wait_for(_ready, timeout=max(0.0, timeout))
+            finally:
+                channel.waiters -= 1
+            state = dict(channel.state) if channel.state is not None else None
+            version = channel.version
+            if channel.waiters == 0 and channel.state is None and self._channels.get(job_id) is channel:
+                # 한 번도 publish되지 않은 채널(없는 작업/다른 워커의 작업)은 대기자가 없으면 바로 제거
+                del self._channels[job_id]
+            if len(self._channels) > self.max_jobs:
+                self._prune()
+            return version, state
+
+    def stream(self, job_id: str, since: int = 0, initial: Optional[Dict[str, Any]] = None,
+               heartbeat: float = 15, max_seconds: float = 7200,
+               fallback: Optional[Callable[[], Optional[Dict[str, Any]]]] = None,
+               poll_interval: float = 5) -> Iterator[str]:
+        """SSE 이벤트 문자열 제너레이터 (종료 상태가 되면 스트림 종료)
+
+        Args:
+            initial: 버스에 아직 상태가 없을 때 먼저 보낼 상태 (저장소에서 읽은 값)
+            heartbeat: 변경이 없을 때 연결 유지 주석을 보내는 간격 (초)
+            max_seconds: 스트림 최대 유지 시간 (초)
+            fallback: 버스에 새 상태가 없을 때 저장소에서 현재 상태를 읽는 함수
+                      (다른 워커 프로세스가 처리하는 작업은 이 버스로 publish되지 않음)
+            poll_interval: fallback 조회 간격 (초)
+        """
+        version, state = self.get(job_id)
+        if state is None and initial is not None:
+            state = initial
+        last_sent = state
+        if state is not None:
+            yield self._format_event(version, state)
+            if state.get('status') in TERMINAL_STATUSES:
+                return
+            since = max(since, version)
+
+        wait_timeout = heartbeat if fallback is None else min(heartbeat, poll_interval)
+        deadline = time.time() + max_seconds
+        last_emit = time.monotonic()
+        while time.time() < deadline:
+            version, state = self.wait(job_id, since=since, timeout=wait_timeout)
+            if state is not None and version > since:
+                since = version
+            elif fallback is not None:
+                state = fallback()
+                if state == last_sent:
+                    state = None
+            else:
+                state = None
+
+            if state is None:
+                if time.monotonic() - last_emit >= heartbeat:
+                    last_emit = time.monotonic()
+                    yield ": heartbeat\n\n"
+                continue
+            last_sent = state
+            last_emit = time.monotonic()
+            yield self._format_event(since, state)
+            if state.get('status') in TERMINAL_STATUSES:
+                return
+
+    @staticmethod
+    def _format_event(version: int, state: Dict[str, Any]) -> str:
+        payload = dict(state)
+        payload['version'] = version
+        return f"id: {version}\nevent: progress\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+    def _prune(self):
+        """오래된 채널 정리 (self._lock 보유 상태에서 호출)
+
+        대기자가 없는 채널 중 retain_seconds 동안 갱신이 없던 것을 제거하고,
+        그래도 max_jobs를 넘으면 종료된 작업부터 오래된 순으로 제거.
+        """
+        now = time.time()
+        idle = [job_id for job_id, c in self._channels.items() if c.waiters == 0]
+        for job_id in idle:
+            if now - self._channels[job_id].updated_at > self.retain_seconds:
+                del self._channels[job_id]
+
+        excess = len(self._channels) - self.max_jobs
+        if excess <= 0:
+            return
+        finished = sorted(
+            (job_id for job_id, c in self._channels.items()
+             if c.waiters == 0 and (c.state or {}).get('status') in TERMINAL_STATUSES),
+            key=lambda job_id: self._channels[job_id].updated_at,
+        )
+        for job_id in finished[:excess]:
+            del self._channels[job_id]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "channels": len(self._channels),
+                "waiters": sum(c.waiters for c in self._channels.values()),
+            }
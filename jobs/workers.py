@@ -0,0 +1,91 @@
+"""
+프로세스별 백그라운드 워커 (prefork 안전)
+
+gunicorn preload_app=True면 앱 모듈은 마스터에서 import되고 요청 워커는 fork로 만들어진다.
+스레드는 fork를 따라가지 않으므로 import 시점에 시작한 스레드는 마스터에만 남고,
+요청을 받는 워커 프로세스의 작업 큐는 아무도 소비하지 않는다.
+그래서 import 시점에는 워커를 등록만 하고, 요청을 처리할 프로세스에서 시작한다:
+
+- gunicorn: gunicorn.conf.py post_fork 훅 → get_background_workers().start()
+- 그 외 (python drama_server.py, preload 없는 실행): 첫 요청 전 ensure_started()
+- fork된 자식은 시작 기록이 비어 있으므로 (pid가 다름) 자기 스레드를 새로 시작
+
+사용법:
+    from jobs import get_background_workers
+
+    workers = get_background_workers()
+    workers.register('video_worker', video_worker)   # import 시점 (시작하지 않음)
+    workers.start()                                   # post_fork / __main__
+"""
+
+import os
+import threading
+from typing import Callable, Dict, Optional
+
+
+class BackgroundWorkers:
+    """이름별 데몬 스레드 등록 + 프로세스(pid)마다 한 번 시작"""
+
+    def __init__(self):
+        self._targets: Dict[str, Callable[[], None]] = {}
+        self._threads: Dict[str, threading.Thread] = {}
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def register(self, name: str, target: Callable[[], None]):
+        """워커 등록 (이미 이 프로세스에서 시작된 상태면 바로 시작)"""
+        with self._lock:
+            self._targets[name] = target
+            if self._pid == os.getpid():
+                self._start_locked(name)
+
+    def _start_locked(self, name: str) -> bool:
+        thread = self._threads.get(name)
+        if thread is not None and thread.is_alive():
+            return False
+        thread = threading.Thread(target=self._targets[name], name=name, daemon=True)
+        thread.start()
+        self._threads[name] = thread
+        return True
+
+    def start(self) -> int:
+        """현재 프로세스에서 등록된 워커 시작 (이미 살아 있는 워커는 건너뜀), 새로 시작한 수 반환"""
+        with self._lock:
+            pid = os.getpid()
+            if self._pid != pid:
+                # fork로 상속된 Thread 객체는 이 프로세스에서 돌지 않음
+                self._threads = {}
+                self._pid = pid
+            started = sum(1 for name in self._targets if self._start_locked(name))
+        if started:
+            print(f"[BG-WORKERS] pid {pid}: 워커 {started}개 시작 ({', '.join(self._targets)})")
+        return started
+
+    def ensure_started(self):
+        """이 프로세스에서 아직 시작하지 않았으면 시작 (요청 경로에서 호출해도 될 만큼 가벼움)"""
+        if self._pid != os.getpid():
+            self.start()
+
+    def is_alive(self, name: str) -> bool:
+        thread = self._threads.get(name) if self._pid == os.getpid() else None
+        return bool(thread and thread.is_alive())
+
+    def stats(self) -> dict:
+        return {
+            'pid': os.getpid(),
+            'started': self._pid == os.getpid(),
+            'workers': {name: self.is_alive(name) for name in self._targets},
+        }
+
+
+_background_workers = None
+_background_workers_lock = threading.Lock()
+
+
+def get_background_workers() -> BackgroundWorkers:
+    """프로세스 공용 워커 레지스트리"""
+    global _background_workers
+    with _background_workers_lock:
+        if _background_workers is None:
+            _background_workers = BackgroundWorkers()
+        return _background_workers
@@ -6,6 +6,7 @@
 - 자막: 절 번호 포함 (1) 태초에...
 - Google Sheets 연동
 - 106개 에피소드 (100일 성경통독 + 6일 보너스)
+- Day 범위 일괄 백필 (backfill.py - TTS/렌더링 파이프라인 + 체크포인트)
 """
 
 from .config import (
@@ -27,6 +28,11 @@ from .config import (
     BIBLE_SHEET_HEADERS,
 )
 
+from .index import (
+    BibleIndex,
+    load_bible_index,
+)
+
 from .run import (
     BiblePipeline,
     Episode,
@@ -54,6 +60,13 @@ from .renderer import (
     create_bible_background,
 )
 
+from .backfill import (
+    run_backfill,
+    load_backfilled_episode,
+    ensure_backfilled_thumbnail,
+    discard_backfilled_episode,
+)
+
 from .sheets import (
     create_bible_sheet,
     get_pending_episodes,
@@ -74,6 +87,8 @@ __all__ = [
     # 성경 데이터
     "BIBLE_JSON_PATH",
     "BIBLE_BOOKS",
+    "BibleIndex",
+    "load_bible_index",
 
     # Google Sheets 설정
     "BIBLE_SHEET_NAME",
@@ -102,6 +117,12 @@ __all__ = [
     "render_verse_frame",
     "create_bible_background",
 
+    # 일괄 백필
+    "run_backfill",
+    "load_backfilled_episode",
+    "ensure_backfilled_thumbnail",
+    "discard_backfilled_episode",
+
     # Google Sheets
     "create_bible_sheet",
     "get_pending_episodes",
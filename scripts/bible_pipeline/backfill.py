@@ -0,0 +1,350 @@
+"""
+성경통독 일괄 백필 (Day 범위 TTS → 썸네일 → 렌더링)
+
+일일 파이프라인(blueprints/bible.py run_bible_episode_pipeline)은 하루에 한 편씩
+TTS → 렌더링 → 업로드를 순서대로 돌린다. 1년치를 미리 만들어 두려면:
+
+- TTS 워커(네트워크 대기)가 앞서 나가고, 렌더 워커(CPU)가 뒤따르는 파이프라인
+  → Day N 렌더링 중에 Day N+1 TTS가 진행됨
+- TTS 결과는 최대 BIBLE_BACKFILL_LOOKAHEAD편까지만 앞서 만듦 (디스크/할당량 보호)
+- 단계마다 {BIBLE_BACKFILL_DIR}/day_NNN/manifest.json에 체크포인트 기록
+  → 중단 후 다시 실행하면 끝난 Day는 건너뛰고, TTS까지 끝난 Day는 렌더링부터
+- 완료될 때마다 처리량(에피소드/시간)과 남은 예상 시간 출력
+
+업로드는 하지 않는다. 일일 파이프라인이 해당 Day를 처리할 때 백필 결과가 있으면
+(같은 음성) TTS/렌더링을 건너뛰고 BGM 믹싱 → 업로드만 한다.
+
+사용법:
+    python -m scripts.bible_pipeline.backfill --start 1 --end 30
+    python -m scripts.bible_pipeline.backfill --start 31 --end 106 --voice chirp3:Charon --tts-workers 2
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import shutil
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+BIBLE_BACKFILL_DIR = os.environ.get('BIBLE_BACKFILL_DIR', 'data/bible_backfill')
+# TTS가 렌더링보다 앞서 나갈 수 있는 에피소드 수
+BIBLE_BACKFILL_LOOKAHEAD = int(os.environ.get('BIBLE_BACKFILL_LOOKAHEAD', '2'))
+
+# 시트 '음성' 열이 비어 있을 때 일일 파이프라인이 쓰는 음성과 같아야 결과가 재사용됨
+DEFAULT_BACKFILL_VOICE = "chirp3:Charon"
+
+_background_lock = threading.Lock()
+
+
+# ============================================================
+# 체크포인트 (Day별 manifest.json)
+# ============================================================
+
+def _day_dir(day_number: int, output_dir: Optional[str] = None) -> str:
+    return os.path.join(output_dir or BIBLE_BACKFILL_DIR, f"day_{day_number:03d}")
+
+
+def _manifest_path(day_number: int, output_dir: Optional[str] = None) -> str:
+    return os.path.join(_day_dir(day_number, output_dir), "manifest.json")
+
+
+def _load_manifest(day_number: int, output_dir: Optional[str] = None) -> Dict[str, Any]:
+    try:
+        with open(_manifest_path(day_number, output_dir), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"[BIBLE-BACKFILL] Day {day_number} 체크포인트 읽기 실패, 처음부터: {e}")
+        return {}
+
+
+def _save_manifest(day_number: int, manifest: Dict[str, Any], output_dir: Optional[str] = None) -> None:
+    path = _manifest_path(day_number, output_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    manifest["updated_at"] = time.time()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _is_done(manifest: Dict[str, Any], voice: str) -> bool:
+    return bool(
+        manifest.get("done")
+        and manifest.get("voice") == voice
+        and manifest.get("video_path")
+        and os.path.exists(manifest["video_path"])
+    )
+
+
+def _has_tts(manifest: Dict[str, Any], voice: str) -> bool:
+    return bool(
+        manifest.get("voice") == voice
+        and manifest.get("verse_durations")
+        and manifest.get("audio_path")
+        and os.path.exists(manifest["audio_path"])
+    )
+
+
+def load_backfilled_episode(day_number: int, voice: str, output_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """백필로 완성된 Day 결과 (같은 음성으로 만든 경우만)
+
+    Returns:
+        {"video_path", "thumbnail_path", "audio_duration", ...} 또는 None
+    """
+    manifest = _load_manifest(day_number, output_dir)
+    return manifest if _is_done(manifest, voice) else None
+
+
+def ensure_backfilled_thumbnail(episode, manifest: Dict[str, Any], output_dir: Optional[str] = None) -> Optional[str]:
+    """백필 결과의 썸네일 경로 (백필 때 실패했거나 파일이 없으면 지금 다시 생성해서 체크포인트에 기록)"""
+    from .thumbnail import generate_episode_thumbnail
+
+    thumbnail_path = manifest.get("thumbnail_path")
+    if thumbnail_path and os.path.exists(thumbnail_path):
+        return thumbnail_path
+
+    day = episode.day_number
+    thumb_result = generate_episode_thumbnail(episode)
+    if not thumb_result.get("ok"):
+        print(f"[BIBLE-BACKFILL] Day {day} 썸네일 재생성 실패: {thumb_result.get('error')}", flush=True)
+        return None
+    manifest["thumbnail_path"] = thumb_result["image_path"]
+    _save_manifest(day, manifest, output_dir)
+    return manifest["thumbnail_path"]
+
+
+def discard_backfilled_episode(day_number: int, output_dir: Optional[str] = None) -> None:
+    """업로드가 끝난 Day의 백필 결과 삭제"""
+    shutil.rmtree(_day_dir(day_number, output_dir), ignore_errors=True)
+
+
+# ============================================================
+# 단계
+# ============================================================
+
+def _default_synthesizer() -> Callable[[Any, str], Dict[str, Any]]:
+    # 절별 duration 계산이 있는 TTS는 일일 파이프라인(blueprints/bible.py)에 있음
+    from blueprints.bible import synthesize_bible_episode_tts
+    return synthesize_bible_episode_tts
+
+
+def _prepare_background(book: str) -> Optional[str]:
+    """책 배경 이미지 (같은 책을 두 워커가 동시에 생성하지 않도록 잠금)"""
+    from .background import get_background_path, generate_book_background
+
+    with _background_lock:
+        background_path = get_background_path(book)
+        if background_path:
+            return background_path
+        result = generate_book_background(book)
+        return result.get("image_path") if result.get("ok") else None
+
+
+def _run_tts_stage(episode, voice: str, synthesize, output_dir: str) -> Dict[str, Any]:
+    """TTS + 썸네일 + 배경 (체크포인트에 있으면 건너뜀)"""
+    day = episode.day_number
+    manifest = _load_manifest(day, output_dir)
+    if manifest.get("voice") != voice:
+        manifest = {"day": day, "voice": voice}
+
+    if not _has_tts(manifest, voice):
+        print(f"[BIBLE-BACKFILL] Day {day} TTS 시작 ({episode.book} {episode.start_chapter}-{episode.end_chapter}장)", flush=True)
+        tts_result = synthesize(episode, voice)
+        if not tts_result.get("ok"):
+            raise RuntimeError(f"TTS 생성 실패: {tts_result.get('error')}")
+
+        audio_path = os.path.join(_day_dir(day, output_dir), f"day_{day:03d}.mp3")
+        os.makedirs(os.path.dirname(audio_path), exist_ok=True)
+        with open(audio_path, 'wb') as f:
+            f.write(tts_result["audio_data"])
+
+        manifest.update({
+            "audio_path": audio_path,
+            "audio_duration": tts_result["audio_duration"],
+            "verse_durations": tts_result["verse_durations"],
+        })
+        _save_manifest(day, manifest, output_dir)
+        print(f"[BIBLE-BACKFILL] Day {day} TTS 완료: {tts_result['audio_duration']:.0f}초", flush=True)
+
+    if not ensure_backfilled_thumbnail(episode, manifest, output_dir):
+        # 업로드 시 blueprints/bible.py가 ensure_backfilled_thumbnail로 다시 시도
+        print(f"[BIBLE-BACKFILL] Day {day} 썸네일 실패 (업로드 시 재시도)", flush=True)
+
+    manifest["background_path"] = _prepare_background(episode.book)
+    return manifest
+
+
+def _run_render_stage(episode, manifest: Dict[str, Any], output_dir: str) -> Dict[str, Any]:
+    from .renderer import render_episode_video
+
+    day = episode.day_number
+    video_result = render_episode_video(
+        episode=episode,
+        audio_path=manifest["audio_path"],
+        verse_durations=manifest["verse_durations"],
+        output_dir=_day_dir(day, output_dir),
+        background_path=manifest.get("background_path"),
+        use_ass=True
+    )
+    if not video_result.get("ok"):
+        raise RuntimeError(f"영상 렌더링 실패: {video_result.get('error')}")
+
+    manifest.update({"video_path": video_result["video_path"], "done": True})
+    _save_manifest(day, manifest, output_dir)
+
+    # 영상에 합쳐졌으므로 TTS 오디오는 삭제 (절별 duration은 체크포인트에 남음)
+    try:
+        os.remove(manifest["audio_path"])
+    except OSError:
+        pass
+    return manifest
+
+
+# ============================================================
+# 백필
+# ============================================================
+
+def run_backfill(
+    start_day: int,
+    end_day: int,
+    voice: str = DEFAULT_BACKFILL_VOICE,
+    output_dir: Optional[str] = None,
+    tts_workers: int = 1,
+    render_workers: int = 1,
+    lookahead: Optional[int] = None,
+    synthesize: Optional[Callable[[Any, str], Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Day 범위 백필
+
+    Args:
+        start_day / end_day: Day 범위 (양 끝 포함)
+        voice: TTS 음성 (시트 '음성' 열과 같은 형식 - 다르면 일일 파이프라인이 재사용하지 않음)
+        output_dir: 결과 디렉토리 (기본: BIBLE_BACKFILL_DIR)
+        tts_workers: 동시 TTS 수 (API 할당량에 맞춰)
+        render_workers: 동시 렌더 수 (렌더 스케줄러가 메모리 기준으로 한 번 더 제한)
+        lookahead: 렌더링 대기열 크기 (기본: BIBLE_BACKFILL_LOOKAHEAD)
+        synthesize: (episode, voice) -> TTS 결과 (기본: synthesize_bible_episode_tts)
+
+    Returns:
+        {"ok": bool, "completed": [...], "skipped": [...], "failed": {day: error},
+         "elapsed": 초, "episodes_per_hour": float}
+    """
+    from .run import BiblePipeline
+
+    output_dir = output_dir or BIBLE_BACKFILL_DIR
+    lookahead = max(lookahead if lookahead is not None else BIBLE_BACKFILL_LOOKAHEAD, 1)
+    synthesize = synthesize or _default_synthesizer()
+
+    episodes = [ep for ep in BiblePipeline().generate_all_bible_episodes()
+                if start_day <= ep.day_number <= end_day]
+
+    skipped = [ep.day_number for ep in episodes if _is_done(_load_manifest(ep.day_number, output_dir), voice)]
+    pending = [ep for ep in episodes if ep.day_number not in skipped]
+    print(f"[BIBLE-BACKFILL] Day {start_day}~{end_day}: {len(pending)}편 처리, {len(skipped)}편 완료됨 "
+          f"(TTS {tts_workers} / 렌더 {render_workers} 워커, 음성: {voice})", flush=True)
+
+    completed: List[int] = []
+    failed: Dict[int, str] = {}
+    lock = threading.Lock()
+    start_time = time.time()
+
+    def report(day: int) -> None:
+        with lock:
+            completed.append(day)
+            elapsed_hours = (time.time() - start_time) / 3600
+            rate = len(completed) / elapsed_hours if elapsed_hours > 0 else 0.0
+            remaining = len(pending) - len(completed) - len(failed)
+            eta = f", 남은 예상 {remaining / rate:.1f}시간" if rate > 0 and remaining > 0 else ""
+            print(f"[BIBLE-BACKFILL] Day {day} 완료 ({len(completed)}/{len(pending)}, "
+                  f"{rate:.2f} 에피소드/시간{eta})", flush=True)
+
+    def fail(day: int, error: Exception) -> None:
+        with lock:
+            failed[day] = str(error)
+        print(f"[BIBLE-BACKFILL] Day {day} 실패: {error}", flush=True)
+
+    # TTS 완료 → 렌더 대기열 (가득 차면 TTS 워커가 기다림)
+    ready: "queue.Queue" = queue.Queue(maxsize=lookahead)
+    _DONE = object()
+
+    def produce(episode) -> None:
+        try:
+            manifest = _run_tts_stage(episode, voice, synthesize, output_dir)
+        except Exception as e:
+            fail(episode.day_number, e)
+            return
+        ready.put((episode, manifest))
+
+    def consume() -> None:
+        while True:
+            item = ready.get()
+            if item is _DONE:
+                return
+            episode, manifest = item
+            try:
+                _run_render_stage(episode, manifest, output_dir)
+                report(episode.day_number)
+            except Exception as e:
+                fail(episode.day_number, e)
+
+    render_threads = [threading.Thread(target=consume, name=f"bible-backfill-render-{i}", daemon=True)
+                      for i in range(max(render_workers, 1))]
+    for t in render_threads:
+        t.start()
+
+    # Day 순서대로 제출 → TTS 워커 수만큼만 동시에 진행
+    with ThreadPoolExecutor(max_workers=max(tts_workers, 1), thread_name_prefix="bible-backfill-tts") as executor:
+        list(executor.map(produce, pending))
+
+    for _ in render_threads:
+        ready.put(_DONE)
+    for t in render_threads:
+        t.join()
+
+    elapsed = time.time() - start_time
+    episodes_per_hour = len(completed) / (elapsed / 3600) if elapsed > 0 else 0.0
+    print(f"[BIBLE-BACKFILL] 종료: 완료 {len(completed)}편, 건너뜀 {len(skipped)}편, 실패 {len(failed)}편 "
+          f"({elapsed / 60:.1f}분, {episodes_per_hour:.2f} 에피소드/시간)", flush=True)
+
+    return {
+        "ok": not failed,
+        "completed": sorted(completed),
+        "skipped": skipped,
+        "failed": failed,
+        "elapsed": elapsed,
+        "episodes_per_hour": episodes_per_hour,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="성경통독 Day 범위 백필 (TTS → 썸네일 → 렌더링)")
+    parser.add_argument('--start', type=int, required=True, help="시작 Day")
+    parser.add_argument('--end', type=int, required=True, help="끝 Day (포함)")
+    parser.add_argument('--voice', default=DEFAULT_BACKFILL_VOICE, help="TTS 음성 (시트 '음성' 열과 같은 형식)")
+    parser.add_argument('--output-dir', default=None, help="결과 디렉토리 (기본: BIBLE_BACKFILL_DIR)")
+    parser.add_argument('--tts-workers', type=int, default=1)
+    parser.add_argument('--render-workers', type=int, default=1)
+    parser.add_argument('--lookahead', type=int, default=None, help="렌더링 대기열 크기")
+    args = parser.parse_args(argv)
+
+    result = run_backfill(
+        start_day=args.start,
+        end_day=args.end,
+        voice=args.voice,
+        output_dir=args.output_dir,
+        tts_workers=args.tts_workers,
+        render_workers=args.render_workers,
+        lookahead=args.lookahead,
+    )
+    return 0 if result["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+성경 JSON 인덱스
+
+성경 JSON(책 → 장 → 절 리스트)을 한 번만 파싱해서 조회용 구조로 컴파일한다.
+
+- 책 이름 → 책 위치, 장 번호 → 장 위치: dict 조회 (선형 탐색 없음)
+- 장별 절: (절 번호, 말씀) 튜플
+- 장별 글자 수 + 누적합(prefix sum): 장 범위 글자 수, 목표 분량에 맞는 끝 장을 O(log n)으로 계산
+
+컴파일 결과는 JSON 옆의 캐시 파일({json}.index.pickle)에 저장하고, 다음 실행부터는
+원본 JSON의 크기/수정 시각이 같으면 JSON을 다시 파싱하지 않고 캐시를 읽는다.
+
+사용법:
+    from scripts.bible_pipeline.index import load_bible_index
+
+    index = load_bible_index(BIBLE_JSON_PATH)
+    index.chapter_verses("창세기", 1)           # [(1, "태초에 ..."), ...]
+    index.range_chars("창세기", 1, 15)          # 1~15장 글자 수
+    index.end_chapter_for_chars("창세기", 1, 16380)
+"""
+
+import os
+import json
+import pickle
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+# 컴파일 포맷이 바뀌면 올려서 기존 캐시 파일을 무효화
+_INDEX_VERSION = 1
+
+VerseTuple = Tuple[int, str]
+
+
+class BookIndex:
+    """책 하나의 장/절 인덱스"""
+
+    __slots__ = ("name", "chapter_nums", "chapter_pos", "verses", "chapter_chars", "prefix_chars")
+
+    def __init__(self, name: str, chapters: List[Tuple[int, List[VerseTuple]]]):
+        chapters = sorted(chapters, key=lambda c: c[0])
+        self.name = name
+        self.chapter_nums: List[int] = [num for num, _ in chapters]
+        self.chapter_pos: Dict[int, int] = {}
+        for i, num in enumerate(self.chapter_nums):
+            self.chapter_pos.setdefault(num, i)
+        self.verses: List[Tuple[VerseTuple, ...]] = [tuple(verses) for _, verses in chapters]
+        self.chapter_chars: List[int] = [sum(len(text) for _, text in verses) for verses in self.verses]
+        # prefix_chars[i] = 0..i-1번째 장의 글자 수 합
+        self.prefix_chars: List[int] = [0]
+        for chars in self.chapter_chars:
+            self.prefix_chars.append(self.prefix_chars[-1] + chars)
+
+    @property
+    def total_chars(self) -> int:
+        return self.prefix_chars[-1]
+
+    def __getstate__(self):
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __setstate__(self, state):
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+
+
+class BibleIndex:
+    """성경 전체 인덱스 (책 이름 → BookIndex)"""
+
+    def __init__(self, version: str, books: List[BookIndex]):
+        self.version = version
+        self.books = books
+        self.book_pos: Dict[str, int] = {}
+        for i, book in enumerate(books):
+            self.book_pos.setdefault(book.name, i)
+
+    @classmethod
+    def from_json_data(cls, bible_data: Dict[str, Any]) -> "BibleIndex":
+        """성경 JSON dict에서 인덱스 컴파일"""
+        books = []
+        for book in bible_data.get("books", []):
+            chapters = []
+            for ch in book.get("chapters", []):
+                verses = [(v.get("verse"), v.get("text", "")) for v in ch.get("verses", [])]
+                chapters.append((ch.get("chapter"), verses))
+            books.append(BookIndex(book.get("name"), chapters))
+        return cls(bible_data.get("version", "Unknown"), books)
+
+    # ----- 조회 -----
+    def get_book(self, book_name: str) -> Optional[BookIndex]:
+        pos = self.book_pos.get(book_name)
+        return self.books[pos] if pos is not None else None
+
+    def chapter_verses(self, book_name: str, chapter_num: int) -> Optional[Tuple[VerseTuple, ...]]:
+        """장의 절 목록 [(절 번호, 말씀), ...] - 없으면 None"""
+        book = self.get_book(book_name)
+        if book is None:
+            return None
+        pos = book.chapter_pos.get(chapter_num)
+        return book.verses[pos] if pos is not None else None
+
+    def chapter_chars(self, book_name: str, chapter_num: int) -> int:
+        book = self.get_book(book_name)
+        if book is None:
+            return 0
+        pos = book.chapter_pos.get(chapter_num)
+        return book.chapter_chars[pos] if pos is not None else 0
+
+    def range_chars(self, book_name: str, start: int, end: int) -> int:
+        """start~end장(포함) 글자 수 합 - 누적합으로 O(log n)"""
+        book = self.get_book(book_name)
+        if book is None:
+            return 0
+        lo = bisect_left(book.chapter_nums, start)
+        hi = bisect_right(book.chapter_nums, end)
+        return book.prefix_chars[hi] - book.prefix_chars[lo] if hi > lo else 0
+
+    def end_chapter_for_chars(self, book_name: str, start: int, max_chars: float) -> Tuple[int, int]:
+        """start장부터 글자 수 합이 max_chars를 넘지 않는 마지막 장
+
+        Returns:
+            (end_chapter, total_chars) - 한 장도 들어가지 않으면 (start, 0)
+        """
+        book = self.get_book(book_name)
+        if book is None:
+            raise KeyError(book_name)
+        lo = bisect_left(book.chapter_nums, start)
+        base = book.prefix_chars[lo]
+        # prefix_chars[hi] <= base + max_chars 인 최대 hi → lo..hi-1번째 장 포함
+        hi = bisect_right(book.prefix_chars, base + max_chars, lo) - 1
+        if hi <= lo:
+            return start, 0
+        return book.chapter_nums[hi - 1], book.prefix_chars[hi] - base
+
+
+# ============================================================
+# 로드 / 캐시 파일
+# ============================================================
+
+def _cache_path(json_path: str) -> str:
+    return json_path + ".index.pickle"
+
+
+def _source_signature(json_path: str) -> Tuple[int, int, int]:
+    st = os.stat(json_path)
+    return _INDEX_VERSION, st.st_size, st.st_mtime_ns
+
+
+_loaded: Dict[str, Tuple[Tuple[int, int, int], BibleIndex]] = {}
+_loaded_lock = threading.Lock()
+
+
+def load_bible_index(json_path: str) -> BibleIndex:
+    """성경 인덱스 로드
+
+    같은 프로세스에서는 메모리의 인덱스를 재사용하고, 캐시 파일이 원본과 일치하면
+    JSON 파싱을 생략한다.
+    """
+    if not os.path.exists(json_path):
+        raise FileNotFoundError(f"성경 파일을 찾을 수 없습니다: {json_path}")
+
+    signature = _source_signature(json_path)
+    with _loaded_lock:
+        loaded = _loaded.get(json_path)
+        if loaded and loaded[0] == signature:
+            return loaded[1]
+        index = _load_or_compile(json_path, signature)
+        _loaded[json_path] = (signature, index)
+        return index
+
+
+def _load_or_compile(json_path: str, signature: Tuple[int, int, int]) -> BibleIndex:
+    cache_path = _cache_path(json_path)
+
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_signature, index = pickle.load(f)
+            if cached_signature == signature:
+                return index
+        except Exception as e:
+            print(f"[BIBLE] 인덱스 캐시 읽기 실패, JSON 재파싱: {e}")
+
+    with open(json_path, 'r', encoding='utf-8') as f:
+        index = BibleIndex.from_json_data(json.load(f))
+
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((signature, index), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"[BIBLE] 인덱스 캐시 저장 실패: {e}")
+
+    return index
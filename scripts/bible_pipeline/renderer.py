@@ -11,11 +11,18 @@ import math
 from typing import Dict, List, Any, Tuple, Optional
 from PIL import Image, ImageDraw, ImageFont
 
+from video.encoder import EncoderProfile, escape_filter_path, get_encoder_profile, render_timeout, run_ffmpeg
+from video.scheduler import estimate_ffmpeg_memory_mb, get_render_scheduler
+
 from .config import (
     BIBLE_BOOKS,
     get_book_by_name,
 )
 
+# 인코더 프로필 (정지 배경 + 자막 - RENDER_PROFILE 환경변수로 전체 채널 덮어쓰기 가능)
+# static: 배경은 한 번만 디코딩, 낮은 fps + 긴 GOP (자막 페이드 300ms는 10fps에서 3프레임)
+RENDER_PROFILE = "static"
+
 
 # ============================================================
 # 색상 팔레트 (구약 파란색 계열, 신약 빨간색 계열)
@@ -689,11 +696,16 @@ def generate_ffmpeg_command(
     subtitle_path: str,
     output_path: str,
     duration: float,
-    subtitle_type: str = "ass"  # "ass" or "srt"
+    subtitle_type: str = "ass",  # "ass" or "srt"
+    profile: Optional[EncoderProfile] = None
 ) -> List[str]:
     """
     FFmpeg 명령어 생성
 
+    프로필에 frame_rate가 있으면(static) 정지 배경 전용 경로:
+    배경 PNG를 한 번만 디코딩해서 loop 필터로 반복하고(-loop 1은 매 프레임 PNG 재디코딩),
+    낮은 fps + 긴 GOP로 인코딩한다. 자막 타이밍은 1/fps초 단위로 맞춰진다.
+
     Args:
         background_path: 배경 이미지 경로
         audio_path: TTS 오디오 파일 경로
@@ -701,36 +713,54 @@ def generate_ffmpeg_command(
         output_path: 출력 영상 경로
         duration: 영상 길이 (초)
         subtitle_type: 자막 타입
+        profile: 인코더 프로필 (None이면 RENDER_PROFILE 기본값)
 
     Returns:
         FFmpeg 명령어 리스트
     """
+    profile = profile or get_encoder_profile(RENDER_PROFILE)
+
+    if subtitle_type == "ass":
+        # ASS 자막 (스타일 포함)
+        subtitle_filter = f"ass={escape_filter_path(subtitle_path)}"
+    else:
+        # SRT 자막
+        subtitle_filter = f"subtitles={escape_filter_path(subtitle_path)}:force_style='FontName=NanumSquareRound,FontSize=48,PrimaryColour=&HFFFFFF,OutlineColour=&H000000,BorderStyle=1,Outline=3,Shadow=2'"
+
+    if profile.frame_rate:
+        fps = profile.output_fps(30)
+        return [
+            'ffmpeg', '-y',
+            '-framerate', str(fps),
+            '-i', background_path,
+            '-i', audio_path,
+            '-filter_complex', f"[0:v]format=yuv420p,loop=loop=-1:size=1,{subtitle_filter}[v]",
+            '-map', '[v]', '-map', '1:a',
+            '-t', str(duration),
+            *profile.video_args(),
+            *profile.audio_args(),
+            *profile.rate_args(fps),
+            '-pix_fmt', 'yuv420p',
+            *profile.thread_args(),
+            output_path,
+        ]
+
     # 기본 명령어
     cmd = [
         'ffmpeg', '-y',
         '-loop', '1',
         '-i', background_path,
         '-i', audio_path,
-        '-c:v', 'libx264',
-        '-tune', 'stillimage',
-        '-c:a', 'aac',
-        '-b:a', '192k',
+        *profile.video_args(),
+        *profile.audio_args(),
         '-pix_fmt', 'yuv420p',
         '-shortest',
         '-t', str(duration),
+        *profile.thread_args(),
     ]
 
     # 자막 필터
-    if subtitle_type == "ass":
-        # ASS 자막 (스타일 포함)
-        cmd.extend([
-            '-vf', f"ass={subtitle_path}",
-        ])
-    else:
-        # SRT 자막
-        cmd.extend([
-            '-vf', f"subtitles={subtitle_path}:force_style='FontName=NanumSquareRound,FontSize=48,PrimaryColour=&HFFFFFF,OutlineColour=&H000000,BorderStyle=1,Outline=3,Shadow=2'",
-        ])
+    cmd.extend(['-vf', subtitle_filter])
 
     cmd.append(output_path)
 
@@ -760,11 +790,6 @@ def render_episode_video(
         {"ok": True, "video_path": str, "duration": float} 또는
         {"ok": False, "error": str}
     """
-    import subprocess
-    import re
-    import time
-    import sys
-
     os.makedirs(output_dir, exist_ok=True)
 
     # 파일 경로 생성
@@ -803,121 +828,43 @@ def render_episode_video(
     print(f"[RENDER] 예상 영상 길이: {total_duration:.1f}초 ({total_duration/60:.1f}분)", flush=True)
 
     # FFmpeg 명령어 생성 및 실행
+    profile = get_encoder_profile(RENDER_PROFILE)
     cmd = generate_ffmpeg_command(
         background_path=background_path,
         audio_path=audio_path,
         subtitle_path=subtitle_path,
         output_path=video_path,
         duration=total_duration,
-        subtitle_type=subtitle_ext
+        subtitle_type=subtitle_ext,
+        profile=profile
     )
 
-    # 타임아웃 계산: 영상 길이의 2배 + 5분 (최소 15분, 최대 60분)
-    # Render 1vCPU에서 실시간의 약 1.5-2배 소요
-    timeout_seconds = min(max(int(total_duration * 2 + 300), 900), 3600)
-    print(f"[RENDER] FFmpeg 실행 시작: Day {episode.day_number} (타임아웃: {timeout_seconds//60}분)", flush=True)
+    # 타임아웃: 영상 길이의 2배 + 5분 (최소 15분, 최대 60분) - video.encoder.render_timeout
+    print(f"[RENDER] FFmpeg 실행 시작: Day {episode.day_number} (타임아웃: {render_timeout(total_duration)//60}분)", flush=True)
     print(f"[RENDER] 명령어: {' '.join(cmd[:10])}...", flush=True)
 
+    # -progress pipe:1 진행률 보고 + 렌더 스케줄러 입장 (동시 렌더 메모리 제어)
+    estimate = estimate_ffmpeg_memory_mb(1920, 1080, total_duration, preset=profile.preset)
     try:
-        import select
-        import threading
-
-        # FFmpeg에 -progress pipe:1 추가하여 진행 정보를 stdout으로 출력
-        cmd_with_progress = cmd[:-1] + ['-progress', 'pipe:1', cmd[-1]]
-
-        process = subprocess.Popen(
-            cmd_with_progress,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-
-        start_time = time.time()
-        last_progress_time = time.time()
-        stderr_lines = []
-        current_time_sec = 0
-
-        def read_stderr():
-            """stderr를 백그라운드에서 읽어 저장"""
-            for line in process.stderr:
-                stderr_lines.append(line)
-
-        # stderr를 별도 스레드에서 읽기 (블로킹 방지)
-        stderr_thread = threading.Thread(target=read_stderr, daemon=True)
-        stderr_thread.start()
+        with get_render_scheduler().admit(estimate, label=f"bible-day-{episode.day_number}"):
+            result = run_ffmpeg(cmd, duration=total_duration, label="RENDER")
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
 
-        # stdout에서 진행 정보 읽기 (FFmpeg -progress 출력)
-        while True:
-            # 타임아웃 체크
-            if time.time() - start_time > timeout_seconds:
-                process.kill()
-                return {"ok": False, "error": f"FFmpeg 타임아웃 ({timeout_seconds//60}분 초과)"}
+    if not result.get("ok"):
+        return result
 
-            # 프로세스 종료 체크
-            if process.poll() is not None:
-                break
+    print(f"[RENDER] FFmpeg 완료! 총 {total_duration:.0f}초 렌더링됨 "
+          f"(소요: {result['elapsed']/60:.1f}분, {result['fps']:.1f}fps, {result['speed']:.1f}배속, "
+          f"프로필: {profile.name})", flush=True)
+    print(f"[RENDER] 영상 생성 완료: {video_path}", flush=True)
 
-            try:
-                line = process.stdout.readline()
-                if not line:
-                    time.sleep(0.1)
-                    continue
-
-                # out_time_ms=12345678 형식에서 시간 추출
-                if line.startswith('out_time_ms='):
-                    try:
-                        ms = int(line.split('=')[1].strip())
-                        current_time_sec = ms / 1000000.0
-                    except:
-                        pass
-
-                # out_time=00:01:23.456789 형식
-                elif line.startswith('out_time='):
-                    time_str = line.split('=')[1].strip()
-                    time_match = re.match(r'(\d+):(\d+):(\d+\.?\d*)', time_str)
-                    if time_match:
-                        hours = int(time_match.group(1))
-                        minutes = int(time_match.group(2))
-                        seconds = float(time_match.group(3))
-                        current_time_sec = hours * 3600 + minutes * 60 + seconds
-
-                # 30초마다 진행 상황 출력
-                if time.time() - last_progress_time >= 30:
-                    progress_pct = (current_time_sec / total_duration * 100) if total_duration > 0 else 0
-                    elapsed = time.time() - start_time
-                    print(f"[RENDER] FFmpeg 진행: {current_time_sec:.0f}초/{total_duration:.0f}초 ({progress_pct:.1f}%) - 경과: {elapsed/60:.1f}분", flush=True)
-                    last_progress_time = time.time()
-
-            except Exception as e:
-                time.sleep(0.1)
-
-        # 프로세스 완료 대기
-        process.wait(timeout=60)
-        stderr_thread.join(timeout=5)
-
-        if process.returncode != 0:
-            error_text = ''.join(stderr_lines[-30:]) if stderr_lines else "No stderr"
-            return {
-                "ok": False,
-                "error": f"FFmpeg 오류 (code {process.returncode}): {error_text[:500]}"
-            }
-
-        elapsed = time.time() - start_time
-        print(f"[RENDER] FFmpeg 완료! 총 {current_time_sec:.0f}초 렌더링됨 (소요: {elapsed/60:.1f}분)", flush=True)
-        print(f"[RENDER] 영상 생성 완료: {video_path}", flush=True)
-
-        return {
-            "ok": True,
-            "video_path": video_path,
-            "subtitle_path": subtitle_path,
-            "duration": total_duration
-        }
-
-    except subprocess.TimeoutExpired:
-        process.kill()
-        return {"ok": False, "error": f"FFmpeg 타임아웃 ({timeout_seconds//60}분 초과)"}
-    except Exception as e:
-        return {"ok": False, "error": str(e)}
+    return {
+        "ok": True,
+        "video_path": video_path,
+        "subtitle_path": subtitle_path,
+        "duration": total_duration
+    }
 
 
 # ============================================================
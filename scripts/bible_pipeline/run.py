@@ -2,7 +2,7 @@
 성경통독 파이프라인 메인 실행 모듈
 
 핵심 기능:
-1. 성경 JSON 로드 및 파싱
+1. 성경 JSON 로드 및 인덱스 컴파일 (index.py)
 2. 에피소드 범위 계산 (20분 분량 기준)
 3. TTS용 텍스트 생성 (절 번호 제외, 말씀만)
 4. 자막용 텍스트 생성 (절 번호 포함)
@@ -38,6 +38,7 @@ from .config import (
     BIBLE_VIDEO_LENGTH_MINUTES,
     get_book_by_name,
 )
+from .index import BibleIndex, BookIndex, load_bible_index
 
 
 @dataclass
@@ -251,46 +252,34 @@ class BiblePipeline:
             bible_json_path: 성경 JSON 파일 경로
         """
         self.bible_json_path = bible_json_path
-        self.bible_data = None
+        self.index: Optional[BibleIndex] = None
         self._load_bible()
 
     def _load_bible(self):
-        """성경 JSON 로드"""
-        if not os.path.exists(self.bible_json_path):
-            raise FileNotFoundError(f"성경 파일을 찾을 수 없습니다: {self.bible_json_path}")
+        """성경 인덱스 로드 (JSON은 최초 1회만 파싱, 이후 캐시 파일 사용)"""
+        self.index = load_bible_index(self.bible_json_path)
 
-        with open(self.bible_json_path, 'r', encoding='utf-8') as f:
-            self.bible_data = json.load(f)
+        print(f"[BIBLE] 로드 완료: {self.index.version}")
+        print(f"[BIBLE] 총 {len(self.index.books)}권")
 
-        print(f"[BIBLE] 로드 완료: {self.bible_data.get('version', 'Unknown')}")
-        print(f"[BIBLE] 총 {len(self.bible_data.get('books', []))}권")
-
-    def get_book(self, book_name: str) -> Optional[Dict[str, Any]]:
-        """책 이름으로 성경 책 데이터 조회"""
-        for book in self.bible_data.get("books", []):
-            if book.get("name") == book_name:
-                return book
-        return None
+    def get_book(self, book_name: str) -> Optional[BookIndex]:
+        """책 이름으로 성경 책 인덱스 조회"""
+        return self.index.get_book(book_name)
 
     def get_chapter(self, book_name: str, chapter_num: int) -> Optional[Chapter]:
         """특정 장 데이터 조회"""
-        book = self.get_book(book_name)
-        if not book:
+        verses = self.index.chapter_verses(book_name, chapter_num)
+        if verses is None:
             return None
 
-        for ch in book.get("chapters", []):
-            if ch.get("chapter") == chapter_num:
-                verses = [
-                    Verse(
-                        book=book_name,
-                        chapter=chapter_num,
-                        verse=v.get("verse"),
-                        text=v.get("text", "")
-                    )
-                    for v in ch.get("verses", [])
-                ]
-                return Chapter(book=book_name, chapter=chapter_num, verses=verses)
-        return None
+        return Chapter(
+            book=book_name,
+            chapter=chapter_num,
+            verses=[
+                Verse(book=book_name, chapter=chapter_num, verse=verse_num, text=text)
+                for verse_num, text in verses
+            ]
+        )
 
     def get_chapters_range(self, book_name: str, start: int, end: int) -> List[Chapter]:
         """특정 범위의 장들 조회"""
@@ -308,7 +297,7 @@ class BiblePipeline:
         target_minutes: float = BIBLE_VIDEO_LENGTH_MINUTES
     ) -> Tuple[int, int, int, float]:
         """
-        목표 시간에 맞는 장 범위 계산
+        목표 시간에 맞는 장 범위 계산 (장별 글자 수 누적합에서 이분 탐색)
 
         Args:
             book_name: 책 이름
@@ -319,28 +308,11 @@ class BiblePipeline:
             (start_chapter, end_chapter, total_chars, estimated_minutes)
         """
         target_chars = target_minutes * BIBLE_CHARS_PER_MINUTE
-        book = self.get_book(book_name)
 
-        if not book:
+        if self.get_book(book_name) is None:
             raise ValueError(f"책을 찾을 수 없습니다: {book_name}")
 
-        total_chars = 0
-        end_chapter = start_chapter
-
-        for ch in book.get("chapters", []):
-            ch_num = ch.get("chapter")
-            if ch_num < start_chapter:
-                continue
-
-            # 이 장의 글자 수 계산
-            ch_chars = sum(len(v.get("text", "")) for v in ch.get("verses", []))
-
-            # 목표 초과 시 이전 장까지
-            if total_chars + ch_chars > target_chars:
-                break
-
-            total_chars += ch_chars
-            end_chapter = ch_num
+        end_chapter, total_chars = self.index.end_chapter_for_chars(book_name, start_chapter, target_chars)
 
         estimated_minutes = total_chars / BIBLE_CHARS_PER_MINUTE
         return start_chapter, end_chapter, total_chars, estimated_minutes
@@ -427,7 +399,7 @@ class BiblePipeline:
         if not book:
             raise ValueError(f"책을 찾을 수 없습니다: {book_name}")
 
-        total_chapters = len(book.get("chapters", []))
+        total_chapters = len(book.chapter_nums)
         episodes = []
         current_start = 1
         episode_num = 1
@@ -482,14 +454,9 @@ class BiblePipeline:
             if not book:
                 continue
 
-            book_chars = 0
-            chapter_chars = []  # [(chapter_num, chars), ...]
-
-            for ch in book.get("chapters", []):
-                ch_num = ch.get("chapter")
-                ch_chars = sum(len(v.get("text", "")) for v in ch.get("verses", []))
-                chapter_chars.append((ch_num, ch_chars))
-                book_chars += ch_chars
+            # 장별 글자 수는 인덱스에 미리 계산되어 있음
+            book_chars = book.total_chars
+            chapter_chars = list(zip(book.chapter_nums, book.chapter_chars))  # [(chapter_num, chars), ...]
 
             book_stats.append({
                 "name": book_name,
@@ -6,6 +6,13 @@ scripts/common - 파이프라인 공통 모듈
 - tts: TTS 생성 (Gemini, Chirp3, Google Cloud)
 - base_agent: 에이전트 기본 클래스
 - srt_utils: SRT 자막 유틸리티
+- rate_limit: API 호출 속도 제한 (토큰 버킷)
+- audio_utils: ffprobe 없는 MP3 재생 시간 계산
+- tts_cache: TTS 오디오 캐시 (텍스트/음성/속도/엔진 기준, LRU)
+- sheets_gateway: Google Sheets batchGet/batchUpdate 게이트웨이
+- zip_stream: 메모리에 쌓지 않는 스트리밍 ZIP 작성
+- text_normalize: TTS/자막 텍스트 정규화 (미리 컴파일된 정규식, 배치 API)
+- youtube_upload: 재시작 후 이어 올리는 YouTube 업로드 (세션 저장, 적응형 청크)
 
 사용법:
     from scripts.common.tts import generate_chirp3_tts, is_chirp3_voice
@@ -35,6 +42,21 @@ from .tts import (
     convert_gemini_wav_to_mp3,
 )
 
+# 공통 유틸
+from .rate_limit import RateLimiter, get_rate_limiter
+from .audio_utils import get_mp3_duration, mp3_duration_from_bytes
+from .tts_cache import TTSAudioCache, get_tts_cache
+from .sheets_gateway import SheetsGateway
+from .zip_stream import atomic_zip, new_zip_spool, zip_write_bytes, zip_write_file, zip_write_url
+from .text_normalize import (
+    convert_numbers_to_korean,
+    korean_numbers_to_arabic,
+    normalize_tts_text,
+    normalize_tts_batch,
+    normalize_subtitle_batch,
+)
+from .youtube_upload import upload_video_resumable
+
 __all__ = [
     # Base Agent
     "AgentStatus",
@@ -51,4 +73,23 @@ __all__ = [
     'preprocess_tts_text',
     'preprocess_tts_extended',
     'convert_gemini_wav_to_mp3',
+    # 공통 유틸
+    'RateLimiter',
+    'get_rate_limiter',
+    'get_mp3_duration',
+    'mp3_duration_from_bytes',
+    'TTSAudioCache',
+    'get_tts_cache',
+    'SheetsGateway',
+    'atomic_zip',
+    'new_zip_spool',
+    'zip_write_bytes',
+    'zip_write_file',
+    'zip_write_url',
+    'convert_numbers_to_korean',
+    'korean_numbers_to_arabic',
+    'normalize_tts_text',
+    'normalize_tts_batch',
+    'normalize_subtitle_batch',
+    'upload_video_resumable',
 ]
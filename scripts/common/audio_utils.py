@@ -0,0 +1,147 @@
+"""
+오디오 유틸리티 - ffprobe 없이 MP3 재생 시간 계산
+
+TTS 청크마다 ffprobe 프로세스를 띄우는 대신 MP3 프레임 헤더를 직접 읽어 길이를 구한다.
+- Xing/Info/VBRI 헤더가 있으면 총 프레임 수로 즉시 계산
+- 없으면 (Google TTS CBR 출력 등) 프레임 헤더를 순회하며 샘플 수 합산
+"""
+
+import os
+from typing import Optional
+
+# 비트레이트 테이블 (kbps) - [MPEG1 / MPEG2·2.5][layer I, II, III]
+_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# 샘플레이트 테이블 - version bits (0=2.5, 2=2, 3=1)
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+
+def _parse_frame_header(data, pos):
+    """pos 위치의 MP3 프레임 헤더 파싱
+
+    Returns:
+        (frame_length, samples_per_frame, sample_rate, version_bits, channel_mode) 또는 None
+    """
+    if pos + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[pos], data[pos + 1], data[pos + 2], data[pos + 3]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version_bits = (b1 >> 3) & 0x03
+    layer_bits = (b1 >> 1) & 0x03
+    bitrate_idx = b2 >> 4
+    rate_idx = (b2 >> 2) & 0x03
+    padding = (b2 >> 1) & 0x01
+    if version_bits == 1 or layer_bits == 0 or bitrate_idx in (0, 15) or rate_idx == 3:
+        return None  # 예약값 / free format
+
+    layer = 4 - layer_bits  # 1=I, 2=II, 3=III
+    mpeg1 = version_bits == 3
+    bitrate = _BITRATES[(1 if mpeg1 else 2, layer)][bitrate_idx] * 1000
+    sample_rate = _SAMPLE_RATES[version_bits][rate_idx]
+
+    if layer == 1:
+        samples = 384
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 2:
+        samples = 1152
+        frame_length = 144 * bitrate // sample_rate + padding
+    else:
+        samples = 1152 if mpeg1 else 576
+        frame_length = (144 if mpeg1 else 72) * bitrate // sample_rate + padding
+
+    return frame_length, samples, sample_rate, version_bits, b3 >> 6
+
+
+def _skip_id3v2(data) -> int:
+    if len(data) >= 10 and data[:3] == b"ID3":
+        size = (data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | (data[9] & 0x7F)
+        footer = 10 if data[5] & 0x10 else 0
+        return 10 + size + footer
+    return 0
+
+
+def _vbr_frame_count(data, pos, header) -> Optional[int]:
+    """첫 프레임의 Xing/Info/VBRI 헤더에서 총 프레임 수 읽기"""
+    _, _, _, version_bits, channel_mode = header
+    mono = channel_mode == 3
+    if version_bits == 3:
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+
+    xing = pos + 4 + side_info
+    tag = bytes(data[xing:xing + 4])
+    if tag in (b"Xing", b"Info"):
+        flags = int.from_bytes(data[xing + 4:xing + 8], "big")
+        if flags & 0x01:
+            return int.from_bytes(data[xing + 8:xing + 12], "big")
+        return None
+
+    vbri = pos + 4 + 32
+    if bytes(data[vbri:vbri + 4]) == b"VBRI":
+        return int.from_bytes(data[vbri + 14:vbri + 18], "big")
+    return None
+
+
+def mp3_duration_from_bytes(data) -> Optional[float]:
+    """MP3 바이트에서 재생 시간(초) 계산 - 프레임을 찾지 못하면 None"""
+    pos = _skip_id3v2(data)
+    end = len(data)
+
+    # 첫 프레임 동기화 (연속된 두 프레임 헤더로 확인해 오탐 방지)
+    first = None
+    while pos < end - 4:
+        header = _parse_frame_header(data, pos)
+        if header and (pos + header[0] >= end or _parse_frame_header(data, pos + header[0])):
+            first = header
+            break
+        pos += 1
+    if first is None:
+        return None
+
+    frame_count = _vbr_frame_count(data, pos, first)
+    if frame_count:
+        return frame_count * first[1] / first[2]
+
+    total_samples = 0
+    sample_rate = first[2]
+    while pos < end - 4:
+        header = _parse_frame_header(data, pos)
+        if header is None:
+            if bytes(data[pos:pos + 3]) == b"TAG":
+                break  # ID3v1 태그 (파일 끝)
+            pos += 1  # 손상 구간 재동기화
+            continue
+        frame_length, samples, sample_rate, _, _ = header
+        if pos + frame_length > end:
+            # 잘린 마지막 프레임은 남은 바이트 비율만큼만 반영
+            total_samples += samples * (end - pos) / frame_length
+            break
+        total_samples += samples
+        pos += frame_length
+
+    return total_samples / sample_rate if total_samples else None
+
+
+def get_mp3_duration(path: str) -> Optional[float]:
+    """MP3 파일의 재생 시간(초) - 파싱 실패 시 None"""
+    try:
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            data = f.read()
+        return mp3_duration_from_bytes(memoryview(data))
+    except Exception:
+        return None
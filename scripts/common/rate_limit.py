@@ -0,0 +1,85 @@
+"""
+API 호출 속도 제한 (토큰 버킷)
+
+여러 스레드가 같은 외부 API(Google TTS, Sheets 등)를 동시에 호출할 때
+초당 요청 수(QPS)를 넘지 않도록 호출 직전에 acquire()로 대기한다.
+
+사용법:
+    from scripts.common.rate_limit import get_rate_limiter
+
+    limiter = get_rate_limiter("google_tts", rate=8)
+    limiter.acquire()
+    requests.post(...)
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+
+class RateLimiter:
+    """스레드 안전 토큰 버킷
+
+    acquire()는 토큰을 먼저 예약하고 부족분만큼 락 밖에서 sleep하므로,
+    대기 중인 스레드들이 요청 순서대로 rate 간격을 두고 깨어난다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Args:
+            rate: 초당 허용 요청 수 (0 이하면 제한 없음)
+            burst: 한 번에 몰아서 쓸 수 있는 최대 토큰 (기본: max(1, rate))
+        """
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1) -> float:
+        """토큰을 얻을 때까지 대기
+
+        Returns:
+            실제로 대기한 시간 (초)
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """대기 없이 토큰을 얻을 수 있으면 사용하고 True"""
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate: float, burst: Optional[float] = None) -> RateLimiter:
+    """이름별 프로세스 공용 RateLimiter (같은 API를 쓰는 모든 호출처가 한 버킷을 공유)
+
+    처음 생성할 때의 rate/burst가 사용되고, 이후 호출의 값은 무시된다.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = RateLimiter(rate, burst)
+            _limiters[name] = limiter
+        return limiter
@@ -0,0 +1,168 @@
+"""
+Google Sheets 일괄 읽기/쓰기 게이트웨이
+
+시트(탭)마다 values.get을 따로 부르고 셀마다 values.update를 따로 부르는 대신:
+- 여러 탭을 values.batchGet 한 번으로 읽는다
+- 셀 쓰기를 모아 두었다가 flush() 때 values.batchUpdate 한 번으로 보낸다
+- 고정 sleep 대신 읽기/쓰기별 토큰 버킷(rate_limit)으로 분당 쿼터(60회/분)를 지킨다
+
+같은 셀에 여러 번 쓰면 마지막 값만 전송한다.
+
+사용법:
+    from scripts.common.sheets_gateway import SheetsGateway
+
+    gateway = SheetsGateway(service, sheet_id)
+    tabs = gateway.batch_get([f"'{name}'!A:AZ" for name in sheet_names])   # {range: rows} 또는 None
+    gateway.update_by_header(sheet_name, row_num, col_map, '상태', '처리중')
+    gateway.update_by_header(sheet_name, row_num, col_map, '작업시간', now_str)
+    gateway.flush()
+"""
+
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .rate_limit import get_rate_limiter
+
+# Sheets API 한도: 사용자당 읽기 60회/분, 쓰기 60회/분
+SHEETS_READ_QPS = float(os.getenv("SHEETS_READ_QPS", "1"))
+SHEETS_WRITE_QPS = float(os.getenv("SHEETS_WRITE_QPS", "1"))
+
+# 재시도 가능한 일시적 오류 패턴
+_TRANSIENT_ERRORS = (
+    'authentication backend unknown error',
+    'backend error',
+    'internal error',
+    'service unavailable',
+    'deadline exceeded',
+    'connection reset',
+    'connection refused',
+    'timeout',
+    '500',
+    '502',
+    '503',
+    '504',
+)
+
+
+def execute_with_retry(request_fn: Callable[[], Any], label: str, limiter=None, max_retries: int = 3):
+    """Sheets API 요청 실행 (429/일시적 오류 재시도)
+
+    Args:
+        request_fn: 호출할 때마다 새 요청을 만들어 execute()하는 함수
+        label: 로그용 작업 이름
+        limiter: 매 시도 직전에 acquire()할 RateLimiter
+
+    Returns:
+        API 응답 (모든 재시도 실패 시 예외를 다시 던짐)
+    """
+    last_error = None
+    for attempt in range(max_retries):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return request_fn()
+        except Exception as e:
+            last_error = e
+            error_str = str(e).lower()
+
+            is_rate_limit = '429' in error_str or 'rate_limit' in error_str or 'quota exceeded' in error_str
+            is_transient = any(pattern in error_str for pattern in _TRANSIENT_ERRORS)
+
+            if is_rate_limit and attempt < max_retries - 1:
+                # 429 에러: 분당 쿼터 리셋 대기
+                wait_time = 65
+                print(f"[SHEETS] {label} Rate Limit 초과 (시도 {attempt + 1}/{max_retries}), {wait_time}초 후 재시도")
+                time.sleep(wait_time)
+            elif is_transient and attempt < max_retries - 1:
+                wait_time = (2 ** attempt) * 2  # 2초, 4초, 8초
+                print(f"[SHEETS] {label} 일시적 오류 (시도 {attempt + 1}/{max_retries}), {wait_time}초 후 재시도: {e}")
+                time.sleep(wait_time)
+            else:
+                print(f"[SHEETS] {label} 실패 (시도 {attempt + 1}/{max_retries}): {e}")
+                if not is_transient and not is_rate_limit:
+                    break
+    raise last_error
+
+
+class SheetsGateway:
+    """스프레드시트 하나에 대한 batchGet/batchUpdate 게이트웨이 (요청 단위로 생성)"""
+
+    def __init__(self, service, sheet_id: str):
+        self.service = service
+        self.sheet_id = sheet_id
+        self._read_limiter = get_rate_limiter("google_sheets_read", SHEETS_READ_QPS)
+        self._write_limiter = get_rate_limiter("google_sheets_write", SHEETS_WRITE_QPS)
+        # range → values (삽입 순서 유지, 같은 range는 마지막 값으로 덮어씀)
+        self._pending: Dict[str, List[List[Any]]] = {}
+
+    # ----- 읽기 -----
+    def batch_get(self, ranges: List[str]) -> Optional[Dict[str, List[List[Any]]]]:
+        """여러 범위를 한 번에 읽기
+
+        Returns:
+            {요청한 range: rows} (빈 범위는 []), API 실패 시 None
+        """
+        if not ranges:
+            return {}
+        try:
+            result = execute_with_retry(
+                lambda: self.service.spreadsheets().values().batchGet(
+                    spreadsheetId=self.sheet_id,
+                    ranges=ranges
+                ).execute(),
+                "일괄 읽기",
+                limiter=self._read_limiter,
+            )
+        except Exception as e:
+            print(f"[SHEETS] 일괄 읽기 최종 실패 ({len(ranges)}개 범위): {e}")
+            return None
+
+        # valueRanges는 요청한 ranges와 같은 순서로 반환됨
+        value_ranges = result.get('valueRanges', [])
+        return {
+            requested: (value_ranges[i].get('values', []) if i < len(value_ranges) else [])
+            for i, requested in enumerate(ranges)
+        }
+
+    # ----- 쓰기 (모아서 flush) -----
+    def update(self, cell_range: str, value) -> None:
+        """셀 쓰기 예약 (cell_range 예시: "'시트'!A2")"""
+        self._pending[cell_range] = [value] if isinstance(value, list) else [[value]]
+
+    def update_by_header(self, sheet_name: str, row_num: int, col_map: Dict[str, Dict[str, Any]],
+                         header_name: str, value) -> bool:
+        """헤더 이름으로 셀 쓰기 예약 (col_map: get_column_mapping() 반환값)"""
+        if header_name not in col_map:
+            print(f"[SHEETS] 경고: 헤더 '{header_name}'을 찾을 수 없음")
+            return False
+        col_letter = col_map[header_name]['letter']
+        self.update(f"'{sheet_name}'!{col_letter}{row_num}", value)
+        return True
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> bool:
+        """예약된 셀 쓰기를 batchUpdate 한 번으로 전송
+
+        실패하면 예약을 유지하므로 다음 flush()에서 다시 시도된다.
+        """
+        if not self._pending:
+            return True
+        data = [{'range': cell_range, 'values': values} for cell_range, values in self._pending.items()]
+        try:
+            execute_with_retry(
+                lambda: self.service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=self.sheet_id,
+                    body={'valueInputOption': 'RAW', 'data': data}
+                ).execute(),
+                "일괄 업데이트",
+                limiter=self._write_limiter,
+            )
+        except Exception as e:
+            print(f"[SHEETS] 일괄 업데이트 최종 실패 ({len(data)}개 셀): {e}")
+            return False
+        self._pending.clear()
+        return True
@@ -0,0 +1,607 @@
+"""
+한국어 텍스트 정규화 엔진 (TTS / 자막 공용)
+
+TTS 전처리(숫자 → 한글 읽기, 기호/약어 → 발음)와 자막 후처리(한글 숫자 → 아라비아 숫자)를
+한 곳에 모은 모듈. 예전에는 요청마다 정규식과 클로저를 새로 만들고, 단위 하나마다
+re.sub를 따로 돌렸다 (문장 하나에 200회 이상).
+
+- 모든 패턴은 모듈 로드 시 한 번만 컴파일
+- 같은 단계의 단위/기호/약어 목록은 하나의 alternation 패턴(또는 str.translate)으로 합쳐 한 번에 처리
+  (alternation 순서 = 기존 목록 순서 → 겹치는 경우 기존과 같은 항목이 이김)
+- 처리 순서가 결과를 바꾸는 단계("개"로 시작하는 한자어 단위, 붙어 있는 통화 기호, 5G/MP3, 자막 수사 역변환)는 항목별로 순서대로
+- 리스트 입력을 받는 배치 API 제공 (normalize_tts_batch, normalize_subtitle_batch)
+
+사용법:
+    from scripts.common.text_normalize import convert_numbers_to_korean, normalize_tts_batch
+
+    convert_numbers_to_korean("3개월 동안 15번")    # "삼개월 동안 열다섯번"
+    normalize_tts_batch(["CEO가 3.5% 올렸다.", ...], language_code="ko-KR")
+
+벤치마크:
+    python -m scripts.common.text_normalize [문장 수]
+"""
+
+import re
+from typing import Iterable, List
+
+# ============================================================
+# 수사 변환
+# ============================================================
+
+_NATIVE_ONES = ['', '한', '두', '세', '네', '다섯', '여섯', '일곱', '여덟', '아홉']
+_NATIVE_TENS = ['', '열', '스물', '서른', '마흔', '쉰', '예순', '일흔', '여든', '아흔']
+_SINO_DIGITS = ['', '일', '이', '삼', '사', '오', '육', '칠', '팔', '구']
+_DECIMAL_DIGITS = ['영', '일', '이', '삼', '사', '오', '육', '칠', '팔', '구']
+_PHONE_DIGITS = ['공', '일', '이', '삼', '사', '오', '육', '칠', '팔', '구']
+
+
+def num_to_native(n: int) -> str:
+    """숫자를 고유어로 변환 (1~99, 범위 밖은 그대로)"""
+    if n <= 0 or n >= 100:
+        return str(n)
+    return _NATIVE_TENS[n // 10] + _NATIVE_ONES[n % 10]
+
+
+def num_to_sino(n: int) -> str:
+    """숫자를 한자어로 변환 (15 → 십오, 10000 → 만)"""
+    if n == 0:
+        return '영'
+    if n < 0:
+        return '마이너스 ' + num_to_sino(-n)
+
+    result = ''
+
+    # 억 단위
+    if n >= 100000000:
+        result += num_to_sino(n // 100000000) + '억'
+        n %= 100000000
+
+    # 만 단위
+    if n >= 10000:
+        man = n // 10000
+        result += '만' if man == 1 else num_to_sino(man) + '만'
+        n %= 10000
+
+    # 천/백/십 단위 (1이면 숫자 생략: 천, 백, 십)
+    for base, name in ((1000, '천'), (100, '백'), (10, '십')):
+        if n >= base:
+            digit = n // base
+            result += name if digit == 1 else _SINO_DIGITS[digit] + name
+            n %= base
+
+    # 일 단위
+    if n > 0:
+        result += _SINO_DIGITS[n]
+
+    return result
+
+
+def _alternation(items: Iterable[str]) -> str:
+    """목록 순서를 유지한 alternation (중복 제거)"""
+    return '|'.join(re.escape(item) for item in dict.fromkeys(items))
+
+
+# ----- 숫자 → 한글 (TTS) 패턴 -----
+
+# 고유어 단위 (15번 → 열다섯번)
+NATIVE_UNITS = ['번', '개', '명', '살', '시', '마리', '잔', '병', '권', '대', '채', '장', '벌', '켤레',
+                '그루', '송이', '군데', '가지', '줄', '쌍']
+
+# "개"로 시작하는 한자어 단위 (고유어 처리 전에 먼저: 11개월 → 십일개월)
+SINO_GE_UNITS = ['개월', '개국', '개사', '개년', '개소', '개항', '개교']
+
+# 한자어 단위 (200원 → 이백원) - 복합 단위(조원, 억원)가 단순 단위(원)보다 먼저
+SINO_UNITS = [
+    # 큰 단위 복합어 (먼저 처리)
+    '조원', '억원', '만원', '천원', '백원',
+    '조달러', '억달러', '만달러',
+    '조엔', '억엔', '만엔',
+    # 큰 단위 단독
+    '조', '억', '만',
+    # 일반 단위
+    '원', '층', '년', '월', '일', '분', '초', '도', '호', '회', '배', '위', '등', '점',
+    '퍼센트', '%', 'km', 'm', 'kg', 'g', 'cm', 'mm', '원짜리', '달러', '엔', '유로',
+    # 주식/지수 단위
+    '선', '포인트', 'p', 'pt',
+    # 추가 단위
+    '세기', '차', '항', '기', '반', '판', '부', '편', '곡', '막', '절', '관',
+    '조', '장', '권', '쪽', '면', '페이지', '화', '회차', '라운드', '세트',
+    '번지', '동', '호실', '구', '로', '길',  # 주소
+    '교시', '학년', '학기',  # 학교
+    '대', '세대',  # 세대
+    '승', '패', '무',  # 스포츠
+]
+
+_THOUSANDS_COMMA_RE = re.compile(r'(\d),(\d{3})')
+_BIBLE_VERSE_RE = re.compile(r'(\d+)장\s*(\d+)절')
+_CHAPTER_CONTEXT_RE = re.compile(r'(제)?(\d+)장(에서|을|의|은|이|과|부터|까지|으로|에|도)')
+# "개"로 시작하는 단위는 하나씩 순서대로: 앞 단위의 결과가 뒤 단위를 만들 수 있음
+# (12개4개월 → 12개사개월 → "12개사"가 개사 단위로 묶여 십이개사개월)
+_SINO_GE_RES = [(unit, re.compile(r'(\d+)(' + re.escape(unit) + ')')) for unit in SINO_GE_UNITS]
+_NATIVE_UNIT_RE = re.compile(r'(\d+)(' + _alternation(NATIVE_UNITS) + ')')
+_DECIMAL_UNIT_RE = re.compile(r'(\d+)\.(\d+)(일|시간|분|초|km|m|kg|g|cm|mm|%|퍼센트|배|도|리터|L|ml)')
+_DECIMAL_RE = re.compile(r'(\d+)\.(\d+)(?![가-힣a-zA-Z%])')
+_SINO_UNIT_RE = re.compile(r'(\d+)(' + _alternation(SINO_UNITS) + ')')
+_MULTIPLY_RE = re.compile(r'(\d+)\s*[xX×]\s*(\d+)')
+_DIVIDE_RE = re.compile(r'(\d+)\s*[/÷]\s*(\d+)')
+_RANGE_RE = re.compile(r'(\d+)~(\d+)(%|퍼센트|개|명|원|만원|억원|조원|kg|g|cm|m|km|일|시간|분|초)?')
+_TIME_RE = re.compile(r'\b([0-2]?[0-9]):([0-5][0-9])\b')
+_SCORE_RE = re.compile(r'(\d+)\s*:\s*(\d+)(?!\d)')
+_PHONE_RE = re.compile(r'\b(0\d{1,2})[- ](\d{3,4})[- ](\d{4})\b')
+_ISO_DATE_RE = re.compile(r'\b(\d{4})-(\d{1,2})-(\d{1,2})\b')
+_PAREN_NUM_RE = re.compile(r'\((\d+)\)')
+_STANDALONE_NUM_RE = re.compile(r'(?<![가-힣a-zA-Z])(\d{3,})(?![가-힣a-zA-Z%])')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+
+# 원문자 / 로마 숫자 → 한자어 읽기 (문자 1:1 치환이므로 str.translate 한 번)
+_NUMERAL_SYMBOLS = str.maketrans({
+    '①': '일', '②': '이', '③': '삼', '④': '사', '⑤': '오',
+    '⑥': '육', '⑦': '칠', '⑧': '팔', '⑨': '구', '⑩': '십',
+    '⑪': '십일', '⑫': '십이', '⑬': '십삼', '⑭': '십사', '⑮': '십오',
+    '⑯': '십육', '⑰': '십칠', '⑱': '십팔', '⑲': '십구', '⑳': '이십',
+    'Ⅰ': '일', 'Ⅱ': '이', 'Ⅲ': '삼', 'Ⅳ': '사', 'Ⅴ': '오',
+    'Ⅵ': '육', 'Ⅶ': '칠', 'Ⅷ': '팔', 'Ⅸ': '구', 'Ⅹ': '십',
+    'Ⅺ': '십일', 'Ⅻ': '십이',
+    'ⅰ': '일', 'ⅱ': '이', 'ⅲ': '삼', 'ⅳ': '사', 'ⅴ': '오',
+    'ⅵ': '육', 'ⅶ': '칠', 'ⅷ': '팔', 'ⅸ': '구', 'ⅹ': '십',
+})
+
+
+def _percent(unit: str) -> str:
+    return '퍼센트' if unit == '%' else unit
+
+
+def _replace_bible_verse(m):
+    return f"{num_to_sino(int(m.group(1)))}장 {num_to_sino(int(m.group(2)))}절"
+
+
+def _replace_chapter_context(m):
+    return f"{m.group(1) or ''}{num_to_sino(int(m.group(2)))}장{m.group(3)}"
+
+
+def _replace_sino_unit(m):
+    return num_to_sino(int(m.group(1))) + _percent(m.group(2))
+
+
+def _replace_native_unit(m):
+    num = int(m.group(1))
+    return (num_to_native(num) if 1 <= num <= 99 else num_to_sino(num)) + m.group(2)
+
+
+def _replace_decimal(m):
+    # 소수점 뒤는 자릿수별로 읽음 (0.75 → 영점칠오)
+    unit = m.group(3) if m.lastindex >= 3 else ''
+    result = num_to_sino(int(m.group(1))) + '점'
+    result += ''.join(_DECIMAL_DIGITS[int(d)] for d in m.group(2))
+    return result + _percent(unit)
+
+
+def _replace_range(m):
+    unit = m.group(3) or ''
+    return f"{num_to_sino(int(m.group(1)))}에서{num_to_sino(int(m.group(2)))}{_percent(unit)}"
+
+
+def _replace_time(m):
+    hour = int(m.group(1))
+    minute = int(m.group(2))
+    if hour > 23 or minute > 59:
+        return m.group(0)  # 시간이 아님
+    # 1~12시는 고유어, 0/13~23시는 한자어, 분은 한자어
+    hour_str = (num_to_native(hour) if 1 <= hour <= 12 else num_to_sino(hour)) + '시'
+    if minute == 0:
+        return hour_str
+    if minute == 30:
+        return hour_str + ' 반'
+    return hour_str + ' ' + num_to_sino(minute) + '분'
+
+
+def _replace_score(m):
+    return f"{num_to_sino(int(m.group(1)))} 대 {num_to_sino(int(m.group(2)))}"
+
+
+def _replace_phone(m):
+    digits = _NON_DIGIT_RE.sub('', m.group(0))
+    return ' '.join(_PHONE_DIGITS[int(d)] for d in digits)
+
+
+def _replace_iso_date(m):
+    return f"{num_to_sino(int(m.group(1)))}년 {num_to_sino(int(m.group(2)))}월 {num_to_sino(int(m.group(3)))}일"
+
+
+def _replace_paren_num(m):
+    return f"({num_to_sino(int(m.group(1)))})"
+
+
+def _replace_standalone_number(m):
+    # 100 이상만 변환 (작은 숫자는 그대로)
+    num = int(m.group(1))
+    return num_to_sino(num) if num >= 100 else m.group(0)
+
+
+def remove_thousands_separators(text: str) -> str:
+    """천 단위 쉼표 제거 (1,234,567 → 1234567)"""
+    while _THOUSANDS_COMMA_RE.search(text):
+        text = _THOUSANDS_COMMA_RE.sub(r'\1\2', text)
+    return text
+
+
+def convert_numbers_to_korean(text: str) -> str:
+    """숫자를 한글로 변환 (TTS 자연스러운 읽기용)
+
+    - 고유어 단위 (번, 개, 명, 살, 시, 마리 ...): 15번 → 열다섯번, 3개 → 세개
+    - 한자어 단위 (원, 층, 년, 월, 일, 분, 초 ...): 200원 → 이백원, 15층 → 십오층
+    - 성경 장/절, 소수점, 범위(~), 시간(3:30), 스코어, 전화번호, ISO 날짜, 원문자/로마 숫자
+    """
+    if not text:
+        return text
+
+    text = remove_thousands_separators(text)
+
+    # 성경 구절 (X장 Y절) / 제X장, X장에서 ... → 한자어 (고유어 처리 전에)
+    text = _BIBLE_VERSE_RE.sub(_replace_bible_verse, text)
+    text = _CHAPTER_CONTEXT_RE.sub(_replace_chapter_context, text)
+
+    # "개"로 시작하는 한자어 단위 (목록 순서대로) → 고유어 단위 순
+    for unit, pattern in _SINO_GE_RES:
+        if unit in text:
+            text = pattern.sub(_replace_sino_unit, text)
+    text = _NATIVE_UNIT_RE.sub(_replace_native_unit, text)
+
+    # 소수점 (단위 있는 것 먼저) → 정수 + 한자어 단위
+    text = _DECIMAL_UNIT_RE.sub(_replace_decimal, text)
+    text = _DECIMAL_RE.sub(_replace_decimal, text)
+    text = _SINO_UNIT_RE.sub(_replace_sino_unit, text)
+
+    # 곱하기/나누기, 범위 (7~8 → 칠에서팔), 남은 ~ 제거
+    text = _MULTIPLY_RE.sub(lambda m: num_to_sino(int(m.group(1))) + ' 곱하기 ' + num_to_sino(int(m.group(2))), text)
+    text = _DIVIDE_RE.sub(lambda m: num_to_sino(int(m.group(1))) + ' 나누기 ' + num_to_sino(int(m.group(2))), text)
+    text = _RANGE_RE.sub(_replace_range, text)
+    text = text.replace('~', ' ')
+
+    # 시간 → 스코어 순 (3:30 → 세시 반, 3:2 → 삼 대 이)
+    text = _TIME_RE.sub(_replace_time, text)
+    text = _SCORE_RE.sub(_replace_score, text)
+
+    text = _PHONE_RE.sub(_replace_phone, text)
+    text = _ISO_DATE_RE.sub(_replace_iso_date, text)
+    text = _PAREN_NUM_RE.sub(_replace_paren_num, text)
+    text = text.translate(_NUMERAL_SYMBOLS)
+
+    # 단위 없는 큰 숫자 (다른 패턴에 안 걸린 숫자)
+    text = _STANDALONE_NUM_RE.sub(_replace_standalone_number, text)
+
+    return text
+
+
+# ============================================================
+# 기호 / 약어 (TTS)
+# ============================================================
+
+_ENGLISH_NAME_PARENS_RE = re.compile(r'\([A-Z][a-zA-Z\-\s\'\.]+\)')
+_MULTI_SPACE_RE = re.compile(r'  +')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_URL_RE = re.compile(r'https?://[^\s<>\"\']+|www\.[^\s<>\"\']+')
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"
+    "\U0001F300-\U0001F5FF"
+    "\U0001F680-\U0001F6FF"
+    "\U0001F1E0-\U0001F1FF"
+    "\U0001F900-\U0001F9FF"
+    "\U0001FA00-\U0001FA6F"
+    "\U0001FA70-\U0001FAFF"
+    "\U0001F200-\U0001F251"
+    "]+",
+    flags=re.UNICODE
+)
+
+CURRENCY_MAP = {
+    '$': '달러', '€': '유로', '¥': '엔',
+    '£': '파운드', '₩': '원', '₿': '비트코인',
+}
+# (기호, 한글, 기호+숫자 패턴, 숫자+기호 패턴) - 기호끼리 붙어 있을 때 결과가 같도록 기호별 순서 유지
+_CURRENCY_PATTERNS = [
+    (symbol, korean, re.compile(re.escape(symbol) + r'(\d)'), re.compile(r'(\d)' + re.escape(symbol)))
+    for symbol, korean in CURRENCY_MAP.items()
+]
+
+_TEMPERATURE_RE = re.compile(r'°C|°F|℃|℉')
+_TEMPERATURE_MAP = {'℃': '도씨', '℉': '화씨', '°C': '도씨', '°F': '화씨'}
+_DEGREE_RE = re.compile(r'(\d)°(?![CF])')
+
+# 특수/수학 기호 + 남은 통화 기호 → 한글/제거 (문자 1:1 치환)
+_SYMBOL_TABLE = str.maketrans({
+    '&': '앤드', '@': '앳', '#': '해시',
+    '※': '', '★': '', '☆': '', '●': '', '○': '',
+    '◆': '', '◇': '', '■': '', '□': '',
+    '▶': '', '◀': '', '→': '', '←': '', '↑': '', '↓': '',
+    '—': ' ', '–': ' ', '…': '...', '·': ' ',
+    '「': '', '」': '', '『': '', '』': '',
+    '〈': '', '〉': '', '《': '', '》': '',
+    '±': '플러스마이너스', '∞': '무한대', '√': '루트',
+    '≤': '이하', '≥': '이상', '≠': '같지않음',
+    '≈': '약', '∴': '따라서', '∵': '왜냐하면',
+})
+
+ABBREVIATION_MAP = {
+    # 기관/조직
+    'CEO': '씨이오', 'CFO': '씨에프오', 'CTO': '씨티오',
+    'UN': '유엔', 'UNESCO': '유네스코', 'WHO': '더블유에이치오',
+    'NATO': '나토', 'OECD': '오이씨디', 'IMF': '아이엠에프',
+    'FBI': '에프비아이', 'CIA': '씨아이에이', 'NASA': '나사',
+    'EU': '이유', 'ASEAN': '아세안', 'OPEC': '오펙',
+    # 기술
+    'AI': '에이아이', 'IT': '아이티', 'PC': '피씨',
+    'USB': '유에스비', 'URL': '유알엘', 'API': '에이피아이',
+    'CPU': '씨피유', 'GPU': '지피유', 'RAM': '램', 'ROM': '롬',
+    'SSD': '에스에스디', 'LED': '엘이디', 'LCD': '엘씨디',
+    'VR': '브이알', 'AR': '에이알', 'IoT': '아이오티',
+    'GPS': '지피에스', 'WIFI': '와이파이', 'LTE': '엘티이',
+    '5G': '오지', '4G': '사지', '3G': '삼지',
+    'QR': '큐알', 'PDF': '피디에프', 'MP3': '엠피쓰리', 'MP4': '엠피포',
+    # 경제/금융
+    'GDP': '지디피', 'GNP': '지엔피', 'ETF': '이티에프',
+    'IPO': '아이피오', 'M&A': '엠앤에이', 'ESG': '이에스지',
+    # 의료
+    'CT': '씨티', 'MRI': '엠알아이', 'DNA': '디엔에이',
+    'RNA': '알엔에이', 'PCR': '피씨알', 'ICU': '아이씨유',
+    # 기타
+    'TV': '티비', 'SNS': '에스엔에스', 'PR': '피알',
+    'OK': '오케이', 'VS': '버서스', 'DIY': '디아이와이',
+    'VIP': '브이아이피', 'MVP': '엠브이피', 'OTT': '오티티',
+    'BTS': '비티에스', 'K-POP': '케이팝', 'KPOP': '케이팝',
+}
+_ABBREVIATION_LOOKUP = {abbr.upper(): korean for abbr, korean in ABBREVIATION_MAP.items()}
+
+
+def _abbreviation_pattern(alternatives: str):
+    return re.compile(r'(?<![가-힣a-zA-Z])(?:' + alternatives + r')(?![가-힣a-zA-Z])', flags=re.IGNORECASE)
+
+
+def _letter_edged(abbr: str) -> bool:
+    return abbr[0].isalpha() and abbr[-1].isalpha()
+
+
+# 숫자로 시작/끝나는 약어(5G, MP3)는 서로 붙으면(MP35G) 먼저 바뀐 쪽이 경계를 막으므로 사전 순서대로 하나씩,
+# 양 끝이 영문자인 약어는 서로 영향이 없으므로 하나의 패턴으로 한 번에 치환
+_DIGIT_EDGED_ABBREVIATIONS = [
+    (_abbreviation_pattern(re.escape(abbr)), korean)
+    for abbr, korean in ABBREVIATION_MAP.items() if not _letter_edged(abbr)
+]
+_ABBREVIATION_RE = _abbreviation_pattern(_alternation(abbr for abbr in ABBREVIATION_MAP if _letter_edged(abbr)))
+_UPPER_ABBREVIATION_RE = re.compile(r'(?<![가-힣a-zA-Z])[A-Z]{2,6}(?![가-힣a-zA-Z])')
+
+LETTER_SOUNDS = {
+    'A': '에이', 'B': '비', 'C': '씨', 'D': '디', 'E': '이',
+    'F': '에프', 'G': '지', 'H': '에이치', 'I': '아이', 'J': '제이',
+    'K': '케이', 'L': '엘', 'M': '엠', 'N': '엔', 'O': '오',
+    'P': '피', 'Q': '큐', 'R': '알', 'S': '에스', 'T': '티',
+    'U': '유', 'V': '브이', 'W': '더블유', 'X': '엑스', 'Y': '와이',
+    'Z': '제트'
+}
+
+
+def _spell_out_abbreviation(m):
+    abbr = m.group(0)
+    if abbr.upper() in _ABBREVIATION_LOOKUP:
+        return abbr
+    return ''.join(LETTER_SOUNDS.get(c.upper(), c) for c in abbr)
+
+
+def strip_english_name_parens(text: str) -> str:
+    """영문 인명 괄호 제거 - 니콜라이 티보-브리뇰(Nikolay Thibeaux-Brignolle) → 니콜라이 티보-브리뇰"""
+    text = _ENGLISH_NAME_PARENS_RE.sub('', text)
+    return _MULTI_SPACE_RE.sub(' ', text)
+
+
+def normalize_symbols(text: str) -> str:
+    """URL/이메일/이모지 제거, 통화·온도·특수·수학 기호 → 한글, 영문 약어 → 발음"""
+    if not text:
+        return text
+
+    text = _URL_RE.sub('', text)
+    text = _EMAIL_RE.sub('', text)
+    text = _EMOJI_RE.sub('', text)
+
+    # 통화 기호 → 한글 ($5 → 5달러)
+    for symbol, korean, before_num_re, after_num_re in _CURRENCY_PATTERNS:
+        if symbol in text:
+            text = before_num_re.sub(r'\1' + korean, text)
+            text = after_num_re.sub(r'\1' + korean, text)
+            text = text.replace(symbol, korean)
+
+    text = _TEMPERATURE_RE.sub(lambda m: _TEMPERATURE_MAP[m.group(0)], text)
+    text = _DEGREE_RE.sub(r'\1도', text)
+
+    text = text.translate(_SYMBOL_TABLE)
+
+    for pattern, korean in _DIGIT_EDGED_ABBREVIATIONS:
+        text = pattern.sub(korean, text)
+    text = _ABBREVIATION_RE.sub(lambda m: _ABBREVIATION_LOOKUP[m.group(0).upper()], text)
+    text = _UPPER_ABBREVIATION_RE.sub(_spell_out_abbreviation, text)
+
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+# ============================================================
+# 문장부호 (TTS)
+# ============================================================
+
+_ESCAPED_NEWLINE_RE = re.compile(r'[/\\][nN]|\n')
+_REPEATED_PUNCT_RE = re.compile(r'\.{2,}|\?{2,}|!{2,}')
+_TRAILING_PUNCT_RE = re.compile(r'[.?!]+\s*$')
+_INNER_PUNCT_RE = re.compile(r'[.?!]+\s+')
+_LONE_PUNCT_RE = re.compile(r'\s+[.?!]+\s+')
+
+
+def clean_tts_punctuation(text: str) -> str:
+    """줄바꿈·문장부호·쉼표 정리 (TTS가 "점", "물음표"로 읽는 것 방지)"""
+    # 줄바꿈 (\n, \\n, \N, /n 등) → 공백
+    text = _ESCAPED_NEWLINE_RE.sub(' ', text)
+
+    # 연속 부호 → 공백, 문장 끝 부호 제거, 문장 중간 부호 → 공백
+    text = _REPEATED_PUNCT_RE.sub(' ', text)
+    text = _TRAILING_PUNCT_RE.sub('', text)
+    text = _INNER_PUNCT_RE.sub(' ', text)
+    text = _LONE_PUNCT_RE.sub(' ', text)
+
+    # 천 단위 쉼표 제거 후 나머지 쉼표 → 공백 (휴지 효과)
+    text = remove_thousands_separators(text).replace(',', ' ')
+
+    return _WHITESPACE_RE.sub(' ', text).strip()
+
+
+def normalize_tts_text(text: str, language_code: str = 'ko-KR', convert_numbers: bool = True) -> str:
+    """TTS 전송 전 전체 정규화 (인명 괄호 → 기호/약어 → 문장부호 → 한국어 숫자)"""
+    text = strip_english_name_parens(text)
+    text = normalize_symbols(text)
+    text = clean_tts_punctuation(text)
+    if convert_numbers and language_code.startswith('ko'):
+        text = convert_numbers_to_korean(text)
+    return text
+
+
+def normalize_tts_batch(texts: Iterable[str], language_code: str = 'ko-KR', convert_numbers: bool = True) -> List[str]:
+    """문장 리스트 → 정규화된 문장 리스트 (순서 유지)"""
+    return [normalize_tts_text(text, language_code, convert_numbers) for text in texts]
+
+
+# ============================================================
+# 한글 숫자 → 아라비아 숫자 (자막)
+# ============================================================
+
+_SUB_NATIVE_TENS = {
+    '열': 10, '스물': 20, '서른': 30, '마흔': 40, '쉰': 50,
+    '예순': 60, '일흔': 70, '여든': 80, '아흔': 90
+}
+_SUB_NATIVE_ONES = {
+    '하나': 1, '둘': 2, '셋': 3, '넷': 4, '다섯': 5,
+    '여섯': 6, '일곱': 7, '여덟': 8, '아홉': 9,
+    '한': 1, '두': 2, '세': 3, '네': 4
+}
+_SUB_NATIVE_COUNTERS = {
+    '한': 1, '두': 2, '세': 3, '네': 4, '다섯': 5,
+    '여섯': 6, '일곱': 7, '여덟': 8, '아홉': 9, '열': 10
+}
+_SUB_SINO_DIGITS = {
+    '영': '0', '일': '1', '이': '2', '삼': '3', '사': '4',
+    '오': '5', '육': '6', '칠': '7', '팔': '8', '구': '9'
+}
+_SUB_SINO_TENS = {'이십': 20, '삼십': 30, '사십': 40, '오십': 50, '육십': 60, '칠십': 70, '팔십': 80, '구십': 90}
+_SUB_SINO_ONES = {'일': 1, '이': 2, '삼': 3, '사': 4, '오': 5, '육': 6, '칠': 7, '팔': 8, '구': 9}
+
+# 자막 역변환은 수사가 붙어 있을 때(사십사십삼십) 어느 쪽이 먼저 묶이는지가 결과를 바꾸므로
+# 단어 하나씩 기존 순서대로 치환한다 (정규식은 미리 컴파일, 복합어는 str.replace)
+_SUB_NATIVE_COMPOUNDS = [(ten + one, str(ten_value + one_value))
+                         for ten, ten_value in _SUB_NATIVE_TENS.items()
+                         for one, one_value in _SUB_NATIVE_ONES.items()]
+_SUB_NATIVE_TENS_RES = [(re.compile(ten + r'(?=\s|살|세|명|개|번|년|월|일|시|분|$)'), str(value))
+                        for ten, value in _SUB_NATIVE_TENS.items()]
+_SUB_NATIVE_COUNTER_RES = [(re.compile(word + r'(?=\s*(?:명|개|번|살|분|시간|달|해))'), str(value))
+                           for word, value in _SUB_NATIVE_COUNTERS.items()]
+_SUB_SINO_SEQUENCE_RE = re.compile('[영일이삼사오육칠팔구]{2,4}')
+_SUB_SINO_COMPOUNDS = [(ten + one, str(ten_value + one_value))
+                       for ten, ten_value in _SUB_SINO_TENS.items()
+                       for one, one_value in _SUB_SINO_ONES.items()]
+_SUB_SINO_TEENS = [('십' + one, str(10 + value)) for one, value in _SUB_SINO_ONES.items()]
+_SUB_TEN_RE = re.compile(r'(?<![이삼사오육칠팔구])십(?![일이삼사오육칠팔구])')
+_SUB_HUNDRED_PLUS_RE = re.compile(r'(\d+)백(\d+)')
+_SUB_HUNDREDS_RE = re.compile(r'(\d+)백(?!\d)')
+_SUB_HUNDRED_RE = re.compile(r'(?<!\d)백(?!\d)')
+_SUB_LARGE_UNIT_SPACE_RE = re.compile(r'(\d+)\s*(만|천|백)\s*(원|명|개)')
+_SUB_UNIT_SPACE_RE = re.compile(r'(\d+)\s+(년|월|일|살|세|명|개|번|시|분|초)')
+
+
+def korean_numbers_to_arabic(text: str) -> str:
+    """한글 숫자를 아라비아 숫자로 변환 (자막 표시용)
+
+    TTS용 대본은 한글 숫자로 작성되어 있으므로, 자막 표시 시 아라비아 숫자로 되돌린다.
+    일흔여섯 살 → 76살, 사십칠 년 → 47년
+    """
+    # 1. 고유어 숫자: 십단위+일단위 → 십단위만 → 일단위 + 단위
+    for word, digits in _SUB_NATIVE_COMPOUNDS:
+        if word in text:
+            text = text.replace(word, digits)
+    for pattern, digits in _SUB_NATIVE_TENS_RES:
+        text = pattern.sub(digits, text)
+    for pattern, digits in _SUB_NATIVE_COUNTER_RES:
+        text = pattern.sub(digits, text)
+
+    # 2. 연속 한자어 숫자 2~4자리 (전화번호 등: 일일구 → 119)
+    text = _SUB_SINO_SEQUENCE_RE.sub(lambda m: ''.join(_SUB_SINO_DIGITS[c] for c in m.group(0)), text)
+
+    # 3. 한자어 복합 숫자 (사십칠 → 47, 이십 → 20, 십오 → 15, 십 → 10)
+    for word, digits in _SUB_SINO_COMPOUNDS:
+        if word in text:
+            text = text.replace(word, digits)
+    for ten, value in _SUB_SINO_TENS.items():
+        text = text.replace(ten, str(value))
+    for word, digits in _SUB_SINO_TEENS:
+        if word in text:
+            text = text.replace(word, digits)
+    text = _SUB_TEN_RE.sub('10', text)
+
+    # 4. 큰 단위 (백)
+    text = _SUB_HUNDRED_PLUS_RE.sub(lambda m: str(int(m.group(1)) * 100 + int(m.group(2))), text)
+    text = _SUB_HUNDREDS_RE.sub(lambda m: str(int(m.group(1)) * 100), text)
+    text = _SUB_HUNDRED_RE.sub('100', text)
+
+    # 5. 공백 정리 ("50 만 원" → "50만원")
+    text = _SUB_LARGE_UNIT_SPACE_RE.sub(r'\1\2\3', text)
+    text = _SUB_UNIT_SPACE_RE.sub(r'\1\2', text)
+
+    return text
+
+
+def normalize_subtitle_batch(texts: Iterable[str]) -> List[str]:
+    """자막 문장 리스트 → 아라비아 숫자로 되돌린 리스트 (순서 유지)"""
+    return [korean_numbers_to_arabic(text) for text in texts]
+
+
+# ============================================================
+# 벤치마크
+# ============================================================
+
+_BENCH_SENTENCES = [
+    "2024년 3월 15일, CEO가 3.5% 인상을 발표했다.",
+    "그는 15번이나 시도했고 3개월 동안 1,234,567원을 모았다!",
+    "요한복음 3장 16절 말씀을 함께 읽겠습니다...",
+    "오후 3:30에 010-1234-5678로 연락 주세요.",
+    "경기는 3:2로 끝났고 관중은 7~8만 명이었다.",
+    "니콜라이 티보-브리뇰(Nikolay Thibeaux-Brignolle)은 AI와 GPU를 연구했다.",
+    "온도는 25℃, 가격은 $300, 두께는 0.75mm였다 ★",
+    "제1장에서 ①번 항목과 Ⅱ장을 비교한다.",
+]
+
+
+def benchmark(n_sentences: int = 5000) -> dict:
+    """n_sentences개 문장을 TTS 정규화 + 자막 역변환하는 시간 측정"""
+    import time
+
+    texts = [_BENCH_SENTENCES[i % len(_BENCH_SENTENCES)] + f" {i}개" for i in range(n_sentences)]
+
+    start = time.perf_counter()
+    tts_texts = normalize_tts_batch(texts)
+    tts_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    normalize_subtitle_batch(tts_texts)
+    subtitle_elapsed = time.perf_counter() - start
+
+    return {
+        'sentences': n_sentences,
+        'tts_sec': round(tts_elapsed, 3),
+        'tts_per_sentence_us': round(tts_elapsed / n_sentences * 1e6, 1),
+        'subtitle_sec': round(subtitle_elapsed, 3),
+        'subtitle_per_sentence_us': round(subtitle_elapsed / n_sentences * 1e6, 1),
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print(f"[TEXT-NORMALIZE] 예시: {normalize_tts_text(_BENCH_SENTENCES[0])}")
+    print(f"[TEXT-NORMALIZE] 벤치마크: {benchmark(count)}")
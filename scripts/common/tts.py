@@ -34,6 +34,10 @@ from typing import Dict, Any, Optional
 
 import requests
 
+from .audio_utils import mp3_duration_from_bytes
+from .tts_cache import get_tts_cache
+from .text_normalize import normalize_symbols, strip_english_name_parens
+
 
 # ============================================================
 # TTS 텍스트 전처리
@@ -52,14 +56,7 @@ def preprocess_tts_text(text: str) -> str:
     Returns:
         영문 인명 괄호가 제거된 텍스트
     """
-    # 영문 인명 패턴: (대문자로 시작하는 영문 이름)
-    pattern = r'\([A-Z][a-zA-Z\-\s\'\.]+\)'
-    result = re.sub(pattern, '', text)
-
-    # 연속 공백 정리
-    result = re.sub(r'  +', ' ', result)
-
-    return result
+    return strip_english_name_parens(text)
 
 
 def preprocess_tts_extended(text: str) -> str:
@@ -74,127 +71,10 @@ def preprocess_tts_extended(text: str) -> str:
     5. URL/이메일 → 제거
     6. 이모지 → 제거
     7. 특수 문장부호 → 정리
-    """
-    if not text:
-        return text
-
-    # 1. URL 제거
-    text = re.sub(r'https?://[^\s<>\"\']+', '', text)
-    text = re.sub(r'www\.[^\s<>\"\']+', '', text)
-
-    # 2. 이메일 제거
-    text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '', text)
-
-    # 3. 이모지 제거
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"
-        "\U0001F300-\U0001F5FF"
-        "\U0001F680-\U0001F6FF"
-        "\U0001F1E0-\U0001F1FF"
-        "\U0001F900-\U0001F9FF"
-        "\U0001FA00-\U0001FA6F"
-        "\U0001FA70-\U0001FAFF"
-        "\U0001F200-\U0001F251"
-        "]+",
-        flags=re.UNICODE
-    )
-    text = emoji_pattern.sub('', text)
-
-    # 4. 통화 기호 → 한글
-    currency_map = {
-        '$': '달러', '€': '유로', '¥': '엔',
-        '£': '파운드', '₩': '원', '₿': '비트코인',
-    }
-    for symbol, korean in currency_map.items():
-        text = re.sub(rf'\{symbol}(\d)', rf'\1{korean}', text)
-        text = re.sub(rf'(\d)\{symbol}', rf'\1{korean}', text)
-        text = text.replace(symbol, korean)
-
-    # 5. 온도 기호 → 한글
-    text = text.replace('℃', '도씨')
-    text = text.replace('℉', '화씨')
-    text = text.replace('°C', '도씨')
-    text = text.replace('°F', '화씨')
-    text = re.sub(r'(\d)°(?![CF])', r'\1도', text)
-
-    # 6. 특수 기호 → 한글/제거
-    symbol_map = {
-        '&': '앤드', '@': '앳', '#': '해시',
-        '※': '', '★': '', '☆': '', '●': '', '○': '',
-        '◆': '', '◇': '', '■': '', '□': '',
-        '▶': '', '◀': '', '→': '', '←': '', '↑': '', '↓': '',
-        '—': ' ', '–': ' ', '…': '...', '·': ' ',
-        '「': '', '」': '', '『': '', '』': '',
-        '〈': '', '〉': '', '《': '', '》': '',
-    }
-    for symbol, replacement in symbol_map.items():
-        text = text.replace(symbol, replacement)
-
-    # 7. 수학 기호 → 한글
-    math_map = {
-        '±': '플러스마이너스', '∞': '무한대', '√': '루트',
-        '≤': '이하', '≥': '이상', '≠': '같지않음',
-        '≈': '약', '∴': '따라서', '∵': '왜냐하면',
-    }
-    for symbol, korean in math_map.items():
-        text = text.replace(symbol, korean)
-
-    # 8. 영문 약어 → 발음
-    abbreviation_map = {
-        # 기관/조직
-        'CEO': '씨이오', 'CFO': '씨에프오', 'CTO': '씨티오',
-        'UN': '유엔', 'UNESCO': '유네스코', 'WHO': '더블유에이치오',
-        'NATO': '나토', 'OECD': '오이씨디', 'IMF': '아이엠에프',
-        'FBI': '에프비아이', 'CIA': '씨아이에이', 'NASA': '나사',
-        'EU': '이유', 'ASEAN': '아세안', 'OPEC': '오펙',
-        # 기술
-        'AI': '에이아이', 'IT': '아이티', 'PC': '피씨',
-        'USB': '유에스비', 'URL': '유알엘', 'API': '에이피아이',
-        'CPU': '씨피유', 'GPU': '지피유', 'RAM': '램', 'ROM': '롬',
-        'SSD': '에스에스디', 'LED': '엘이디', 'LCD': '엘씨디',
-        'VR': '브이알', 'AR': '에이알', 'IoT': '아이오티',
-        'GPS': '지피에스', 'WIFI': '와이파이', 'LTE': '엘티이',
-        '5G': '오지', '4G': '사지', '3G': '삼지',
-        'QR': '큐알', 'PDF': '피디에프', 'MP3': '엠피쓰리', 'MP4': '엠피포',
-        # 경제/금융
-        'GDP': '지디피', 'GNP': '지엔피', 'ETF': '이티에프',
-        'IPO': '아이피오', 'M&A': '엠앤에이', 'ESG': '이에스지',
-        # 의료
-        'CT': '씨티', 'MRI': '엠알아이', 'DNA': '디엔에이',
-        'RNA': '알엔에이', 'PCR': '피씨알', 'ICU': '아이씨유',
-        # 기타
-        'TV': '티비', 'SNS': '에스엔에스', 'PR': '피알',
-        'OK': '오케이', 'VS': '버서스', 'DIY': '디아이와이',
-        'VIP': '브이아이피', 'MVP': '엠브이피', 'OTT': '오티티',
-        'BTS': '비티에스', 'K-POP': '케이팝', 'KPOP': '케이팝',
-    }
-
-    for abbr, korean in abbreviation_map.items():
-        pattern = rf'(?<![가-힣a-zA-Z]){re.escape(abbr)}(?![가-힣a-zA-Z])'
-        text = re.sub(pattern, korean, text, flags=re.IGNORECASE)
-
-    # 사전에 없는 대문자 약어 → 개별 알파벳 발음
-    def spell_out_abbreviation(match):
-        abbr = match.group(0)
-        if abbr.upper() in abbreviation_map:
-            return abbr
-        letter_sounds = {
-            'A': '에이', 'B': '비', 'C': '씨', 'D': '디', 'E': '이',
-            'F': '에프', 'G': '지', 'H': '에이치', 'I': '아이', 'J': '제이',
-            'K': '케이', 'L': '엘', 'M': '엠', 'N': '엔', 'O': '오',
-            'P': '피', 'Q': '큐', 'R': '알', 'S': '에스', 'T': '티',
-            'U': '유', 'V': '브이', 'W': '더블유', 'X': '엑스', 'Y': '와이',
-            'Z': '제트'
-        }
-        return ''.join(letter_sounds.get(c.upper(), c) for c in abbr)
-
-    text = re.sub(r'(?<![가-힣a-zA-Z])[A-Z]{2,6}(?![가-힣a-zA-Z])', spell_out_abbreviation, text)
-
-    # 9. 연속 공백 정리
-    text = re.sub(r'\s+', ' ', text).strip()
 
-    return text
+    (정규식은 scripts.common.text_normalize에서 모듈 로드 시 한 번만 컴파일)
+    """
+    return normalize_symbols(text)
 
 
 # ============================================================
@@ -289,7 +169,7 @@ def generate_gemini_tts(
     model: str = "gemini-2.5-flash-preview-tts"
 ) -> Dict[str, Any]:
     """
-    Gemini TTS API를 사용하여 음성 생성
+    Gemini TTS API를 사용하여 음성 생성 (같은 텍스트/음성/모델은 TTS 캐시에서 재사용)
 
     Args:
         text: 변환할 텍스트
@@ -300,6 +180,23 @@ def generate_gemini_tts(
         dict: {"ok": True, "audio_data": bytes, "duration": float, "format": "wav"}
               또는 {"ok": False, "error": str}
     """
+    cache = get_tts_cache()
+    cache_key = cache.make_key("gemini", text, voice_name, model=model)
+    cached = cache.get(cache_key)
+    if cached:
+        audio_data, meta = cached
+        print(f"[GEMINI-TTS] 캐시 사용 - 크기: {len(audio_data)}bytes, 길이: {meta.get('duration', 0):.1f}초")
+        return {"ok": True, "audio_data": audio_data, "duration": meta.get("duration", 0.0),
+                "format": meta.get("format", "wav"), "cached": True}
+
+    result = _generate_gemini_tts_uncached(text, voice_name, model)
+    if result.get("ok"):
+        cache.put(cache_key, result["audio_data"], result.get("duration"), result.get("format", "wav"))
+    return result
+
+
+def _generate_gemini_tts_uncached(text: str, voice_name: str, model: str) -> Dict[str, Any]:
+    """Gemini TTS API 호출 (캐시 미사용)"""
     # 텍스트 전처리
     text = preprocess_tts_text(text)
     text = preprocess_tts_extended(text)
@@ -454,6 +351,7 @@ def generate_chirp3_tts(
     Google Cloud TTS Chirp 3 HD를 사용하여 음성 생성
 
     긴 텍스트는 자동으로 청크로 분할하여 처리 (5,000바이트 제한)
+    같은 텍스트/음성/언어는 TTS 캐시에서 재사용
 
     Args:
         text: 변환할 텍스트
@@ -463,6 +361,24 @@ def generate_chirp3_tts(
     Returns:
         dict: {"ok": True, "audio_data": bytes} 또는 {"ok": False, "error": str}
     """
+    cache = get_tts_cache()
+    cache_key = cache.make_key("chirp3", text, voice_name, language=language_code)
+    cached = cache.get(cache_key)
+    if cached:
+        audio_data, meta = cached
+        print(f"[CHIRP3-TTS] 캐시 사용 - {len(audio_data)} bytes", flush=True)
+        return {"ok": True, "audio_data": audio_data, "duration": meta.get("duration", 0.0), "cached": True}
+
+    result = _generate_chirp3_tts_uncached(text, voice_name, language_code)
+    # 연결 실패로 첫 청크만 반환된 결과는 캐시하지 않음
+    if result.get("ok") and not result.get("partial"):
+        audio_data = result["audio_data"]
+        cache.put(cache_key, audio_data, mp3_duration_from_bytes(audio_data), "mp3")
+    return result
+
+
+def _generate_chirp3_tts_uncached(text: str, voice_name: str, language_code: str) -> Dict[str, Any]:
+    """Chirp3 HD 합성 (캐시 미사용)"""
     # 텍스트 전처리
     text = preprocess_tts_text(text)
     text = preprocess_tts_extended(text)
@@ -652,7 +568,7 @@ def generate_chirp3_tts(
                     return {"ok": True, "audio_data": final_audio}
                 else:
                     print(f"[CHIRP3-TTS] FFmpeg 실패 - 첫 청크만 반환", flush=True)
-                    return {"ok": True, "audio_data": all_audio[0]}
+                    return {"ok": True, "audio_data": all_audio[0], "partial": True}
             finally:
                 shutil.rmtree(temp_dir, ignore_errors=True)
 
@@ -0,0 +1,255 @@
+"""
+TTS 오디오 캐시 (content-addressed)
+
+같은 문장을 같은 음성/속도/엔진으로 합성하면 결과가 같으므로, 인코딩된 오디오와
+측정된 길이를 디스크에 보관해 두고 재시도·재렌더 시 API 호출 없이 재사용한다.
+(리뷰 에피소드의 성경 구절, 고정 인트로/아웃트로, 업로드 단계에서 실패한 에피소드 등)
+
+- 키: sha256(engine, text, voice, rate, 기타 합성 파라미터)
+- 저장: {TTS_CACHE_DIR}/{key[:2]}/{key}.bin + {key}.json (길이, 포맷 메타)
+- 제거: 총 용량이 TTS_CACHE_MAX_MB를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+- TTS_CACHE=0 이면 비활성화 (조회는 항상 miss, 저장은 무시)
+
+사용법:
+    from scripts.common.tts_cache import get_tts_cache
+
+    cache = get_tts_cache()
+    key = cache.make_key("chirp3", text, voice_name, 1.0, language=language_code)
+    hit = cache.get(key)   # (audio_bytes, meta) 또는 None
+    ...
+    cache.put(key, audio_bytes, duration, "mp3")
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+TTS_CACHE_ENABLED = os.environ.get('TTS_CACHE', '1') == '1'
+TTS_CACHE_DIR = os.environ.get('TTS_CACHE_DIR', 'data/tts_cache')
+TTS_CACHE_MAX_MB = int(os.environ.get('TTS_CACHE_MAX_MB', '1024'))
+
+# 캐시 포맷이 바뀌면 올려서 기존 항목을 무효화
+_CACHE_VERSION = 1
+
+
+class TTSAudioCache:
+    """크기 제한이 있는 디스크 기반 TTS 오디오 캐시 (프로세스 내 스레드 안전)
+
+    항목 수가 많고 크기가 작으므로 총 용량/항목 수는 처음 한 번만 디렉토리를 훑어 계산하고
+    이후에는 메모리에서 증감한다. 디렉토리 전체 스캔은 용량 초과 시에만 한다 (LRU 순서 결정).
+    """
+
+    def __init__(self, cache_dir: str = TTS_CACHE_DIR, max_bytes: int = TTS_CACHE_MAX_MB * 1024 * 1024,
+                 enabled: bool = TTS_CACHE_ENABLED):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._total_bytes = None
+        self._entry_count = 0
+        self.hits = 0
+        self.misses = 0
+
+    # ----- 키 / 경로 -----
+    def make_key(self, engine: str, text: str, voice: str, rate: Optional[float] = None, **params) -> str:
+        """합성 입력으로 캐시 키 생성 (params: language, model, pitch 등 결과에 영향을 주는 값)"""
+        payload = json.dumps({
+            'v': _CACHE_VERSION,
+            'engine': engine,
+            'text': text,
+            'voice': voice or '',
+            'rate': round(float(rate), 4) if rate is not None else None,
+            'params': params,
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + '.bin', base + '.json'
+
+    def _read_meta(self, key: str) -> Optional[Dict[str, Any]]:
+        audio_path, meta_path = self._paths(key)
+        if not (os.path.exists(audio_path) and os.path.exists(meta_path)):
+            return None
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        # LRU: 마지막 사용 시각 갱신
+        now = time.time()
+        os.utime(audio_path, (now, now))
+        return meta
+
+    # ----- 조회 -----
+    def get(self, key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """캐시 히트 시 (audio_bytes, meta) 반환 - meta: {'duration', 'format', ...}"""
+        if not self.enabled:
+            return None
+        audio_path, _ = self._paths(key)
+        with self._lock:
+            try:
+                meta = self._read_meta(key)
+                if meta is None:
+                    self.misses += 1
+                    return None
+                with open(audio_path, 'rb') as f:
+                    data = f.read()
+            except Exception as e:
+                print(f"[TTS-CACHE] 조회 실패 ({key[:12]}): {e}")
+                self.misses += 1
+                return None
+            self.hits += 1
+        return data, meta
+
+    def fetch(self, key: str, dest_path: str) -> Optional[Dict[str, Any]]:
+        """캐시 히트 시 dest_path에 오디오를 복사하고 meta 반환
+
+        청크 파일 경로는 에피소드별로 고정이라 나중에 같은 경로에 다시 쓰일 수 있으므로,
+        하드링크 대신 복사해서 캐시 항목이 덮어써지지 않게 한다.
+        """
+        if not self.enabled:
+            return None
+        audio_path, _ = self._paths(key)
+        with self._lock:
+            try:
+                meta = self._read_meta(key)
+                if meta is None:
+                    self.misses += 1
+                    return None
+                dest_dir = os.path.dirname(dest_path)
+                if dest_dir:
+                    os.makedirs(dest_dir, exist_ok=True)
+                shutil.copyfile(audio_path, dest_path)
+            except Exception as e:
+                print(f"[TTS-CACHE] 조회 실패 ({key[:12]}): {e}")
+                self.misses += 1
+                return None
+            self.hits += 1
+        return meta
+
+    # ----- 저장 -----
+    def put(self, key: str, data: bytes, duration: Optional[float], fmt: str = 'mp3') -> bool:
+        """합성된 오디오 바이트를 캐시에 등록"""
+        if not self.enabled or not data:
+            return False
+        audio_path, meta_path = self._paths(key)
+        try:
+            os.makedirs(os.path.dirname(audio_path), exist_ok=True)
+            existed = os.path.exists(audio_path)
+            old_size = os.path.getsize(audio_path) if existed else 0
+            # 임시 파일에 쓰고 rename → 다른 스레드/프로세스가 반쯤 쓴 파일을 보지 않도록
+            suffix = f"{os.getpid()}.{threading.get_ident()}.tmp"
+            tmp_audio = f"{audio_path}.{suffix}"
+            with open(tmp_audio, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_audio, audio_path)
+            tmp_meta = f"{meta_path}.{suffix}"
+            with open(tmp_meta, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'duration': float(duration) if duration else 0.0,
+                    'format': fmt,
+                    'size': len(data),
+                    'created_at': time.time(),
+                }, f)
+            os.replace(tmp_meta, meta_path)
+        except Exception as e:
+            print(f"[TTS-CACHE] 저장 실패 ({key[:12]}): {e}")
+            return False
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += len(data) - old_size
+                if not existed:
+                    self._entry_count += 1
+        self.evict()
+        return True
+
+    def put_file(self, key: str, path: str, duration: Optional[float], fmt: str = 'mp3') -> bool:
+        """디스크에 쓰인 오디오 파일을 캐시에 등록 (원본 파일은 그대로 둠)"""
+        if not self.enabled:
+            return False
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            print(f"[TTS-CACHE] 저장 실패 ({key[:12]}): {e}")
+            return False
+        return self.put(key, data, duration, fmt)
+
+    # ----- 제거 -----
+    def _ensure_totals(self):
+        """처음 한 번 디렉토리를 훑어 총 용량/항목 수 계산 (self._lock 보유 상태에서 호출)"""
+        if self._total_bytes is None:
+            entries = self._entries()
+            self._total_bytes = sum(e[1] for e in entries)
+            self._entry_count = len(entries)
+
+    def _entries(self):
+        """(mtime, size, audio_path, meta_path) 목록"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.bin'):
+                    continue
+                audio_path = os.path.join(root, name)
+                try:
+                    st = os.stat(audio_path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, audio_path, audio_path[:-4] + '.json'))
+        return entries
+
+    def evict(self) -> int:
+        """용량 초과 시 LRU 순으로 삭제, 삭제 개수 반환"""
+        with self._lock:
+            self._ensure_totals()
+            if self._total_bytes <= self.max_bytes:
+                return 0
+            entries = self._entries()
+            total = sum(e[1] for e in entries)
+            removed = 0
+            for _mtime, size, audio_path, meta_path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                for path in (audio_path, meta_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                total -= size
+                removed += 1
+            self._total_bytes = total
+            self._entry_count = len(entries) - removed
+        if removed:
+            print(f"[TTS-CACHE] LRU 제거: {removed}개 (현재 {total / (1024 * 1024):.1f}MB)")
+        return removed
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._ensure_totals()
+            entries = self._entry_count
+            total = self._total_bytes
+        return {
+            'enabled': self.enabled,
+            'entries': entries,
+            'size_mb': round(total / (1024 * 1024), 2),
+            'max_mb': round(self.max_bytes / (1024 * 1024), 2),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+_tts_cache = None
+_tts_cache_lock = threading.Lock()
+
+
+def get_tts_cache() -> TTSAudioCache:
+    """프로세스 공용 캐시 인스턴스"""
+    global _tts_cache
+    with _tts_cache_lock:
+        if _tts_cache is None:
+            _tts_cache = TTSAudioCache()
+        return _tts_cache
@@ -0,0 +1,298 @@
+"""
+YouTube 재개 가능(resumable) 업로드 관리자
+
+기존 업로드는 MediaFileUpload(resumable=True, chunksize=1MB)로 next_chunk()를 돌리지만
+세션 URI를 어디에도 저장하지 않아서, 서버 재시작/타임아웃이 나면 절반 올라간 500MB 영상을
+처음부터 다시 올렸다. 대신:
+
+- 작업(채널/프로젝트/파일/메타데이터)별로 세션 URI와 업로드된 바이트 위치를
+  {YOUTUBE_UPLOAD_STATE_DIR}/{key}.json 에 청크마다 저장
+- 같은 작업을 다시 올리면 서버에 현재 위치를 조회해서 그 지점부터 이어 올림
+  (세션 만료/파일 변경 시에는 새 세션)
+- 청크 크기는 측정한 전송 속도에 맞춰 조절 (청크 하나가 약 YOUTUBE_UPLOAD_CHUNK_SECONDS초)
+- 일시적 오류(5xx, 연결 끊김)는 청크를 줄이고 백오프 후 같은 세션으로 재시도
+
+사용법:
+    from scripts.common.youtube_upload import upload_video_resumable
+
+    youtube = build('youtube', 'v3', credentials=creds)
+    response = upload_video_resumable(youtube, body, "uploads/video.mp4", scope=f"{channel_id}|{project_suffix}")
+    video_id = response['id']
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+YOUTUBE_UPLOAD_STATE_DIR = os.environ.get('YOUTUBE_UPLOAD_STATE_DIR', 'data/upload_sessions')
+# 첫 청크 크기 (이후 전송 속도에 맞춰 조절)
+YOUTUBE_UPLOAD_CHUNK_MB = int(os.environ.get('YOUTUBE_UPLOAD_CHUNK_MB', '8'))
+# MediaFileUpload는 청크를 통째로 메모리에 읽으므로 렌더링과 같은 2GB 인스턴스에서 감당할 크기로 제한
+YOUTUBE_UPLOAD_MAX_CHUNK_MB = int(os.environ.get('YOUTUBE_UPLOAD_MAX_CHUNK_MB', '64'))
+# 청크 하나에 걸리는 목표 시간 (초)
+YOUTUBE_UPLOAD_CHUNK_SECONDS = float(os.environ.get('YOUTUBE_UPLOAD_CHUNK_SECONDS', '20'))
+# 연속 실패 허용 횟수 (넘으면 세션을 남겨둔 채 예외 → 다음 호출에서 이어 올림)
+YOUTUBE_UPLOAD_RETRIES = int(os.environ.get('YOUTUBE_UPLOAD_RETRIES', '5'))
+
+# resumable 업로드 청크는 256KB 배수여야 함
+_CHUNK_ALIGN = 256 * 1024
+_MIN_CHUNK = 4 * _CHUNK_ALIGN  # 1MB
+
+# YouTube 세션 URI는 약 1주일 유효 → 여유를 두고 6일 지나면 새 세션
+_SESSION_TTL = 6 * 24 * 3600
+
+_RETRYABLE_STATUS = (500, 502, 503, 504)
+
+_key_locks: Dict[str, threading.Lock] = {}
+_key_locks_guard = threading.Lock()
+
+
+def _align_chunk(size: float) -> int:
+    max_chunk = max(YOUTUBE_UPLOAD_MAX_CHUNK_MB * 1024 * 1024, _MIN_CHUNK)
+    size = int(min(max(size, _MIN_CHUNK), max_chunk))
+    return size - size % _CHUNK_ALIGN
+
+
+_media_class = None
+
+
+def _adaptive_media_class():
+    """청크 크기를 업로드 중에 바꿀 수 있는 MediaFileUpload (googleapiclient는 지연 임포트)"""
+    global _media_class
+    if _media_class is None:
+        from googleapiclient.http import MediaFileUpload
+
+        class AdaptiveMediaFileUpload(MediaFileUpload):
+            """next_chunk()가 매번 chunksize()를 읽으므로 값만 바꾸면 다음 청크부터 적용"""
+
+            def __init__(self, filename, mimetype, chunksize):
+                super().__init__(filename, mimetype=mimetype, chunksize=_align_chunk(chunksize), resumable=True)
+                self.current_chunksize = _align_chunk(chunksize)
+
+            def chunksize(self):
+                return self.current_chunksize
+
+            def adapt(self, sent_bytes: int, elapsed: float) -> None:
+                """직전 청크의 전송 속도로 다음 청크 크기 결정 (한 번에 최대 2배/절반)"""
+                if sent_bytes <= 0 or elapsed <= 0:
+                    return
+                target = sent_bytes / elapsed * YOUTUBE_UPLOAD_CHUNK_SECONDS
+                target = min(max(target, self.current_chunksize / 2), self.current_chunksize * 2)
+                self.current_chunksize = _align_chunk(target)
+
+            def shrink(self) -> None:
+                self.current_chunksize = _align_chunk(self.current_chunksize / 2)
+
+        _media_class = AdaptiveMediaFileUpload
+    return _media_class
+
+
+# ============================================================
+# 세션 상태 파일
+# ============================================================
+
+def upload_job_key(video_path: str, body: Dict[str, Any], scope: str = '') -> str:
+    """업로드 작업 키 - 같은 채널/프로젝트(scope), 같은 파일, 같은 메타데이터면 같은 키"""
+    st = os.stat(video_path)
+    raw = json.dumps({
+        'scope': scope,
+        'path': os.path.abspath(video_path),
+        'size': st.st_size,
+        'mtime': st.st_mtime_ns,
+        'body': body,
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]
+
+
+def _state_path(key: str) -> str:
+    return os.path.join(YOUTUBE_UPLOAD_STATE_DIR, f"{key}.json")
+
+
+def _load_state(key: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(_state_path(key), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[YOUTUBE-UPLOAD] 세션 상태 읽기 실패, 새로 업로드: {e}")
+        return None
+
+
+def _save_state(key: str, state: Dict[str, Any]) -> None:
+    try:
+        os.makedirs(YOUTUBE_UPLOAD_STATE_DIR, exist_ok=True)
+        path = _state_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[YOUTUBE-UPLOAD] 세션 상태 저장 실패: {e}")
+
+
+def _clear_state(key: str) -> None:
+    try:
+        os.remove(_state_path(key))
+    except OSError:
+        pass
+
+
+def _prune_stale_states() -> None:
+    """만료된 세션 상태 파일 정리 (완료/포기된 작업의 흔적)"""
+    try:
+        names = os.listdir(YOUTUBE_UPLOAD_STATE_DIR)
+    except OSError:
+        return
+    cutoff = time.time() - _SESSION_TTL
+    for name in names:
+        path = os.path.join(YOUTUBE_UPLOAD_STATE_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+def _key_lock(key: str) -> threading.Lock:
+    with _key_locks_guard:
+        lock = _key_locks.get(key)
+        if lock is None:
+            lock = _key_locks[key] = threading.Lock()
+        return lock
+
+
+def _query_session(http, session_uri: str, size: int) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+    """저장된 세션의 현재 상태 조회 (빈 PUT + Content-Range: bytes */size)
+
+    Returns:
+        (이어 올릴 바이트 위치, None) - 진행 중
+        (None, 응답 dict) - 이미 업로드 완료
+        (None, None) - 세션 만료/무효 → 새로 시작
+    """
+    resp, content = http.request(
+        session_uri, 'PUT',
+        headers={'Content-Range': f'bytes */{size}', 'Content-Length': '0'}
+    )
+    if resp.status in (200, 201):
+        if isinstance(content, bytes):
+            content = content.decode('utf-8')
+        return None, json.loads(content)
+    if resp.status == 308:
+        range_header = resp.get('range')
+        return (int(range_header.split('-')[1]) + 1 if range_header else 0), None
+    return None, None
+
+
+def _is_retryable(error: Exception) -> bool:
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    if status is not None:
+        return int(status) in _RETRYABLE_STATUS
+    # 응답 없이 끊긴 경우 (소켓/SSL/타임아웃)
+    return isinstance(error, OSError) or 'timed out' in str(error).lower()
+
+
+# ============================================================
+# 업로드
+# ============================================================
+
+def upload_video_resumable(
+    youtube,
+    body: Dict[str, Any],
+    video_path: str,
+    scope: str = '',
+    part: str = 'snippet,status',
+    mimetype: str = 'video/mp4',
+    log_prefix: str = '[YOUTUBE-UPLOAD]',
+) -> Dict[str, Any]:
+    """videos.insert 재개 가능 업로드
+
+    Args:
+        youtube: googleapiclient YouTube 클라이언트
+        body: videos.insert 요청 본문 (snippet/status)
+        video_path: 영상 파일 경로
+        scope: 세션을 구분할 값 (채널 ID + OAuth 프로젝트 - 세션은 발급한 자격 증명에 묶임)
+
+    Returns:
+        videos.insert 응답 (video 리소스)
+
+    Raises:
+        할당량 초과 등 재시도할 수 없는 오류, 또는 재시도를 모두 소진한 오류.
+        세션 상태는 남겨두므로 같은 작업을 다시 호출하면 이어서 올린다.
+    """
+    size = os.path.getsize(video_path)
+    key = upload_job_key(video_path, body, scope)
+
+    with _key_lock(key):
+        _prune_stale_states()
+
+        media = _adaptive_media_class()(video_path, mimetype, YOUTUBE_UPLOAD_CHUNK_MB * 1024 * 1024)
+        request = youtube.videos().insert(part=part, body=body, media_body=media)
+
+        state = _load_state(key)
+        if state and time.time() - state.get('created_at', 0) < _SESSION_TTL:
+            try:
+                offset, completed = _query_session(request.http, state['uri'], size)
+            except Exception as e:
+                print(f"{log_prefix} 저장된 세션 조회 실패, 새로 업로드: {e}")
+                offset, completed = None, None
+            if completed is not None:
+                print(f"{log_prefix} 이전 세션에서 이미 업로드 완료됨: {completed.get('id')}")
+                _clear_state(key)
+                return completed
+            if offset is not None:
+                request.resumable_uri = state['uri']
+                request.resumable_progress = offset
+                media.current_chunksize = _align_chunk(state.get('chunksize', media.current_chunksize))
+                print(f"{log_prefix} 이전 세션 이어 올리기: {offset / 1024 / 1024:.1f}MB / {size / 1024 / 1024:.1f}MB")
+            else:
+                print(f"{log_prefix} 저장된 세션 만료, 새로 업로드")
+                state = None
+        else:
+            state = None
+
+        created_at = state['created_at'] if state else time.time()
+        response = None
+        failures = 0
+        last_percent = -1
+
+        while response is None:
+            before = request.resumable_progress
+            started = time.monotonic()
+            try:
+                status, response = request.next_chunk()
+            except Exception as e:
+                if not _is_retryable(e) or failures >= YOUTUBE_UPLOAD_RETRIES:
+                    raise
+                failures += 1
+                media.shrink()
+                wait = min(2 ** failures, 60)
+                print(f"{log_prefix} 청크 전송 오류 ({failures}/{YOUTUBE_UPLOAD_RETRIES}), "
+                      f"{wait}초 후 재시도 (청크 {media.current_chunksize // (1024 * 1024)}MB): {e}")
+                time.sleep(wait)
+                continue
+
+            failures = 0
+            if response is not None:
+                break
+
+            media.adapt(request.resumable_progress - before, time.monotonic() - started)
+            _save_state(key, {
+                'uri': request.resumable_uri,
+                'offset': request.resumable_progress,
+                'size': size,
+                'chunksize': media.current_chunksize,
+                'created_at': created_at,
+            })
+
+            if status:
+                percent = int(status.progress() * 100)
+                if percent != last_percent:
+                    last_percent = percent
+                    print(f"{log_prefix} 진행률: {percent}% (다음 청크 {media.current_chunksize // (1024 * 1024)}MB)")
+
+        _clear_state(key)
+        return response
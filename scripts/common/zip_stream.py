@@ -0,0 +1,94 @@
+"""
+스트리밍 ZIP 작성 유틸
+
+io.BytesIO에 ZIP 전체를 만들면 이미지/오디오/영상이 모두 메모리에 올라가
+긴 대본(수백 MB)에서 2GB 인스턴스가 OOM으로 죽는다. 대신:
+
+- 디스크에 저장할 ZIP은 {path}.tmp 에 바로 쓰고 완료 후 rename (atomic_zip)
+- 응답으로 보낼 ZIP은 SpooledTemporaryFile에 쓰고 (작으면 메모리, 크면 디스크) send_file
+- 엔트리는 파일 경로/URL 스트림에서 청크 단위로 복사 (전체를 bytes로 읽지 않음)
+- 이미 압축된 포맷(mp3, png, jpg, mp4 ...)은 ZIP_STORED로 저장 (재압축 CPU 낭비 방지)
+
+사용법:
+    from scripts.common.zip_stream import atomic_zip, new_zip_spool, zip_write_file, zip_write_url
+
+    with atomic_zip("uploads/assets.zip") as zf:
+        zip_write_file(zf, "uploads/scene_01.mp3", "audio/01_scene.mp3")
+        zip_write_url(zf, "https://.../01.png", "images/01_scene.png")
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import urllib.request
+import zipfile
+from contextlib import contextmanager
+from typing import Iterator
+
+# 응답용 ZIP이 이 크기를 넘으면 메모리 대신 임시 파일로 넘어감
+ZIP_SPOOL_MAX_MB = int(os.environ.get('ZIP_SPOOL_MAX_MB', '16'))
+
+# 이미 압축된 포맷 → 재압축하지 않음
+_STORED_EXTENSIONS = ('.mp3', '.mp4', '.m4a', '.aac', '.png', '.jpg', '.jpeg', '.webp', '.gif', '.zip')
+
+_COPY_CHUNK = 1024 * 1024
+
+
+def compress_type_for(arcname: str) -> int:
+    """엔트리 이름으로 압축 방식 결정"""
+    return zipfile.ZIP_STORED if arcname.lower().endswith(_STORED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+
+
+def _zip_info(arcname: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(arcname, date_time=time.localtime()[:6])
+    info.compress_type = compress_type_for(arcname)
+    return info
+
+
+def zip_write_file(zf: zipfile.ZipFile, path: str, arcname: str) -> None:
+    """디스크 파일을 ZIP 엔트리로 추가 (zipfile이 청크 단위로 복사)"""
+    zf.write(path, arcname, compress_type=compress_type_for(arcname))
+
+
+def zip_write_bytes(zf: zipfile.ZipFile, arcname: str, data) -> None:
+    """메모리 데이터를 ZIP 엔트리로 추가 (str이면 UTF-8)"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    zf.writestr(arcname, data, compress_type=compress_type_for(arcname))
+
+
+def zip_write_url(zf: zipfile.ZipFile, url: str, arcname: str, timeout: int = 30) -> None:
+    """HTTP 응답 본문을 ZIP 엔트리로 스트리밍 (응답 전체를 메모리에 올리지 않음)"""
+    req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        with zf.open(_zip_info(arcname), 'w') as entry:
+            shutil.copyfileobj(response, entry, _COPY_CHUNK)
+
+
+@contextmanager
+def atomic_zip(path: str, compression: int = zipfile.ZIP_DEFLATED) -> Iterator[zipfile.ZipFile]:
+    """path에 ZIP을 스트리밍으로 작성
+
+    {path}.tmp 에 쓰고 정상 종료 시 rename하므로, 작성 중이거나 실패한 ZIP이
+    다운로드 경로에 노출되지 않는다.
+    """
+    dir_name = os.path.dirname(path)
+    if dir_name:
+        os.makedirs(dir_name, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with zipfile.ZipFile(tmp_path, 'w', compression) as zf:
+            yield zf
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def new_zip_spool() -> tempfile.SpooledTemporaryFile:
+    """응답용 ZIP 버퍼 (ZIP_SPOOL_MAX_MB까지 메모리, 넘으면 임시 파일)
+
+    send_file()에 그대로 넘기면 응답 종료 시 닫히면서 임시 파일도 삭제된다.
+    """
+    return tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_MB * 1024 * 1024, suffix='.zip')
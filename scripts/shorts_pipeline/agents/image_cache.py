@@ -6,20 +6,69 @@ ImageCache - 이미지 프롬프트 캐시 시스템
 - 이슈 타입별 템플릿 관리
 - 유사 프롬프트 매칭
 - 실패 프롬프트 블랙리스트
+
+저장소: SQLite (image_cache.db, WAL 모드)
+- 캐시 키 / 블랙리스트 해시는 PRIMARY KEY 조회 (JSON 전체 로드·재작성 없음)
+- 여러 파이프라인 프로세스가 동시에 읽고 써도 안전 (스레드별 연결 + busy_timeout)
+- 히트/미스 카운터와 last_used 갱신은 메모리에 모았다가 일정 횟수마다 한 번에 반영
+- 캐시 이미지는 images/ 아래에 복사해서 보관, TTL(IMAGE_CACHE_TTL_DAYS)과
+  LRU 상한(IMAGE_CACHE_MAX_ENTRIES)을 넘은 항목은 이미지 파일과 함께 삭제
+- 기존 prompt_cache.json / blacklist.json은 최초 1회 DB로 가져온 뒤 *.migrated로 이름 변경
 """
 
 import os
 import json
+import time
+import shutil
+import atexit
+import sqlite3
 import hashlib
+import threading
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
 # 캐시 파일 경로
 CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "image_cache")
+CACHE_DB_FILE = os.path.join(CACHE_DIR, "image_cache.db")
+CACHE_IMAGE_DIR = os.path.join(CACHE_DIR, "images")
+
+# 이전 JSON 저장소 (최초 1회 DB로 이전)
 PROMPT_CACHE_FILE = os.path.join(CACHE_DIR, "prompt_cache.json")
 BLACKLIST_FILE = os.path.join(CACHE_DIR, "blacklist.json")
 
+# 마지막 사용 후 이 기간이 지난 캐시 항목은 삭제
+IMAGE_CACHE_TTL_DAYS = int(os.environ.get('IMAGE_CACHE_TTL_DAYS', '30'))
+# 캐시 항목 상한 (넘으면 오래 안 쓴 것부터 삭제)
+IMAGE_CACHE_MAX_ENTRIES = int(os.environ.get('IMAGE_CACHE_MAX_ENTRIES', '200'))
+
+# 히트/미스 카운터를 DB에 반영하는 주기 (조회 횟수)
+_STATS_FLUSH_EVERY = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS prompts (
+    cache_key TEXT PRIMARY KEY,
+    issue_type TEXT NOT NULL,
+    scene_number INTEGER NOT NULL,
+    prompt TEXT NOT NULL,
+    image_path TEXT,
+    success_count INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_prompts_last_used ON prompts(last_used);
+CREATE TABLE IF NOT EXISTS blacklist (
+    hash TEXT PRIMARY KEY,
+    prompt_preview TEXT,
+    reason TEXT,
+    added_at TEXT
+);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL DEFAULT 0
+);
+"""
+
 
 # 이슈 타입별 기본 배경 템플릿
 BACKGROUND_TEMPLATES = {
@@ -69,46 +118,119 @@ BACKGROUND_TEMPLATES = {
 
 
 class ImageCache:
-    """이미지 프롬프트 캐시 관리자"""
+    """이미지 프롬프트 캐시 관리자 (SQLite)"""
+
+    def __init__(self, db_path: str = CACHE_DB_FILE):
+        self.db_path = db_path
+        self.image_dir = os.path.join(os.path.dirname(db_path), "images")
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # DB 반영 대기 중인 카운터 / last_used
+        self._pending_stats = {"hits": 0, "misses": 0}
+        self._pending_touch: Dict[str, float] = {}
+        # 이 프로세스에서의 히트/미스 (슈퍼바이저 보고용)
+        self._session_stats = {"hits": 0, "misses": 0}
 
-    def __init__(self):
         self._ensure_cache_dir()
-        self.prompt_cache = self._load_cache()
-        self.blacklist = self._load_blacklist()
+        self._conn().executescript(_SCHEMA)
+        self._migrate_json()
+        self.evict()
+        atexit.register(self.flush_stats)
 
     def _ensure_cache_dir(self):
         """캐시 디렉토리 생성"""
-        os.makedirs(CACHE_DIR, exist_ok=True)
-
-    def _load_cache(self) -> Dict[str, Any]:
-        """캐시 로드"""
+        os.makedirs(self.image_dir, exist_ok=True)
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 (fork 이후에는 새로 연결)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _migrate_json(self):
+        """기존 JSON 캐시/블랙리스트를 DB로 가져오기 (최초 1회)"""
+        conn = self._conn()
         if os.path.exists(PROMPT_CACHE_FILE):
             try:
                 with open(PROMPT_CACHE_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
-        return {"prompts": {}, "stats": {"hits": 0, "misses": 0}}
-
-    def _save_cache(self):
-        """캐시 저장"""
-        with open(PROMPT_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.prompt_cache, f, ensure_ascii=False, indent=2)
-
-    def _load_blacklist(self) -> List[str]:
-        """블랙리스트 로드"""
+                    data = json.load(f)
+                now = time.time()
+                for cache_key, item in data.get("prompts", {}).items():
+                    issue_type, _, scene = cache_key.rpartition("_scene")
+                    try:
+                        last_used = datetime.fromisoformat(item.get("last_used", "")).timestamp()
+                    except ValueError:
+                        last_used = now
+                    conn.execute(
+                        "INSERT OR IGNORE INTO prompts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (cache_key, issue_type, int(scene) if scene.isdigit() else 0, item.get("prompt", ""),
+                         item.get("image_path"), item.get("success_count", 1), last_used, last_used)
+                    )
+                stats = data.get("stats", {})
+                self._add_stats(conn, stats.get("hits", 0), stats.get("misses", 0))
+                os.replace(PROMPT_CACHE_FILE, PROMPT_CACHE_FILE + ".migrated")
+                print(f"[IMAGE-CACHE] JSON 캐시 이전 완료: {len(data.get('prompts', {}))}개 프롬프트")
+            except Exception as e:
+                print(f"[IMAGE-CACHE] JSON 캐시 이전 실패 (무시): {e}")
+
         if os.path.exists(BLACKLIST_FILE):
             try:
                 with open(BLACKLIST_FILE, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
-        return []
-
-    def _save_blacklist(self):
-        """블랙리스트 저장"""
-        with open(BLACKLIST_FILE, 'w', encoding='utf-8') as f:
-            json.dump(self.blacklist, f, ensure_ascii=False, indent=2)
+                    items = json.load(f)
+                for item in items:
+                    if isinstance(item, dict) and item.get("hash"):
+                        conn.execute(
+                            "INSERT OR IGNORE INTO blacklist VALUES (?, ?, ?, ?)",
+                            (item["hash"], item.get("prompt_preview"), item.get("reason"), item.get("added_at"))
+                        )
+                os.replace(BLACKLIST_FILE, BLACKLIST_FILE + ".migrated")
+            except Exception as e:
+                print(f"[IMAGE-CACHE] 블랙리스트 이전 실패 (무시): {e}")
+
+    @staticmethod
+    def _add_stats(conn: sqlite3.Connection, hits: int, misses: int):
+        conn.executemany(
+            "INSERT INTO stats (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            [("hits", hits), ("misses", misses)]
+        )
+
+    def _record(self, hit: bool, cache_key: Optional[str] = None):
+        """히트/미스 기록 (DB 반영은 _STATS_FLUSH_EVERY회마다)"""
+        name = "hits" if hit else "misses"
+        with self._lock:
+            self._pending_stats[name] += 1
+            self._session_stats[name] += 1
+            if cache_key:
+                self._pending_touch[cache_key] = time.time()
+            pending = self._pending_stats["hits"] + self._pending_stats["misses"]
+        if pending >= _STATS_FLUSH_EVERY:
+            self.flush_stats()
+
+    def flush_stats(self):
+        """모아둔 카운터 / last_used를 DB에 반영"""
+        with self._lock:
+            stats, self._pending_stats = self._pending_stats, {"hits": 0, "misses": 0}
+            touch, self._pending_touch = self._pending_touch, {}
+        if not (stats["hits"] or stats["misses"] or touch):
+            return
+        try:
+            conn = self._conn()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                self._add_stats(conn, stats["hits"], stats["misses"])
+                conn.executemany(
+                    "UPDATE prompts SET last_used = MAX(last_used, ?) WHERE cache_key = ?",
+                    [(ts, key) for key, ts in touch.items()]
+                )
+        except sqlite3.Error as e:
+            print(f"[IMAGE-CACHE] 통계 저장 실패 (무시): {e}")
 
     def _hash_prompt(self, prompt: str) -> str:
         """프롬프트 해시 생성"""
@@ -116,6 +238,57 @@ class ImageCache:
         normalized = prompt.lower().strip()
         return hashlib.md5(normalized.encode()).hexdigest()[:12]
 
+    def _store_image(self, cache_key: str, image_path: str) -> Optional[str]:
+        """캐시용 이미지 사본 저장 (작업 폴더가 지워져도 재사용 가능하도록)"""
+        if not image_path or not os.path.exists(image_path):
+            return None
+        ext = os.path.splitext(image_path)[1] or ".png"
+        dest_path = os.path.join(self.image_dir, f"{cache_key}{ext}")
+        tmp_path = f"{dest_path}.{os.getpid()}.tmp"
+        shutil.copy2(image_path, tmp_path)
+        os.replace(tmp_path, dest_path)
+        return dest_path
+
+    def _remove_image(self, image_path: Optional[str]):
+        """캐시가 소유한 이미지만 삭제 (images/ 밖의 파일은 건드리지 않음)"""
+        if not image_path:
+            return
+        if os.path.dirname(os.path.abspath(image_path)) != os.path.abspath(self.image_dir):
+            return
+        try:
+            os.remove(image_path)
+        except OSError:
+            pass
+
+    def evict(self, ttl_days: int = None, max_entries: int = None) -> int:
+        """TTL이 지났거나 LRU 상한을 넘은 항목 삭제 (이미지 파일 포함)
+
+        Returns:
+            삭제된 항목 수
+        """
+        ttl_days = IMAGE_CACHE_TTL_DAYS if ttl_days is None else ttl_days
+        max_entries = IMAGE_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.flush_stats()
+
+        conn = self._conn()
+        cutoff = time.time() - ttl_days * 86400
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT cache_key, image_path FROM prompts WHERE last_used < ? "
+                "UNION SELECT cache_key, image_path FROM ("
+                "  SELECT cache_key, image_path FROM prompts ORDER BY last_used DESC LIMIT -1 OFFSET ?"
+                ")",
+                (cutoff, max(max_entries, 0))
+            ).fetchall()
+            conn.executemany("DELETE FROM prompts WHERE cache_key = ?", [(row["cache_key"],) for row in rows])
+
+        for row in rows:
+            self._remove_image(row["image_path"])
+        if rows:
+            print(f"[IMAGE-CACHE] 캐시 정리: {len(rows)}개 항목 삭제")
+        return len(rows)
+
     def get_template(self, issue_type: str, scene_number: int) -> Optional[str]:
         """이슈 타입별 템플릿 반환"""
         templates = BACKGROUND_TEMPLATES.get(issue_type, BACKGROUND_TEMPLATES["default"])
@@ -123,20 +296,26 @@ class ImageCache:
         return templates.get(scene_key)
 
     def get_cached_prompt(self, issue_type: str, scene_number: int, keywords: List[str] = None) -> Optional[Dict]:
-        """캐시된 프롬프트 찾기"""
+        """캐시된 프롬프트 찾기 (이미지가 사라진 항목은 미스로 처리하고 삭제)"""
         cache_key = f"{issue_type}_scene{scene_number}"
 
-        if cache_key in self.prompt_cache["prompts"]:
-            cached = self.prompt_cache["prompts"][cache_key]
-            self.prompt_cache["stats"]["hits"] += 1
-            self._save_cache()
+        row = self._conn().execute(
+            "SELECT prompt, image_path FROM prompts WHERE cache_key = ?", (cache_key,)
+        ).fetchone()
+
+        if row is not None and row["image_path"] and not os.path.exists(row["image_path"]):
+            self._conn().execute("DELETE FROM prompts WHERE cache_key = ?", (cache_key,))
+            row = None
+
+        if row is not None:
+            self._record(hit=True, cache_key=cache_key)
             return {
-                "prompt": cached["prompt"],
-                "image_path": cached.get("image_path"),
+                "prompt": row["prompt"],
+                "image_path": row["image_path"],
                 "from_cache": True,
             }
 
-        self.prompt_cache["stats"]["misses"] += 1
+        self._record(hit=False)
         return None
 
     def save_successful_prompt(
@@ -148,31 +327,31 @@ class ImageCache:
     ):
         """성공한 프롬프트 저장"""
         cache_key = f"{issue_type}_scene{scene_number}"
-
-        self.prompt_cache["prompts"][cache_key] = {
-            "prompt": prompt,
-            "image_path": image_path,
-            "success_count": self.prompt_cache["prompts"].get(cache_key, {}).get("success_count", 0) + 1,
-            "last_used": datetime.now().isoformat(),
-        }
-        self._save_cache()
+        cached_path = self._store_image(cache_key, image_path)
+        now = time.time()
+
+        self._conn().execute(
+            "INSERT INTO prompts (cache_key, issue_type, scene_number, prompt, image_path, success_count, created_at, last_used) "
+            "VALUES (?, ?, ?, ?, ?, 1, ?, ?) "
+            "ON CONFLICT(cache_key) DO UPDATE SET prompt = excluded.prompt, image_path = excluded.image_path, "
+            "success_count = success_count + 1, last_used = excluded.last_used",
+            (cache_key, issue_type, scene_number, prompt, cached_path, now, now)
+        )
+        self.evict()
 
     def add_to_blacklist(self, prompt: str, reason: str = ""):
         """실패 프롬프트 블랙리스트 추가"""
-        prompt_hash = self._hash_prompt(prompt)
-        if prompt_hash not in self.blacklist:
-            self.blacklist.append({
-                "hash": prompt_hash,
-                "prompt_preview": prompt[:100],
-                "reason": reason,
-                "added_at": datetime.now().isoformat(),
-            })
-            self._save_blacklist()
+        self._conn().execute(
+            "INSERT OR IGNORE INTO blacklist (hash, prompt_preview, reason, added_at) VALUES (?, ?, ?, ?)",
+            (self._hash_prompt(prompt), prompt[:100], reason, datetime.now().isoformat())
+        )
 
     def is_blacklisted(self, prompt: str) -> bool:
         """블랙리스트 확인"""
-        prompt_hash = self._hash_prompt(prompt)
-        return any(item.get("hash") == prompt_hash for item in self.blacklist if isinstance(item, dict))
+        row = self._conn().execute(
+            "SELECT 1 FROM blacklist WHERE hash = ?", (self._hash_prompt(prompt),)
+        ).fetchone()
+        return row is not None
 
     def get_optimized_prompts(self, scenes: List[Dict], issue_type: str) -> List[Dict]:
         """
@@ -241,27 +420,40 @@ class ImageCache:
         return optimized
 
     def get_stats(self) -> Dict[str, Any]:
-        """캐시 통계"""
-        stats = self.prompt_cache.get("stats", {"hits": 0, "misses": 0})
-        total = stats["hits"] + stats["misses"]
-        hit_rate = (stats["hits"] / total * 100) if total > 0 else 0
+        """캐시 통계 (누적 + 이 프로세스)"""
+        self.flush_stats()
+        conn = self._conn()
+        stats = {row["name"]: row["value"] for row in conn.execute("SELECT name, value FROM stats")}
+        hits, misses = stats.get("hits", 0), stats.get("misses", 0)
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total > 0 else 0
+
+        with self._lock:
+            session_hits, session_misses = self._session_stats["hits"], self._session_stats["misses"]
+        session_total = session_hits + session_misses
 
         return {
-            "hits": stats["hits"],
-            "misses": stats["misses"],
+            "hits": hits,
+            "misses": misses,
             "hit_rate": f"{hit_rate:.1f}%",
-            "cached_prompts": len(self.prompt_cache.get("prompts", {})),
-            "blacklisted": len(self.blacklist),
+            "session_hits": session_hits,
+            "session_misses": session_misses,
+            "session_hit_rate": f"{(session_hits / session_total * 100) if session_total else 0:.1f}%",
+            "cached_prompts": conn.execute("SELECT COUNT(*) FROM prompts").fetchone()[0],
+            "blacklisted": conn.execute("SELECT COUNT(*) FROM blacklist").fetchone()[0],
         }
 
 
 # 싱글톤 인스턴스
 _cache_instance = None
+_cache_lock = threading.Lock()
 
 
 def get_image_cache() -> ImageCache:
     """ImageCache 싱글톤 반환"""
     global _cache_instance
     if _cache_instance is None:
-        _cache_instance = ImageCache()
+        with _cache_lock:
+            if _cache_instance is None:
+                _cache_instance = ImageCache()
     return _cache_instance
@@ -503,7 +503,8 @@ class SupervisorAgent(BaseAgent):
                 "cache_hits": 2,
                 "generate_count": 3,
                 "estimated_savings": 0.10,
-                "summary": "5개 씬 중 2개 캐시 사용, $0.10 절감 예상"
+                "summary": "5개 씬 중 2개 캐시 사용, $0.10 절감 예상",
+                "cache_stats": {"hits": 120, "misses": 40, "hit_rate": "75.0%", ...}
             }
         """
         if not context.script or not context.script.get("scenes"):
@@ -532,7 +533,9 @@ class SupervisorAgent(BaseAgent):
             if estimated_savings > 0:
                 summary += f", ${estimated_savings:.2f} 절감"
 
-            self.log(f"최적화 분석: {summary}")
+            cache_stats = cache.get_stats()
+            self.log(f"최적화 분석: {summary} (캐시 히트율 {cache_stats['hit_rate']}, "
+                     f"이번 프로세스 {cache_stats['session_hit_rate']})")
 
             return {
                 "optimized_scenes": optimized,
@@ -541,6 +544,7 @@ class SupervisorAgent(BaseAgent):
                 "estimated_savings": estimated_savings,
                 "summary": summary,
                 "issue_type": issue_type,
+                "cache_stats": cache_stats,
             }
 
         except Exception as e:
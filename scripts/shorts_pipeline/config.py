@@ -753,39 +753,43 @@ SHORTS_KEN_BURNS = {
     },
 }
 
-# FFmpeg zoompan 필터 프리셋
+# FFmpeg Ken Burns 프리셋 (zoompan 좌표계 식 - video.kenburns.build_ken_burns_filter로 필터 생성)
+# z는 이전 프레임 zoom에 의존하지 않는 on(출력 프레임 번호) 닫힌 식이어야 함
+# zoom_max: 줌이 변하는 프리셋의 최대 배율 (crop 엔진의 마스터 크기)
 FFMPEG_ZOOMPAN_PRESETS = {
     "zoom_in": {
-        # 1.0 → 1.15 확대
-        "z": "'min(zoom+0.0015,1.15)'",
-        "x": "'iw/2-(iw/zoom/2)'",
-        "y": "'ih/2-(ih/zoom/2)'",
+        # 1.0 → 1.15 확대 (프레임당 0.0015)
+        "z": "min(1+0.0015*(on+1),1.15)",
+        "x": "iw/2-(iw/zoom/2)",
+        "y": "ih/2-(ih/zoom/2)",
+        "zoom_max": 1.15,
     },
     "zoom_out": {
-        # 1.15 → 1.0 축소
-        "z": "'if(eq(on,1),1.15,max(zoom-0.0015,1.0))'",
-        "x": "'iw/2-(iw/zoom/2)'",
-        "y": "'ih/2-(ih/zoom/2)'",
+        # 1.15 → 1.0 축소 (프레임당 0.0015)
+        "z": "max(1.15-0.0015*on,1.0)",
+        "x": "iw/2-(iw/zoom/2)",
+        "y": "ih/2-(ih/zoom/2)",
+        "zoom_max": 1.15,
     },
     "pan_right": {
         "z": "1.1",
-        "x": "'min(on*2,100)'",  # 왼쪽에서 오른쪽으로
-        "y": "'ih/2-(ih/zoom/2)'",
+        "x": "min(on*2,100)",  # 왼쪽에서 오른쪽으로
+        "y": "ih/2-(ih/zoom/2)",
     },
     "pan_left": {
         "z": "1.1",
-        "x": "'max(100-on*2,0)'",  # 오른쪽에서 왼쪽으로
-        "y": "'ih/2-(ih/zoom/2)'",
+        "x": "max(100-on*2,0)",  # 오른쪽에서 왼쪽으로
+        "y": "ih/2-(ih/zoom/2)",
     },
     "pan_up": {
         "z": "1.1",
-        "x": "'iw/2-(iw/zoom/2)'",
-        "y": "'max(100-on*2,0)'",  # 아래에서 위로
+        "x": "iw/2-(iw/zoom/2)",
+        "y": "max(100-on*2,0)",  # 아래에서 위로
     },
     "pan_down": {
         "z": "1.1",
-        "x": "'iw/2-(iw/zoom/2)'",
-        "y": "'min(on*2,100)'",  # 위에서 아래로
+        "x": "iw/2-(iw/zoom/2)",
+        "y": "min(on*2,100)",  # 위에서 아래로
     },
 }
 
@@ -33,6 +33,8 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 # 프로젝트 루트 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from video.kenburns import KenBurnsMotion, build_ken_burns_filter
+
 from .config import (
     SHEET_NAME,
     estimate_cost,
@@ -1247,7 +1249,7 @@ def render_video(
 
             # 1-2) Ken Burns 효과 패턴
             pattern = SHORTS_KEN_BURNS["scene_patterns"].get(scene_num, "zoom_in")
-            zoompan = FFMPEG_ZOOMPAN_PRESETS.get(pattern, FFMPEG_ZOOMPAN_PRESETS["zoom_in"])
+            preset = FFMPEG_ZOOMPAN_PRESETS.get(pattern, FFMPEG_ZOOMPAN_PRESETS["zoom_in"])
 
             # 강도 조절
             intensity = SHORTS_KEN_BURNS["intensity_by_issue"].get(
@@ -1258,7 +1260,9 @@ def render_video(
 
             # FFmpeg 명령어 (이미 9:16 크기이므로 scale 불필요)
             fps = 30
-            total_frames = int(scene_duration * fps)
+            motion = KenBurnsMotion(
+                zoom=preset["z"], x=preset["x"], y=preset["y"], zoom_max=preset.get("zoom_max")
+            )
 
             # Ken Burns는 이미지 영역(중앙)에만 적용하도록 조정
             # 전체 프레임에 적용하면 타이틀/자막 영역도 움직임
@@ -1267,7 +1271,8 @@ def render_video(
                 "ffmpeg", "-y",
                 "-loop", "1",
                 "-i", composed_path,
-                "-vf", f"zoompan=z={zoompan['z']}:x={zoompan['x']}:y={zoompan['y']}:d={total_frames}:s={VIDEO_WIDTH}x{VIDEO_HEIGHT}:fps={fps}",
+                "-vf", build_ken_burns_filter(motion, VIDEO_WIDTH, VIDEO_HEIGHT, VIDEO_WIDTH, VIDEO_HEIGHT,
+                                              fps, scene_duration),
                 "-t", str(scene_duration),
                 "-c:v", "libx264",
                 "-preset", "fast",
@@ -26,7 +26,8 @@ class ProductionAgent(BaseAgent):
     def __init__(self, server_url: str = "http://localhost:5059"):
         super().__init__("ProductionAgent", max_retries=2)
         self.server_url = server_url
-        self.poll_interval = 2  # 폴링 간격 (초)
+        self.poll_interval = 2  # 폴링 간격 (초) - long-poll 미지원/오류 시
+        self.long_poll_timeout = 25  # long-poll 서버 대기 시간 (초)
         self.max_poll_time = 2400  # 최대 40분
 
     async def execute(self, context: VideoTaskContext, **kwargs) -> AgentResult:
@@ -156,7 +157,10 @@ class ProductionAgent(BaseAgent):
 
     async def _poll_video_status(self, job_id: str) -> Dict[str, Any]:
         """
-        영상 생성 상태 폴링
+        영상 생성 상태 대기 (long-poll)
+
+        /api/jobs/{job_id}/wait는 상태가 바뀌는 즉시 응답하므로 고정 간격 폴링 없이
+        진행 상황을 받는다. 서버가 long-poll을 지원하지 않으면(404) 기존 상태 API 폴링으로 폴백.
 
         Args:
             job_id: 작업 ID
@@ -165,52 +169,69 @@ class ProductionAgent(BaseAgent):
             최종 결과
         """
         start_time = time.time()
-
-        while True:
-            elapsed = time.time() - start_time
-            if elapsed > self.max_poll_time:
-                return {"ok": False, "error": "영상 생성 타임아웃 (40분 초과)"}
-
-            try:
-                async with httpx.AsyncClient(timeout=30) as client:
-                    response = await client.get(
-                        f"{self.server_url}/api/image/video-status/{job_id}"
-                    )
+        use_long_poll = True
+        since = -1
+
+        async with httpx.AsyncClient(timeout=self.long_poll_timeout + 30) as client:
+            while True:
+                elapsed = time.time() - start_time
+                if elapsed > self.max_poll_time:
+                    return {"ok": False, "error": "영상 생성 타임아웃 (40분 초과)"}
+
+                try:
+                    if use_long_poll:
+                        response = await client.get(
+                            f"{self.server_url}/api/jobs/{job_id}/wait",
+                            params={"since": since, "timeout": self.long_poll_timeout},
+                        )
+                        if response.status_code == 404:
+                            self.log("long-poll 미지원 또는 작업 없음 → 상태 폴링으로 전환", "warning")
+                            use_long_poll = False
+                            continue
+                    else:
+                        response = await client.get(
+                            f"{self.server_url}/api/image/video-status/{job_id}"
+                        )
                     response.raise_for_status()
                     status = response.json()
+                    since = status.get("version", since)
+
+                    state = status.get("status", "unknown")
+
+                    if state == "completed":
+                        # API는 video_url 반환 (URL 경로: /uploads/xxx.mp4)
+                        video_url = status.get("video_url") or status.get("video_path")
+
+                        # URL 경로를 파일 경로로 변환 (/uploads/xxx.mp4 → uploads/xxx.mp4)
+                        if video_url and video_url.startswith("/"):
+                            video_path = video_url.lstrip("/")
+                        else:
+                            video_path = video_url
+
+                        return {
+                            "ok": True,
+                            "video_path": video_path,
+                            "duration": status.get("duration"),
+                        }
+                    elif state == "failed":
+                        return {
+                            "ok": False,
+                            "error": status.get("error", "영상 생성 실패")
+                        }
+                    elif state in ["pending", "processing"]:
+                        progress = status.get("progress", 0)
+                        self.log(f"영상 생성 중: {progress}% ({elapsed:.0f}초 경과)")
+                    else:
+                        self.log(f"알 수 없는 상태: {state}", "warning")
 
-                state = status.get("status", "unknown")
-
-                if state == "completed":
-                    # API는 video_url 반환 (URL 경로: /uploads/xxx.mp4)
-                    video_url = status.get("video_url") or status.get("video_path")
+                except Exception as e:
+                    self.log(f"상태 확인 실패: {e}", "warning")
+                    await asyncio.sleep(self.poll_interval)
+                    continue
 
-                    # URL 경로를 파일 경로로 변환 (/uploads/xxx.mp4 → uploads/xxx.mp4)
-                    if video_url and video_url.startswith("/"):
-                        video_path = video_url.lstrip("/")
-                    else:
-                        video_path = video_url
-
-                    return {
-                        "ok": True,
-                        "video_path": video_path,
-                        "duration": status.get("duration"),
-                    }
-                elif state == "failed":
-                    return {
-                        "ok": False,
-                        "error": status.get("error", "영상 생성 실패")
-                    }
-                elif state in ["pending", "processing"]:
-                    progress = status.get("progress", 0)
-                    self.log(f"영상 생성 중: {progress}% ({elapsed:.0f}초 경과)")
-                else:
-                    self.log(f"알 수 없는 상태: {state}", "warning")
-
-            except Exception as e:
-                self.log(f"상태 확인 실패: {e}", "warning")
-
-            await asyncio.sleep(self.poll_interval)
+                if use_long_poll:
+                    continue  # 서버가 변경 시까지 대기했으므로 바로 다음 요청
+                await asyncio.sleep(self.poll_interval)
 
     async def generate_shorts(
         self,
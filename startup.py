@@ -0,0 +1,245 @@
+"""
+서버 시작 시간 관리 모듈
+
+Render는 배포/헬스체크 실패 때마다 프로세스를 다시 띄우므로 import 시점 작업이 곧 다운타임이다.
+- 시작 단계별 소요 시간 기록 + 예산(STARTUP_BUDGET_SECONDS) 초과 시 느린 단계 경고
+- 입력이 바뀔 때만 다시 실행하는 초기화 (fc-cache, DB 스키마): 지문(fingerprint) 마커 비교
+- 무거운 SDK 클라이언트 지연 생성 (LazyObject)
+- import 시간 프로파일 CLI (python -X importtime 결과 집계)
+
+사용법:
+    from startup import get_startup_profile, directory_fingerprint, marker_matches, write_marker
+
+    profile = get_startup_profile()
+    profile.mark('imports')             # 이전 mark 이후 소요 시간을 'imports' 단계로 기록
+
+    fp = directory_fingerprint('fonts')
+    if not marker_matches('fontconfig', fp):
+        ...
+        write_marker('fontconfig', fp)
+
+    python -m startup importtime                     # drama_server import 프로파일 (상위 25개)
+    python -m startup importtime --module video --top 40
+"""
+
+import os
+import sys
+import json
+import time
+import types
+import hashlib
+import argparse
+import threading
+import subprocess
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+STARTUP_STATE_DIR = os.environ.get('STARTUP_STATE_DIR', 'data/startup')
+# 0이면 예산 검사 안 함
+STARTUP_BUDGET_SECONDS = float(os.environ.get('STARTUP_BUDGET_SECONDS', '10'))
+
+
+# ===== 단계별 시작 시간 =====
+class StartupProfile:
+    """import 시점 초기화 단계별 소요 시간 (mark 사이 구간)"""
+
+    def __init__(self, budget_seconds: float = STARTUP_BUDGET_SECONDS):
+        self.budget_seconds = budget_seconds
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases: List[Dict[str, Any]] = []
+
+    def mark(self, name: str) -> float:
+        """이전 mark 이후 구간을 name 단계로 기록, 구간 시간(초) 반환"""
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self._last = now
+        self.phases.append({'name': name, 'seconds': round(elapsed, 3)})
+        return elapsed
+
+    @property
+    def total_seconds(self) -> float:
+        return self._last - self.started
+
+    def report(self) -> dict:
+        return {
+            'pid': os.getpid(),
+            'totalSeconds': round(self.total_seconds, 3),
+            'budgetSeconds': self.budget_seconds,
+            'overBudget': bool(self.budget_seconds) and self.total_seconds > self.budget_seconds,
+            'phases': list(self.phases),
+        }
+
+    def log_summary(self):
+        total = self.total_seconds
+        phases = ', '.join(f"{p['name']} {p['seconds']:.2f}s" for p in self.phases)
+        print(f"[STARTUP] 시작 완료 {total:.2f}초 ({phases})")
+        if self.budget_seconds and total > self.budget_seconds:
+            slowest = sorted(self.phases, key=lambda p: p['seconds'], reverse=True)[:3]
+            print(f"[STARTUP] 시작 예산 {self.budget_seconds:g}초 초과 - 느린 단계: "
+                  f"{', '.join(p['name'] for p in slowest)} (python -m startup importtime 으로 확인)")
+
+
+_startup_profile = None
+_startup_profile_lock = threading.Lock()
+
+
+def get_startup_profile() -> StartupProfile:
+    """프로세스 공용 시작 프로파일 (처음 호출한 시점이 시작 시각)"""
+    global _startup_profile
+    with _startup_profile_lock:
+        if _startup_profile is None:
+            _startup_profile = StartupProfile()
+        return _startup_profile
+
+
+# ===== 지문 마커 (입력이 바뀔 때만 다시 실행) =====
+def directory_fingerprint(path: str, extra: str = '') -> str:
+    """디렉토리 파일 목록(상대 경로, 크기, mtime) + extra의 sha256 - 파일 내용은 읽지 않음"""
+    entries = []
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            full = os.path.join(root, name)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            entries.append([os.path.relpath(full, path), st.st_size, st.st_mtime_ns])
+    payload = json.dumps({'path': os.path.abspath(path), 'files': entries, 'extra': extra})
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def code_fingerprint(func: Callable) -> str:
+    """함수 안의 문자열 상수(SQL 등)의 sha256 - DDL이 바뀌면 값이 바뀜"""
+    strings = []
+
+    def collect(code: types.CodeType):
+        for const in code.co_consts:
+            if isinstance(const, str):
+                strings.append(const)
+            elif isinstance(const, types.CodeType):
+                collect(const)
+
+    collect(func.__code__)
+    return hashlib.sha256('\0'.join(strings).encode('utf-8')).hexdigest()
+
+
+def _marker_path(name: str) -> str:
+    return os.path.join(STARTUP_STATE_DIR, f"{name}.json")
+
+
+def marker_matches(name: str, fingerprint: str) -> bool:
+    try:
+        with open(_marker_path(name), 'r', encoding='utf-8') as f:
+            return json.load(f).get('fingerprint') == fingerprint
+    except (OSError, ValueError):
+        return False
+
+
+def write_marker(name: str, fingerprint: str):
+    """마커 기록 (임시 파일 + rename, 실패해도 다음 시작 때 다시 실행될 뿐)"""
+    try:
+        os.makedirs(STARTUP_STATE_DIR, exist_ok=True)
+        path = _marker_path(name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': fingerprint, 'updated_at': datetime.now().isoformat()}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[STARTUP] 마커 저장 실패 ({name}): {e}")
+
+
+# ===== 지연 생성 =====
+class LazyObject:
+    """첫 속성 접근 때 factory()로 실제 객체를 만드는 프록시 (SDK import/클라이언트 생성을 첫 사용까지 미룸)"""
+
+    def __init__(self, factory: Callable[[], Any]):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_target', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _resolve(self):
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    target = self._factory()
+                    object.__setattr__(self, '_target', target)
+        return target
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+
+# ===== import 시간 프로파일 =====
+def profile_imports(module: str = 'drama_server') -> List[Dict[str, Any]]:
+    """python -X importtime -c "import {module}" 실행 결과 → [{module, self_ms, cumulative_ms, depth}, ...]
+
+    module 자체의 self 시간에는 import 시점 초기화(DB, fontconfig 등)가 포함된다.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        capture_output=True, text=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        # "import time:       123 |       4567 |     package.module" (들여쓰기 = import 깊이)
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        name = parts[2].rstrip()
+        rows.append({
+            'module': name.strip(),
+            'self_ms': int(parts[0]) / 1000,
+            'cumulative_ms': int(parts[1]) / 1000,
+            'depth': (len(name) - len(name.lstrip())) // 2,
+        })
+    if result.returncode != 0:
+        tail = result.stderr.strip().splitlines()[-1:] or ['']
+        print(f"[STARTUP] import {module} 실패: {tail[0]}")
+    return rows
+
+
+def print_import_report(rows: List[Dict[str, Any]], top: int = 25):
+    if not rows:
+        print("[STARTUP] importtime 결과 없음")
+        return
+    # depth 0~1 = 대상 모듈이 직접 끌어온 패키지와 그 바로 아래 모듈
+    roots = sorted((r for r in rows if r['depth'] <= 1), key=lambda r: r['cumulative_ms'], reverse=True)
+    total_ms = max(r['cumulative_ms'] for r in rows)
+    print(f"\n{'cumulative(ms)':>15}{'self(ms)':>10}  module (상위 {top}개, 누적 기준)")
+    for r in roots[:top]:
+        print(f"{r['cumulative_ms']:>15.1f}{r['self_ms']:>10.1f}  {r['module']}")
+    print(f"\n{'self(ms)':>15}  module (self 기준)")
+    for r in sorted(rows, key=lambda r: r['self_ms'], reverse=True)[:top]:
+        print(f"{r['self_ms']:>15.1f}  {r['module']}")
+    print(f"\n[STARTUP] 전체 import {total_ms / 1000:.2f}초, 모듈 {len(rows)}개")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="서버 시작 시간 도구")
+    sub = parser.add_subparsers(dest='command', required=True)
+    imp = sub.add_parser('importtime', help="모듈 import 시간 프로파일 (python -X importtime 집계)")
+    imp.add_argument('--module', default='drama_server')
+    imp.add_argument('--top', type=int, default=25)
+    imp.add_argument('--json', dest='json_path', default=None, help="전체 결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    rows = profile_imports(args.module)
+    print_import_report(rows, top=args.top)
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+        print(f"[STARTUP] 결과 저장: {args.json_path}")
+    return 0 if rows else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -217,6 +217,16 @@ const ImageMain = {
     this.showStatus('🔄 이전 세션이 복구되었습니다!', 'success');
   },
 
+  /**
+   * 영상 작업 상태 long-poll
+   * 서버가 상태 변경 시 즉시 응답 (변경 없으면 최대 25초 대기)
+   * since: 마지막으로 받은 version (-1이면 현재 상태를 바로 반환)
+   */
+  async fetchVideoStatus(jobId, since = -1) {
+    const response = await fetch(`/api/jobs/${jobId}/wait?since=${since}`);
+    return response.json();
+  },
+
   /**
    * 진행 중인 영상 작업 폴링 재개
    */
@@ -234,14 +244,14 @@ const ImageMain = {
 
     this.showStatus('🔄 진행 중인 영상 작업에 재연결 중...', 'info');
 
-    const pollInterval = 2000;
-    const maxPolls = 900;
-    let polls = 0;
+    const retryInterval = 2000;
+    const deadline = Date.now() + 30 * 60 * 1000; // 최대 30분
+    let since = -1;
 
     const pollStatus = async () => {
       try {
-        const response = await fetch(`/api/image/video-status/${jobId}`);
-        const data = await response.json();
+        const data = await this.fetchVideoStatus(jobId, since);
+        if (data.version !== undefined) since = data.version;
 
         if (!data.ok) {
           // 작업을 찾을 수 없음 - 이미 완료되었거나 실패
@@ -289,18 +299,15 @@ const ImageMain = {
           }
           this.showStatus('영상 생성 실패: ' + (data.error || '알 수 없는 오류'), 'error');
 
-        } else {
-          polls++;
-          if (polls < maxPolls) {
-            setTimeout(pollStatus, pollInterval);
-          }
+        } else if (Date.now() < deadline) {
+          // 서버가 변경 시까지 대기하므로 바로 다음 요청
+          setTimeout(pollStatus, 0);
         }
 
       } catch (error) {
         console.error('[ImageMain] Poll error:', error);
-        polls++;
-        if (polls < maxPolls) {
-          setTimeout(pollStatus, pollInterval);
+        if (Date.now() < deadline) {
+          setTimeout(pollStatus, retryInterval);
         }
       }
     };
@@ -626,14 +633,13 @@ const ImageMain = {
    * 영상 완료 대기 (폴링)
    */
   async waitForVideoCompletion(jobId) {
-    const pollInterval = 2000;
-    const maxPolls = 300;
-    let polls = 0;
+    const deadline = Date.now() + 10 * 60 * 1000; // 최대 10분
+    let since = -1;
 
-    while (polls < maxPolls) {
+    while (Date.now() < deadline) {
       try {
-        const response = await fetch(`/api/image/video-status/${jobId}`);
-        const data = await response.json();
+        const data = await this.fetchVideoStatus(jobId, since);
+        if (data.version !== undefined) since = data.version;
 
         if (data.status === 'completed') {
           this.pendingVideoJobId = null;
@@ -646,8 +652,6 @@ const ImageMain = {
         }
 
         this.showStatus(`영상 생성 중... ${data.progress}%`, 'info');
-        await this.sleep(pollInterval);
-        polls++;
       } catch (error) {
         console.error('[ImageMain] 영상 폴링 오류:', error);
         return false;
@@ -1866,15 +1870,14 @@ const ImageMain = {
       btn.textContent = '⏳ 처리 중...';
       progressText.textContent = `작업 시작됨 (${startData.estimated_time})`;
 
-      // 2. 상태 폴링
-      const pollInterval = 2000; // 2초마다 확인
-      const maxPolls = 900; // 최대 30분 (900 * 2초)
-      let polls = 0;
+      // 2. 상태 long-poll (변경 시 즉시 응답)
+      const deadline = Date.now() + 30 * 60 * 1000; // 최대 30분
+      let since = -1;
 
       const pollStatus = async () => {
         try {
-          const statusResponse = await fetch(`/api/image/video-status/${jobId}`);
-          const statusData = await statusResponse.json();
+          const statusData = await this.fetchVideoStatus(jobId, since);
+          if (statusData.version !== undefined) since = statusData.version;
 
           if (!statusData.ok) {
             throw new Error(statusData.error || '상태 확인 실패');
@@ -1923,10 +1926,9 @@ const ImageMain = {
             throw new Error(statusData.error || '영상 생성 실패');
 
           } else {
-            // 계속 폴링
-            polls++;
-            if (polls < maxPolls) {
-              setTimeout(pollStatus, pollInterval);
+            // 계속 대기 (서버가 변경 시까지 응답을 보류하므로 바로 다음 요청)
+            if (Date.now() < deadline) {
+              setTimeout(pollStatus, 0);
             } else {
               throw new Error('시간 초과 (30분)');
             }
@@ -1942,7 +1944,7 @@ const ImageMain = {
       };
 
       // 폴링 시작
-      setTimeout(pollStatus, pollInterval);
+      pollStatus();
 
     } catch (error) {
       console.error('[ImageMain] Video generation error:', error);
@@ -0,0 +1,98 @@
+"""scripts/bible_pipeline/index.py - 누적합 조회, 캐시 파일 재사용"""
+
+import json
+import os
+import random
+
+import pytest
+
+# scripts.bible_pipeline 패키지 import 시 렌더러가 Pillow를 불러옴
+pytest.importorskip("PIL")
+
+from scripts.bible_pipeline import index as bible_index
+from scripts.bible_pipeline.index import BibleIndex, load_bible_index
+
+
+def _bible_data(chapter_lengths):
+    chapters = []
+    for num, lengths in enumerate(chapter_lengths, start=1):
+        verses = [{"verse": v, "text": "가" * n} for v, n in enumerate(lengths, start=1)]
+        chapters.append({"chapter": num, "verses": verses})
+    return {"version": "테스트역", "books": [{"name": "창세기", "chapters": chapters}]}
+
+
+def _linear_end_chapter(chapter_chars, start, max_chars):
+    """기존 방식: 시작 장부터 한 장씩 더해가며 초과 직전에 멈춤"""
+    total, end = 0, start
+    for num in range(start, len(chapter_chars) + 1):
+        if total + chapter_chars[num - 1] > max_chars:
+            break
+        total += chapter_chars[num - 1]
+        end = num
+    return (end, total) if total else (start, 0)
+
+
+def test_lookups_and_range_chars():
+    index = BibleIndex.from_json_data(_bible_data([[3, 2], [5], [1, 1, 1]]))
+    assert index.version == "테스트역"
+    assert index.chapter_verses("창세기", 2) == ((1, "가" * 5),)
+    assert index.chapter_verses("창세기", 9) is None
+    assert index.chapter_verses("출애굽기", 1) is None
+    assert index.chapter_chars("창세기", 1) == 5
+    assert index.range_chars("창세기", 1, 3) == 13
+    assert index.range_chars("창세기", 2, 3) == 8
+    assert index.range_chars("창세기", 3, 2) == 0
+    assert index.get_book("창세기").total_chars == 13
+
+
+def test_end_chapter_for_chars_matches_linear_scan():
+    rng = random.Random(7)
+    lengths = [[rng.randint(1, 40) for _ in range(rng.randint(1, 6))] for _ in range(30)]
+    index = BibleIndex.from_json_data(_bible_data(lengths))
+    chapter_chars = [sum(ls) for ls in lengths]
+
+    for _ in range(500):
+        start = rng.randint(1, 30)
+        max_chars = rng.randint(0, 600)
+        assert index.end_chapter_for_chars("창세기", start, max_chars) == \
+            _linear_end_chapter(chapter_chars, start, max_chars)
+
+
+def test_end_chapter_for_unknown_book_raises():
+    index = BibleIndex.from_json_data(_bible_data([[1]]))
+    with pytest.raises(KeyError):
+        index.end_chapter_for_chars("출애굽기", 1, 100)
+
+
+def test_load_writes_cache_and_reuses_it(tmp_path, monkeypatch):
+    json_path = str(tmp_path / "bible.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(_bible_data([[2, 2], [4]]), f, ensure_ascii=False)
+    monkeypatch.setattr(bible_index, "_loaded", {})
+
+    index = load_bible_index(json_path)
+    assert os.path.exists(json_path + ".index.pickle")
+    assert load_bible_index(json_path) is index
+
+    # 새 프로세스처럼 메모리 캐시를 비우면 JSON 대신 캐시 파일에서 읽음
+    monkeypatch.setattr(bible_index, "_loaded", {})
+    monkeypatch.setattr(BibleIndex, "from_json_data", classmethod(lambda cls, data: pytest.fail("JSON 재파싱")))
+    assert load_bible_index(json_path).range_chars("창세기", 1, 2) == 8
+
+
+def test_load_recompiles_when_source_changes(tmp_path, monkeypatch):
+    json_path = str(tmp_path / "bible.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(_bible_data([[2]]), f)
+    monkeypatch.setattr(bible_index, "_loaded", {})
+    assert load_bible_index(json_path).get_book("창세기").total_chars == 2
+
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(_bible_data([[2], [7, 1]]), f)
+    os.utime(json_path, ns=(0, os.stat(json_path).st_mtime_ns + 10**9))
+    assert load_bible_index(json_path).get_book("창세기").total_chars == 10
+
+
+def test_load_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_bible_index(str(tmp_path / "nope.json"))
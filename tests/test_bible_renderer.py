@@ -0,0 +1,61 @@
+"""scripts/bible_pipeline/renderer.py - 정지 배경(static) FFmpeg 명령어"""
+
+import shutil
+import subprocess
+
+import pytest
+
+# 렌더러는 배경 생성에 Pillow를 사용
+pytest.importorskip("PIL")
+
+from scripts.bible_pipeline.renderer import generate_ffmpeg_command
+from video.encoder import ENCODER_PROFILES
+
+_RENDER_ENV = ('RENDER_PROFILE', 'RENDER_PRESET', 'RENDER_CRF', 'RENDER_THREADS', 'RENDER_STATIC_FPS')
+
+
+@pytest.fixture(autouse=True)
+def _clean_render_env(monkeypatch):
+    for name in _RENDER_ENV:
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_default_profile_decodes_background_once_at_low_fps():
+    cmd = generate_ffmpeg_command('bg.png', 'a.mp3', '/tmp/sub:1.ass', 'out.mp4', 95.5)
+    assert cmd[:8] == ['ffmpeg', '-y', '-framerate', '10', '-i', 'bg.png', '-i', 'a.mp3']
+    assert '-loop' not in cmd
+    assert cmd[cmd.index('-filter_complex') + 1] == \
+        "[0:v]format=yuv420p,loop=loop=-1:size=1,ass=/tmp/sub\\:1.ass[v]"
+    assert cmd[cmd.index('-t') + 1] == '95.5'
+    assert cmd[cmd.index('-r') + 1] == '10'
+    assert cmd[cmd.index('-g') + 1] == '600'
+    assert cmd[-1] == 'out.mp4'
+
+
+def test_profile_without_fixed_fps_keeps_loop_input():
+    cmd = generate_ffmpeg_command('bg.png', 'a.mp3', 'sub.srt', 'out.mp4', 30.0,
+                                  subtitle_type='srt', profile=ENCODER_PROFILES['stillimage'])
+    assert cmd[2:6] == ['-loop', '1', '-i', 'bg.png']
+    assert '-shortest' in cmd
+    assert cmd[cmd.index('-vf') + 1].startswith("subtitles=sub.srt:force_style=")
+    assert '-filter_complex' not in cmd
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="ffmpeg 없음")
+def test_static_command_runs_in_ffmpeg(tmp_path):
+    bg = tmp_path / 'bg.png'
+    audio = tmp_path / 'a.wav'
+    sub = tmp_path / 'sub.ass'
+    out = tmp_path / 'out.mp4'
+    subprocess.run(['ffmpeg', '-y', '-v', 'error', '-f', 'lavfi', '-i', 'color=c=navy:size=320x180',
+                    '-frames:v', '1', str(bg)], check=True)
+    subprocess.run(['ffmpeg', '-y', '-v', 'error', '-f', 'lavfi', '-i', 'sine', '-t', '2', str(audio)],
+                   check=True)
+    sub.write_text("[Script Info]\nScriptType: v4.00+\n\n[V4+ Styles]\n"
+                   "Format: Name, Fontsize\nStyle: Default,20\n\n[Events]\n"
+                   "Format: Layer, Start, End, Style, Text\n"
+                   "Dialogue: 0,0:00:00.00,0:00:01.00,Default,태초에\n", encoding='utf-8')
+
+    cmd = generate_ffmpeg_command(str(bg), str(audio), str(sub), str(out), 2.0)
+    subprocess.run(cmd[:1] + ['-v', 'error'] + cmd[1:], check=True, capture_output=True)
+    assert out.stat().st_size > 0
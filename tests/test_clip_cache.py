@@ -0,0 +1,72 @@
+"""video/clip_cache.py - 키 구성, 조회/저장, LRU 제거, 용량 카운터"""
+
+import os
+
+from video.clip_cache import SceneClipCache, hash_file
+
+
+def _clip(path, size):
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    return path
+
+
+def test_key_depends_on_every_render_parameter(tmp_path):
+    cache = SceneClipCache(str(tmp_path / 'cache'))
+    base = cache.make_key('img', 'aud', 854, 480, 24, ['-crf', '32'])
+    assert base == cache.make_key('img', 'aud', 854, 480, 24, ['-crf', '32'])
+    assert base != cache.make_key('img2', 'aud', 854, 480, 24, ['-crf', '32'])
+    assert base != cache.make_key('img', None, 854, 480, 24, ['-crf', '32'])
+    assert base != cache.make_key('img', 'aud', 1280, 720, 24, ['-crf', '32'])
+    assert base != cache.make_key('img', 'aud', 854, 480, 30, ['-crf', '32'])
+    assert base != cache.make_key('img', 'aud', 854, 480, 24, ['-crf', '28'])
+
+
+def test_hash_file_matches_content(tmp_path):
+    a = _clip(str(tmp_path / 'a.bin'), 10)
+    b = _clip(str(tmp_path / 'b.bin'), 10)
+    c = _clip(str(tmp_path / 'c.bin'), 11)
+    assert hash_file(a) == hash_file(b) != hash_file(c)
+
+
+def test_store_then_fetch_returns_clip_and_duration(tmp_path):
+    cache = SceneClipCache(str(tmp_path / 'cache'))
+    key = cache.make_key('img', 'aud', 854, 480, 24, [])
+    src = _clip(str(tmp_path / 'src.mp4'), 100)
+
+    assert cache.fetch(key, str(tmp_path / 'miss.mp4')) is None
+    assert cache.store(key, src, 3.5)
+    dest = str(tmp_path / 'out.mp4')
+    assert cache.fetch(key, dest) == (dest, 3.5)
+    assert os.path.getsize(dest) == 100
+
+    stats = cache.stats()
+    assert (stats['entries'], stats['hits'], stats['misses']) == (1, 1, 1)
+
+
+def test_evicts_least_recently_used_first(tmp_path):
+    cache = SceneClipCache(str(tmp_path / 'cache'), max_bytes=2500)
+    keys = [cache.make_key(f'img{i}', None, 854, 480, 24, []) for i in range(4)]
+    out = str(tmp_path / 'out.mp4')
+
+    cache.store(keys[0], _clip(str(tmp_path / 's0.mp4'), 1000), 1.0)
+    cache.store(keys[1], _clip(str(tmp_path / 's1.mp4'), 1000), 1.0)
+    assert cache.fetch(keys[0], out)          # keys[0]이 최근 사용
+    cache.store(keys[2], _clip(str(tmp_path / 's2.mp4'), 1000), 1.0)
+
+    assert cache.fetch(keys[1], out) is None  # 가장 오래 사용하지 않은 항목 제거
+    assert cache.fetch(keys[0], out)
+    assert cache.fetch(keys[2], out)
+    assert cache.stats()['entries'] == 2
+
+
+def test_running_total_survives_restart_scan(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    cache = SceneClipCache(cache_dir)
+    for i in range(3):
+        cache.store(cache.make_key(f'img{i}', None, 1, 1, 1, []), _clip(str(tmp_path / f's{i}.mp4'), 1024 * 1024), 1.0)
+    assert cache.stats()['size_mb'] == 3.0
+
+    restarted = SceneClipCache(cache_dir)
+    assert restarted.stats()['entries'] == 3
+    assert restarted.stats()['size_mb'] == 3.0
@@ -0,0 +1,109 @@
+"""video/encoder.py, video/still.py - 인코더 프로필, 타임아웃, 진행률 실행기, 정지 이미지 명령어"""
+
+import shutil
+
+import pytest
+
+from video import encoder
+from video.encoder import (
+    ENCODER_PROFILES,
+    _parse_out_time,
+    escape_filter_path,
+    get_encoder_profile,
+    render_timeout,
+    run_ffmpeg,
+)
+from video.still import AssStyle, build_still_video_command, srt_to_ass
+
+_RENDER_ENV = ('RENDER_PROFILE', 'RENDER_PRESET', 'RENDER_CRF', 'RENDER_THREADS', 'RENDER_STATIC_FPS')
+
+
+@pytest.fixture(autouse=True)
+def _clean_render_env(monkeypatch):
+    for name in _RENDER_ENV:
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_profile_args():
+    fast = ENCODER_PROFILES['fast']
+    assert fast.video_args() == ['-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '28']
+    assert fast.thread_args() == ['-threads', '2']
+    assert fast.rate_args(24) == ['-r', '24']
+
+    static = ENCODER_PROFILES['static']
+    assert static.video_args()[-2:] == ['-tune', 'stillimage']
+    assert static.audio_args() == ['-c:a', 'aac', '-b:a', '192k']
+    assert static.thread_args() == []
+    assert static.rate_args(30) == ['-r', '10', '-g', '600']
+
+
+def test_env_overrides_profile(monkeypatch):
+    assert get_encoder_profile('fast') is ENCODER_PROFILES['fast']
+
+    monkeypatch.setenv('RENDER_PROFILE', 'static')
+    monkeypatch.setenv('RENDER_CRF', '30')
+    monkeypatch.setenv('RENDER_THREADS', '0')
+    monkeypatch.setenv('RENDER_STATIC_FPS', '5')
+    profile = get_encoder_profile('fast')
+    assert (profile.name, profile.crf, profile.threads, profile.frame_rate) == ('static', 30, None, 5)
+
+    # 고정 fps가 없는 프로필에는 RENDER_STATIC_FPS를 적용하지 않음
+    monkeypatch.setenv('RENDER_PROFILE', 'unknown')
+    monkeypatch.setenv('RENDER_PRESET', 'slow')
+    profile = get_encoder_profile('balanced')
+    assert (profile.name, profile.preset, profile.frame_rate) == ('balanced', 'slow', None)
+
+
+def test_render_timeout_scales_with_duration_and_is_clamped(monkeypatch):
+    monkeypatch.setattr(encoder, 'RENDER_TIMEOUT_FACTOR', 2.0)
+    monkeypatch.setattr(encoder, 'RENDER_TIMEOUT_MAX', 3600)
+    assert render_timeout(0) == 900
+    assert render_timeout(600) == 1500
+    assert render_timeout(10 ** 6) == 3600
+
+
+def test_escape_filter_path_and_out_time():
+    assert escape_filter_path('C:\\subs\\a.ass') == 'C\\:\\\\subs\\\\a.ass'
+    assert escape_filter_path('/tmp/a:b.ass') == '/tmp/a\\:b.ass'
+    assert _parse_out_time('00:01:02.500000') == pytest.approx(62.5)
+    assert _parse_out_time('N/A') is None
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="ffmpeg 없음")
+def test_run_ffmpeg_reports_progress_and_errors(tmp_path):
+    progress = []
+    result = run_ffmpeg(
+        ['ffmpeg', '-y', '-f', 'lavfi', '-i', 'testsrc=size=160x120:rate=10', '-t', '1',
+         '-f', 'null', '-'],
+        duration=1.0, on_progress=lambda cur, total: progress.append((cur, total)),
+    )
+    assert result['ok'] is True
+    assert result['frames'] == 10
+    assert progress and progress[-1][1] == 1.0
+
+    failed = run_ffmpeg(['ffmpeg', '-y', '-i', str(tmp_path / 'missing.mp4'), str(tmp_path / 'out.mp4')])
+    assert failed['ok'] is False
+    assert 'missing.mp4' in failed['error']
+
+
+def test_srt_to_ass_converts_blocks_and_style():
+    srt = "1\r\n00:00:01,250 --> 00:00:03,000\r\n첫 줄\r\n둘째 줄\r\n\r\n2\r\nbad timing\r\n텍스트\r\n"
+    ass = srt_to_ass(srt, AssStyle(font_size=40, margin_v=60))
+    assert "Style: Default,NotoSansKR-Bold,40," in ass
+    assert ass.endswith("Dialogue: 0,0:00:01.25,0:00:03.00,Default,,0,0,0,,첫 줄\\N둘째 줄")
+    assert ass.count("Dialogue:") == 1
+
+
+def test_still_video_command_single_and_multi_image():
+    profile = ENCODER_PROFILES['fast']
+    single = build_still_video_command('a.mp3', ['1.png'], 'out.mp4', 12.0, 'scale=1280:720', profile, fps=24)
+    assert single[:8] == ['ffmpeg', '-y', '-loop', '1', '-i', '1.png', '-i', 'a.mp3']
+    assert '-shortest' in single and '-t' not in single
+    assert single[-3:] == ['-threads', '2', 'out.mp4']
+
+    multi = build_still_video_command('a.mp3', ['1.png', '2.png'], 'out.mp4', 12.0, 'scale=1280:720',
+                                      ENCODER_PROFILES['static'], fps=24, list_path='list.txt')
+    assert multi[2:10] == ['-f', 'concat', '-safe', '0', '-i', 'list.txt', '-i', 'a.mp3']
+    assert multi[multi.index('-t') + 1] == '12.0'
+    assert '-shortest' not in multi
+    assert multi[multi.index('-r') + 1] == '10'
@@ -0,0 +1,71 @@
+"""video/filtergraph.py - 단일 패스 filter_complex / 명령어 생성"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from video.filtergraph import (
+    build_single_pass_command,
+    build_single_pass_filter,
+    estimate_single_pass_memory_mb,
+)
+
+MEDIA = [('1.png', '1.mp3', 2.5), ('2.png', None, 1.0), ('3.png', '3.mp3', 1.25)]
+
+
+def test_filter_numbers_inputs_and_fills_missing_audio_with_silence():
+    lines = build_single_pass_filter(MEDIA, 640, 360, 24).split(';\n')
+    assert len(lines) == 7
+    assert lines[0].startswith("[0:v]scale=640:360:force_original_aspect_ratio=decrease,")
+    assert lines[0].endswith("trim=duration=2.500,setpts=PTS-STARTPTS[v0]")
+    assert lines[1].startswith("[1:a]") and "apad,atrim=duration=2.500" in lines[1]
+    assert lines[2].startswith("[2:v]") and lines[2].endswith("[v1]")
+    assert lines[3].startswith("anullsrc=r=44100:cl=stereo,") and lines[3].endswith("[a1]")
+    assert lines[4].startswith("[3:v]") and lines[5].startswith("[4:a]")
+    assert lines[6] == "[v0][a0][v1][a1][v2][a2]concat=n=3:v=1:a=1[outv][outa]"
+
+
+def test_command_writes_script_and_bounds_looped_inputs(tmp_path):
+    script = tmp_path / 'graph.txt'
+    cmd = build_single_pass_command(MEDIA, 640, 360, 24, 'out.mp4', str(script), threads=2)
+
+    assert script.read_text(encoding='utf-8') == build_single_pass_filter(MEDIA, 640, 360, 24)
+    assert cmd[:4] == ['ffmpeg', '-y', '-threads', '2']
+    assert cmd.count('-loop') == 3
+    assert cmd[4:12] == ['-loop', '1', '-framerate', '24', '-t', '2.500', '-i', '1.png']
+    assert [cmd[i + 1] for i, arg in enumerate(cmd) if arg == '-i'] == \
+        ['1.png', '1.mp3', '2.png', '3.png', '3.mp3']
+    assert cmd[cmd.index('-filter_complex_script') + 1] == str(script)
+    assert cmd[-1] == 'out.mp4'
+
+
+def test_command_rejects_empty_media(tmp_path):
+    with pytest.raises(ValueError):
+        build_single_pass_command([], 640, 360, 24, 'out.mp4', str(tmp_path / 'graph.txt'))
+
+
+def test_memory_estimate_grows_with_cuts_and_resolution():
+    base = estimate_single_pass_memory_mb(10, 854, 480)
+    assert estimate_single_pass_memory_mb(0, 854, 480) == 200
+    assert estimate_single_pass_memory_mb(20, 854, 480) > base
+    assert estimate_single_pass_memory_mb(10, 1920, 1080) > base
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None or shutil.which('ffprobe') is None, reason="ffmpeg 없음")
+def test_single_pass_output_duration_matches_cuts(tmp_path):
+    image = tmp_path / 'img.png'
+    audio = tmp_path / 'a.wav'
+    subprocess.run(['ffmpeg', '-y', '-v', 'error', '-f', 'lavfi', '-i', 'testsrc=size=320x240',
+                    '-frames:v', '1', str(image)], check=True)
+    subprocess.run(['ffmpeg', '-y', '-v', 'error', '-f', 'lavfi', '-i', 'sine', '-t', '0.5', str(audio)],
+                   check=True)
+    media = [(str(image), str(audio), 1.0), (str(image), None, 0.5)]
+    output = tmp_path / 'out.mp4'
+
+    cmd = build_single_pass_command(media, 320, 240, 10, str(output), str(tmp_path / 'graph.txt'))
+    subprocess.run(cmd[:1] + ['-v', 'error'] + cmd[1:], check=True, capture_output=True)
+
+    probe = subprocess.run(['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+                            '-of', 'csv=p=0', str(output)], capture_output=True, text=True, check=True)
+    assert float(probe.stdout) == pytest.approx(1.5, abs=0.15)
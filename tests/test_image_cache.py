@@ -0,0 +1,116 @@
+"""scripts/shorts_pipeline/agents/image_cache.py - SQLite 캐시 조회/저장, TTL·LRU 정리, JSON 이전"""
+
+import json
+import os
+import time
+
+import pytest
+
+# scripts.shorts_pipeline.agents 패키지 import 시 에이전트들이 openai를 불러옴
+pytest.importorskip("openai")
+
+from scripts.shorts_pipeline.agents import image_cache as image_cache_module
+from scripts.shorts_pipeline.agents.image_cache import ImageCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(image_cache_module, "PROMPT_CACHE_FILE", str(tmp_path / "prompt_cache.json"))
+    monkeypatch.setattr(image_cache_module, "BLACKLIST_FILE", str(tmp_path / "blacklist.json"))
+    return tmp_path
+
+
+def _image(tmp_path, name="scene.png"):
+    path = tmp_path / "work" / name
+    path.parent.mkdir(exist_ok=True)
+    path.write_bytes(b"png")
+    return str(path)
+
+
+def test_save_and_hit_uses_cached_copy(cache_dir):
+    cache = ImageCache(str(cache_dir / "image_cache.db"))
+    assert cache.get_cached_prompt("논란", 2) is None
+
+    source = _image(cache_dir)
+    cache.save_successful_prompt("논란", 2, "studio background", source)
+    os.remove(source)  # 작업 폴더가 지워져도 캐시 사본으로 재사용
+
+    hit = cache.get_cached_prompt("논란", 2)
+    assert hit["prompt"] == "studio background"
+    assert hit["from_cache"] is True
+    assert os.path.dirname(hit["image_path"]) == cache.image_dir
+    assert os.path.exists(hit["image_path"])
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["cached_prompts"]) == (1, 1, 1)
+    assert stats["session_hit_rate"] == "50.0%"
+
+
+def test_missing_cached_image_is_a_miss_and_row_is_dropped(cache_dir):
+    cache = ImageCache(str(cache_dir / "image_cache.db"))
+    cache.save_successful_prompt("열애", 3, "sunset", _image(cache_dir))
+    os.remove(cache.get_cached_prompt("열애", 3)["image_path"])
+
+    assert cache.get_cached_prompt("열애", 3) is None
+    assert cache.get_stats()["cached_prompts"] == 0
+
+
+def test_evict_applies_ttl_and_lru_limit_and_removes_images(cache_dir):
+    cache = ImageCache(str(cache_dir / "image_cache.db"))
+    for scene in (2, 3, 4, 5):
+        cache.save_successful_prompt("컴백", scene, f"prompt {scene}", _image(cache_dir, f"{scene}.png"))
+    conn = cache._conn()
+    now = time.time()
+    for scene, age_days in ((2, 40), (3, 3), (4, 2), (5, 1)):
+        conn.execute("UPDATE prompts SET last_used = ? WHERE cache_key = ?",
+                     (now - age_days * 86400, f"컴백_scene{scene}"))
+    scene2_image = os.path.join(cache.image_dir, "컴백_scene2.png")
+    scene3_image = os.path.join(cache.image_dir, "컴백_scene3.png")
+
+    # TTL 초과(scene2) + 상한 2개 초과분 중 가장 오래된 것(scene3)
+    assert cache.evict(ttl_days=30, max_entries=2) == 2
+    keys = {row[0] for row in conn.execute("SELECT cache_key FROM prompts")}
+    assert keys == {"컴백_scene4", "컴백_scene5"}
+    assert not os.path.exists(scene2_image)
+    assert not os.path.exists(scene3_image)
+
+
+def test_hit_counters_are_flushed_in_batches(cache_dir, monkeypatch):
+    monkeypatch.setattr(image_cache_module, "_STATS_FLUSH_EVERY", 3)
+    cache = ImageCache(str(cache_dir / "image_cache.db"))
+
+    def _stored():
+        return {row["name"]: row["value"] for row in cache._conn().execute("SELECT name, value FROM stats")}
+
+    cache.get_cached_prompt("사건", 2)
+    cache.get_cached_prompt("사건", 3)
+    assert _stored().get("misses", 0) == 0
+    cache.get_cached_prompt("사건", 4)
+    assert _stored()["misses"] == 3
+
+
+def test_blacklist_matches_normalized_prompt(cache_dir):
+    cache = ImageCache(str(cache_dir / "image_cache.db"))
+    cache.add_to_blacklist("  Red Carpet  ", "safety")
+    cache.add_to_blacklist("red carpet", "duplicate")
+    assert cache.is_blacklisted("RED CARPET")
+    assert not cache.is_blacklisted("blue carpet")
+    assert cache.get_stats()["blacklisted"] == 1
+
+
+def test_json_store_is_migrated_once(cache_dir):
+    with open(image_cache_module.PROMPT_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump({
+            "prompts": {"성과_scene2": {"prompt": "award stage", "image_path": None, "success_count": 4,
+                                        "last_used": "2099-01-01T00:00:00"}},
+            "stats": {"hits": 7, "misses": 2},
+        }, f)
+    with open(image_cache_module.BLACKLIST_FILE, "w", encoding="utf-8") as f:
+        json.dump([{"hash": "abc", "prompt_preview": "bad", "reason": "x", "added_at": "2024-01-01"}], f)
+
+    cache = ImageCache(str(cache_dir / "image_cache.db"))
+    assert cache.get_cached_prompt("성과", 2)["prompt"] == "award stage"
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["blacklisted"]) == (8, 2, 1)
+    assert os.path.exists(image_cache_module.PROMPT_CACHE_FILE + ".migrated")
+    assert not os.path.exists(image_cache_module.BLACKLIST_FILE)
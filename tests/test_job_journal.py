@@ -0,0 +1,98 @@
+"""jobs/journal.py - append-only 저널 재생, 레거시 이관, 압축/TTL"""
+
+import json
+from datetime import datetime, timedelta
+
+from jobs.journal import JobJournal
+
+
+def _journal(tmp_path, **kwargs):
+    return JobJournal(str(tmp_path / 'jobs.jsonl'), legacy_path=str(tmp_path / 'jobs.json'), **kwargs)
+
+
+def test_replay_keeps_last_state_and_applies_deletes(tmp_path):
+    journal = _journal(tmp_path)
+    journal.put('a', {'status': 'pending'})
+    journal.put('b', {'status': 'pending'})
+    journal.put('a', {'status': 'processing', 'progress': 40})
+    journal.delete('b')
+
+    assert _journal(tmp_path).load() == {'a': {'status': 'processing', 'progress': 40}}
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    journal = _journal(tmp_path)
+    journal.put('a', {'status': 'completed'})
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"op": "put", "id": "b", "jo')
+
+    assert _journal(tmp_path).load() == {'a': {'status': 'completed'}}
+
+
+def test_legacy_json_is_migrated_once(tmp_path):
+    with open(tmp_path / 'jobs.json', 'w', encoding='utf-8') as f:
+        json.dump({'old': {'status': 'completed'}}, f)
+
+    assert _journal(tmp_path).load() == {'old': {'status': 'completed'}}
+    with open(tmp_path / 'jobs.jsonl', encoding='utf-8') as f:
+        assert json.loads(f.readline()) == {'op': 'put', 'id': 'old', 'job': {'status': 'completed'}}
+
+
+def test_get_reads_only_complete_appended_lines(tmp_path):
+    writer = _journal(tmp_path)
+    reader = _journal(tmp_path)
+    writer.put('a', {'status': 'pending'})
+    assert reader.get('a') == {'status': 'pending'}
+    assert reader.get('missing') is None
+
+    # 다른 프로세스가 쓰는 중인 줄(개행 전)은 다음 조회까지 반영하지 않음
+    line = json.dumps({'op': 'put', 'id': 'a', 'job': {'status': 'processing'}})
+    with open(writer.path, 'a', encoding='utf-8') as f:
+        f.write(line[:10])
+    assert reader.get('a') == {'status': 'pending'}
+    with open(writer.path, 'a', encoding='utf-8') as f:
+        f.write(line[10:] + '\n')
+    assert reader.get('a') == {'status': 'processing'}
+
+
+def test_get_replays_again_after_compaction_replaces_file(tmp_path):
+    writer = _journal(tmp_path)
+    reader = _journal(tmp_path)
+    jobs = {'a': {'status': 'processing'}, 'b': {'status': 'pending'}}
+    for job_id, job in jobs.items():
+        writer.put(job_id, job)
+    assert reader.get('b') == {'status': 'pending'}
+
+    writer.delete('b')
+    del jobs['b']
+    writer.compact(jobs)
+    assert reader.get('b') is None
+    assert reader.get('a') == {'status': 'processing'}
+
+
+def test_compaction_drops_expired_jobs_and_keeps_other_processes_jobs(tmp_path):
+    journal = _journal(tmp_path, ttl_hours=1)
+    other = _journal(tmp_path)
+    old = (datetime.now() - timedelta(hours=2)).isoformat()
+    jobs = {
+        'done-old': {'status': 'completed', 'completed_at': old},
+        'failed-old': {'status': 'failed', 'created_at': old},
+        'running-old': {'status': 'processing', 'created_at': old},
+        'done-new': {'status': 'completed', 'completed_at': datetime.now().isoformat()},
+    }
+    for job_id, job in jobs.items():
+        journal.put(job_id, job)
+    other.put('other-worker', {'status': 'pending'})
+
+    assert journal.compact(jobs) == 2
+    assert set(jobs) == {'running-old', 'done-new'}
+    assert set(_journal(tmp_path).load()) == {'running-old', 'done-new', 'other-worker'}
+
+
+def test_needs_compaction_counts_lines_against_live_jobs(tmp_path):
+    journal = _journal(tmp_path, compact_min_lines=10, compact_ratio=2)
+    for i in range(9):
+        journal.put('a', {'progress': i})
+    assert not journal.needs_compaction()
+    journal.put('a', {'progress': 10})
+    assert journal.needs_compaction()
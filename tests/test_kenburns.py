@@ -0,0 +1,71 @@
+"""video/kenburns.py - zoompan 식 변환과 필터 체인 생성"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from video.kenburns import (
+    KenBurnsMotion,
+    _frame_expr,
+    build_crop_motion_filter,
+    build_ken_burns_filter,
+    build_zoompan_filter,
+)
+
+ZOOM_IN = KenBurnsMotion(zoom="1.0+0.08*on/48", x="iw/2-(iw/zoom/2)", y="ih/2-(ih/zoom/2)", zoom_max=1.08)
+PAN_RIGHT = KenBurnsMotion(zoom="1.1", x="min(on*2,100)", y="ih/2-(ih/zoom/2)")
+
+
+def test_frame_expr_substitutes_zoom_input_size_and_frame_number():
+    assert _frame_expr("iw/2-(iw/zoom/2)+on", "Z", 640, 360) == "640/2-(640/(Z)/2)+n"
+    assert _frame_expr("in_h-ih/zoom", "1.1", 640, 360) == "360-360/(1.1)"
+    # 다른 식별자 안의 on/iw는 건드리지 않음
+    assert _frame_expr("iwx+bon", "Z", 640, 360) == "iwx+bon"
+
+
+def test_static_zoom_pans_over_prescaled_master_without_per_frame_scale():
+    assert PAN_RIGHT.is_static_zoom
+    vf = build_crop_motion_filter(PAN_RIGHT, 896, 504, 640, 360, fps=24)
+    assert vf == (
+        "scale=704:396:force_original_aspect_ratio=increase,crop=704:396,"
+        "loop=loop=-1:size=1,setpts=N/24/TB,fps=24,"
+        "crop=640:360:x='(min(n*2,100))*704/896':y='(504/2-(504/(clip(1.1,1,10))/2))*396/504',setsar=1"
+    )
+    assert "eval=frame" not in vf
+
+
+def test_changing_zoom_scales_master_per_frame_then_crops():
+    assert not ZOOM_IN.is_static_zoom
+    vf = build_crop_motion_filter(ZOOM_IN, 896, 504, 640, 360, fps=24)
+    frame_w = "2*trunc(640*clip(1.0+0.08*n/48,1,10)/2)"
+    assert vf.startswith("scale=690:388:force_original_aspect_ratio=increase,crop=690:388,loop=loop=-1:size=1,")
+    assert f"scale=w='{frame_w}':h='2*trunc(360*clip(1.0+0.08*n/48,1,10)/2)':eval=frame:flags=bilinear," in vf
+    assert f"x='(896/2-(896/(clip(1.0+0.08*n/48,1,10))/2))*({frame_w})/896'" in vf
+    assert vf.endswith(",setsar=1")
+
+
+def test_engine_switch_builds_legacy_zoompan_chain():
+    legacy = build_ken_burns_filter(ZOOM_IN, 896, 504, 640, 360, fps=24, duration=2.0, engine='zoompan')
+    assert legacy == build_zoompan_filter(ZOOM_IN, 896, 504, 640, 360, fps=24, duration=2.0)
+    assert legacy == (
+        "scale=896:504:force_original_aspect_ratio=increase,crop=896:504,"
+        "zoompan=z='1.0+0.08*on/48':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':d=48:s=640x360:fps=24"
+    )
+    assert build_ken_burns_filter(ZOOM_IN, 896, 504, 640, 360, fps=24, duration=2.0, engine='crop') == \
+        build_crop_motion_filter(ZOOM_IN, 896, 504, 640, 360, fps=24)
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None, reason="ffmpeg 없음")
+@pytest.mark.parametrize("motion", [ZOOM_IN, PAN_RIGHT], ids=["zoom_in", "pan_right"])
+def test_filter_chain_runs_in_ffmpeg(tmp_path, motion):
+    image = tmp_path / "image.png"
+    subprocess.run(["ffmpeg", "-y", "-v", "error", "-f", "lavfi", "-i", "testsrc=size=800x600",
+                    "-frames:v", "1", str(image)], check=True)
+    vf = build_ken_burns_filter(motion, 896, 504, 640, 360, fps=24, duration=0.5, engine='crop')
+    result = subprocess.run(
+        ["ffmpeg", "-v", "error", "-i", str(image), "-vf", vf, "-t", "0.5", "-f", "rawvideo",
+         "-pix_fmt", "gray", "-"],
+        capture_output=True, check=True,
+    )
+    assert len(result.stdout) == 12 * 640 * 360
@@ -0,0 +1,79 @@
+"""jobs/lease.py, jobs/workers.py - 프로세스 간 lease, fork 후 워커 시작"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from jobs.lease import FileLease
+from jobs.workers import BackgroundWorkers
+
+
+def test_lease_excludes_threads_and_records_holder(tmp_path):
+    lease = FileLease('pipeline', lock_dir=str(tmp_path))
+    assert lease.holder() is None
+    assert lease.acquire(blocking=False)
+    assert lease.locked()
+    assert lease.holder()['pid'] == os.getpid()
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(lease.acquire(blocking=False)))
+    thread.start()
+    thread.join()
+    assert results == [False]
+
+    lease.release()
+    assert not lease.locked()
+    assert lease.holder() is None
+
+
+def test_lease_blocking_timeout(tmp_path):
+    lease = FileLease('render-floor', lock_dir=str(tmp_path))
+    other = FileLease('render-floor', lock_dir=str(tmp_path))  # 다른 프로세스의 인스턴스 역할
+    with lease:
+        start = time.monotonic()
+        assert not other.acquire(timeout=0.3)
+        assert time.monotonic() - start >= 0.3
+    assert other.acquire(timeout=0.3)
+    other.release()
+
+
+def test_release_without_holding_raises(tmp_path):
+    with pytest.raises(RuntimeError):
+        FileLease('pipeline', lock_dir=str(tmp_path)).release()
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='fork 필요')
+def test_lease_excludes_other_processes(tmp_path):
+    lease = FileLease('pipeline', lock_dir=str(tmp_path))
+    assert lease.acquire(blocking=False)
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        child = FileLease('pipeline', lock_dir=str(tmp_path))
+        os.write(write_fd, b'1' if child.acquire(blocking=False) else b'0')
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b'0'
+    lease.release()
+
+
+def test_background_workers_start_once_per_process():
+    ran = threading.Event()
+    stop = threading.Event()
+
+    def target():
+        ran.set()
+        stop.wait(5)
+
+    workers = BackgroundWorkers()
+    workers.register('video_worker', target)
+    assert not workers.is_alive('video_worker')  # 등록만, 시작 안 함
+
+    assert workers.start() == 1
+    assert ran.wait(5) and workers.is_alive('video_worker')
+    assert workers.start() == 0
+    workers.ensure_started()
+    assert workers.stats()['workers'] == {'video_worker': True}
+    stop.set()
@@ -0,0 +1,81 @@
+"""video/media.py - data URL 청크 디코딩, spool, 로컬 경로 허용 루트 제한"""
+
+import base64
+import os
+
+import pytest
+
+from video import media
+from video.media import decode_data_url_to_file, fetch_media, spool_data_url_list, spool_data_urls
+
+
+@pytest.fixture
+def spool_root(tmp_path, monkeypatch):
+    root = tmp_path / 'uploads' / 'media_spool'
+    monkeypatch.setattr(media, 'MEDIA_SPOOL_DIR', str(root))
+    return root
+
+
+def _data_url(payload: bytes, mime='image/png') -> str:
+    return f"data:{mime};base64," + base64.b64encode(payload).decode('ascii')
+
+
+@pytest.mark.parametrize('size', [0, 1, 2, 3, media._B64_CHUNK, media._B64_CHUNK * 3 + 7])
+def test_decode_across_chunk_boundaries(tmp_path, size):
+    payload = bytes(i % 251 for i in range(size))
+    dest = tmp_path / 'out.bin'
+    assert decode_data_url_to_file(_data_url(payload), str(dest)) == size
+    assert dest.read_bytes() == payload
+
+
+def test_decode_whitespace_missing_padding_and_plain_data(tmp_path):
+    dest = tmp_path / 'out.bin'
+    encoded = base64.b64encode(b'hello world!!').decode('ascii').rstrip('=')
+    wrapped = '\n'.join(encoded[i:i + 5] for i in range(0, len(encoded), 5))
+    assert decode_data_url_to_file('data:text/plain;base64,' + wrapped, str(dest)) == 13
+    assert dest.read_bytes() == b'hello world!!'
+
+    assert decode_data_url_to_file('data:text/plain,a%20b', str(dest)) == 3
+    assert dest.read_bytes() == b'a b'
+
+    with pytest.raises(ValueError):
+        decode_data_url_to_file('data:image/png;base64', str(dest))
+
+
+def test_spool_replaces_data_urls_with_references(spool_root, tmp_path):
+    cuts = [
+        {'imageUrl': _data_url(b'png-bytes'), 'audioUrl': _data_url(b'mp3', 'audio/mpeg')},
+        {'imageUrl': 'https://example.com/a.png', 'audioUrl': None},
+    ]
+    job_dir = str(spool_root / 'job1')
+    assert spool_data_urls(cuts, ('imageUrl', 'audioUrl'), job_dir, prefix='cut') == 2
+    assert cuts[0] == {'imageUrl': 'spool://job1/cut_000_imageUrl.png',
+                       'audioUrl': 'spool://job1/cut_000_audioUrl.mp3'}
+    assert cuts[1]['imageUrl'] == 'https://example.com/a.png'
+
+    assert spool_data_url_list(['/static/a.png', _data_url(b'x', 'image/gif')], job_dir) == \
+        ['/static/a.png', 'spool://job1/item_001.bin']
+
+    dest = tmp_path / 'scene.png'
+    assert fetch_media(cuts[0]['imageUrl'], str(dest))
+    assert dest.read_bytes() == b'png-bytes'
+
+
+def test_local_paths_are_confined_to_allowed_roots(spool_root, tmp_path):
+    base = tmp_path / 'app'
+    (base / 'static').mkdir(parents=True)
+    (base / 'static' / 'logo.png').write_bytes(b'logo')
+    (base / 'secret.txt').write_text('secret')
+    (base / 'static' / 'link.txt').symlink_to(base / 'secret.txt')
+    spool_root.mkdir(parents=True)
+    (tmp_path / 'uploads' / 'outside.txt').write_text('outside')
+    dest = tmp_path / 'out.bin'
+
+    assert fetch_media('/static/logo.png', str(dest), base_dir=str(base))
+    assert dest.read_bytes() == b'logo'
+    assert fetch_media('static/logo.png', str(dest), base_dir=str(base))
+
+    for url in ('/static/../secret.txt', '/secret.txt', '/static/link.txt', 'file:///etc/passwd',
+                str(base / 'secret.txt'), 'spool://../outside.txt', '/static/missing.png'):
+        assert not fetch_media(url, str(dest), base_dir=str(base)), url
+    assert not os.path.exists(str(dest) + '.part')
@@ -0,0 +1,128 @@
+"""video/postprod.py - BGM 구간 계산과 후반 작업 filter_complex 생성"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from video.postprod import (
+    BgmTrack,
+    SfxCue,
+    VideoInfo,
+    bgm_track_filter,
+    build_post_production_command,
+    build_post_production_filter,
+    compute_bgm_segments,
+    scene_bgm_track,
+)
+
+INFO = VideoInfo(width=640, height=360, fps=24, duration=10.0)
+
+
+def test_compute_bgm_segments_splits_on_mood_changes():
+    scenes = [{'duration': 10}, {'duration': 5}, {'duration': 7}, {'duration': 3}]
+    changes = [{'scene': 1, 'mood': 'calm'}, {'scene': 3, 'mood': 'tense'}]
+    assert compute_bgm_segments(scenes, 'hopeful', changes) == [
+        {'mood': 'calm', 'start': 0.0, 'end': 15.0, 'duration': 15.0},
+        {'mood': 'tense', 'start': 15.0, 'end': 25.0, 'duration': 10.0},
+    ]
+    assert compute_bgm_segments(scenes, 'hopeful', []) == [
+        {'mood': 'hopeful', 'start': 0.0, 'end': 25.0, 'duration': 25.0},
+    ]
+
+
+def test_scene_bgm_track_keeps_staged_fade_timing():
+    long_track = scene_bgm_track('bgm.mp3', {'start': 15.0, 'duration': 10.0})
+    assert (long_track.fade_in, long_track.fade_out, long_track.fade_out_start) == (1.0, 1.0, 9.0)
+
+    # 5초보다 짧은 구간: 페이드 길이는 20%, 시작은 기존처럼 구간 끝 1초 전
+    short_track = scene_bgm_track('bgm.mp3', {'start': 0.0, 'duration': 3.0})
+    assert short_track.fade_out == pytest.approx(0.6)
+    assert short_track.fade_out_start == 2.0
+    assert "afade=t=out:st=2.000:d=0.600" in bgm_track_filter(short_track, 1, 'bgm0')
+
+    tiny = scene_bgm_track('bgm.mp3', {'start': 0.0, 'duration': 0.5})
+    assert tiny.fade_out_start == 0.0
+
+
+def test_bgm_track_filter_defaults_fade_to_track_end():
+    track = BgmTrack('bgm.mp3', start=2.5, duration=8.0, fade_in=2.0, fade_out=3.0, volume=0.1)
+    assert bgm_track_filter(track, 1, 'bgm0') == (
+        "[1:a]atrim=0:8.000,asetpts=PTS-STARTPTS,volume=0.1,"
+        "afade=t=in:st=0:d=2.000,afade=t=out:st=5.000:d=3.000,adelay=2500|2500[bgm0]"
+    )
+
+
+def test_filter_without_effects_passes_streams_through():
+    assert build_post_production_filter(INFO) == (
+        "[0:v]setsar=1,fps=24,format=yuv420p[vmain];"
+        "[0:a]aresample=44100,aformat=sample_fmts=fltp:channel_layouts=stereo[amain];"
+        "[vmain]null[vout];[amain]anull[aout]"
+    )
+
+
+def test_filter_numbers_inputs_in_bgm_sfx_outro_order():
+    vf = build_post_production_filter(
+        INFO,
+        subtitle_filter="ass=subs.ass",
+        bgm_tracks=[BgmTrack('a.mp3', 0, 5, 1, 1), BgmTrack('b.mp3', 5, 5, 1, 1)],
+        sfx_cues=[SfxCue('s.mp3', start=1.25)],
+        has_outro=True,
+    )
+    lines = vf.split(';')
+    assert lines[0] == "[0:v]ass=subs.ass,setsar=1,fps=24,format=yuv420p[vmain]"
+    assert lines[1].startswith("[1:a]") and lines[1].endswith("[bgm0]")
+    assert lines[2].startswith("[2:a]") and lines[2].endswith("[bgm1]")
+    assert lines[3] == ("[3:a]atrim=0:2.5,asetpts=PTS-STARTPTS,afade=t=out:st=2.0:d=0.5,"
+                        "adelay=1250|1250,volume=0.8[sfx0]")
+    assert lines[4].startswith("[0:a][bgm0][bgm1][sfx0]amix=inputs=4:duration=first:")
+    assert "normalize=0" in lines[4]
+    assert lines[5].startswith("[4:v]scale=640:360:force_original_aspect_ratio=decrease,pad=640:360:")
+    assert lines[6].startswith("[4:a]")
+    assert lines[7] == "[vmain][amain][voutro][aoutro]concat=n=2:v=1:a=1[vout][aout]"
+
+
+def test_command_loops_bgm_inputs_and_ends_with_output_path():
+    cmd = build_post_production_command(
+        'merged.mp4', 'final.mp4', INFO,
+        bgm_tracks=[BgmTrack('bgm.mp3', 0, 10, 1, 1)],
+        sfx_cues=[SfxCue('sfx.mp3', 3.0)],
+        outro_path='outro.mp4',
+    )
+    assert cmd[:2] == ['ffmpeg', '-y']
+    assert cmd[2:12] == ['-i', 'merged.mp4', '-stream_loop', '-1', '-i', 'bgm.mp3',
+                         '-i', 'sfx.mp3', '-i', 'outro.mp4']
+    assert cmd[cmd.index('-map') + 1] == '[vout]'
+    assert cmd[-1] == 'final.mp4'
+
+
+@pytest.mark.skipif(shutil.which('ffmpeg') is None or shutil.which('ffprobe') is None, reason="ffmpeg 없음")
+def test_graph_runs_in_ffmpeg(tmp_path):
+    merged = tmp_path / 'merged.mp4'
+    bgm = tmp_path / 'bgm.wav'
+    outro = tmp_path / 'outro.mp4'
+    _ffmpeg('-f', 'lavfi', '-i', 'testsrc=size=640x360:rate=24', '-f', 'lavfi', '-i', 'sine=frequency=440',
+            '-t', '2', '-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p', '-c:a', 'aac',
+            str(merged))
+    _ffmpeg('-f', 'lavfi', '-i', 'sine=frequency=220', '-t', '1', str(bgm))
+    _ffmpeg('-f', 'lavfi', '-i', 'testsrc=size=320x240:rate=30', '-f', 'lavfi', '-i', 'sine=frequency=880',
+            '-t', '1', '-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p', '-c:a', 'aac',
+            str(outro))
+
+    output = tmp_path / 'final.mp4'
+    cmd = build_post_production_command(
+        str(merged), str(output), VideoInfo(640, 360, 24, 2.0),
+        bgm_tracks=[scene_bgm_track(str(bgm), {'start': 0.0, 'duration': 2.0})],
+        sfx_cues=[SfxCue(str(bgm), 0.5)],
+        outro_path=str(outro),
+        video_args=['-c:v', 'libx264', '-preset', 'ultrafast', '-pix_fmt', 'yuv420p'],
+    )
+    subprocess.run(cmd[:1] + ['-v', 'error'] + cmd[1:], check=True, capture_output=True)
+
+    probe = subprocess.run(['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+                            '-of', 'csv=p=0', str(output)], capture_output=True, text=True, check=True)
+    assert float(probe.stdout) == pytest.approx(3.0, abs=0.2)
+
+
+def _ffmpeg(*args):
+    subprocess.run(['ffmpeg', '-y', '-v', 'error', *args], check=True, capture_output=True)
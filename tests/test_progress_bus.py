@@ -0,0 +1,88 @@
+"""jobs/progress.py - 버전 대기, 채널 정리, SSE 스트림(폴백/하트비트)"""
+
+import json
+import threading
+
+from jobs.progress import ProgressBus
+
+
+def _events(chunks):
+    return [json.loads(c.split('data: ', 1)[1]) for c in chunks if c.startswith('id: ')]
+
+
+def test_publish_bumps_version_and_get_returns_copy():
+    bus = ProgressBus()
+    assert bus.get('a') == (0, None)
+    assert bus.publish('a', {'status': 'processing', 'progress': 10}) == 1
+    assert bus.publish('a', {'status': 'processing', 'progress': 20}) == 2
+
+    version, state = bus.get('a')
+    state['progress'] = 99
+    assert version == 2
+    assert bus.get('a') == (2, {'status': 'processing', 'progress': 20})
+
+
+def test_wait_returns_immediately_for_newer_version_or_terminal_state():
+    bus = ProgressBus()
+    bus.publish('a', {'status': 'processing'})
+    assert bus.wait('a', since=0, timeout=5) == (1, {'status': 'processing'})
+
+    bus.publish('b', {'status': 'completed'})
+    assert bus.wait('b', since=1, timeout=5) == (1, {'status': 'completed'})
+
+
+def test_wait_wakes_on_publish_from_other_thread():
+    bus = ProgressBus()
+    bus.publish('a', {'status': 'processing', 'progress': 0})
+    timer = threading.Timer(0.05, bus.publish, args=('a', {'status': 'processing', 'progress': 50}))
+    timer.start()
+    try:
+        assert bus.wait('a', since=1, timeout=5) == (2, {'status': 'processing', 'progress': 50})
+    finally:
+        timer.cancel()
+
+
+def test_wait_timeout_on_unknown_job_does_not_leave_channel():
+    bus = ProgressBus()
+    assert bus.wait('missing', since=0, timeout=0.01) == (0, None)
+    assert bus.stats() == {'channels': 0, 'waiters': 0}
+
+
+def test_prune_drops_finished_jobs_over_capacity_first():
+    bus = ProgressBus(max_jobs=2)
+    bus.publish('done-old', {'status': 'completed'})
+    bus.publish('running', {'status': 'processing'})
+    bus.publish('done-new', {'status': 'failed'})
+
+    assert bus.get('done-old') == (0, None)
+    assert bus.get('running')[0] == 1
+    assert bus.get('done-new')[0] == 1
+
+
+def test_stream_sends_initial_terminal_state_and_stops():
+    bus = ProgressBus()
+    chunks = list(bus.stream('a', initial={'status': 'completed', 'progress': 100}))
+    assert _events(chunks) == [{'status': 'completed', 'progress': 100, 'version': 0}]
+
+
+def test_stream_falls_back_to_store_when_bus_is_silent():
+    bus = ProgressBus()
+    states = iter([
+        {'status': 'processing', 'progress': 0},
+        {'status': 'processing', 'progress': 50},
+        {'status': 'completed', 'progress': 100},
+    ])
+    chunks = list(bus.stream('a', initial={'status': 'processing', 'progress': 0},
+                             heartbeat=60, max_seconds=5, fallback=lambda: next(states),
+                             poll_interval=0.01))
+
+    # 같은 상태는 다시 보내지 않고, 종료 상태를 보내면 스트림 종료
+    assert [e['progress'] for e in _events(chunks)] == [0, 50, 100]
+    assert not any(c.startswith(':') for c in chunks)
+
+
+def test_stream_emits_heartbeat_without_changes():
+    bus = ProgressBus()
+    chunks = list(bus.stream('a', initial={'status': 'processing'}, heartbeat=0.01, max_seconds=0.1))
+    assert _events(chunks) == [{'status': 'processing', 'version': 0}]
+    assert ': heartbeat\n\n' in chunks
@@ -0,0 +1,72 @@
+"""scripts/common/rate_limit.py, scripts/common/audio_utils.py - 토큰 버킷, MP3 헤더 길이 계산"""
+
+from scripts.common.audio_utils import get_mp3_duration, mp3_duration_from_bytes
+from scripts.common.rate_limit import RateLimiter, get_rate_limiter
+
+# MPEG1 Layer III, 128kbps, 44.1kHz, 패딩 없음 → 프레임 417바이트, 1152샘플
+_CBR_FRAME = bytes([0xFF, 0xFB, 0x90, 0x00]) + bytes(413)
+
+
+class _FrozenClock:
+    """rate_limit 모듈의 time 대체 - sleep은 기록만 하고 시간은 직접 진행"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+def test_burst_is_free_then_requests_are_spaced_by_rate(monkeypatch):
+    clock = _FrozenClock()
+    monkeypatch.setattr('scripts.common.rate_limit.time', clock)
+    limiter = RateLimiter(rate=20, burst=2)
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.0
+    assert abs(limiter.acquire() - 0.05) < 1e-9
+    assert len(clock.sleeps) == 1 and abs(clock.sleeps[0] - 0.05) < 1e-9
+
+
+def test_waiting_callers_reserve_tokens_in_order(monkeypatch):
+    clock = _FrozenClock()
+    monkeypatch.setattr('scripts.common.rate_limit.time', clock)
+    limiter = RateLimiter(rate=50, burst=1)
+    # 동시에 들어온 호출은 토큰을 먼저 예약하므로 1/rate 간격으로 대기
+    assert [round(limiter.acquire(), 6) for _ in range(4)] == [0.0, 0.02, 0.04, 0.06]
+
+    # 시간이 흐르면 그만큼 토큰이 채워짐 (burst 상한)
+    clock.now += 10
+    assert limiter.acquire() == 0.0
+    assert round(limiter.acquire(), 6) == 0.02
+
+
+def test_try_acquire_and_unlimited_rate():
+    limiter = RateLimiter(rate=1, burst=1)
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    unlimited = RateLimiter(rate=0)
+    assert all(unlimited.acquire() == 0.0 for _ in range(100))
+    assert unlimited.try_acquire()
+
+
+def test_named_limiters_are_shared():
+    first = get_rate_limiter('test-shared-api', rate=5)
+    assert get_rate_limiter('test-shared-api', rate=100) is first
+    assert first.rate == 5
+
+
+def test_cbr_mp3_duration_from_frame_headers(tmp_path):
+    data = _CBR_FRAME * 100
+    assert abs(mp3_duration_from_bytes(data) - 100 * 1152 / 44100) < 1e-9
+
+    path = tmp_path / 'chunk.mp3'
+    path.write_bytes(b'ID3\x03\x00\x00\x00\x00\x00\x0a' + bytes(10) + _CBR_FRAME * 50)
+    assert abs(get_mp3_duration(str(path)) - 50 * 1152 / 44100) < 1e-9
+
+
+def test_non_mp3_returns_none():
+    assert mp3_duration_from_bytes(b'not audio at all') is None
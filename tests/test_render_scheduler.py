@@ -0,0 +1,125 @@
+"""video/scheduler.py - 메모리 기반 입장 제어"""
+
+import threading
+import time
+
+from video.scheduler import RenderScheduler, estimate_ffmpeg_memory_mb
+
+
+class _FakeLease:
+    def __init__(self, free=True):
+        self.free = free
+        self.acquired = 0
+        self.released = 0
+
+    def acquire(self, blocking=True):
+        if not self.free:
+            return False
+        self.free = False
+        self.acquired += 1
+        return True
+
+    def release(self):
+        self.free = True
+        self.released += 1
+
+
+def test_memory_estimate_grows_with_resolution_preset_and_scale():
+    small = estimate_ffmpeg_memory_mb(854, 480)
+    assert estimate_ffmpeg_memory_mb(1920, 1080) > small
+    assert estimate_ffmpeg_memory_mb(854, 480, preset='medium') > small
+    assert estimate_ffmpeg_memory_mb(854, 480, scale=1.4) > small
+    assert estimate_ffmpeg_memory_mb(854, 480, duration=600) > small
+
+
+def test_admits_while_memory_allows_and_counts_reservations():
+    scheduler = RenderScheduler(max_parallel=4, reserve_mb=100, memory_probe=lambda: 1000)
+    with scheduler.admit(400):
+        assert scheduler._try_admit(400) == (True, False)     # 1000 - 400 >= 400 + 100
+        with scheduler.admit(400):
+            assert scheduler._try_admit(400) == (False, False)  # 1000 - 800 < 500
+            assert scheduler.stats()['reservedMB'] == 800
+    stats = scheduler.stats()
+    assert (stats['inFlight'], stats['reservedMB'], stats['completed']) == (0, 0, 2)
+
+
+def test_max_parallel_caps_admission_even_with_free_memory():
+    scheduler = RenderScheduler(max_parallel=1, memory_probe=lambda: 100000)
+    with scheduler.admit(10):
+        assert scheduler._try_admit(10) == (False, False)
+
+
+def test_first_job_is_admitted_without_memory_when_idle():
+    scheduler = RenderScheduler(max_parallel=2, memory_probe=lambda: 0)
+    with scheduler.admit(5000):
+        assert scheduler.stats()['inFlight'] == 1
+
+
+def test_floor_lease_limits_the_unconditional_admission():
+    lease = _FakeLease()
+    scheduler = RenderScheduler(max_parallel=2, memory_probe=lambda: 0, floor_lease=lease)
+    with scheduler.admit(5000):
+        assert lease.acquired == 1 and not lease.free
+    assert lease.released == 1
+
+    # 다른 프로세스가 floor를 잡고 있으면 메모리가 풀릴 때까지 입장하지 않음
+    lease.free = False
+    assert scheduler._try_admit(5000) == (False, False)
+
+
+def test_floor_lease_not_used_when_memory_is_available():
+    lease = _FakeLease(free=False)
+    scheduler = RenderScheduler(max_parallel=2, memory_probe=lambda: 10000, floor_lease=lease)
+    with scheduler.admit(500):
+        pass
+    assert lease.acquired == 0
+
+
+def test_waiting_job_enters_after_running_job_finishes():
+    scheduler = RenderScheduler(max_parallel=1, memory_probe=lambda: None)
+    order = []
+    release = threading.Event()
+
+    def first():
+        with scheduler.admit(100, label='first'):
+            order.append('first')
+            release.wait(5)
+
+    def second():
+        with scheduler.admit(100, label='second'):
+            order.append('second')
+
+    t1 = threading.Thread(target=first)
+    t1.start()
+    while not order:
+        time.sleep(0.01)
+    t2 = threading.Thread(target=second)
+    t2.start()
+    time.sleep(0.1)
+    assert order == ['first'] and scheduler.stats()['queueDepth'] == 1
+    release.set()
+    t1.join(5)
+    t2.join(5)
+    assert order == ['first', 'second']
+
+
+def test_fits_and_parallelism_for():
+    scheduler = RenderScheduler(max_parallel=8, reserve_mb=100, memory_probe=lambda: 1100)
+    assert scheduler.fits(1000)
+    assert not scheduler.fits(1001)
+    assert scheduler.parallelism_for(250) == 4
+    assert RenderScheduler(max_parallel=3, memory_probe=lambda: None).parallelism_for(250) == 3
+    assert not RenderScheduler(memory_probe=lambda: None).fits(1)
+
+
+def test_run_all_returns_every_result_and_error():
+    scheduler = RenderScheduler(max_parallel=2, memory_probe=lambda: None)
+
+    def work(x):
+        if x == 3:
+            raise ValueError('bad')
+        return x * 2
+
+    results = {i: (r, e) for i, r, e in scheduler.run_all(work, [1, 2, 3], [10, 10, 10])}
+    assert results[0] == (2, None) and results[1] == (4, None)
+    assert results[2][0] is None and isinstance(results[2][1], ValueError)
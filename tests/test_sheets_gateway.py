@@ -0,0 +1,128 @@
+"""scripts/common/sheets_gateway.py - batchGet 매핑, 셀 쓰기 모으기, 재시도"""
+
+import pytest
+
+from scripts.common import sheets_gateway
+from scripts.common.sheets_gateway import SheetsGateway, execute_with_retry
+
+
+class _Request:
+    def __init__(self, fn):
+        self._fn = fn
+
+    def execute(self):
+        return self._fn()
+
+
+class _FakeValues:
+    def __init__(self):
+        self.calls = []
+        self.get_result = {'valueRanges': []}
+        self.update_error = None
+
+    def batchGet(self, spreadsheetId, ranges):
+        self.calls.append(('batchGet', spreadsheetId, list(ranges)))
+        return _Request(lambda: self.get_result)
+
+    def batchUpdate(self, spreadsheetId, body):
+        self.calls.append(('batchUpdate', spreadsheetId, body))
+
+        def _run():
+            if self.update_error is not None:
+                raise self.update_error
+            return {}
+        return _Request(_run)
+
+
+class _FakeService:
+    def __init__(self):
+        self.values_api = _FakeValues()
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self.values_api
+
+
+class _NoLimit:
+    def acquire(self):
+        return 0.0
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    monkeypatch.setattr(sheets_gateway, 'get_rate_limiter', lambda name, rate: _NoLimit())
+    return SheetsGateway(_FakeService(), 'sheet-1')
+
+
+def test_batch_get_maps_value_ranges_in_request_order(gateway):
+    gateway.service.values_api.get_result = {'valueRanges': [
+        {'range': "'A'!A1:AZ3", 'values': [['h1'], ['v1']]},
+        {'range': "'B'!A1:AZ1"},
+    ]}
+    ranges = ["'A'!A:AZ", "'B'!A:AZ", "'C'!A:AZ"]
+
+    assert gateway.batch_get(ranges) == {"'A'!A:AZ": [['h1'], ['v1']], "'B'!A:AZ": [], "'C'!A:AZ": []}
+    assert gateway.service.values_api.calls == [('batchGet', 'sheet-1', ranges)]
+    assert gateway.batch_get([]) == {}
+
+
+def test_updates_are_coalesced_into_one_batch_update(gateway):
+    col_map = {'상태': {'letter': 'B'}, '작업시간': {'letter': 'F'}}
+    gateway.update_by_header('시트1', 5, col_map, '상태', '처리중')
+    gateway.update_by_header('시트1', 5, col_map, '작업시간', '2024-01-01 00:00')
+    gateway.update_by_header('시트1', 5, col_map, '상태', '완료')
+    assert gateway.update_by_header('시트1', 5, col_map, '없는헤더', 'x') is False
+    gateway.update("'시트1'!A2:C2", ['a', 'b', 'c'])
+    assert gateway.pending_count == 3
+
+    assert gateway.flush() is True
+    (_, sheet_id, body), = gateway.service.values_api.calls
+    assert sheet_id == 'sheet-1'
+    assert body == {'valueInputOption': 'RAW', 'data': [
+        {'range': "'시트1'!B5", 'values': [['완료']]},
+        {'range': "'시트1'!F5", 'values': [['2024-01-01 00:00']]},
+        {'range': "'시트1'!A2:C2", 'values': [['a', 'b', 'c']]},
+    ]}
+    assert gateway.pending_count == 0
+    # 보낼 것이 없으면 API를 부르지 않음
+    assert gateway.flush() is True
+    assert len(gateway.service.values_api.calls) == 1
+
+
+def test_failed_flush_keeps_pending_updates(gateway):
+    gateway.service.values_api.update_error = ValueError('invalid range')
+    gateway.update("'시트1'!A1", 1)
+    assert gateway.flush() is False
+    assert gateway.pending_count == 1
+
+    gateway.service.values_api.update_error = None
+    assert gateway.flush() is True
+    assert gateway.pending_count == 0
+
+
+def test_execute_with_retry_retries_transient_errors_only(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(sheets_gateway.time, 'sleep', sleeps.append)
+
+    attempts = iter([RuntimeError('503 Service Unavailable'), RuntimeError('backend error'), 'ok'])
+
+    def _flaky():
+        result = next(attempts)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert execute_with_retry(_flaky, 'test') == 'ok'
+    assert sleeps == [2, 4]
+
+    calls = []
+
+    def _bad_request():
+        calls.append(1)
+        raise ValueError('invalid argument')
+
+    with pytest.raises(ValueError):
+        execute_with_retry(_bad_request, 'test')
+    assert len(calls) == 1
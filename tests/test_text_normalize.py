@@ -0,0 +1,69 @@
+"""scripts/common/text_normalize.py - 기존(요청마다 정규식을 만들던) 구현과 같은 결과인지 고정"""
+
+import pytest
+
+from scripts.common.text_normalize import (
+    convert_numbers_to_korean,
+    korean_numbers_to_arabic,
+    normalize_subtitle_batch,
+    normalize_tts_batch,
+    num_to_native,
+    num_to_sino,
+)
+
+# (입력, 기존 구현 출력)
+TTS_NUMBER_CASES = [
+    # 붙어 있는 수량 단위: 앞 단위 변환 결과가 "개사" 단위를 만듦 (기존 규칙 순서)
+    ('12개4개월', '십이개사개월'),
+    ('3학년14개42개국', '삼학년십사개사십이개국'),
+    ('60265명7관8개44개월', '육만이백육십오명칠관팔개사십사개월'),
+    ('28051호실111길12개47385개월', '이만팔천오십일호실백십일길십이개사만칠천삼백팔십오개월'),
+    ('3개월 동안 15번', '삼개월 동안 열다섯번'),
+    ('5개국 11개월', '오개국 십일개월'),
+    ('요한복음 3장 16절', '요한복음 삼장 십육절'),
+    ('제1장에서', '제일장에서'),
+    ('1,234,567원', '백이십삼만사천오백육십칠원'),
+    ('3억5만원', '삼억오만원'),
+    ('0.75%', '영점칠오퍼센트'),
+    ('7~8만 명', '7 팔만 명'),
+    ('오후 3:30', '오후 세시 반'),
+    ('3:2', '삼 대 이'),
+    ('010-1234-5678', '공 일 공 일 이 삼 사 오 육 칠 팔'),
+    ('2025-12-23', '이천이십오년 십이월 이십삼일'),
+    ('①번', '일번'),
+]
+
+SUBTITLE_CASES = [
+    ('일흔여섯 살', '76살'),
+    ('사십칠 년', '47년'),
+    ('오십 만 원', '50만원'),
+    ('일일구', '119'),
+    ('사십사십삼십', '404310'),
+    ('스물 두 명', '20 2명'),
+    ('세 개', '3개'),
+    ('십오 분', '15분'),
+]
+
+
+@pytest.mark.parametrize('text, expected', TTS_NUMBER_CASES)
+def test_convert_numbers_to_korean_matches_baseline(text, expected):
+    assert convert_numbers_to_korean(text) == expected
+
+
+@pytest.mark.parametrize('text, expected', SUBTITLE_CASES)
+def test_korean_numbers_to_arabic_matches_baseline(text, expected):
+    assert korean_numbers_to_arabic(text) == expected
+
+
+def test_num_readings():
+    assert num_to_native(15) == '열다섯'
+    assert num_to_native(100) == '100'
+    assert num_to_sino(10000) == '만'
+    assert num_to_sino(120000305) == '일억이천만삼백오'
+    assert num_to_sino(-3) == '마이너스 삼'
+
+
+def test_batch_api_keeps_order():
+    texts = ['CEO 3.5% 올렸다.', '15번']
+    assert normalize_tts_batch(texts) == ['씨이오 삼점오퍼센트 올렸다', '열다섯번']
+    assert normalize_subtitle_batch(['일흔여섯 살', '세 개']) == ['76살', '3개']
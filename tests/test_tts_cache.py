@@ -0,0 +1,68 @@
+"""scripts/common/tts_cache.py - 키 구성, 조회/저장, LRU 제거, 용량/항목 수 카운터"""
+
+import os
+
+from scripts.common.tts_cache import TTSAudioCache
+
+
+def test_key_depends_on_text_voice_rate_engine_and_params(tmp_path):
+    cache = TTSAudioCache(str(tmp_path))
+    base = cache.make_key('chirp3', '안녕하세요', 'ko-KR-Chirp3-HD-Charon', 1.0, language='ko-KR')
+    assert base == cache.make_key('chirp3', '안녕하세요', 'ko-KR-Chirp3-HD-Charon', 1.00001, language='ko-KR')
+    assert base != cache.make_key('gemini', '안녕하세요', 'ko-KR-Chirp3-HD-Charon', 1.0, language='ko-KR')
+    assert base != cache.make_key('chirp3', '안녕히 가세요', 'ko-KR-Chirp3-HD-Charon', 1.0, language='ko-KR')
+    assert base != cache.make_key('chirp3', '안녕하세요', 'ko-KR-Chirp3-HD-Kore', 1.0, language='ko-KR')
+    assert base != cache.make_key('chirp3', '안녕하세요', 'ko-KR-Chirp3-HD-Charon', 1.2, language='ko-KR')
+    assert base != cache.make_key('chirp3', '안녕하세요', 'ko-KR-Chirp3-HD-Charon', 1.0, language='en-US')
+
+
+def test_put_get_and_fetch(tmp_path):
+    cache = TTSAudioCache(str(tmp_path / 'cache'))
+    key = cache.make_key('google', '문장', 'voice', 1.0)
+    assert cache.get(key) is None
+    assert cache.put(key, b'mp3-bytes', 2.5)
+
+    data, meta = cache.get(key)
+    assert data == b'mp3-bytes'
+    assert (meta['duration'], meta['format']) == (2.5, 'mp3')
+
+    dest = str(tmp_path / 'out' / 'chunk.mp3')
+    assert cache.fetch(key, dest)['duration'] == 2.5
+    with open(dest, 'rb') as f:
+        assert f.read() == b'mp3-bytes'
+
+
+def test_disabled_cache_never_hits(tmp_path):
+    cache = TTSAudioCache(str(tmp_path), enabled=False)
+    key = cache.make_key('google', '문장', 'voice')
+    assert not cache.put(key, b'data', 1.0)
+    assert cache.get(key) is None
+    assert not os.listdir(tmp_path)
+
+
+def test_evicts_least_recently_used_and_keeps_counters(tmp_path):
+    cache = TTSAudioCache(str(tmp_path / 'cache'), max_bytes=250)
+    keys = [cache.make_key('google', f'문장 {i}', 'voice') for i in range(3)]
+    cache.put(keys[0], b'a' * 100, 1.0)
+    os.utime(cache._paths(keys[0])[0], (1, 1))  # 가장 오래 사용하지 않은 항목
+    cache.put(keys[1], b'b' * 100, 1.0)
+    cache.put(keys[1], b'b' * 100, 1.0)         # 같은 키 덮어쓰기는 항목 수를 늘리지 않음
+    assert cache.stats()['entries'] == 2
+
+    cache.put(keys[2], b'c' * 100, 1.0)
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) and cache.get(keys[2])
+    stats = cache.stats()
+    assert stats['entries'] == 2
+    assert stats['size_mb'] == round(200 / (1024 * 1024), 2)
+
+
+def test_counters_are_initialized_from_disk(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    first = TTSAudioCache(cache_dir)
+    for i in range(3):
+        first.put(first.make_key('google', f'문장 {i}', 'voice'), b'x' * 1024 * 1024, 1.0)
+
+    restarted = TTSAudioCache(cache_dir)
+    assert restarted.stats()['entries'] == 3
+    assert restarted.stats()['size_mb'] == 3.0
@@ -0,0 +1,140 @@
+"""scripts/common/youtube_upload.py - 청크 크기 조절, 세션 상태 파일, 세션 조회"""
+
+import json
+import os
+import time
+
+import pytest
+
+from scripts.common import youtube_upload
+from scripts.common.youtube_upload import (
+    _CHUNK_ALIGN,
+    _MIN_CHUNK,
+    _align_chunk,
+    _is_retryable,
+    _query_session,
+    upload_job_key,
+)
+
+MB = 1024 * 1024
+
+
+def test_align_chunk_clamps_and_rounds_down_to_256kb():
+    assert _align_chunk(0) == _MIN_CHUNK
+    assert _align_chunk(10 * MB + 1000) == 10 * MB
+    assert _align_chunk(10 * MB + _CHUNK_ALIGN - 1) == 10 * MB
+    assert _align_chunk(10 ** 12) == youtube_upload.YOUTUBE_UPLOAD_MAX_CHUNK_MB * MB
+    assert _align_chunk(3.7 * MB) % _CHUNK_ALIGN == 0
+
+
+def test_adaptive_chunk_follows_throughput_within_double_or_half(tmp_path, monkeypatch):
+    pytest.importorskip('googleapiclient')
+    monkeypatch.setattr(youtube_upload, 'YOUTUBE_UPLOAD_CHUNK_SECONDS', 20.0)
+    video = tmp_path / 'video.mp4'
+    video.write_bytes(b'\0' * 1024)
+    media = youtube_upload._adaptive_media_class()(str(video), 'video/mp4', 8 * MB)
+    assert media.chunksize() == 8 * MB
+
+    # 8MB를 10초에 보냄 → 목표 16MB (2배 한도 안)
+    media.adapt(8 * MB, 10.0)
+    assert media.chunksize() == 16 * MB
+    # 아주 빠른 회선이어도 한 번에 2배까지만
+    media.adapt(16 * MB, 0.1)
+    assert media.chunksize() == 32 * MB
+    # 아주 느려도 한 번에 절반까지만
+    media.adapt(32 * MB, 1000.0)
+    assert media.chunksize() == 16 * MB
+    # 측정값이 없으면 그대로
+    media.adapt(0, 5.0)
+    assert media.chunksize() == 16 * MB
+
+    media.shrink()
+    assert media.chunksize() == 8 * MB
+    for _ in range(10):
+        media.shrink()
+    assert media.chunksize() == _MIN_CHUNK
+
+
+def test_upload_job_key_depends_on_scope_body_and_file(tmp_path):
+    video = tmp_path / 'video.mp4'
+    video.write_bytes(b'a' * 100)
+    body = {'snippet': {'title': '제목'}}
+
+    key = upload_job_key(str(video), body, scope='ch1|p1')
+    assert key == upload_job_key(str(video), dict(body), scope='ch1|p1')
+    assert len(key) == 32
+    assert key != upload_job_key(str(video), body, scope='ch2|p1')
+    assert key != upload_job_key(str(video), {'snippet': {'title': '다른 제목'}}, scope='ch1|p1')
+
+    video.write_bytes(b'b' * 101)
+    assert key != upload_job_key(str(video), body, scope='ch1|p1')
+
+
+def test_state_roundtrip_clear_and_prune(tmp_path, monkeypatch):
+    monkeypatch.setattr(youtube_upload, 'YOUTUBE_UPLOAD_STATE_DIR', str(tmp_path / 'sessions'))
+    assert youtube_upload._load_state('k1') is None
+
+    state = {'session_uri': 'https://upload.example/session', 'size': 1000, 'created_at': time.time()}
+    youtube_upload._save_state('k1', state)
+    assert youtube_upload._load_state('k1') == state
+    assert os.listdir(tmp_path / 'sessions') == ['k1.json']
+
+    youtube_upload._clear_state('k1')
+    assert youtube_upload._load_state('k1') is None
+
+    # 깨진 파일은 새 업로드로 처리
+    (tmp_path / 'sessions' / 'bad.json').write_text('{"session_uri": ')
+    assert youtube_upload._load_state('bad') is None
+
+    youtube_upload._save_state('old', state)
+    youtube_upload._save_state('new', state)
+    stale = time.time() - youtube_upload._SESSION_TTL - 60
+    os.utime(tmp_path / 'sessions' / 'old.json', (stale, stale))
+    youtube_upload._prune_stale_states()
+    assert youtube_upload._load_state('old') is None
+    assert youtube_upload._load_state('new') == state
+
+
+class _Resp(dict):
+    def __init__(self, status, headers=None):
+        super().__init__(headers or {})
+        self.status = status
+
+
+class _FakeHttp:
+    def __init__(self, resp, content=b''):
+        self.resp = resp
+        self.content = content
+        self.requests = []
+
+    def request(self, uri, method, headers=None):
+        self.requests.append((uri, method, headers))
+        return self.resp, self.content
+
+
+def test_query_session_parses_offset_completion_and_expiry():
+    http = _FakeHttp(_Resp(308, {'range': 'bytes=0-5242879'}))
+    assert _query_session(http, 'https://upload.example/s', 10 * MB) == (5 * MB, None)
+    assert http.requests == [('https://upload.example/s', 'PUT',
+                              {'Content-Range': f'bytes */{10 * MB}', 'Content-Length': '0'})]
+
+    # 308인데 Range가 없으면 아직 한 바이트도 받지 않은 세션
+    assert _query_session(_FakeHttp(_Resp(308)), 'u', 10) == (0, None)
+
+    done = _FakeHttp(_Resp(200), json.dumps({'id': 'abc123'}).encode('utf-8'))
+    assert _query_session(done, 'u', 10) == (None, {'id': 'abc123'})
+
+    assert _query_session(_FakeHttp(_Resp(404)), 'u', 10) == (None, None)
+
+
+def test_is_retryable():
+    class _HttpError(Exception):
+        def __init__(self, status):
+            super().__init__(f'HTTP {status}')
+            self.resp = _Resp(status)
+
+    assert _is_retryable(_HttpError(503))
+    assert not _is_retryable(_HttpError(403))
+    assert _is_retryable(ConnectionResetError())
+    assert _is_retryable(RuntimeError('The read operation timed out'))
+    assert not _is_retryable(ValueError('bad metadata'))
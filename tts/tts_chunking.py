@@ -14,6 +14,15 @@ from typing import List, Dict
 # Google TTS 바이트 제한 (5000) 보다 여유있게 설정
 MAX_BYTES = 4800
 
+# 전처리/분할 정규식 (모듈 로드 시 한 번만 컴파일)
+_DECIMAL_RE = re.compile(r'(\d+)\.(\d+)')
+_COMMA_NO_SPACE_RE = re.compile(r',(\S)')
+_REPEATED_COMMA_RE = re.compile(r',\s*,+')
+_SSML_COMMA_RE = re.compile(r',\s*')
+_COMMA_SPLIT_RE = re.compile(r'([,，、]\s*)')
+_PARTICLE_SPLIT_RE = re.compile(r'((?:은|는|이|가|을|를|에서|에게|으로|로|도|과|와|의)\s+)')
+_CONJUNCTION_SPLIT_RE = re.compile(r'(\s+(?:그리고|하지만|그래서|그러나|또한|그런데|따라서|즉)\s+)')
+
 
 def utf8_len(text: str) -> int:
     """UTF-8 인코딩 바이트 길이 계산"""
@@ -28,7 +37,6 @@ def _protect_numbers(text: str) -> tuple[str, dict]:
     Returns:
         (치환된 텍스트, 복원용 딕셔너리)
     """
-    import re
     placeholders = {}
     counter = [0]
 
@@ -39,7 +47,7 @@ def _protect_numbers(text: str) -> tuple[str, dict]:
         return key
 
     # 숫자.숫자 패턴 (1.5, 3.14, 2.0 등)
-    protected = re.sub(r'(\d+\.\d+)', replacer, text)
+    protected = _DECIMAL_RE.sub(replacer, text)
     return protected, placeholders
 
 
@@ -64,24 +72,18 @@ def preprocess_for_tts(text: str) -> str:
     Returns:
         TTS에 최적화된 텍스트
     """
-    import re
-
     if not text:
         return text
 
     # 1) 숫자.숫자 패턴을 "숫자점숫자"로 변환 (TTS가 자연스럽게 읽도록)
     # 예: 1.5톤 → 1점5톤, 3.14 → 3점14
-    def replace_decimal(match):
-        num = match.group(0)
-        return num.replace('.', '점')
-
-    text = re.sub(r'(\d+)\.(\d+)', replace_decimal, text)
+    text = _DECIMAL_RE.sub(r'\1점\2', text)
 
     # 2) 쉼표 뒤에 공백이 없으면 추가 (TTS 휴지 개선)
-    text = re.sub(r',(\S)', r', \1', text)
+    text = _COMMA_NO_SPACE_RE.sub(r', \1', text)
 
     # 3) 연속 쉼표 정리
-    text = re.sub(r',\s*,+', ',', text)
+    text = _REPEATED_COMMA_RE.sub(',', text)
 
     return text
 
@@ -96,7 +98,6 @@ def preprocess_for_tts_ssml(text: str) -> str:
     Returns:
         SSML 휴지가 포함된 텍스트 (아직 <speak> 태그 없음)
     """
-    import re
     import html
 
     if not text:
@@ -109,7 +110,7 @@ def preprocess_for_tts_ssml(text: str) -> str:
     text = html.escape(text, quote=False)
 
     # 3) 쉼표 뒤에 SSML 휴지 추가 (150ms - 자연스러운 짧은 휴지)
-    text = re.sub(r',\s*', ',<break time="150ms"/> ', text)
+    text = _SSML_COMMA_RE.sub(',<break time="150ms"/> ', text)
 
     return text
 
@@ -280,21 +281,21 @@ def _split_long_sentence_natural(sentence: str, max_bytes: int) -> List[str]:
         return [sentence]
 
     # 1차: 쉼표 기준 분할
-    parts = re.split(r'([,，、]\s*)', sentence)
+    parts = _COMMA_SPLIT_RE.split(sentence)
     if len(parts) > 1:
         chunks = _merge_parts_to_limit(parts, max_bytes)
         if all(utf8_len(c) <= max_bytes for c in chunks):
             return chunks
 
     # 2차: 조사 뒤에서 분할 (은/는/이/가 + 공백)
-    parts = re.split(r'((?:은|는|이|가|을|를|에서|에게|으로|로|도|과|와|의)\s+)', sentence)
+    parts = _PARTICLE_SPLIT_RE.split(sentence)
     if len(parts) > 1:
         chunks = _merge_parts_to_limit(parts, max_bytes)
         if all(utf8_len(c) <= max_bytes for c in chunks):
             return chunks
 
     # 3차: 접속어 앞에서 분할
-    parts = re.split(r'(\s+(?:그리고|하지만|그래서|그러나|또한|그런데|따라서|즉)\s+)', sentence)
+    parts = _CONJUNCTION_SPLIT_RE.split(sentence)
     if len(parts) > 1:
         chunks = _merge_parts_to_limit(parts, max_bytes)
         if all(utf8_len(c) <= max_bytes for c in chunks):
@@ -341,7 +342,7 @@ def _split_long_sentence(sentence: str, max_bytes: int) -> List[str]:
     chunks = []
     
     # 쉼표 기준으로 먼저 분할 시도
-    parts = re.split(r'([,，、]\s*)', sentence)
+    parts = _COMMA_SPLIT_RE.split(sentence)
     
     current = ""
     for part in parts:
@@ -4,7 +4,7 @@ TTS Service - Step3 메인 파이프라인
 
 핵심 흐름:
 1. 씬별 나레이션 → 청크 분할 (tts_chunking)
-2. 청크별 TTS 호출 → WAV/MP3 세그먼트 생성
+2. 청크별 TTS 호출 → WAV/MP3 세그먼트 생성 (동시 실행 + QPS 제한, 순서 유지, 캐시 재사용)
 3. FFmpeg로 전체 오디오 병합
 4. 문장별 타임라인 계산 → SRT 자막 생성
 """
@@ -13,8 +13,13 @@ import os
 import uuid
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 
+from scripts.common.audio_utils import get_mp3_duration
+from scripts.common.rate_limit import get_rate_limiter
+from scripts.common.tts_cache import get_tts_cache
+
 from .tts_chunking import build_chunks_for_scenes, estimate_chunk_stats
 
 # 환경변수로 문장별 TTS 모드 제어 (기본: 활성화)
@@ -22,6 +27,10 @@ import os
 TTS_SENTENCE_MODE = os.getenv("TTS_SENTENCE_MODE", "1") == "1"
 TTS_MIN_CHARS = int(os.getenv("TTS_MIN_CHARS", "10"))
 
+# 청크 동시 합성 수 / Google TTS 초당 요청 상한 (프로세스 전체 공유)
+TTS_CONCURRENCY = int(os.getenv("TTS_CONCURRENCY", "4"))
+TTS_MAX_QPS = float(os.getenv("TTS_MAX_QPS", "8"))
+
 # 출력 디렉토리
 AUDIO_DIR = "outputs/audio"
 SUBTITLE_DIR = "outputs/subtitles"
@@ -86,35 +95,45 @@ def run_tts_pipeline(
             "episode_id": episode_id
         }
     
-    # 2. 청크별 TTS 생성
-    audio_segments = []
-    
-    for idx, chunk in enumerate(chunks):
+    # 2. 청크별 TTS 생성 (동시 실행, 결과는 청크 순서대로)
+    limiter = get_rate_limiter("google_tts", TTS_MAX_QPS)
+
+    def _synthesize(idx):
+        chunk = chunks[idx]
         print(f"[TTS-PIPELINE] TTS 생성 {idx+1}/{len(chunks)}: {chunk['byte_length']}bytes")
-        
+
         filename = f"{episode_id}_chunk_{idx:03d}.mp3"
         out_path = os.path.join(AUDIO_DIR, filename)
-        
-        # TTS 호출
+
+        # TTS 호출 (캐시 miss일 때만 QPS 제한)
         success = synthesize_chunk_google_api(
             text=chunk["text"],
             voice_config=voice_config,
-            output_path=out_path
+            output_path=out_path,
+            limiter=limiter
         )
-        
+
         if success:
-            duration = get_audio_duration_ffprobe(out_path)
+            duration = get_audio_duration(out_path)
         else:
             duration = estimate_duration_from_text(chunk["text"], voice_config["speaking_rate"])
-        
-        audio_segments.append({
+
+        return {
             "scene_id": chunk["scene_id"],
             "chunk_index": chunk["chunk_index"],
             "file": out_path,
             "sentences": chunk["sentences"],
             "duration_sec": duration,
             "success": success
-        })
+        }
+
+    workers = max(1, min(TTS_CONCURRENCY, len(chunks)))
+    if workers == 1:
+        audio_segments = [_synthesize(idx) for idx in range(len(chunks))]
+    else:
+        # executor.map은 완료 순서와 무관하게 입력 순서로 결과 반환 → SRT 타임라인 순서 보장
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            audio_segments = list(executor.map(_synthesize, range(len(chunks))))
     
     # 3. 전체 오디오 병합 (FFmpeg)
     successful_files = [seg["file"] for seg in audio_segments if seg["success"]]
@@ -154,17 +173,33 @@ def run_tts_pipeline(
 def synthesize_chunk_google_api(
     text: str,
     voice_config: Dict,
-    output_path: str
+    output_path: str,
+    limiter=None
 ) -> bool:
     """
     Google Cloud TTS API REST 호출로 음성 생성
-    
+
+    같은 텍스트/음성/속도는 TTS 캐시에서 output_path로 바로 배치 (API 호출 없음).
+    gTTS 폴백 결과는 캐시하지 않는다.
+
+    Args:
+        limiter: 실제 API 호출 직전에 acquire()할 RateLimiter (캐시 히트 시 사용 안 함)
+
     Returns:
         성공 여부
     """
     import requests
     import base64
-    
+
+    speaking_rate = voice_config.get("speaking_rate", 0.9)
+    language_code = voice_config.get("language_code", "ko-KR")
+    voice_name = voice_config.get("name", "ko-KR-Neural2-B")
+
+    cache = get_tts_cache()
+    cache_key = cache.make_key("google_tts", text, voice_name, speaking_rate, language=language_code)
+    if cache.fetch(cache_key, output_path) is not None:
+        return True
+
     api_key = os.getenv("GOOGLE_CLOUD_API_KEY", "")
     
     if not api_key:
@@ -173,14 +208,11 @@ def synthesize_chunk_google_api(
     
     url = f"https://texttospeech.googleapis.com/v1/text:synthesize?key={api_key}"
     
-    # 속도/피치 변환
-    speaking_rate = voice_config.get("speaking_rate", 0.9)
-    
     payload = {
         "input": {"text": text},
         "voice": {
-            "languageCode": voice_config.get("language_code", "ko-KR"),
-            "name": voice_config.get("name", "ko-KR-Neural2-B")
+            "languageCode": language_code,
+            "name": voice_name
         },
         "audioConfig": {
             "audioEncoding": "MP3",
@@ -189,6 +221,8 @@ def synthesize_chunk_google_api(
     }
     
     try:
+        if limiter is not None:
+            limiter.acquire()
         response = requests.post(url, json=payload, timeout=60)
         
         if response.status_code == 200:
@@ -198,7 +232,8 @@ def synthesize_chunk_google_api(
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             with open(output_path, "wb") as f:
                 f.write(audio_content)
-            
+
+            cache.put(cache_key, audio_content, get_mp3_duration(output_path), "mp3")
             return True
         else:
             print(f"[TTS] Google API 오류: {response.status_code}")
@@ -226,6 +261,14 @@ def synthesize_chunk_gtts(text: str, output_path: str, speaking_rate: float = 0.
         return False
 
 
+def get_audio_duration(path: str) -> float:
+    """오디오 길이(초) - MP3 프레임 헤더로 계산, 실패 시에만 ffprobe"""
+    duration = get_mp3_duration(path)
+    if duration:
+        return duration
+    return get_audio_duration_ffprobe(path)
+
+
 def get_audio_duration_ffprobe(path: str) -> float:
     """ffprobe로 오디오 길이(초) 측정"""
     if not os.path.exists(path):
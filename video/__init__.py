@@ -0,0 +1,120 @@
+"""
+영상 렌더링 공통 모듈
+drama_server 영상 생성 경로에서 공유하는 렌더링 인프라
+
+핵심 기능:
+- 씬 클립 캐시 (clip_cache): 변경되지 않은 씬은 재인코딩 없이 재사용
+- 렌더 스케줄러 (scheduler): 여유 메모리/CPU 기반 FFmpeg 동시 실행 제어
+- 단일 패스 렌더러 (filtergraph): 씬 목록을 FFmpeg 1회 호출로 인코딩
+- 미디어 수집 (media): HTTP 스트리밍 다운로드, data URL 청크 디코딩, 작업 payload spool
+- 인코더 프로필 / FFmpeg 실행기 (encoder): 채널 공용 x264 설정, -progress 진행률, 길이 기반 타임아웃
+- 정지 이미지 렌더러 (still): history/isekai/wuxia 공용 이미지+오디오+자막 렌더링
+- Ken Burns 모션 (kenburns): zoompan 대신 마스터 1회 스케일 + crop 이동
+- 영상 자산 캐시 (assets): 아웃트로/인트로를 해상도/fps/템플릿별로 한 번만 사전 인코딩
+- 후반 작업 (postprod): 자막 + BGM + 효과음 + 아웃트로를 filter_complex 하나로 1회 인코딩
+- 벤치마크 (benchmark): python -m video.benchmark 로 프로필별 fps/소요 시간/크기 비교
+"""
+
+from .clip_cache import (
+    SceneClipCache,
+    get_clip_cache,
+    hash_file,
+)
+from .scheduler import (
+    RenderScheduler,
+    get_render_scheduler,
+    estimate_ffmpeg_memory_mb,
+    available_memory_mb,
+)
+from .filtergraph import (
+    SINGLE_PASS_MAX_CUTS,
+    build_single_pass_command,
+    build_single_pass_filter,
+    estimate_single_pass_memory_mb,
+)
+from .media import (
+    MEDIA_SPOOL_DIR,
+    get_http_session,
+    fetch_media,
+    decode_data_url_to_file,
+    spool_data_url,
+    spool_data_urls,
+    spool_data_url_list,
+)
+from .encoder import (
+    EncoderProfile,
+    ENCODER_PROFILES,
+    get_encoder_profile,
+    probe_duration,
+    render_timeout,
+    run_ffmpeg,
+)
+from .still import (
+    AssStyle,
+    srt_to_ass,
+    render_still_video,
+)
+from .kenburns import (
+    KEN_BURNS_ENGINE,
+    KenBurnsMotion,
+    build_ken_burns_filter,
+)
+from .assets import (
+    VideoAssetCache,
+    get_asset_cache,
+)
+from .postprod import (
+    VideoInfo,
+    BgmTrack,
+    SfxCue,
+    probe_video_info,
+    compute_bgm_segments,
+    scene_bgm_track,
+    bgm_track_filter,
+    build_post_production_filter,
+    build_post_production_command,
+)
+
+__all__ = [
+    "SceneClipCache",
+    "get_clip_cache",
+    "hash_file",
+    "RenderScheduler",
+    "get_render_scheduler",
+    "estimate_ffmpeg_memory_mb",
+    "available_memory_mb",
+    "SINGLE_PASS_MAX_CUTS",
+    "build_single_pass_command",
+    "build_single_pass_filter",
+    "estimate_single_pass_memory_mb",
+    "get_http_session",
+    "MEDIA_SPOOL_DIR",
+    "fetch_media",
+    "decode_data_url_to_file",
+    "spool_data_url",
+    "spool_data_urls",
+    "spool_data_url_list",
+    "EncoderProfile",
+    "ENCODER_PROFILES",
+    "get_encoder_profile",
+    "probe_duration",
+    "render_timeout",
+    "run_ffmpeg",
+    "AssStyle",
+    "srt_to_ass",
+    "render_still_video",
+    "KEN_BURNS_ENGINE",
+    "KenBurnsMotion",
+    "build_ken_burns_filter",
+    "VideoAssetCache",
+    "get_asset_cache",
+    "VideoInfo",
+    "BgmTrack",
+    "SfxCue",
+    "probe_video_info",
+    "compute_bgm_segments",
+    "scene_bgm_track",
+    "bgm_track_filter",
+    "build_post_production_filter",
+    "build_post_production_command",
+]
@@ -0,0 +1,154 @@
+"""
+사전 인코딩 영상 자산 캐시 (아웃트로 / 인트로)
+
+아웃트로처럼 작업마다 내용이 같은 짧은 영상을 매번 libx264로 다시 만들지 않고,
+(종류, 해상도, fps, 템플릿) 조합마다 한 번만 렌더링해서 디스크에 보관한다.
+템플릿은 렌더 명령 전체(텍스트, 색, drawtext 필터, 인코더 인자)와 폰트 파일이라
+문구나 인코더 설정이 바뀌면 키가 바뀌어 자동으로 새로 렌더링된다.
+
+- 키: sha256(버전, 종류, width, height, fps, 렌더 명령, 의존 파일 크기/mtime)
+- 저장: {VIDEO_ASSET_CACHE_DIR}/{kind}_{W}x{H}_{fps}_{key[:16]}.mp4
+- 무효화: 같은 종류/해상도/fps의 다른 키 파일은 이전 템플릿 → 새 파일 렌더 후 삭제
+
+호출 측은 인코더 인자를 메인 렌더와 똑같이 넘겨야 concat demuxer 스트림 복사가 성공한다.
+
+사용법:
+    from video import get_asset_cache
+
+    cmd = ['ffmpeg', '-y', '-f', 'lavfi', '-i', 'color=...', ..., '-c:v', 'libx264', ...]  # 출력 경로 제외
+    path = get_asset_cache().get_or_render('outro', 1280, 720, 24, cmd, dependencies=[font_path])
+"""
+
+import os
+import glob
+import json
+import hashlib
+import threading
+import subprocess
+from typing import Dict, List, Optional, Sequence
+
+VIDEO_ASSET_CACHE_DIR = os.environ.get('VIDEO_ASSET_CACHE_DIR', 'data/video_assets')
+
+# 캐시 포맷이 바뀌면 올려서 기존 자산을 무효화
+_ASSET_VERSION = 1
+
+
+def _file_signature(path: str) -> List:
+    try:
+        st = os.stat(path)
+        return [os.path.abspath(path), st.st_size, st.st_mtime_ns]
+    except OSError:
+        return [path, None, None]
+
+
+class VideoAssetCache:
+    """종류/해상도/fps/템플릿별로 한 번만 렌더링하는 디스크 캐시 (프로세스 내 스레드 안전)"""
+
+    def __init__(self, cache_dir: str = VIDEO_ASSET_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ----- 키 / 경로 -----
+    def make_key(self, kind: str, width: int, height: int, fps: float,
+                 render_cmd: Sequence[str], dependencies: Sequence[str] = ()) -> str:
+        """렌더 파라미터 + 템플릿(렌더 명령, 의존 파일)으로 캐시 키 생성"""
+        payload = json.dumps({
+            'v': _ASSET_VERSION,
+            'kind': kind,
+            'size': [int(width), int(height)],
+            'fps': f"{fps:g}",
+            'cmd': list(render_cmd),
+            'deps': [_file_signature(p) for p in dependencies],
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _variant_prefix(self, kind: str, width: int, height: int, fps: float) -> str:
+        return os.path.join(self.cache_dir, f"{kind}_{int(width)}x{int(height)}_{fps:g}_")
+
+    def asset_path(self, kind: str, width: int, height: int, fps: float, key: str) -> str:
+        return f"{self._variant_prefix(kind, width, height, fps)}{key[:16]}.mp4"
+
+    def _lock_for(self, path: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(path)
+            if lock is None:
+                lock = self._locks[path] = threading.Lock()
+            return lock
+
+    # ----- 조회 / 렌더링 -----
+    def get_or_render(self, kind: str, width: int, height: int, fps: float,
+                      render_cmd: Sequence[str], dependencies: Sequence[str] = (),
+                      timeout: int = 120) -> Optional[str]:
+        """캐시된 자산 경로 반환 (없으면 render_cmd + [출력 경로]로 렌더링) - 실패 시 None"""
+        key = self.make_key(kind, width, height, fps, render_cmd, dependencies)
+        path = self.asset_path(kind, width, height, fps, key)
+        if os.path.exists(path):
+            self.hits += 1
+            return path
+
+        with self._lock_for(path):
+            if os.path.exists(path):
+                self.hits += 1
+                return path
+            self.misses += 1
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # 임시 파일에 쓰고 rename → 다른 프로세스가 반쯤 쓴 파일을 보지 않도록 (확장자로 mp4 먹서 선택)
+            tmp_path = f"{path[:-4]}.{os.getpid()}.{threading.get_ident()}.tmp.mp4"
+            try:
+                result = subprocess.run([*render_cmd, tmp_path], stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.PIPE, timeout=timeout)
+                if result.returncode != 0 or not os.path.exists(tmp_path):
+                    stderr = result.stderr.decode('utf-8', errors='ignore')[-300:]
+                    print(f"[VIDEO-ASSET] {kind} 렌더링 실패: {stderr}")
+                    return None
+                os.replace(tmp_path, path)
+            except Exception as e:
+                print(f"[VIDEO-ASSET] {kind} 렌더링 오류: {e}")
+                return None
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+            print(f"[VIDEO-ASSET] {kind} 생성 ({int(width)}x{int(height)}@{fps:g}): {path}")
+            self._remove_stale(kind, width, height, fps, path)
+        return path
+
+    def _remove_stale(self, kind: str, width: int, height: int, fps: float, current_path: str) -> int:
+        """같은 종류/해상도/fps의 이전 템플릿 자산 삭제"""
+        removed = 0
+        for stale in glob.glob(f"{glob.escape(self._variant_prefix(kind, width, height, fps))}*.mp4"):
+            if stale == current_path or '.tmp.' in os.path.basename(stale):
+                continue
+            try:
+                os.remove(stale)
+                removed += 1
+            except OSError:
+                pass
+        if removed:
+            print(f"[VIDEO-ASSET] 이전 템플릿 {kind} 삭제: {removed}개")
+        return removed
+
+    def stats(self) -> dict:
+        files = [f for f in glob.glob(os.path.join(self.cache_dir, '*.mp4')) if '.tmp.' not in f]
+        return {
+            'entries': len(files),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+_asset_cache = None
+_asset_cache_lock = threading.Lock()
+
+
+def get_asset_cache() -> VideoAssetCache:
+    """프로세스 공용 자산 캐시 인스턴스"""
+    global _asset_cache
+    with _asset_cache_lock:
+        if _asset_cache is None:
+            _asset_cache = VideoAssetCache()
+        return _asset_cache
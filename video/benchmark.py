@@ -0,0 +1,265 @@
+"""
+렌더 엔진 벤치마크
+
+기준 에피소드(이미지 여러 장 + 오디오 + 한국어 자막)를 FFmpeg lavfi로 만들고,
+인코더 프로필마다 render_still_video로 렌더링해서 fps / 소요 시간 / 배속 / 출력 크기를 비교한다.
+같은 머신에서 프로필 간 상대 비교용 (채널 전체의 RENDER_PROFILE / RENDER_THREADS 결정).
+
+--ken-burns: 기준 이미지 1장으로 Ken Burns 효과별 crop 엔진 / zoompan 엔진 fps와
+zoompan 대비 SSIM(화면 일치도)을 비교 (KEN_BURNS_ENGINE 결정).
+
+사용법:
+    python -m video.benchmark                                  # 60초, 전체 프로필
+    python -m video.benchmark --duration 300 --profiles fast,balanced --threads 2
+    python -m video.benchmark --json results.json
+    python -m video.benchmark --ken-burns --duration 10 --threads 1
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import subprocess
+import tempfile
+from dataclasses import replace
+from typing import Dict, List, Optional
+
+from .encoder import ENCODER_PROFILES
+from .kenburns import KenBurnsMotion, build_ken_burns_filter
+from .still import AssStyle, render_still_video
+
+_SUBTITLE_LINES = [
+    "조선의 왕은 새벽이 오기 전에 궁궐 문을 나섰다.",
+    "아무도 그가 어디로 가는지 알지 못했다.",
+    "성문 밖에는 백성들이 이미 모여 있었다.",
+    "그날의 선택이 나라의 운명을 바꾸게 된다.",
+]
+
+
+def _srt_time(seconds: float) -> str:
+    ms = int(round(seconds * 1000))
+    return f"{ms // 3600000:02d}:{ms // 60000 % 60:02d}:{ms // 1000 % 60:02d},{ms % 1000:03d}"
+
+
+def build_reference_episode(work_dir: str, duration: float, image_count: int, resolution: str) -> Dict[str, object]:
+    """기준 에피소드 자산 생성 (이미지 PNG, 오디오 MP3, SRT)"""
+    width, height = resolution.split('x')
+    image_paths = []
+    for i in range(image_count):
+        path = os.path.join(work_dir, f"scene_{i + 1:02d}.png")
+        # 장면마다 다른 패턴 (정지 이미지지만 디테일이 있어 인코더 부하가 실제와 비슷함)
+        subprocess.run(
+            ['ffmpeg', '-y', '-v', 'error', '-f', 'lavfi',
+             '-i', f"testsrc2=size={width}x{height}:rate=1,hue=h={i * 47}",
+             '-frames:v', '1', path],
+            check=True
+        )
+        image_paths.append(path)
+
+    audio_path = os.path.join(work_dir, "narration.mp3")
+    subprocess.run(
+        ['ffmpeg', '-y', '-v', 'error', '-f', 'lavfi',
+         '-i', f"sine=frequency=220:sample_rate=44100:duration={duration}",
+         '-c:a', 'libmp3lame', '-b:a', '128k', audio_path],
+        check=True
+    )
+
+    srt_path = os.path.join(work_dir, "narration.srt")
+    with open(srt_path, 'w', encoding='utf-8') as f:
+        t, idx = 0.0, 1
+        while t < duration:
+            end = min(t + 3.0, duration)
+            f.write(f"{idx}\n{_srt_time(t)} --> {_srt_time(end)}\n{_SUBTITLE_LINES[idx % len(_SUBTITLE_LINES)]}\n\n")
+            t, idx = end, idx + 1
+
+    return {"image_paths": image_paths, "audio_path": audio_path, "srt_path": srt_path}
+
+
+def run_benchmark(
+    profiles: Optional[List[str]] = None,
+    duration: float = 60.0,
+    image_count: int = 6,
+    resolution: str = "1920x1080",
+    fps: int = 30,
+    threads: Optional[int] = None,
+) -> List[Dict[str, object]]:
+    """프로필별 렌더링 결과 [{profile, ok, wall_s, fps, speed, size_mb}, ...]"""
+    profiles = profiles or list(ENCODER_PROFILES)
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="render_bench_") as work_dir:
+        episode = build_reference_episode(work_dir, duration, image_count, resolution)
+        print(f"[RENDER-BENCH] 기준 에피소드: {duration:.0f}초, 이미지 {image_count}장, {resolution}@{fps}")
+
+        for name in profiles:
+            profile = ENCODER_PROFILES.get(name)
+            if profile is None:
+                print(f"[RENDER-BENCH] 알 수 없는 프로필: {name}")
+                continue
+            if threads is not None:
+                profile = replace(profile, threads=threads if threads > 0 else None)
+
+            output_path = os.path.join(work_dir, f"bench_{name}.mp4")
+            result = render_still_video(
+                audio_path=episode["audio_path"],
+                image_paths=episode["image_paths"],
+                output_path=output_path,
+                srt_path=episode["srt_path"],
+                resolution=resolution,
+                fps=fps,
+                profile=profile,
+                ass_style=AssStyle(),
+                label=f"RENDER-BENCH:{name}",
+            )
+            row = {"profile": name, "preset": profile.preset, "crf": profile.crf,
+                   "threads": profile.threads, "ok": result.get("ok", False)}
+            if result.get("ok"):
+                row.update({
+                    "wall_s": round(result["elapsed"], 2),
+                    "fps": round(result["fps"], 1),
+                    "speed": round(duration / result["elapsed"], 2) if result["elapsed"] > 0 else 0.0,
+                    "size_mb": round(os.path.getsize(output_path) / 1024 / 1024, 2),
+                })
+            else:
+                row["error"] = result.get("error")
+            results.append(row)
+
+    return results
+
+
+def _ken_burns_cases(total_frames: int) -> Dict[str, KenBurnsMotion]:
+    """drama_server / 쇼츠 파이프라인과 같은 형태의 움직임 식"""
+    return {
+        "zoom_in": KenBurnsMotion(zoom=f"1.0+0.08*on/{total_frames}", x="iw/2-(iw/zoom/2)",
+                                  y="ih/2-(ih/zoom/2)", zoom_max=1.08),
+        "zoom_out": KenBurnsMotion(zoom=f"1.08-0.08*on/{total_frames}", x="iw/2-(iw/zoom/2)",
+                                   y="ih/2-(ih/zoom/2)", zoom_max=1.08),
+        "pan_right": KenBurnsMotion(zoom="1.1", x="min(on*2,100)", y="ih/2-(ih/zoom/2)"),
+        "pan_down": KenBurnsMotion(zoom="1.1", x="iw/2-(iw/zoom/2)", y="min(on*2,100)"),
+    }
+
+
+def _ssim(path: str, reference_path: str) -> Optional[float]:
+    result = subprocess.run(
+        ['ffmpeg', '-v', 'info', '-i', path, '-i', reference_path,
+         '-lavfi', '[0:v][1:v]ssim', '-f', 'null', '-'],
+        capture_output=True, text=True
+    )
+    match = re.search(r'All:([0-9.]+)', result.stderr)
+    return float(match.group(1)) if match else None
+
+
+def run_ken_burns_benchmark(
+    duration: float = 10.0,
+    resolution: str = "1280x720",
+    fps: int = 24,
+    threads: Optional[int] = None,
+) -> List[Dict[str, object]]:
+    """효과 × 엔진별 렌더링 결과 [{effect, engine, ok, wall_s, fps, ssim}, ...]"""
+    out_w, out_h = (int(v) for v in resolution.split('x'))
+    in_w, in_h = int(out_w * 1.4), int(out_h * 1.4)   # drama_server와 같은 기준 좌표계
+    total_frames = int(duration * fps)
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="kenburns_bench_") as work_dir:
+        image_path = os.path.join(work_dir, "reference.png")
+        subprocess.run(
+            ['ffmpeg', '-y', '-v', 'error', '-f', 'lavfi',
+             '-i', "testsrc2=size=1920x1080:rate=1", '-frames:v', '1', image_path],
+            check=True
+        )
+        print(f"[KENBURNS-BENCH] 기준 이미지 1920x1080 → {resolution}@{fps}, {duration:.0f}초")
+
+        for effect, motion in _ken_burns_cases(total_frames).items():
+            outputs = {}
+            for engine in ('zoompan', 'crop'):
+                output_path = os.path.join(work_dir, f"{effect}_{engine}.mp4")
+                vf = build_ken_burns_filter(motion, in_w, in_h, out_w, out_h, fps, duration, engine=engine)
+                cmd = ['ffmpeg', '-y', '-v', 'error', '-loop', '1', '-framerate', str(fps), '-i', image_path,
+                       '-vf', vf, '-t', str(duration), '-c:v', 'libx264', '-preset', 'fast',
+                       '-pix_fmt', 'yuv420p']
+                if threads is not None:
+                    cmd += ['-threads', str(threads)]
+                start = time.time()
+                result = subprocess.run([*cmd, output_path], capture_output=True, text=True)
+                elapsed = time.time() - start
+                row = {"effect": effect, "engine": engine, "ok": result.returncode == 0}
+                if row["ok"]:
+                    outputs[engine] = output_path
+                    row.update({"wall_s": round(elapsed, 2),
+                                "fps": round(total_frames / elapsed, 1) if elapsed > 0 else 0.0})
+                else:
+                    row["error"] = result.stderr[-300:]
+                results.append(row)
+
+            if len(outputs) == 2:
+                results[-1]["ssim"] = _ssim(outputs['crop'], outputs['zoompan'])
+
+    return results
+
+
+def print_ken_burns_report(results: List[Dict[str, object]]) -> None:
+    print(f"\n{'effect':<12}{'engine':<10}{'wall(s)':>10}{'fps':>9}{'ssim':>9}")
+    for row in results:
+        if row["ok"]:
+            ssim = f"{row['ssim']:.4f}" if row.get("ssim") is not None else "-"
+            print(f"{row['effect']:<12}{row['engine']:<10}{row['wall_s']:>10}{row['fps']:>9}{ssim:>9}")
+        else:
+            print(f"{row['effect']:<12}{row['engine']:<10}  실패: {row.get('error')}")
+
+
+def print_report(results: List[Dict[str, object]]) -> None:
+    print(f"\n{'profile':<12}{'preset':<11}{'crf':>4}{'thr':>5}{'wall(s)':>10}{'fps':>9}{'speed':>8}{'size(MB)':>10}")
+    for row in results:
+        threads = row["threads"] if row["threads"] is not None else "auto"
+        if row["ok"]:
+            print(f"{row['profile']:<12}{row['preset']:<11}{row['crf']:>4}{threads:>5}"
+                  f"{row['wall_s']:>10}{row['fps']:>9}{str(row['speed']) + 'x':>8}{row['size_mb']:>10}")
+        else:
+            print(f"{row['profile']:<12}{row['preset']:<11}{row['crf']:>4}{threads:>5}  실패: {row.get('error')}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="렌더 엔진 인코더 프로필 벤치마크")
+    parser.add_argument('--duration', type=float, default=60.0, help="기준 에피소드 길이 (초)")
+    parser.add_argument('--images', type=int, default=6, help="이미지 수")
+    parser.add_argument('--resolution', default=None, help="출력 해상도 (기본 1920x1080, --ken-burns는 1280x720)")
+    parser.add_argument('--fps', type=int, default=None, help="기본 30 (--ken-burns는 24)")
+    parser.add_argument('--profiles', default=",".join(ENCODER_PROFILES), help="쉼표 구분 프로필 이름")
+    parser.add_argument('--threads', type=int, default=None, help="모든 프로필의 -threads 덮어쓰기 (0=자동)")
+    parser.add_argument('--json', dest='json_path', default=None, help="결과 JSON 저장 경로")
+    parser.add_argument('--ken-burns', action='store_true',
+                        help="Ken Burns crop 엔진 vs zoompan 비교")
+    args = parser.parse_args(argv)
+
+    if args.ken_burns:
+        results = run_ken_burns_benchmark(
+            duration=args.duration,
+            resolution=args.resolution or "1280x720",
+            fps=args.fps or 24,
+            threads=args.threads,
+        )
+        print_ken_burns_report(results)
+    else:
+        results = run_benchmark(
+            profiles=[p.strip() for p in args.profiles.split(',') if p.strip()],
+            duration=args.duration,
+            image_count=args.images,
+            resolution=args.resolution or "1920x1080",
+            fps=args.fps or 30,
+            threads=args.threads,
+        )
+        print_report(results)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n[RENDER-BENCH] 결과 저장: {args.json_path}")
+
+    return 0 if all(row["ok"] for row in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
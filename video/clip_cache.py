@@ -0,0 +1,227 @@
+"""
+씬 클립 캐시 (content-addressed)
+
+같은 이미지/오디오/해상도/FPS/인코더 옵션으로 만든 씬 클립은 결과가 같으므로
+디스크에 보관해 두고 재시도·부분 수정 시 재인코딩 없이 재사용한다.
+
+- 키: sha256(이미지 바이트, 오디오 바이트, width, height, fps, 인코더 인자)
+- 저장: {CLIP_CACHE_DIR}/{key[:2]}/{key}.mp4 + {key}.json (길이 등 메타)
+- 제거: 총 용량이 CLIP_CACHE_MAX_MB를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+- 용량/LRU 순서는 메모리 인덱스로 관리 (디렉토리 전체 스캔은 프로세스에서 처음 사용할 때 1회)
+
+사용법:
+    from video import get_clip_cache, hash_file
+
+    cache = get_clip_cache()
+    key = cache.make_key(hash_file(img_path), hash_file(audio_path), width, height, fps, encoder_args)
+    hit = cache.fetch(key, segment_path)   # (segment_path, duration) 또는 None
+    ...
+    cache.store(key, segment_path, duration)
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+CLIP_CACHE_DIR = os.environ.get('CLIP_CACHE_DIR', 'data/clip_cache')
+CLIP_CACHE_MAX_MB = int(os.environ.get('CLIP_CACHE_MAX_MB', '2048'))
+
+# 캐시 포맷이 바뀌면 올려서 기존 항목을 무효화
+_CACHE_VERSION = 1
+_HASH_CHUNK = 1024 * 1024
+
+
+def hash_file(path: str) -> str:
+    """파일 내용의 sha256 (청크 단위로 읽어 메모리 사용 최소화)"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class SceneClipCache:
+    """크기 제한이 있는 디스크 기반 씬 클립 캐시 (프로세스 내 스레드 안전)"""
+
+    def __init__(self, cache_dir: str = CLIP_CACHE_DIR, max_bytes: int = CLIP_CACHE_MAX_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # key → 클립 크기 (오래 사용하지 않은 순서), 총 크기는 저장/제거 때마다 갱신
+        self._index: 'OrderedDict[str, int]' = OrderedDict()
+        self._total_bytes = 0
+        self._scanned = False
+        self.hits = 0
+        self.misses = 0
+
+    # ----- 키 / 경로 -----
+    def make_key(self, image_hash: str, audio_hash: Optional[str], width: int, height: int,
+                 fps: int, encoder_args: Sequence[str]) -> str:
+        """입력 해시와 렌더 파라미터로 캐시 키 생성"""
+        payload = json.dumps({
+            'v': _CACHE_VERSION,
+            'image': image_hash,
+            'audio': audio_hash or '',
+            'size': [int(width), int(height)],
+            'fps': fps,
+            'encoder': list(encoder_args),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + '.mp4', base + '.json'
+
+    # ----- 조회 / 저장 -----
+    def fetch(self, key: str, dest_path: str) -> Optional[Tuple[str, float]]:
+        """캐시 히트 시 dest_path에 클립을 배치하고 (dest_path, duration) 반환
+
+        하드링크를 우선 사용하고 (같은 파일시스템), 실패하면 복사한다.
+        이후 캐시 항목이 제거되어도 dest_path는 유효하다.
+        """
+        clip_path, meta_path = self._paths(key)
+        with self._lock:
+            if not (os.path.exists(clip_path) and os.path.exists(meta_path)):
+                # 다른 프로세스가 제거한 항목이면 인덱스에서도 제거
+                if self._scanned and key in self._index:
+                    self._total_bytes -= self._index.pop(key)
+                self.misses += 1
+                return None
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                if os.path.exists(dest_path):
+                    os.remove(dest_path)
+                try:
+                    os.link(clip_path, dest_path)
+                except OSError:
+                    shutil.copy2(clip_path, dest_path)
+                # LRU: 마지막 사용 시각 갱신 (파일 mtime은 재시작 후 스캔 순서용)
+                now = time.time()
+                os.utime(clip_path, (now, now))
+                self._touch(key, clip_path)
+            except Exception as e:
+                print(f"[CLIP-CACHE] 조회 실패 ({key[:12]}): {e}")
+                self.misses += 1
+                return None
+            self.hits += 1
+        return dest_path, float(meta.get('duration', 0))
+
+    def store(self, key: str, clip_path: str, duration: float) -> bool:
+        """렌더링된 클립을 캐시에 등록 (원본 파일은 그대로 둠)"""
+        cached_clip, meta_path = self._paths(key)
+        try:
+            os.makedirs(os.path.dirname(cached_clip), exist_ok=True)
+            # 임시 파일에 쓰고 rename → 다른 스레드/프로세스가 반쯤 쓴 파일을 보지 않도록
+            tmp_clip = f"{cached_clip}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                os.link(clip_path, tmp_clip)
+            except OSError:
+                shutil.copy2(clip_path, tmp_clip)
+            os.replace(tmp_clip, cached_clip)
+            tmp_meta = f"{meta_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_meta, 'w', encoding='utf-8') as f:
+                json.dump({'duration': duration, 'created_at': time.time()}, f)
+            os.replace(tmp_meta, meta_path)
+            size = os.path.getsize(cached_clip)
+        except Exception as e:
+            print(f"[CLIP-CACHE] 저장 실패 ({key[:12]}): {e}")
+            return False
+        with self._lock:
+            self._ensure_index()
+            self._total_bytes += size - self._index.pop(key, 0)
+            self._index[key] = size
+        self.evict()
+        return True
+
+    # ----- 인덱스 -----
+    def _ensure_index(self):
+        """처음 사용할 때 디렉토리를 한 번 스캔해 인덱스/총 크기 구성 (self._lock 보유 상태에서 호출)"""
+        if self._scanned:
+            return
+        for _mtime, size, clip_path, _meta_path in sorted(self._entries()):
+            key = os.path.basename(clip_path)[:-4]
+            self._total_bytes += size - self._index.pop(key, 0)
+            self._index[key] = size
+        self._scanned = True
+
+    def _touch(self, key: str, clip_path: str):
+        """조회된 항목을 가장 최근 사용으로 이동 (다른 프로세스가 저장한 항목이면 인덱스에 추가)"""
+        self._ensure_index()
+        if key in self._index:
+            self._index.move_to_end(key)
+            return
+        try:
+            size = os.path.getsize(clip_path)
+        except OSError:
+            return
+        self._index[key] = size
+        self._total_bytes += size
+
+    # ----- 제거 -----
+    def _entries(self):
+        """(mtime, size, clip_path, meta_path) 목록 - 인덱스 초기화용 전체 스캔"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.mp4'):
+                    continue
+                clip_path = os.path.join(root, name)
+                try:
+                    st = os.stat(clip_path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, clip_path, clip_path[:-4] + '.json'))
+        return entries
+
+    def evict(self) -> int:
+        """용량 초과 시 LRU 순으로 삭제, 삭제 개수 반환"""
+        removed = 0
+        with self._lock:
+            self._ensure_index()
+            while self._total_bytes > self.max_bytes and self._index:
+                key, size = self._index.popitem(last=False)
+                for path in self._paths(key):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                self._total_bytes -= size
+                removed += 1
+            total = self._total_bytes
+        if removed:
+            print(f"[CLIP-CACHE] LRU 제거: {removed}개 (현재 {total / (1024 * 1024):.1f}MB)")
+        return removed
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._ensure_index()
+            entries = len(self._index)
+            total = self._total_bytes
+        return {
+            'entries': entries,
+            'size_mb': round(total / (1024 * 1024), 2),
+            'max_mb': round(self.max_bytes / (1024 * 1024), 2),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+_clip_cache = None
+_clip_cache_lock = threading.Lock()
+
+
+def get_clip_cache() -> SceneClipCache:
+    """프로세스 공용 캐시 인스턴스"""
+    global _clip_cache
+    with _clip_cache_lock:
+        if _clip_cache is None:
+            _clip_cache = SceneClipCache()
+        return _clip_cache
@@ -0,0 +1,258 @@
+"""
+인코더 프로필 + FFmpeg 실행기 (진행률 보고)
+
+파이프라인마다 '-preset ultrafast', '-threads 2', 고정 타임아웃을 각자 하드코딩하던 것을
+프로필 하나로 모은다. 채널 렌더러는 프로필 이름만 고르고, 실제 인코더 인자는 여기서 만든다.
+
+프로필:
+- fast: ultrafast / CRF 28 (history, isekai, wuxia 기존 설정)
+- stillimage: medium / CRF 23 / tune stillimage (bible 기존 설정)
+- balanced: veryfast / CRF 23 / tune stillimage (정지 이미지 영상의 속도/용량 절충)
+- compact: faster / CRF 26 / tune stillimage (업로드 용량 우선)
+- static: veryfast / CRF 23 / tune stillimage / 10fps / GOP 60초 (배경이 고정된 영상 - bible)
+
+환경변수 (하드웨어와 무관한 튜닝 값 - 모든 채널에 적용):
+- RENDER_PROFILE: 채널 기본 프로필 대신 사용할 프로필 이름
+- RENDER_PRESET / RENDER_CRF: 프로필의 x264 프리셋 / CRF 덮어쓰기
+- RENDER_THREADS: FFmpeg -threads (0이면 FFmpeg 자동, 미설정이면 프로필 값)
+- RENDER_STATIC_FPS: 낮은 fps 프로필(static)의 프레임레이트
+- RENDER_TIMEOUT_FACTOR: 타임아웃 = 영상 길이 × 배수 + 5분 (기본 2, 최소 15분)
+- RENDER_TIMEOUT_MAX: 타임아웃 상한 (초, 기본 3600)
+
+사용법:
+    from video.encoder import get_encoder_profile, run_ffmpeg
+
+    profile = get_encoder_profile("fast")
+    cmd = ['ffmpeg', '-y', '-loop', '1', '-i', img, '-i', audio,
+           *profile.video_args(), *profile.audio_args(), '-shortest', out]
+    result = run_ffmpeg(cmd, duration=900.0, label="HISTORY-RENDERER")
+    # {"ok": True, "elapsed": 412.3, "fps": 65.4, "speed": 2.18}
+"""
+
+import os
+import re
+import time
+import threading
+import subprocess
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional
+
+RENDER_TIMEOUT_FACTOR = float(os.environ.get('RENDER_TIMEOUT_FACTOR', '2'))
+RENDER_TIMEOUT_MAX = int(os.environ.get('RENDER_TIMEOUT_MAX', '3600'))
+
+# 진행률 로그 간격 (초)
+_PROGRESS_LOG_INTERVAL = 30
+
+
+@dataclass(frozen=True)
+class EncoderProfile:
+    """x264/AAC 인코더 설정"""
+    name: str
+    preset: str
+    crf: int
+    tune: Optional[str] = None
+    threads: Optional[int] = None   # None이면 -threads 생략 (FFmpeg 자동)
+    audio_bitrate: str = '128k'
+    frame_rate: Optional[int] = None       # 설정 시 호출 측 fps 대신 사용 (정지 배경은 낮은 fps로 충분)
+    keyint_seconds: Optional[int] = None   # 키프레임 간격 (초) - 정지 배경은 긴 GOP
+
+    def video_args(self) -> List[str]:
+        args = ['-c:v', 'libx264', '-preset', self.preset, '-crf', str(self.crf)]
+        if self.tune:
+            args += ['-tune', self.tune]
+        return args
+
+    def audio_args(self) -> List[str]:
+        return ['-c:a', 'aac', '-b:a', self.audio_bitrate]
+
+    def thread_args(self) -> List[str]:
+        return ['-threads', str(self.threads)] if self.threads is not None else []
+
+    def output_fps(self, default: int) -> int:
+        return self.frame_rate or default
+
+    def rate_args(self, default_fps: int) -> List[str]:
+        """-r (+ 긴 GOP면 -g) 인자"""
+        fps = self.output_fps(default_fps)
+        args = ['-r', str(fps)]
+        if self.keyint_seconds:
+            args += ['-g', str(fps * self.keyint_seconds)]
+        return args
+
+
+ENCODER_PROFILES: Dict[str, EncoderProfile] = {
+    'fast': EncoderProfile('fast', preset='ultrafast', crf=28, threads=2),
+    'stillimage': EncoderProfile('stillimage', preset='medium', crf=23, tune='stillimage', audio_bitrate='192k'),
+    'balanced': EncoderProfile('balanced', preset='veryfast', crf=23, tune='stillimage', threads=2),
+    'compact': EncoderProfile('compact', preset='faster', crf=26, tune='stillimage', threads=2),
+    'static': EncoderProfile('static', preset='veryfast', crf=23, tune='stillimage', audio_bitrate='192k',
+                             frame_rate=10, keyint_seconds=60),
+}
+
+
+def get_encoder_profile(default: str = 'fast') -> EncoderProfile:
+    """채널 기본 프로필 → 환경변수 덮어쓰기 적용한 프로필"""
+    name = os.environ.get('RENDER_PROFILE') or default
+    profile = ENCODER_PROFILES.get(name)
+    if profile is None:
+        print(f"[RENDER] 알 수 없는 프로필 '{name}', '{default}' 사용")
+        profile = ENCODER_PROFILES[default]
+
+    overrides = {}
+    if os.environ.get('RENDER_PRESET'):
+        overrides['preset'] = os.environ['RENDER_PRESET']
+    if os.environ.get('RENDER_CRF'):
+        overrides['crf'] = int(os.environ['RENDER_CRF'])
+    if os.environ.get('RENDER_THREADS'):
+        threads = int(os.environ['RENDER_THREADS'])
+        overrides['threads'] = threads if threads > 0 else None
+    if os.environ.get('RENDER_STATIC_FPS') and profile.frame_rate:
+        overrides['frame_rate'] = int(os.environ['RENDER_STATIC_FPS'])
+    return replace(profile, **overrides) if overrides else profile
+
+
+# ============================================================
+# ffprobe / 타임아웃
+# ============================================================
+
+def probe_duration(path: str, default: float = 60.0) -> float:
+    """미디어 파일 재생 시간(초) - 실패 시 default"""
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+             '-of', 'default=noprint_wrappers=1:nokey=1', path],
+            capture_output=True, text=True, timeout=30
+        )
+        return float(result.stdout.strip()) if result.stdout.strip() else default
+    except Exception:
+        return default
+
+
+def render_timeout(duration: float) -> int:
+    """영상 길이 기반 FFmpeg 타임아웃 (길이 × 배수 + 5분, 15분 ~ RENDER_TIMEOUT_MAX)"""
+    return int(min(max(duration * RENDER_TIMEOUT_FACTOR + 300, 900), max(RENDER_TIMEOUT_MAX, 900)))
+
+
+def escape_filter_path(path: str) -> str:
+    """필터 인자(ass=, subtitles=)에 넣을 경로 이스케이프"""
+    return path.replace('\\', '\\\\').replace(':', '\\:')
+
+
+# ============================================================
+# 실행 (-progress pipe:1)
+# ============================================================
+
+_OUT_TIME_RE = re.compile(r'(\d+):(\d+):(\d+(?:\.\d+)?)')
+
+
+def _parse_out_time(value: str) -> Optional[float]:
+    m = _OUT_TIME_RE.match(value)
+    if not m:
+        return None
+    return int(m.group(1)) * 3600 + int(m.group(2)) * 60 + float(m.group(3))
+
+
+def run_ffmpeg(
+    cmd: List[str],
+    duration: float = 0.0,
+    label: str = 'RENDER',
+    timeout: Optional[int] = None,
+    on_progress: Optional[Callable[[float, float], None]] = None,
+) -> Dict:
+    """FFmpeg 실행 + 진행률 보고
+
+    출력 경로(cmd 마지막 인자) 앞에 '-progress pipe:1 -nostats'를 넣어 stdout으로
+    진행 정보를 받고, stderr는 별도 스레드에서 모아 오류 메시지에 사용한다.
+
+    Args:
+        cmd: FFmpeg 명령어 (마지막 인자가 출력 경로)
+        duration: 예상 출력 길이 (초) - 진행률/타임아웃 계산용
+        label: 로그 태그
+        timeout: 타임아웃 (초, None이면 render_timeout(duration))
+        on_progress: (현재 초, 전체 초) 콜백
+
+    Returns:
+        {"ok": True, "elapsed": 초, "fps": 평균 fps, "speed": 실시간 대비 배속, "frames": 프레임 수}
+        또는 {"ok": False, "error": str}
+    """
+    if timeout is None:
+        timeout = render_timeout(duration)
+    cmd_with_progress = cmd[:-1] + ['-progress', 'pipe:1', '-nostats', cmd[-1]]
+
+    start_time = time.time()
+    try:
+        process = subprocess.Popen(
+            cmd_with_progress,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors='ignore',
+        )
+    except FileNotFoundError:
+        return {"ok": False, "error": "FFmpeg가 설치되어 있지 않습니다."}
+
+    stderr_lines: List[str] = []
+
+    def read_stderr():
+        for line in process.stderr:
+            stderr_lines.append(line)
+            if len(stderr_lines) > 200:
+                del stderr_lines[:100]
+
+    stderr_thread = threading.Thread(target=read_stderr, daemon=True)
+    stderr_thread.start()
+
+    timed_out = threading.Event()
+
+    def kill_on_timeout():
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.daemon = True
+    timer.start()
+
+    current_sec = 0.0
+    frames = 0
+    last_log = start_time
+    try:
+        for line in process.stdout:
+            key, _, value = line.strip().partition('=')
+            if key == 'out_time':
+                parsed = _parse_out_time(value)
+                if parsed is not None:
+                    current_sec = parsed
+            elif key == 'frame':
+                try:
+                    frames = int(value)
+                except ValueError:
+                    pass
+            elif key == 'progress':
+                if on_progress:
+                    on_progress(current_sec, duration)
+                now = time.time()
+                if now - last_log >= _PROGRESS_LOG_INTERVAL:
+                    pct = (current_sec / duration * 100) if duration > 0 else 0
+                    print(f"[{label}] FFmpeg 진행: {current_sec:.0f}초/{duration:.0f}초 ({pct:.1f}%) "
+                          f"- 경과: {(now - start_time) / 60:.1f}분", flush=True)
+                    last_log = now
+        process.wait()
+    finally:
+        timer.cancel()
+        stderr_thread.join(timeout=5)
+
+    elapsed = time.time() - start_time
+    if timed_out.is_set():
+        return {"ok": False, "error": f"FFmpeg 타임아웃 ({timeout // 60}분 초과)"}
+    if process.returncode != 0:
+        error_text = ''.join(stderr_lines[-30:]) if stderr_lines else "No stderr"
+        print(f"[{label}] FFmpeg 오류 (code {process.returncode}):\n{error_text}", flush=True)
+        return {"ok": False, "error": f"FFmpeg 오류 (code {process.returncode}): {error_text[-500:]}"}
+
+    return {
+        "ok": True,
+        "elapsed": elapsed,
+        "frames": frames,
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+        "speed": current_sec / elapsed if elapsed > 0 else 0.0,
+    }
@@ -0,0 +1,105 @@
+"""
+단일 패스 필터그래프 렌더러 (cut 기반 영상)
+
+씬마다 MP4를 만들고 concat하는 대신, 모든 씬(정지 이미지 + 오디오)을
+하나의 FFmpeg 호출과 filter_complex로 한 번에 인코딩한다.
+- FFmpeg 프로세스 시작 / x264 lookahead 워밍업 / AAC priming이 씬마다 반복되지 않음
+- 개별 인코딩된 AAC 세그먼트를 concat할 때 생기는 씬 경계의 무음 틈이 없음
+- 중간 세그먼트 파일을 디스크에 쓰지 않음
+
+입력 이미지마다 디코딩된 프레임 1장을 메모리에 유지하므로 호출 측에서 옵트인으로만 사용한다
+(VIDEO_RENDER_MODE=single_pass, 또는 auto에서 씬 수가 SINGLE_PASS_MAX_CUTS 이하이고
+estimate_single_pass_memory_mb()가 여유 메모리에 들어갈 때).
+
+사용법:
+    from video import build_single_pass_command
+
+    cmd = build_single_pass_command(media, 854, 480, 24, output_path, script_path)
+    # media: [(img_path, audio_path 또는 None, duration), ...]
+"""
+
+import os
+from typing import List, Optional, Sequence, Tuple
+
+SINGLE_PASS_MAX_CUTS = int(os.environ.get('SINGLE_PASS_MAX_CUTS', '60'))
+
+# 씬별 렌더링(_create_scene_clip)과 동일한 화질/오디오 설정
+DEFAULT_VIDEO_ARGS = ['-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '32']
+DEFAULT_AUDIO_ARGS = ['-c:a', 'aac', '-b:a', '96k']
+
+CutMedia = Tuple[str, Optional[str], float]
+
+
+def build_single_pass_filter(media: Sequence[CutMedia], width: int, height: int, fps: int) -> str:
+    """씬 목록에 대한 filter_complex 문자열 생성
+
+    입력 순서: 씬별로 [이미지, (오디오)] → 오디오가 없는 씬은 anullsrc로 무음 생성
+    """
+    lines = []
+    concat_inputs = []
+    input_idx = 0
+
+    for i, (_img, audio_path, duration) in enumerate(media):
+        dur = f"{duration:.3f}"
+        lines.append(
+            f"[{input_idx}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps},format=yuv420p,"
+            f"trim=duration={dur},setpts=PTS-STARTPTS[v{i}]"
+        )
+        input_idx += 1
+
+        if audio_path:
+            # 오디오 길이를 영상 길이에 정확히 맞춤 (짧으면 무음 패딩, 길면 자름)
+            lines.append(
+                f"[{input_idx}:a]aresample=44100,aformat=sample_fmts=fltp:channel_layouts=stereo,"
+                f"apad,atrim=duration={dur},asetpts=PTS-STARTPTS[a{i}]"
+            )
+            input_idx += 1
+        else:
+            lines.append(
+                f"anullsrc=r=44100:cl=stereo,aformat=sample_fmts=fltp,"
+                f"atrim=duration={dur},asetpts=PTS-STARTPTS[a{i}]"
+            )
+        concat_inputs.append(f"[v{i}][a{i}]")
+
+    lines.append(f"{''.join(concat_inputs)}concat=n={len(media)}:v=1:a=1[outv][outa]")
+    return ';\n'.join(lines)
+
+
+def build_single_pass_command(media: Sequence[CutMedia], width: int, height: int, fps: int,
+                              output_path: str, script_path: str, threads: int = 1,
+                              video_args: Optional[List[str]] = None,
+                              audio_args: Optional[List[str]] = None) -> List[str]:
+    """단일 패스 FFmpeg 명령 생성
+
+    filter_complex는 씬 수에 비례해 길어지므로 script_path 파일로 전달한다
+    (명령행 길이 제한 회피).
+    """
+    if not media:
+        raise ValueError("렌더링할 씬이 없습니다")
+
+    with open(script_path, 'w', encoding='utf-8') as f:
+        f.write(build_single_pass_filter(media, width, height, fps))
+
+    cmd = ['ffmpeg', '-y', '-threads', str(threads)]
+    for img_path, audio_path, duration in media:
+        # -t로 입력 자체를 잘라 루프 이미지가 무한히 디코딩되지 않게 함
+        cmd += ['-loop', '1', '-framerate', str(fps), '-t', f"{duration:.3f}", '-i', img_path]
+        if audio_path:
+            cmd += ['-i', audio_path]
+
+    cmd += [
+        '-filter_complex_script', script_path,
+        '-map', '[outv]', '-map', '[outa]',
+    ]
+    cmd += list(video_args or DEFAULT_VIDEO_ARGS) + ['-threads', str(threads)]
+    cmd += list(audio_args or DEFAULT_AUDIO_ARGS)
+    cmd += ['-r', str(fps), '-pix_fmt', 'yuv420p', '-movflags', '+faststart', output_path]
+    return cmd
+
+
+def estimate_single_pass_memory_mb(num_cuts: int, width: int, height: int) -> int:
+    """단일 패스 렌더링의 메모리 추정 (입력 이미지별 디코딩 프레임 + 인코더)"""
+    # 원본 이미지는 보통 최대 1920x1080 RGB (~6MB) + 스케일 결과
+    per_input_mb = 6 + width * height * 1.5 / (1024 * 1024)
+    return int(200 + num_cuts * per_input_mb)
@@ -0,0 +1,126 @@
+"""
+Ken Burns 모션 필터 (zoompan 대체)
+
+zoompan은 출력 프레임마다 swscale 컨텍스트를 새로 만들고 crop 창 전체를 bicubic으로 다시 스케일한다.
+줌이 없는 패닝도 매 프레임 리샘플링하고, 입력이 1.4배 업스케일된 이미지라 비용이 더 크다.
+같은 움직임(zoompan 좌표계의 z / x / y 식)을 더 싼 필터 체인으로 만든다:
+
+- 이미지를 한 번만 스케일해서 "마스터"로 만들고 loop 필터로 반복 (디코딩/스케일 1회)
+- 줌이 고정이면 (패닝): 마스터 크기 = 출력 × 줌, 프레임마다 crop 위치만 이동 → 리샘플링 없음
+- 줌이 변하면: 마스터 크기 = 출력 × 최대 줌, 프레임마다 출력 × 줌 크기로 bilinear 축소 후 crop
+  (마스터가 최종 크기에 가까워 1~0.9배 축소뿐이라 bilinear로 충분)
+
+crop 필터가 x/y를 [0, 입력-출력]으로 자르는 것이 zoompan의 [0, iw - iw/zoom] 제한과 같아서
+기존 식을 그대로 옮겨도 화면 위치가 같다 (차이는 짝수 픽셀 반올림 수준).
+KEN_BURNS_ENGINE=zoompan이면 기존 zoompan 체인을 만든다.
+
+비교: python -m video.benchmark --ken-burns (1080p 기준 이미지, 효과별 fps + zoompan 대비 SSIM)
+
+사용법:
+    from video.kenburns import KenBurnsMotion, build_ken_burns_filter
+
+    motion = KenBurnsMotion(zoom="1.0+0.08*on/240", x="(iw-1280)/2", y="(ih-720)/2", zoom_max=1.08)
+    vf = build_ken_burns_filter(motion, 1792, 1008, 1280, 720, fps=24, duration=10.0)
+    # 입력: -loop 1 -framerate 24 -i image.jpg (또는 이미지 1장), 출력 길이는 -t로 제한
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+KEN_BURNS_ENGINE = os.environ.get('KEN_BURNS_ENGINE', 'crop')
+
+_ON_RE = re.compile(r'\bon\b')
+_ZOOM_RE = re.compile(r'\bzoom\b')
+_IW_RE = re.compile(r'\b(iw|in_w)\b')
+_IH_RE = re.compile(r'\b(ih|in_h)\b')
+
+
+@dataclass(frozen=True)
+class KenBurnsMotion:
+    """zoompan 좌표계의 움직임 식
+
+    zoom: 줌 배율 식 (on = 출력 프레임 번호, 1~10으로 제한됨)
+    x, y: crop 창 좌상단 (입력 이미지 좌표 - iw/ih/zoom/on 사용 가능)
+    zoom_max: 줌이 변하는 경우 최대 배율 (마스터 크기 결정)
+    """
+    zoom: str
+    x: str
+    y: str
+    zoom_max: Optional[float] = None
+
+    @property
+    def is_static_zoom(self) -> bool:
+        return not _ON_RE.search(self.zoom)
+
+
+def _even(value: float) -> int:
+    return max(2, int(value) // 2 * 2)
+
+
+def _cover(width: int, height: int) -> str:
+    """입력 이미지를 width x height로 채우고 넘치는 부분은 중앙 기준 crop"""
+    return f"scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height}"
+
+
+def _frame_expr(expr: str, zoom_expr: str, in_w: int, in_h: int) -> str:
+    """zoompan 식 → crop/scale 식 (zoom/iw/ih는 상수·식으로 치환, on → n)"""
+    expr = _ZOOM_RE.sub(f"({zoom_expr})", expr)
+    expr = _IW_RE.sub(str(in_w), expr)
+    expr = _IH_RE.sub(str(in_h), expr)
+    return _ON_RE.sub('n', expr)
+
+
+def build_zoompan_filter(motion: KenBurnsMotion, in_w: int, in_h: int, out_w: int, out_h: int,
+                         fps: int, duration: float) -> str:
+    """기존 방식: in_w x in_h로 스케일 → zoompan"""
+    total_frames = int(duration * fps)
+    return (
+        f"{_cover(in_w, in_h)},"
+        f"zoompan=z='{motion.zoom}':x='{motion.x}':y='{motion.y}':d={total_frames}:s={out_w}x{out_h}:fps={fps}"
+    )
+
+
+def build_crop_motion_filter(motion: KenBurnsMotion, in_w: int, in_h: int, out_w: int, out_h: int,
+                             fps: int) -> str:
+    """마스터 1회 스케일 + loop + (줌이 변할 때만 프레임별 bilinear 축소) + crop"""
+    zoom = f"clip({_ON_RE.sub('n', motion.zoom)},1,10)"
+    x = _frame_expr(motion.x, zoom, in_w, in_h)
+    y = _frame_expr(motion.y, zoom, in_w, in_h)
+
+    if motion.is_static_zoom:
+        z = min(max(float(motion.zoom), 1.0), 10.0)
+        master_w, master_h = _even(out_w * z), _even(out_h * z)
+        return (
+            f"{_cover(master_w, master_h)},loop=loop=-1:size=1,setpts=N/{fps}/TB,fps={fps},"
+            f"crop={out_w}:{out_h}:x='({x})*{master_w}/{in_w}':y='({y})*{master_h}/{in_h}',setsar=1"
+        )
+
+    zoom_max = min(max(motion.zoom_max or 1.0, 1.0), 10.0)
+    master_w, master_h = _even(out_w * zoom_max), _even(out_h * zoom_max)
+    # 프레임별 스케일 크기 - crop의 iw/ih는 링크 설정 시 한 번만 정해지므로 같은 식을 crop 좌표에도 직접 넣음
+    frame_w = f"2*trunc({out_w}*{zoom}/2)"
+    frame_h = f"2*trunc({out_h}*{zoom}/2)"
+    return (
+        f"{_cover(master_w, master_h)},loop=loop=-1:size=1,setpts=N/{fps}/TB,fps={fps},"
+        f"scale=w='{frame_w}':h='{frame_h}':eval=frame:flags=bilinear,"
+        f"crop={out_w}:{out_h}:x='({x})*({frame_w})/{in_w}':y='({y})*({frame_h})/{in_h}',setsar=1"
+    )
+
+
+def build_ken_burns_filter(motion: KenBurnsMotion, in_w: int, in_h: int, out_w: int, out_h: int,
+                           fps: int, duration: float, engine: Optional[str] = None) -> str:
+    """Ken Burns 필터 체인 (engine: 'crop' 기본 / 'zoompan' 기존 방식)
+
+    Args:
+        motion: zoompan 좌표계의 움직임 식
+        in_w, in_h: 식의 기준 좌표계 (이미지를 이 크기로 채운 것으로 간주 - 기존 1.4배 업스케일 크기)
+        out_w, out_h: 출력 해상도
+        fps: 출력 프레임레이트
+        duration: 클립 길이 (초, zoompan의 d 계산용)
+    """
+    engine = engine or KEN_BURNS_ENGINE
+    if engine == 'zoompan':
+        return build_zoompan_filter(motion, in_w, in_h, out_w, out_h, fps, duration)
+    return build_crop_motion_filter(motion, in_w, in_h, out_w, out_h, fps)
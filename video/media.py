@@ -0,0 +1,213 @@
+"""
+미디어 수집 (스트리밍 다운로드 / data URL 청크 디코딩)
+
+씬 이미지·오디오를 메모리에 통째로 올리지 않고 디스크로 바로 기록한다.
+- http(s): 공용 requests.Session(커넥션 풀)으로 스트리밍 다운로드
+- data: base64를 청크 단위로 디코딩하여 파일에 기록
+- spool:// / 로컬 경로: 파일 복사 (MEDIA_SPOOL_DIR, static/, uploads/ 아래만 허용)
+
+작업 큐에 들어가는 payload의 data URL은 spool_data_urls()로 미리 파일로 빼내고
+spool:// 참조만 남긴다 (video_jobs / 작업 JSON에 base64가 남지 않도록).
+URL은 요청 JSON에서 오므로 file:// / 절대 경로는 받지 않고, realpath가 허용 루트 밖이면 거부한다.
+
+사용법:
+    from video import fetch_media, spool_data_urls
+
+    spool_data_urls(cuts, ('imageUrl', 'audioUrl'), spool_dir)
+    ok = fetch_media(cut['imageUrl'], img_path, base_dir=os.path.dirname(__file__))
+"""
+
+import os
+import re
+import base64
+import shutil
+import threading
+from typing import Iterable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# data URL spool 디렉토리 (작업별 하위 디렉토리, spool://{job_id}/{파일명}으로 참조)
+MEDIA_SPOOL_DIR = 'uploads/media_spool'
+SPOOL_SCHEME = 'spool://'
+# 로컬 미디어로 읽을 수 있는 base_dir 아래 디렉토리
+_LOCAL_MEDIA_ROOTS = ('static', 'uploads')
+
+# 스트리밍 청크 크기 (HTTP / 파일 쓰기)
+_STREAM_CHUNK = 64 * 1024
+# base64 디코딩 청크 (4의 배수여야 함)
+_B64_CHUNK = 4 * 16 * 1024
+
+_MIME_EXT = {
+    'image/png': '.png',
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/webp': '.webp',
+    'audio/mpeg': '.mp3',
+    'audio/mp3': '.mp3',
+    'audio/wav': '.wav',
+    'audio/x-wav': '.wav',
+    'video/mp4': '.mp4',
+}
+_DATA_URL_HEADER = re.compile(r'^data:([^;,]+)?(;[^,]*)?,')
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """프로세스 공용 HTTP 세션 (keep-alive 커넥션 재사용)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=2)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({'User-Agent': 'Mozilla/5.0'})
+            _session = session
+        return _session
+
+
+def decode_data_url_to_file(data_url: str, dest_path: str) -> int:
+    """data URL의 base64 본문을 청크 단위로 디코딩하여 파일에 기록, 기록한 바이트 수 반환"""
+    comma = data_url.find(',')
+    if comma < 0:
+        raise ValueError("잘못된 data URL 형식")
+    is_base64 = ';base64' in data_url[:comma]
+
+    written = 0
+    with open(dest_path, 'wb') as f:
+        if not is_base64:
+            from urllib.parse import unquote_to_bytes
+            payload = unquote_to_bytes(data_url[comma + 1:])
+            f.write(payload)
+            return len(payload)
+
+        pos = comma + 1
+        end = len(data_url)
+        pending = ''
+        while pos < end:
+            chunk = pending + data_url[pos:pos + _B64_CHUNK]
+            pos += _B64_CHUNK
+            # 공백/개행이 섞인 data URL 대비
+            if any(c in chunk for c in ' \n\r\t'):
+                chunk = re.sub(r'\s+', '', chunk)
+            usable = len(chunk) - (len(chunk) % 4)
+            pending = chunk[usable:]
+            if usable:
+                decoded = base64.b64decode(chunk[:usable])
+                f.write(decoded)
+                written += len(decoded)
+        if pending:
+            # 패딩이 빠진 꼬리 처리
+            decoded = base64.b64decode(pending + '=' * (-len(pending) % 4))
+            f.write(decoded)
+            written += len(decoded)
+    return written
+
+
+def _contained(path: str, root: str) -> Optional[str]:
+    """root 아래 path의 realpath (심볼릭 링크 / '..'로 root를 벗어나면 None)"""
+    root = os.path.realpath(root)
+    real = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([real, root]) != root:
+        return None
+    return real
+
+
+def _resolve_local(url: str, base_dir: Optional[str]) -> Optional[str]:
+    """spool:// / '/static/...' / '/uploads/...' (상대 경로 포함)를 허용 루트 아래 로컬 파일 경로로 변환
+
+    file:// / 임의의 절대 경로 / 루트 밖 경로는 None (요청 JSON에서 서버 파일을 읽지 못하도록)
+    """
+    if url.startswith(SPOOL_SCHEME):
+        path = _contained(url[len(SPOOL_SCHEME):], MEDIA_SPOOL_DIR)
+    else:
+        # 웹 경로 (/static/..., /uploads/...) → base_dir 기준
+        rel = os.path.normpath(url.lstrip('/'))
+        top = rel.split(os.sep, 1)[0]
+        if top not in _LOCAL_MEDIA_ROOTS:
+            return None
+        root = os.path.join(base_dir or os.getcwd(), top)
+        path = _contained(os.path.relpath(rel, top), root)
+
+    if path and os.path.isfile(path):
+        return path
+    return None
+
+
+def fetch_media(url: str, dest_path: str, base_dir: Optional[str] = None,
+                timeout: int = 60, label: str = '') -> bool:
+    """URL(data:/http/spool/로컬)의 내용을 dest_path에 기록
+
+    Returns:
+        성공 여부 (실패 사유는 로그로 출력)
+    """
+    if not url:
+        return False
+    tag = f"[MEDIA-FETCH]{f' {label}' if label else ''}"
+    tmp_path = f"{dest_path}.part"
+    try:
+        if url.startswith('data:'):
+            decode_data_url_to_file(url, tmp_path)
+        elif url.startswith('http://') or url.startswith('https://'):
+            with get_http_session().get(url, stream=True, timeout=timeout) as response:
+                if response.status_code != 200:
+                    print(f"{tag} 다운로드 실패 (상태: {response.status_code}): {url[:100]}")
+                    return False
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=_STREAM_CHUNK):
+                        if chunk:
+                            f.write(chunk)
+        else:
+            local_path = _resolve_local(url, base_dir)
+            if not local_path:
+                print(f"{tag} 로컬 파일 없음 (또는 허용되지 않은 경로): {url[:100]}")
+                return False
+            shutil.copyfile(local_path, tmp_path)
+        os.replace(tmp_path, dest_path)
+        return True
+    except Exception as e:
+        print(f"{tag} 오류: {e}")
+        return False
+    finally:
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def spool_data_url(data_url: str, spool_dir: str, name: str) -> str:
+    """data URL을 spool_dir(MEDIA_SPOOL_DIR 아래)에 파일로 저장하고 spool:// 참조 반환"""
+    os.makedirs(spool_dir, exist_ok=True)
+    match = _DATA_URL_HEADER.match(data_url[:256])
+    mime = (match.group(1) or '').lower() if match else ''
+    path = os.path.join(spool_dir, name + _MIME_EXT.get(mime, '.bin'))
+    decode_data_url_to_file(data_url, path)
+    rel = os.path.relpath(os.path.abspath(path), os.path.abspath(MEDIA_SPOOL_DIR))
+    return SPOOL_SCHEME + rel.replace(os.sep, '/')
+
+
+def spool_data_urls(items: Iterable[dict], keys: Iterable[str], spool_dir: str, prefix: str = 'item') -> int:
+    """dict 목록의 data URL 필드를 파일로 빼내고 spool:// 참조로 교체 (in-place), 교체 개수 반환"""
+    keys = list(keys)
+    count = 0
+    for idx, item in enumerate(items):
+        if not isinstance(item, dict):
+            continue
+        for key in keys:
+            value = item.get(key)
+            if isinstance(value, str) and value.startswith('data:'):
+                item[key] = spool_data_url(value, spool_dir, f"{prefix}_{idx:03d}_{key}")
+                count += 1
+    return count
+
+
+def spool_data_url_list(urls: List[str], spool_dir: str, prefix: str = 'item') -> List[str]:
+    """URL 문자열 목록에서 data URL만 파일로 빼낸 새 목록 반환"""
+    return [
+        spool_data_url(u, spool_dir, f"{prefix}_{idx:03d}") if isinstance(u, str) and u.startswith('data:') else u
+        for idx, u in enumerate(urls)
+    ]
@@ -0,0 +1,241 @@
+"""
+단일 인코딩 후반 작업 (자막 + BGM + 효과음 + 아웃트로)
+
+병합된 영상(merged.mp4)에 자막 burn-in → BGM 믹싱 → 효과음 믹싱 → 아웃트로 연결을
+단계마다 FFmpeg를 따로 실행하면 매 단계가 전체 영상을 다시 디코딩/먹싱하고,
+아웃트로 concat 폴백까지 가면 영상을 한 번 더 인코딩한다.
+켜진 효과를 하나의 filter_complex로 묶어서 최종 YouTube 업로드용 파일을 1회 인코딩으로 만든다.
+
+- 영상: [0:v] → ass 자막 → (아웃트로와 concat)
+- 오디오: 나레이션 [0:a] + BGM 구간들 + 효과음들 → amix 한 번 (normalize=0: TTS 볼륨 유지)
+- 효과음 트림(2.5초 + 페이드아웃)은 별도 MP3를 만들지 않고 그래프 안에서 atrim/afade로 처리
+- 아웃트로는 메인 영상 해상도/fps/샘플레이트에 맞춰 concat 필터로 연결
+
+그래프 실행이 실패하면 호출 측에서 기존 단계별 처리로 폴백한다.
+
+사용법:
+    from video.postprod import BgmTrack, SfxCue, build_post_production_command
+
+    cmd = build_post_production_command(
+        merged_path, output_path, video_info,
+        subtitle_filter="ass=subs.ass:fontsdir=fonts",
+        bgm_tracks=[BgmTrack(bgm_path, start=0.0, duration=600.0, fade_in=2.0, fade_out=3.0)],
+        sfx_cues=[SfxCue(sfx_path, start=12.5)],
+        outro_path=outro_path,
+    )
+"""
+
+import subprocess
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+# drama_server 단계별 처리와 동일한 믹싱 값
+BGM_VOLUME = 0.10
+SFX_VOLUME = 0.8
+SFX_MAX_DURATION = 2.5
+SFX_FADE_OUT = 0.5
+
+# 단계별 자막 burn-in과 동일한 YouTube 호환 설정
+DEFAULT_VIDEO_ARGS = ['-c:v', 'libx264', '-preset', 'fast', '-profile:v', 'high', '-level', '4.0',
+                      '-pix_fmt', 'yuv420p']
+DEFAULT_AUDIO_ARGS = ['-c:a', 'aac', '-b:a', '128k', '-ar', '44100']
+
+_AUDIO_FORMAT = "aresample=44100,aformat=sample_fmts=fltp:channel_layouts=stereo"
+
+
+@dataclass(frozen=True)
+class VideoInfo:
+    """메인 영상 스트림 정보 (아웃트로를 여기에 맞춤)"""
+    width: int
+    height: int
+    fps: float
+    duration: float
+
+
+@dataclass(frozen=True)
+class BgmTrack:
+    """BGM 구간 - start초부터 duration초 동안 재생 (파일은 -stream_loop로 반복)"""
+    path: str
+    start: float
+    duration: float
+    fade_in: float
+    fade_out: float
+    volume: float = BGM_VOLUME
+    # 페이드아웃 시작 시각 (구간 기준 초) - None이면 duration - fade_out (구간 끝에서 끝남)
+    fade_out_start: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class SfxCue:
+    """효과음 - start초에 재생, SFX_MAX_DURATION초로 자르고 페이드아웃"""
+    path: str
+    start: float
+    volume: float = SFX_VOLUME
+
+
+def probe_video_info(path: str) -> Optional[VideoInfo]:
+    """ffprobe로 해상도/fps/길이 조회 - 실패 시 None"""
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+             '-show_entries', 'stream=width,height,r_frame_rate:format=duration',
+             '-of', 'default=noprint_wrappers=1', path],
+            capture_output=True, text=True, timeout=30
+        )
+        values = dict(line.split('=', 1) for line in result.stdout.splitlines() if '=' in line)
+        num, _, den = values['r_frame_rate'].partition('/')
+        fps = float(num) / float(den or 1)
+        return VideoInfo(int(values['width']), int(values['height']), fps, float(values['duration']))
+    except Exception:
+        return None
+
+
+def compute_bgm_segments(scenes: Sequence[Dict[str, Any]], base_mood: str,
+                         scene_bgm_changes: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """씬 길이와 씬별 BGM 변경으로 BGM 구간 계산
+
+    Returns:
+        [{"mood": "calm", "start": 0.0, "end": 42.0, "duration": 42.0}, ...]
+    """
+    changes = {c['scene']: c['mood'] for c in scene_bgm_changes}
+    segments = []
+    current_mood = base_mood
+    segment_start = 0.0
+    current_time = 0.0
+
+    for idx, scene in enumerate(scenes):
+        scene_num = idx + 1
+        if scene_num in changes:
+            if current_time > segment_start:
+                segments.append({'mood': current_mood, 'start': segment_start, 'end': current_time,
+                                 'duration': current_time - segment_start})
+            current_mood = changes[scene_num]
+            segment_start = current_time
+        current_time += scene.get('duration', 0)
+
+    if current_time > segment_start:
+        segments.append({'mood': current_mood, 'start': segment_start, 'end': current_time,
+                         'duration': current_time - segment_start})
+    return segments
+
+
+def scene_bgm_track(path: str, segment: Dict[str, Any], volume: float = BGM_VOLUME) -> BgmTrack:
+    """compute_bgm_segments 구간 → BgmTrack (구간 시작/끝에 최대 1초, 구간 길이의 20% 페이드)
+
+    단일 인코딩과 단계별 처리(drama_server._mix_scene_bgm_with_video)가 같은 값을 쓰도록 공용.
+    페이드아웃은 기존 단계별 처리와 같이 구간 끝 1초 전(0 이상)에서 시작 - 5초보다 짧은 구간은
+    페이드가 구간 끝보다 먼저 끝난다.
+    """
+    duration = segment['duration']
+    fade = min(1.0, duration * 0.2)
+    return BgmTrack(path, segment['start'], duration, fade_in=fade, fade_out=fade, volume=volume,
+                    fade_out_start=max(0.0, duration - 1.0))
+
+
+def bgm_track_filter(track: BgmTrack, input_idx: int, label: str) -> str:
+    """BGM 구간 1개의 필터 체인 (트림 → 볼륨 → 페이드 인/아웃 → 시작 시각만큼 지연) → [label]"""
+    fade_out_start = track.fade_out_start
+    if fade_out_start is None:
+        fade_out_start = max(0.0, track.duration - track.fade_out)
+    delay_ms = int(track.start * 1000)
+    return (
+        f"[{input_idx}:a]atrim=0:{track.duration:.3f},asetpts=PTS-STARTPTS,"
+        f"volume={track.volume},"
+        f"afade=t=in:st=0:d={track.fade_in:.3f},"
+        f"afade=t=out:st={fade_out_start:.3f}:d={track.fade_out:.3f},"
+        f"adelay={delay_ms}|{delay_ms}[{label}]"
+    )
+
+
+def build_post_production_filter(
+    info: VideoInfo,
+    subtitle_filter: Optional[str] = None,
+    bgm_tracks: Sequence[BgmTrack] = (),
+    sfx_cues: Sequence[SfxCue] = (),
+    has_outro: bool = False,
+) -> str:
+    """후반 작업 filter_complex 생성 → 출력 라벨 [vout] [aout]
+
+    입력 순서: 0=메인 영상, BGM 트랙들, 효과음들, (아웃트로)
+    """
+    lines = []
+    fps = f"{info.fps:g}"
+    video_chain = [subtitle_filter] if subtitle_filter else []
+    video_chain += ['setsar=1', f'fps={fps}', 'format=yuv420p']
+    lines.append(f"[0:v]{','.join(video_chain)}[vmain]")
+
+    mix_labels = ['[0:a]']
+    input_idx = 1
+    for i, track in enumerate(bgm_tracks):
+        lines.append(bgm_track_filter(track, input_idx, f"bgm{i}"))
+        mix_labels.append(f'[bgm{i}]')
+        input_idx += 1
+
+    sfx_fade_start = SFX_MAX_DURATION - SFX_FADE_OUT
+    for i, cue in enumerate(sfx_cues):
+        delay_ms = int(cue.start * 1000)
+        lines.append(
+            f"[{input_idx}:a]atrim=0:{SFX_MAX_DURATION},asetpts=PTS-STARTPTS,"
+            f"afade=t=out:st={sfx_fade_start}:d={SFX_FADE_OUT},"
+            f"adelay={delay_ms}|{delay_ms},volume={cue.volume}[sfx{i}]"
+        )
+        mix_labels.append(f'[sfx{i}]')
+        input_idx += 1
+
+    if len(mix_labels) > 1:
+        lines.append(
+            f"{''.join(mix_labels)}amix=inputs={len(mix_labels)}:duration=first:"
+            f"dropout_transition=2:normalize=0,{_AUDIO_FORMAT}[amain]"
+        )
+    else:
+        lines.append(f"[0:a]{_AUDIO_FORMAT}[amain]")
+
+    if has_outro:
+        w, h = info.width, info.height
+        lines.append(
+            f"[{input_idx}:v]scale={w}:{h}:force_original_aspect_ratio=decrease,"
+            f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps},format=yuv420p[voutro]"
+        )
+        lines.append(f"[{input_idx}:a]{_AUDIO_FORMAT}[aoutro]")
+        lines.append("[vmain][amain][voutro][aoutro]concat=n=2:v=1:a=1[vout][aout]")
+    else:
+        lines.append("[vmain]null[vout]")
+        lines.append("[amain]anull[aout]")
+
+    return ";".join(lines)
+
+
+def build_post_production_command(
+    video_path: str,
+    output_path: str,
+    info: VideoInfo,
+    subtitle_filter: Optional[str] = None,
+    bgm_tracks: Sequence[BgmTrack] = (),
+    sfx_cues: Sequence[SfxCue] = (),
+    outro_path: Optional[str] = None,
+    video_args: Optional[List[str]] = None,
+    audio_args: Optional[List[str]] = None,
+) -> List[str]:
+    """후반 작업 1회 인코딩 FFmpeg 명령어 (마지막 인자가 출력 경로 - run_ffmpeg 호환)"""
+    inputs = ['-i', video_path]
+    for track in bgm_tracks:
+        inputs += ['-stream_loop', '-1', '-i', track.path]
+    for cue in sfx_cues:
+        inputs += ['-i', cue.path]
+    if outro_path:
+        inputs += ['-i', outro_path]
+
+    filter_complex = build_post_production_filter(
+        info, subtitle_filter, bgm_tracks, sfx_cues, has_outro=bool(outro_path)
+    )
+
+    return [
+        'ffmpeg', '-y',
+        *inputs,
+        '-filter_complex', filter_complex,
+        '-map', '[vout]', '-map', '[aout]',
+        *(video_args or DEFAULT_VIDEO_ARGS),
+        *(audio_args or DEFAULT_AUDIO_ARGS),
+        '-movflags', '+faststart',
+        output_path,
+    ]
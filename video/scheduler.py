@@ -0,0 +1,246 @@
+"""
+FFmpeg 렌더 스케줄러 (메모리 기반 동시 실행 제어)
+
+고정 워커 수(VIDEO_PARALLEL_WORKERS) 대신, 현재 남은 메모리와 CPU 수를 보고
+FFmpeg 서브프로세스를 몇 개까지 동시에 띄울지 결정한다.
+- 1 CPU / 2GB: 사실상 순차 실행 (기존 동작과 동일)
+- 4 CPU / 8GB: 메모리가 허용하는 만큼 병렬 실행
+
+실제 인코딩은 FFmpeg 자식 프로세스에서 일어나므로, 파이썬 쪽은 스레드로
+subprocess를 기다리기만 한다 (gunicorn 워커를 fork하는 프로세스 풀보다 메모리 부담이 적음).
+
+gunicorn 워커가 여러 개면 프로세스마다 스케줄러가 있다. 여유 메모리는 호스트(cgroup) 기준이라
+다른 워커의 FFmpeg도 반영되지만, "실행 중인 작업이 없으면 무조건 입장"(교착 방지)은 프로세스마다 적용되므로
+floor_lease(프로세스 간 lock)를 주면 메모리가 부족할 때의 무조건 입장을 호스트 전체에서 1건으로 제한한다.
+
+환경변수:
+- RENDER_MAX_PARALLEL: 동시 실행 상한 (기본: CPU 수)
+- VIDEO_PARALLEL_WORKERS: (레거시) 설정되어 있으면 상한으로 사용
+- RENDER_MEM_RESERVE_MB: 항상 남겨둘 여유 메모리 (기본 300MB)
+
+사용법:
+    from video import get_render_scheduler, estimate_ffmpeg_memory_mb
+
+    scheduler = get_render_scheduler()
+    est = estimate_ffmpeg_memory_mb(854, 480, duration=12.0)
+    with scheduler.admit(est, label="scene-3"):
+        subprocess.run(cmd, ...)
+"""
+
+import os
+import time
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple
+
+RENDER_MEM_RESERVE_MB = int(os.environ.get('RENDER_MEM_RESERVE_MB', '300'))
+
+# x264 프리셋별 lookahead 프레임 수 (대략치 - 메모리 추정용)
+_PRESET_LOOKAHEAD = {
+    'ultrafast': 0,
+    'superfast': 0,
+    'veryfast': 10,
+    'faster': 20,
+    'fast': 30,
+    'medium': 40,
+}
+
+
+def estimate_ffmpeg_memory_mb(width: int, height: int, duration: float = 0.0,
+                              preset: str = 'ultrafast', scale: float = 1.0) -> int:
+    """FFmpeg 인코딩 1건의 최대 메모리(MB) 추정
+
+    Args:
+        width, height: 출력 해상도
+        duration: 클립 길이 (초) - 오디오 디코딩/먹싱 버퍼 추정용
+        preset: x264 프리셋 (lookahead 버퍼 크기 결정)
+        scale: 입력 이미지 업스케일 배율 (Ken Burns는 1.4배)
+    """
+    frame_mb = width * height * 1.5 / (1024 * 1024)  # yuv420p 1프레임
+    source_mb = frame_mb * 4 * scale * scale          # RGB 원본 + 업스케일 버퍼
+    lookahead = _PRESET_LOOKAHEAD.get(preset, 40)
+    encoder_mb = frame_mb * (lookahead + 16) * 2   # lookahead + 참조 프레임 (스레드별 버퍼 포함)
+    audio_mb = duration * 0.05
+    return int(150 + source_mb + encoder_mb + audio_mb)
+
+
+def _read_int(path: str) -> Optional[int]:
+    try:
+        with open(path, 'r') as f:
+            value = f.read().strip()
+        if value in ('', 'max'):
+            return None
+        return int(value)
+    except (OSError, ValueError):
+        return None
+
+
+def available_memory_mb() -> Optional[int]:
+    """컨테이너(cgroup) 한도와 /proc/meminfo 중 더 작은 여유 메모리(MB)
+
+    측정할 수 없는 환경(macOS 등)에서는 None.
+    """
+    candidates = []
+
+    # cgroup v2
+    limit = _read_int('/sys/fs/cgroup/memory.max')
+    usage = _read_int('/sys/fs/cgroup/memory.current')
+    if limit is None:
+        # cgroup v1
+        limit = _read_int('/sys/fs/cgroup/memory/memory.limit_in_bytes')
+        usage = _read_int('/sys/fs/cgroup/memory/memory.usage_in_bytes')
+    # v1은 무제한일 때 매우 큰 값을 돌려줌
+    if limit is not None and usage is not None and limit < (1 << 50):
+        candidates.append((limit - usage) // (1024 * 1024))
+
+    try:
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    candidates.append(int(line.split()[1]) // 1024)
+                    break
+    except (OSError, ValueError):
+        pass
+
+    return min(candidates) if candidates else None
+
+
+def _default_max_parallel() -> int:
+    for key in ('RENDER_MAX_PARALLEL', 'VIDEO_PARALLEL_WORKERS'):
+        value = os.environ.get(key)
+        if value:
+            try:
+                return max(1, int(value))
+            except ValueError:
+                pass
+    return max(1, os.cpu_count() or 1)
+
+
+class RenderScheduler:
+    """메모리/CPU 기반 FFmpeg 작업 입장 제어 (프로세스 내 스레드 안전)
+
+    - 동시 실행 수는 max_parallel을 넘지 않는다
+    - 새 작업은 (여유 메모리 - 실행 중 작업 예약분) >= (추정치 + 예비분)일 때만 입장
+      실행 중 작업의 실제 사용량이 이미 여유 메모리에 반영되어 있을 수 있으므로 보수적인 계산
+    - 실행 중인 작업이 하나도 없으면 메모리와 관계없이 입장 (교착 방지)
+      floor_lease가 있으면 이 무조건 입장은 lease를 잡은 프로세스 1곳에서만 (acquire(blocking=False) / release())
+    """
+
+    def __init__(self, max_parallel: Optional[int] = None, reserve_mb: int = RENDER_MEM_RESERVE_MB,
+                 memory_probe: Callable[[], Optional[int]] = available_memory_mb,
+                 floor_lease: Optional[Any] = None):
+        self.max_parallel = max_parallel or _default_max_parallel()
+        self.reserve_mb = reserve_mb
+        self.floor_lease = floor_lease
+        self._memory_probe = memory_probe
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._waiting = 0
+        self._reserved_mb = 0
+        self._completed = 0
+
+    def _try_admit(self, estimate_mb: int) -> Tuple[bool, bool]:
+        """(입장 가능 여부, floor lease를 잡았는지)"""
+        if self._in_flight == 0 and self.floor_lease is None:
+            return True, False
+        if self._in_flight >= self.max_parallel:
+            return False, False
+        free_mb = self._memory_probe()
+        if free_mb is None or free_mb - self._reserved_mb >= estimate_mb + self.reserve_mb:
+            return True, False
+        if self._in_flight == 0 and self.floor_lease.acquire(blocking=False):
+            # 메모리가 부족해도 호스트 전체에서 1건은 진행 (교착 방지)
+            return True, True
+        return False, False
+
+    @contextmanager
+    def admit(self, estimate_mb: int, label: str = ''):
+        """입장 허가를 받을 때까지 대기한 뒤 블록 실행"""
+        with self._cond:
+            self._waiting += 1
+            waited_from = time.time()
+            while True:
+                admitted, holds_floor = self._try_admit(estimate_mb)
+                if admitted:
+                    break
+                # 다른 작업(다른 워커 프로세스 포함)이 끝나거나, 메모리가 풀렸는지 주기적으로 재측정
+                self._cond.wait(timeout=2.0)
+            self._waiting -= 1
+            self._in_flight += 1
+            self._reserved_mb += estimate_mb
+            waited = time.time() - waited_from
+        if waited > 1:
+            print(f"[RENDER-SCHED] {label} 입장 ({waited:.1f}초 대기, 실행 중 {self._in_flight}/{self.max_parallel})")
+        try:
+            yield
+        finally:
+            if holds_floor:
+                self.floor_lease.release()
+            with self._cond:
+                self._in_flight -= 1
+                self._reserved_mb -= estimate_mb
+                self._completed += 1
+                self._cond.notify_all()
+
+    def fits(self, estimate_mb: int) -> bool:
+        """지금 여유 메모리로 estimate_mb 작업을 (예비분 포함) 실행할 수 있는지 - 측정 불가면 False"""
+        free_mb = self._memory_probe()
+        if free_mb is None:
+            return False
+        with self._cond:
+            reserved_mb = self._reserved_mb
+        return free_mb - reserved_mb >= estimate_mb + self.reserve_mb
+
+    def parallelism_for(self, estimate_mb: int) -> int:
+        """현재 여유 메모리 기준으로 동시에 돌릴 수 있는 작업 수 (워커 스레드 수 결정용)"""
+        free_mb = self._memory_probe()
+        if free_mb is None:
+            return self.max_parallel
+        by_memory = (free_mb - self.reserve_mb) // max(1, estimate_mb)
+        return int(max(1, min(self.max_parallel, by_memory)))
+
+    def run_all(self, func: Callable, tasks: Sequence, estimates: Sequence[int],
+                labels: Optional[Sequence[str]] = None) -> Iterator[Tuple[int, object, Optional[BaseException]]]:
+        """tasks를 입장 제어 하에 실행하고 완료 순서대로 (index, result, error) 반환"""
+        if not tasks:
+            return
+        workers = min(len(tasks), self.parallelism_for(max(estimates)))
+
+        def _run(i):
+            label = labels[i] if labels else f"task-{i}"
+            with self.admit(estimates[i], label=label):
+                return func(tasks[i])
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_idx = {executor.submit(_run, i): i for i in range(len(tasks))}
+            for future in as_completed(future_to_idx):
+                i = future_to_idx[future]
+                try:
+                    yield i, future.result(), None
+                except Exception as e:
+                    yield i, None, e
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                'maxParallel': self.max_parallel,
+                'inFlight': self._in_flight,
+                'queueDepth': self._waiting,
+                'reservedMB': self._reserved_mb,
+                'completed': self._completed,
+                'availableMB': self._memory_probe(),
+            }
+
+
+_render_scheduler = None
+_render_scheduler_lock = threading.Lock()
+
+
+def get_render_scheduler() -> RenderScheduler:
+    """프로세스 공용 스케줄러 인스턴스"""
+    global _render_scheduler
+    with _render_scheduler_lock:
+        if _render_scheduler is None:
+            _render_scheduler = RenderScheduler()
+        return _render_scheduler
@@ -0,0 +1,218 @@
+"""
+정지 이미지 + 오디오 영상 렌더러 (history / isekai / wuxia 공용)
+
+채널별 renderer.py에 복사되어 있던 get_audio_duration / srt_to_ass /
+render_video / render_multi_image_video를 하나로 합친 것.
+채널 차이(자막 스타일, 로그 태그, 인코더 프로필)는 인자로 넘긴다.
+
+- 이미지 1장: -loop 1 + -shortest
+- 여러 장: concat demuxer (절대 경로, 오디오 길이 균등 분배) + -t 오디오 길이
+  (concat demuxer와 -shortest 조합 시 싱크 문제 발생)
+- SRT가 있으면 ASS로 변환해서 하드코딩
+- FFmpeg 실행은 렌더 스케줄러 입장 후 encoder.run_ffmpeg로 (진행률 보고)
+
+사용법:
+    from video.still import render_still_video, AssStyle
+
+    result = render_still_video(audio_path, [img1, img2], output_path, srt_path=srt,
+                                profile="fast", ass_style=AssStyle(font_size=40), label="RENDERER")
+"""
+
+import os
+import re
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+
+from .encoder import EncoderProfile, escape_filter_path, get_encoder_profile, probe_duration, run_ffmpeg
+from .scheduler import estimate_ffmpeg_memory_mb, get_render_scheduler
+
+
+@dataclass(frozen=True)
+class AssStyle:
+    """ASS Default 스타일 (1920x1080 기준)"""
+    font_name: str = "NotoSansKR-Bold"
+    font_size: int = 80
+    outline: int = 3
+    shadow: int = 1
+    margin_v: int = 120
+
+
+_SRT_BLOCK_SPLIT_RE = re.compile(r'\n\s*\n')
+_SRT_TIME_RE = re.compile(r'(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})')
+
+
+def _srt_to_ass_time(srt_time: str) -> str:
+    """SRT 타임스탬프를 ASS 형식으로 변환"""
+    hours, minutes, seconds_ms = srt_time.split(':')
+    seconds, milliseconds = seconds_ms.split(',')
+    centiseconds = int(milliseconds) // 10
+    return f"{int(hours)}:{minutes}:{seconds}.{centiseconds:02d}"
+
+
+def srt_to_ass(srt_content: str, style: Optional[AssStyle] = None) -> str:
+    """SRT를 ASS 형식으로 변환"""
+    style = style or AssStyle()
+    ass_header = f"""[Script Info]
+ScriptType: v4.00+
+Collisions: Normal
+PlayResX: 1920
+PlayResY: 1080
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,{style.font_name},{style.font_size},&HFFFFFF,&H000000FF,&H00000000,&H80000000,1,0,0,0,100,100,0,0,4,{style.outline},{style.shadow},2,20,20,{style.margin_v},1
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+"""
+
+    ass_events = []
+    srt_normalized = srt_content.replace('\r\n', '\n').strip()
+
+    for block in _SRT_BLOCK_SPLIT_RE.split(srt_normalized):
+        lines = block.strip().split('\n')
+        if len(lines) >= 3:
+            time_match = _SRT_TIME_RE.match(lines[1])
+            if time_match:
+                start_time = _srt_to_ass_time(time_match.group(1))
+                end_time = _srt_to_ass_time(time_match.group(2))
+                text = '\\N'.join(lines[2:])
+                ass_events.append(f"Dialogue: 0,{start_time},{end_time},Default,,0,0,0,,{text}")
+
+    return ass_header + '\n'.join(ass_events)
+
+
+def build_still_video_command(
+    audio_path: str,
+    image_paths: List[str],
+    output_path: str,
+    duration: float,
+    vf_filter: str,
+    profile: EncoderProfile,
+    fps: int,
+    list_path: Optional[str] = None,
+) -> List[str]:
+    """FFmpeg 명령어 생성 (이미지 1장이면 -loop, 여러 장이면 concat 리스트 파일 사용)"""
+    if len(image_paths) == 1:
+        inputs = ['-loop', '1', '-i', image_paths[0], '-i', audio_path]
+        length_args = ['-shortest']
+    else:
+        inputs = ['-f', 'concat', '-safe', '0', '-i', list_path, '-i', audio_path]
+        length_args = ['-t', str(duration)]
+
+    return [
+        'ffmpeg', '-y',
+        *inputs,
+        *length_args,
+        '-vf', vf_filter,
+        *profile.video_args(),
+        *profile.audio_args(),
+        *profile.rate_args(fps),
+        '-pix_fmt', 'yuv420p',
+        *profile.thread_args(),
+        output_path,
+    ]
+
+
+def render_still_video(
+    audio_path: str,
+    image_paths: List[str],
+    output_path: str,
+    srt_path: str = None,
+    resolution: str = "1920x1080",
+    fps: int = 30,
+    profile: Union[str, EncoderProfile] = "fast",
+    ass_style: Optional[AssStyle] = None,
+    label: str = "RENDERER",
+) -> Dict[str, Any]:
+    """
+    이미지 + 오디오로 영상 생성 (여러 장이면 시간 균등 분배)
+
+    Args:
+        audio_path: TTS 오디오 파일 경로
+        image_paths: 배경 이미지 경로 목록
+        output_path: 출력 영상 경로
+        srt_path: SRT 자막 파일 경로 (선택)
+        resolution: 해상도 (기본: 1920x1080)
+        fps: 프레임레이트 (기본: 30)
+        profile: 인코더 프로필 이름 또는 EncoderProfile (RENDER_PROFILE 등 환경변수가 우선)
+        ass_style: 자막 스타일
+        label: 로그 태그
+
+    Returns:
+        {"ok": True, "video_path": "...", "duration": 900.5, "elapsed": 412.3, "fps": 65.4}
+    """
+    if not image_paths:
+        return {"ok": False, "error": "이미지가 없습니다."}
+
+    if isinstance(profile, str):
+        profile = get_encoder_profile(profile)
+
+    try:
+        if not shutil.which('ffmpeg'):
+            return {"ok": False, "error": "FFmpeg가 설치되어 있지 않습니다."}
+
+        # 오디오 길이 확인
+        duration = probe_duration(audio_path)
+        image_duration = duration / len(image_paths)
+        if len(image_paths) > 1:
+            print(f"[{label}] 오디오: {duration:.1f}초, 이미지당: {image_duration:.1f}초")
+        else:
+            print(f"[{label}] 오디오 길이: {duration:.1f}초")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            width, height = resolution.split('x')
+
+            list_path = None
+            if len(image_paths) > 1:
+                # 이미지 리스트 파일 생성 (절대 경로 - 리스트 파일 위치 기준 상대 경로 해석 방지)
+                list_path = os.path.join(temp_dir, "images.txt")
+                with open(list_path, 'w') as f:
+                    for img_path in image_paths:
+                        f.write(f"file '{os.path.abspath(img_path)}'\n")
+                        f.write(f"duration {image_duration}\n")
+                    f.write(f"file '{os.path.abspath(image_paths[-1])}'\n")  # 마지막 이미지 한번 더
+
+            # 기본 필터
+            vf_filter = f"scale={width}:{height}:force_original_aspect_ratio=decrease,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2"
+
+            # 자막 처리
+            if srt_path and os.path.exists(srt_path):
+                print(f"[{label}] 자막 파일: {srt_path}")
+                with open(srt_path, 'r', encoding='utf-8') as f:
+                    ass_content = srt_to_ass(f.read(), ass_style)
+                ass_path = os.path.join(temp_dir, "subtitle.ass")
+                with open(ass_path, 'w', encoding='utf-8') as f:
+                    f.write(ass_content)
+                vf_filter = f"{vf_filter},ass={escape_filter_path(ass_path)}"
+
+            cmd = build_still_video_command(
+                audio_path, image_paths, output_path, duration, vf_filter, profile, fps, list_path
+            )
+
+            print(f"[{label}] FFmpeg 실행 중... ({len(image_paths)}개 이미지, 프로필: {profile.name}/{profile.preset})")
+            estimate = estimate_ffmpeg_memory_mb(int(width), int(height), duration, preset=profile.preset)
+            with get_render_scheduler().admit(estimate, label=os.path.basename(output_path)):
+                result = run_ffmpeg(cmd, duration=duration, label=label)
+
+            if not result.get("ok"):
+                return result
+
+            if os.path.exists(output_path):
+                file_size = os.path.getsize(output_path)
+                print(f"[{label}] 완료: {output_path} ({file_size / 1024 / 1024:.1f}MB, "
+                      f"{result['elapsed']:.0f}초, {result['fps']:.1f}fps)")
+                return {
+                    "ok": True,
+                    "video_path": output_path,
+                    "duration": duration,
+                    "elapsed": result["elapsed"],
+                    "fps": result["fps"],
+                }
+            else:
+                return {"ok": False, "error": "출력 파일이 생성되지 않았습니다."}
+
+    except Exception as e:
+        return {"ok": False, "error": str(e)}